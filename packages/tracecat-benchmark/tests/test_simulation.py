@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import asyncio
+import json
+from pathlib import Path
+
+import pytest
+from tracecat_benchmark.simulation import (
+    SIMULATION_BASELINE_PATH,
+    SimulationConfig,
+    SimulationShape,
+    chain,
+    default_shapes,
+    do_while,
+    fan_out,
+    main,
+    nested_scatter,
+    simulate,
+)
+
+from tracecat import config as tracecat_config
+
+
+@pytest.mark.parametrize(
+    ("shape", "actions", "scheduled_tasks", "activities", "platform_calls"),
+    [
+        (chain(5), 5, 5, 5, 0),
+        (fan_out(4), 6, 6, 6, 0),
+        # 3 scatter inputs, 8 gather items and 3 gather finalizations
+        (nested_scatter(2, 3), 6, 17, 9, 14),
+        # A seed, then 2 actions plus the loop start and end per iteration. The
+        # loop condition is evaluated in the workflow.
+        (do_while(3, 2), 7, 13, 13, 0),
+    ],
+    ids=lambda value: value.name if isinstance(value, SimulationShape) else None,
+)
+def test_simulation_counts_are_deterministic(
+    shape: SimulationShape,
+    actions: int,
+    scheduled_tasks: int,
+    activities: int,
+    platform_calls: int,
+) -> None:
+    result = asyncio.run(simulate(shape))
+
+    assert result.shape == shape.name
+    assert result.actions == actions
+    assert result.scheduled_tasks == scheduled_tasks
+    assert result.activities == activities
+    assert result.platform_calls == platform_calls
+    assert result.estimated_events == 3 * activities + result.platform_calls
+    assert result.peak_memory_bytes > 0
+
+
+def test_simulation_leaves_runtime_config_untouched() -> None:
+    externalization = tracecat_config.TRACECAT__RESULT_EXTERNALIZATION_ENABLED
+
+    asyncio.run(simulate(chain(2), SimulationConfig(latency=0.001)))
+
+    assert tracecat_config.TRACECAT__RESULT_EXTERNALIZATION_ENABLED == externalization
+
+
+def test_default_shapes_scale() -> None:
+    assert [shape.name for shape in default_shapes()] == [
+        "chain-100",
+        "fan-out-500",
+        "nested-scatter-10x50",
+        "do-while-20x5",
+    ]
+    assert default_shapes(2)[0].name == "chain-200"
+
+
+def test_baseline_covers_default_shapes() -> None:
+    baseline = json.loads(SIMULATION_BASELINE_PATH.read_text(encoding="utf-8"))
+
+    assert list(baseline) == [shape.name for shape in default_shapes()]
+
+
+def _set_argv(monkeypatch: pytest.MonkeyPatch, *args: str) -> None:
+    monkeypatch.setattr(
+        "tracecat_benchmark.simulation.default_shapes", lambda _: [chain(3)]
+    )
+    monkeypatch.setattr("sys.argv", ["tracecat-benchmark-simulate", "--json", *args])
+
+
+def test_main_gates_on_baseline_counters(
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+    tmp_path: Path,
+) -> None:
+    baseline_path = tmp_path / "baseline.json"
+    _set_argv(monkeypatch, "--baseline", str(baseline_path), "--update-baseline")
+    main()
+    baseline = json.loads(baseline_path.read_text(encoding="utf-8"))
+    assert baseline == {
+        "chain-3": {"scheduled_tasks": 3, "platform_calls": 0, "estimated_events": 9}
+    }
+
+    _set_argv(monkeypatch, "--baseline", str(baseline_path))
+    main()
+
+    baseline["chain-3"]["scheduled_tasks"] = 2
+    baseline_path.write_text(json.dumps(baseline), encoding="utf-8")
+    capsys.readouterr()
+    with pytest.raises(SystemExit) as exc_info:
+        main()
+
+    assert exc_info.value.code == 1
+    captured = capsys.readouterr()
+    assert '"shape": "chain-3"' in captured.out
+    assert captured.err == "chain-3: scheduled_tasks 3 > baseline 2\n"
+
+
+def test_main_fails_wall_time_bound(
+    monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    _set_argv(monkeypatch, "--max-wall-seconds", "0")
+
+    with pytest.raises(SystemExit) as exc_info:
+        main()
+
+    assert exc_info.value.code == 1
+    assert "chain-3: wall time" in capsys.readouterr().err
@@ -0,0 +1,508 @@
+"""Offline simulation of DSL workflow orchestration.
+
+Drives ``DSLScheduler`` outside Temporal so that the cost of orchestration
+itself can be measured without a cluster. Actions run on an in-memory executor
+with configurable latency and result size. Platform activities (scatter input,
+gather items, finalization and condition fallbacks) run in-process, the same
+way they run as local activities on the workflow worker. Result
+externalization is disabled, so every result stays inline.
+
+Each run reports:
+
+- scheduler CPU time per executed action (process CPU, which includes the
+  in-process platform activities but not the simulated action latency),
+- peak Python heap allocation during the run (``tracemalloc``),
+- executed actions, tasks scheduled by the scheduler, executor activities,
+  platform activity calls and the estimated number of workflow history events.
+  Every executor activity (an action, a batch of scatter items, or a
+  control-flow noop) costs three events, and every platform call costs one
+  local activity marker.
+
+The counters are deterministic, so CI gates orchestration regressions on them
+by comparing each shape against ``examples/simulation-baseline.json``. Wall
+time is only checked against a loose bound. CPU and memory figures are
+indicative and machine dependent.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import inspect
+import json
+import sys
+import time
+import tracemalloc
+import uuid
+from collections.abc import Callable, Iterator, Sequence
+from contextlib import ExitStack, contextmanager
+from dataclasses import asdict, dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any, Final
+from unittest import mock
+
+from temporalio import workflow
+
+from tracecat import config as tracecat_config
+from tracecat.auth.types import Role
+from tracecat.contexts import ctx_stream_id
+from tracecat.dsl.common import DSLEntrypoint, DSLInput
+from tracecat.dsl.enums import PlatformAction
+from tracecat.dsl.scheduler import DSLScheduler
+from tracecat.dsl.schemas import (
+    ActionStatement,
+    ExecutionContext,
+    RunContext,
+    StreamID,
+    TaskResult,
+)
+from tracecat.identifiers.workflow import WorkflowUUID
+from tracecat.storage.backends.inline import InlineObjectStorage
+from tracecat.storage.object import reset_object_storage, set_object_storage
+
+ACTIVITY_EVENTS: Final = 3
+"""Scheduled, started and completed events of one executor activity"""
+LOCAL_ACTIVITY_EVENTS: Final = 1
+"""Marker event of one local activity"""
+
+SIMULATION_BASELINE_PATH: Final = (
+    Path(__file__).with_name("examples") / "simulation-baseline.json"
+)
+GATED_COUNTERS: Final = ("scheduled_tasks", "platform_calls", "estimated_events")
+"""Deterministic counters that must not grow past the baseline"""
+
+_CONTROL_FLOW_ACTIONS: Final = frozenset(
+    {
+        PlatformAction.TRANSFORM_GATHER,
+        PlatformAction.LOOP_START,
+        PlatformAction.LOOP_END,
+    }
+)
+
+
+@dataclass(frozen=True, slots=True)
+class SimulationShape:
+    """A named DAG to simulate."""
+
+    name: str
+    dsl: DSLInput
+
+
+@dataclass(frozen=True, slots=True)
+class SimulationConfig:
+    latency: float = 0.0
+    """Seconds each action takes in the in-memory executor"""
+    result_bytes: int = 64
+    """Size of the string each action returns"""
+    max_pending_tasks: int = tracecat_config.TRACECAT__DSL_SCHEDULER_MAX_PENDING_TASKS
+    critical_path_ordering: bool = True
+
+
+@dataclass(frozen=True, slots=True)
+class SimulationResult:
+    shape: str
+    actions: int
+    scheduled_tasks: int
+    activities: int
+    platform_calls: int
+    estimated_events: int
+    wall_seconds: float
+    cpu_seconds: float
+    cpu_per_action_us: float
+    peak_memory_bytes: int
+
+
+# === Shapes === #
+
+
+def _dsl(title: str, actions: list[ActionStatement]) -> DSLInput:
+    return DSLInput(
+        title=title,
+        description=f"Simulated {title} workflow",
+        entrypoint=DSLEntrypoint(ref=actions[0].ref),
+        actions=actions,
+    )
+
+
+def chain(length: int) -> SimulationShape:
+    """A single dependency chain of actions."""
+    actions = [
+        ActionStatement(
+            ref=f"step_{i}",
+            action="core.noop",
+            depends_on=[f"step_{i - 1}"] if i else [],
+        )
+        for i in range(length)
+    ]
+    return SimulationShape(f"chain-{length}", _dsl("chain", actions))
+
+
+def fan_out(width: int) -> SimulationShape:
+    """One action fanning out to independent actions that join again."""
+    branches = [f"branch_{i}" for i in range(width)]
+    actions = [
+        ActionStatement(ref="start", action="core.noop"),
+        *(
+            ActionStatement(ref=ref, action="core.noop", depends_on=["start"])
+            for ref in branches
+        ),
+        ActionStatement(ref="join", action="core.noop", depends_on=branches),
+    ]
+    return SimulationShape(f"fan-out-{width}", _dsl("fan-out", actions))
+
+
+def nested_scatter(outer: int, inner: int) -> SimulationShape:
+    """A scatter inside a scatter, with one action per inner item."""
+    actions = [
+        ActionStatement(
+            ref="outer",
+            action="core.transform.scatter",
+            args={"collection": list(range(outer))},
+        ),
+        ActionStatement(
+            ref="inner",
+            action="core.transform.scatter",
+            depends_on=["outer"],
+            args={"collection": list(range(inner))},
+        ),
+        ActionStatement(ref="body", action="core.noop", depends_on=["inner"]),
+        ActionStatement(
+            ref="inner_gather",
+            action="core.transform.gather",
+            depends_on=["body"],
+            args={"items": "${{ ACTIONS.body.result }}"},
+        ),
+        ActionStatement(
+            ref="outer_gather",
+            action="core.transform.gather",
+            depends_on=["inner_gather"],
+            args={"items": "${{ ACTIONS.inner_gather.result }}"},
+        ),
+    ]
+    return SimulationShape(
+        f"nested-scatter-{outer}x{inner}", _dsl("nested-scatter", actions)
+    )
+
+
+def do_while(iterations: int, body: int) -> SimulationShape:
+    """A do-while loop running a chain of `body` actions per iteration."""
+    steps = [
+        ActionStatement(
+            ref=f"step_{i}",
+            action="core.noop",
+            depends_on=[f"step_{i - 1}" if i else "loop_start"],
+        )
+        for i in range(body)
+    ]
+    actions = [
+        ActionStatement(ref="seed", action="core.noop"),
+        ActionStatement(
+            ref="loop_start", action="core.loop.start", depends_on=["seed"]
+        ),
+        *steps,
+        ActionStatement(
+            ref="loop_end",
+            action="core.loop.end",
+            depends_on=[steps[-1].ref],
+            args={
+                "condition": (
+                    f"${{{{ ACTIONS.loop_start.result.iteration < {iterations - 1} }}}}"
+                ),
+                "max_iterations": iterations,
+            },
+        ),
+    ]
+    return SimulationShape(f"do-while-{iterations}x{body}", _dsl("do-while", actions))
+
+
+def default_shapes(scale: int = 1) -> list[SimulationShape]:
+    """The shapes reported by the CLI, sized by `scale`."""
+    return [
+        chain(100 * scale),
+        fan_out(500 * scale),
+        nested_scatter(10 * scale, 50),
+        do_while(20 * scale, 5),
+    ]
+
+
+# === Harness === #
+
+
+class _InMemoryRuntime:
+    """Executor and platform activity runner for one simulated workflow."""
+
+    def __init__(self, sim_config: SimulationConfig) -> None:
+        self.config = sim_config
+        self.scheduler: DSLScheduler | None = None
+        self.actions = 0
+        self.scheduled_tasks = 0
+        self.activities = 0
+        self.platform_calls = 0
+        self._result = TaskResult.from_result("x" * sim_config.result_bytes)
+
+    async def execute(self, stmt: ActionStatement) -> None:
+        self.activities += 1
+        if self.config.latency > 0:
+            await asyncio.sleep(self.config.latency)
+        # Like the workflow's noop activities, control flow keeps the result
+        # the scheduler already set
+        if stmt.action not in _CONTROL_FLOW_ACTIONS:
+            self.actions += 1
+            self._bound.set_action_result(ctx_stream_id.get(), stmt.ref, self._result)
+
+    async def execute_batch(
+        self, stmt: ActionStatement, stream_ids: list[StreamID]
+    ) -> list[BaseException | None]:
+        self.activities += 1
+        self.actions += len(stream_ids)
+        if self.config.latency > 0:
+            await asyncio.sleep(self.config.latency)
+        for stream_id in stream_ids:
+            self._bound.set_action_result(stream_id, stmt.ref, self._result)
+        return [None] * len(stream_ids)
+
+    @property
+    def _bound(self) -> DSLScheduler:
+        if self.scheduler is None:
+            raise RuntimeError("The runtime isn't bound to a scheduler")
+        return self.scheduler
+
+    async def run_platform_activity(
+        self, activity: Callable[..., Any], *, args: Sequence[Any], **_: Any
+    ) -> Any:
+        self.platform_calls += 1
+        if inspect.iscoroutinefunction(activity):
+            return await activity(*args)
+        # Sync activities run in the worker's thread pool
+        return await asyncio.to_thread(activity, *args)
+
+
+@contextmanager
+def _offline_workflow(runtime: _InMemoryRuntime) -> Iterator[None]:
+    """Route the workflow APIs the scheduler uses to the in-memory runtime.
+
+    Every patch marker reports the latest code path.
+    """
+    with ExitStack() as stack:
+        stack.enter_context(mock.patch.object(workflow, "patched", lambda _: True))
+        for name in ("execute_activity", "execute_local_activity"):
+            stack.enter_context(
+                mock.patch.object(workflow, name, runtime.run_platform_activity)
+            )
+        stack.enter_context(
+            mock.patch.object(
+                tracecat_config, "TRACECAT__RESULT_EXTERNALIZATION_ENABLED", False
+            )
+        )
+        set_object_storage(InlineObjectStorage())
+        stack.callback(reset_object_storage)
+        yield
+
+
+def _build_scheduler(
+    shape: SimulationShape, sim_config: SimulationConfig, runtime: _InMemoryRuntime
+) -> DSLScheduler:
+    wf_id = WorkflowUUID.new_uuid4()
+    scheduler = DSLScheduler(
+        executor=runtime.execute,
+        batch_executor=runtime.execute_batch,
+        dsl=shape.dsl,
+        max_pending_tasks=sim_config.max_pending_tasks,
+        context=ExecutionContext(ACTIONS={}, TRIGGER=None),
+        role=Role(
+            type="service",
+            service_id="tracecat-runner",
+            workspace_id=uuid.uuid4(),
+            user_id=uuid.uuid4(),
+        ),
+        run_context=RunContext(
+            wf_id=wf_id,
+            wf_exec_id=f"{wf_id.short()}/exec_simulation",
+            wf_run_id=uuid.uuid4(),
+            environment="simulation",
+            logical_time=datetime.now(UTC),
+        ),
+        critical_path_ordering=sim_config.critical_path_ordering,
+    )
+    schedule_task = scheduler._schedule_task
+
+    async def count_scheduled_task(task: Any) -> None:
+        runtime.scheduled_tasks += 1
+        await schedule_task(task)
+
+    scheduler._schedule_task = count_scheduled_task  # type: ignore[method-assign]
+    runtime.scheduler = scheduler
+    return scheduler
+
+
+async def _run_once(
+    shape: SimulationShape, sim_config: SimulationConfig
+) -> tuple[_InMemoryRuntime, float, float]:
+    runtime = _InMemoryRuntime(sim_config)
+    with _offline_workflow(runtime):
+        scheduler = _build_scheduler(shape, sim_config, runtime)
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        if (exceptions := await scheduler.start()) is not None:
+            raise RuntimeError(
+                f"Simulated workflow {shape.name!r} failed: {exceptions}"
+            )
+        cpu_seconds = time.process_time() - cpu_start
+        wall_seconds = time.perf_counter() - wall_start
+    return runtime, wall_seconds, cpu_seconds
+
+
+async def simulate(
+    shape: SimulationShape, sim_config: SimulationConfig | None = None
+) -> SimulationResult:
+    """Run a shape twice: once for time, then under `tracemalloc` for memory."""
+    sim_config = sim_config or SimulationConfig()
+    runtime, wall_seconds, cpu_seconds = await _run_once(shape, sim_config)
+
+    tracemalloc.start()
+    try:
+        await _run_once(shape, sim_config)
+        _, peak_memory_bytes = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return SimulationResult(
+        shape=shape.name,
+        actions=runtime.actions,
+        scheduled_tasks=runtime.scheduled_tasks,
+        activities=runtime.activities,
+        platform_calls=runtime.platform_calls,
+        estimated_events=(
+            runtime.activities * ACTIVITY_EVENTS
+            + runtime.platform_calls * LOCAL_ACTIVITY_EVENTS
+        ),
+        wall_seconds=wall_seconds,
+        cpu_seconds=cpu_seconds,
+        cpu_per_action_us=cpu_seconds / max(runtime.actions, 1) * 1e6,
+        peak_memory_bytes=peak_memory_bytes,
+    )
+
+
+# === CLI === #
+
+
+def _parse_args(argv: list[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="tracecat-benchmark-simulate",
+        description="Measure DSL scheduler orchestration cost offline.",
+    )
+    parser.add_argument("--scale", type=int, default=1, help="shape size multiplier")
+    parser.add_argument(
+        "--latency-ms", type=float, default=0.0, help="simulated action latency"
+    )
+    parser.add_argument(
+        "--result-bytes", type=int, default=64, help="simulated action result size"
+    )
+    parser.add_argument(
+        "--max-pending-tasks",
+        type=int,
+        default=tracecat_config.TRACECAT__DSL_SCHEDULER_MAX_PENDING_TASKS,
+    )
+    parser.add_argument(
+        "--baseline",
+        type=Path,
+        default=None,
+        help="exit non-zero if any shape's counters exceed this baseline file",
+    )
+    parser.add_argument(
+        "--update-baseline",
+        action="store_true",
+        help="write the counters to --baseline instead of checking them",
+    )
+    parser.add_argument(
+        "--max-wall-seconds",
+        type=float,
+        default=None,
+        help="exit non-zero if any shape takes longer than this wall time",
+    )
+    parser.add_argument("--json", action="store_true", help="print JSON lines")
+    return parser.parse_args(argv)
+
+
+async def _run(args: argparse.Namespace) -> list[SimulationResult]:
+    sim_config = SimulationConfig(
+        latency=args.latency_ms / 1000,
+        result_bytes=args.result_bytes,
+        max_pending_tasks=args.max_pending_tasks,
+    )
+    return [await simulate(shape, sim_config) for shape in default_shapes(args.scale)]
+
+
+def baseline_counters(results: Sequence[SimulationResult]) -> dict[str, Any]:
+    """The gated counters of each shape, in the baseline file's format."""
+    return {
+        result.shape: {name: getattr(result, name) for name in GATED_COUNTERS}
+        for result in results
+    }
+
+
+def check_baseline(
+    results: Sequence[SimulationResult], baseline: dict[str, Any]
+) -> list[str]:
+    """Describe every gated counter that grew past its baseline."""
+    regressions = []
+    for result in results:
+        if (expected := baseline.get(result.shape)) is None:
+            regressions.append(f"{result.shape}: no baseline")
+            continue
+        for name in GATED_COUNTERS:
+            if (actual := getattr(result, name)) > expected[name]:
+                regressions.append(
+                    f"{result.shape}: {name} {actual} > baseline {expected[name]}"
+                )
+    return regressions
+
+
+def main() -> None:
+    args = _parse_args(sys.argv[1:])
+    results = asyncio.run(_run(args))
+
+    if args.json:
+        for result in results:
+            sys.stdout.write(json.dumps(asdict(result)) + "\n")
+    else:
+        sys.stdout.write(
+            f"{'shape':<24} {'actions':>8} {'scheduled':>10} {'activities':>11} "
+            f"{'platform':>9} {'events':>8} {'wall':>9} {'cpu/action':>11} "
+            f"{'peak mem':>10}\n"
+        )
+        for result in results:
+            sys.stdout.write(
+                f"{result.shape:<24} {result.actions:>8} "
+                f"{result.scheduled_tasks:>10} {result.activities:>11} "
+                f"{result.platform_calls:>9} {result.estimated_events:>8} "
+                f"{result.wall_seconds * 1000:>7.0f}ms "
+                f"{result.cpu_per_action_us:>9.1f}us "
+                f"{result.peak_memory_bytes / 1024:>8.0f}KB\n"
+            )
+
+    if args.baseline is not None and args.update_baseline:
+        args.baseline.write_text(
+            json.dumps(baseline_counters(results), indent=2) + "\n",
+            encoding="utf-8",
+        )
+        return
+
+    failures = []
+    if args.baseline is not None:
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+        failures.extend(check_baseline(results, baseline))
+    if (limit := args.max_wall_seconds) is not None:
+        failures.extend(
+            f"{result.shape}: wall time {result.wall_seconds:.2f}s > {limit}s"
+            for result in results
+            if result.wall_seconds > limit
+        )
+    if failures:
+        sys.stderr.write("".join(f"{failure}\n" for failure in failures))
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
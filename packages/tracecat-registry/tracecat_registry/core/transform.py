@@ -317,6 +317,15 @@ def scatter(
         float | None,
         Doc("The interval in seconds between each scatter task."),
     ] = None,
+    batch_size: Annotated[
+        int | None,
+        Doc(
+            "Run each action in the scatter for up to this many consecutive items"
+            " in one executor call. Use this for cheap actions, such as"
+            " transforms, where per-item orchestration dominates the cost. Items"
+            " still succeed or fail independently."
+        ),
+    ] = None,
 ) -> Any:
     raise ActionIsInterfaceError()
 
@@ -0,0 +1,133 @@
+#!/usr/bin/env python
+"""Measure the `execute_action_activity` input size per action.
+
+Builds the `RunActionInput` a DSL workflow sends to the executor for a few
+typical statements, with an inline trigger payload of the given size, and
+reports the serialized size of each input. Compares the full root context
+(`build_stream_aware_context`) against the pruned context the workflow ships
+(`build_action_input_context`). The input is recorded in workflow history once
+per action, so the difference is the history bytes saved per action.
+
+Run with:
+    uv run python scripts/benchmark/action_context_size_benchmark.py --trigger-kb 64
+"""
+
+from __future__ import annotations
+
+import argparse
+import uuid
+from datetime import UTC, datetime
+
+from tracecat.auth.types import Role
+from tracecat.authz.scopes import SERVICE_PRINCIPAL_SCOPES
+from tracecat.dsl.common import DSLEntrypoint, DSLInput
+from tracecat.dsl.scheduler import DSLScheduler
+from tracecat.dsl.schemas import (
+    ROOT_STREAM,
+    ActionStatement,
+    ExecutionContext,
+    RunActionInput,
+    RunContext,
+    TaskResult,
+)
+from tracecat.identifiers.workflow import WorkflowUUID
+from tracecat.registry.lock.types import RegistryLock
+from tracecat.storage.object import InlineObject
+
+STATEMENTS = [
+    ActionStatement(
+        ref="no_trigger",
+        action="core.transform.reshape",
+        args={"value": "${{ ACTIONS.lookup.result }}"},
+    ),
+    ActionStatement(
+        ref="one_key",
+        action="core.http_request",
+        args={"url": "https://example.com", "params": {"id": "${{ TRIGGER.id }}"}},
+    ),
+    ActionStatement(
+        ref="whole_trigger",
+        action="core.transform.reshape",
+        args={"value": "${{ TRIGGER }}"},
+    ),
+]
+
+
+def build_scheduler(trigger_kb: int) -> DSLScheduler:
+    async def executor(_: ActionStatement) -> None:
+        return None
+
+    wf_id = WorkflowUUID.new_uuid4()
+    trigger = InlineObject(
+        data={
+            "id": "alert-1",
+            "severity": "high",
+            "raw": [{"line": "x" * 1000} for _ in range(trigger_kb)],
+        }
+    )
+    scheduler = DSLScheduler(
+        executor=executor,
+        dsl=DSLInput(
+            title="benchmark",
+            description="benchmark",
+            entrypoint=DSLEntrypoint(ref=STATEMENTS[0].ref),
+            actions=STATEMENTS,
+        ),
+        max_pending_tasks=16,
+        context=ExecutionContext(
+            ACTIONS={"lookup": TaskResult.from_result({"ok": True})},
+            TRIGGER=trigger,
+        ),
+        role=Role(
+            type="service",
+            service_id="tracecat-runner",
+            workspace_id=uuid.uuid4(),
+            user_id=uuid.uuid4(),
+            scopes=SERVICE_PRINCIPAL_SCOPES["tracecat-runner"],
+        ),
+        run_context=RunContext(
+            wf_id=wf_id,
+            wf_exec_id=f"{wf_id.short()}/exec_benchmark",
+            wf_run_id=uuid.uuid4(),
+            environment="benchmark",
+            logical_time=datetime.now(UTC),
+        ),
+    )
+    return scheduler
+
+
+def input_size(
+    scheduler: DSLScheduler, task: ActionStatement, context: ExecutionContext
+) -> int:
+    arg = RunActionInput(
+        task=task,
+        exec_context=context,
+        run_context=scheduler.run_context,
+        registry_lock=RegistryLock(
+            origins={"tracecat_registry": "benchmark"},
+            actions={task.action: "tracecat_registry"},
+        ),
+    )
+    return len(arg.model_dump_json())
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--trigger-kb", type=int, default=64)
+    args = parser.parse_args()
+
+    scheduler = build_scheduler(args.trigger_kb)
+    print(f"inline trigger of ~{args.trigger_kb} KB")
+    print(f"{'statement':<15} {'full':>10} {'pruned':>10} {'saved':>8}")
+    for task in STATEMENTS:
+        full = input_size(
+            scheduler, task, scheduler.build_stream_aware_context(task, ROOT_STREAM)
+        )
+        pruned = input_size(
+            scheduler, task, scheduler.build_action_input_context(task, ROOT_STREAM)
+        )
+        print(f"{task.ref:<15} {full:>10} {pruned:>10} {1 - pruned / full:>7.1%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+#!/usr/bin/env python
+"""Simulate DSLScheduler makespan with FIFO vs critical-path task ordering.
+
+Builds mixed DAGs: an entry action fans out to a wide set of cheap independent
+actions and to a long dependency chain. Every action sleeps for one time unit,
+and `max_pending_tasks` caps how many run at once. With FIFO ordering, the
+chain waits behind the fan-out. Critical-path ordering starts it first.
+
+Run with:
+    uv run python scripts/benchmark/critical_path_queue_benchmark.py --unit-ms 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+import uuid
+from datetime import UTC, datetime
+
+from tracecat.auth.types import Role
+from tracecat.dsl.common import DSLEntrypoint, DSLInput
+from tracecat.dsl.scheduler import DSLScheduler
+from tracecat.dsl.schemas import ActionStatement, ExecutionContext, RunContext
+from tracecat.identifiers.workflow import WorkflowUUID
+
+SHAPES = [
+    # (fan-out width, chain length, max pending tasks)
+    (32, 8, 4),
+    (64, 16, 8),
+    (128, 8, 16),
+    (16, 32, 4),
+]
+
+
+def build_dsl(width: int, length: int) -> DSLInput:
+    # Fan-out refs sort before the chain, so FIFO queues them first
+    actions = [ActionStatement(ref="start", action="core.noop")]
+    actions.extend(
+        ActionStatement(ref=f"a_fan_{i}", action="core.noop", depends_on=["start"])
+        for i in range(width)
+    )
+    actions.extend(
+        ActionStatement(
+            ref=f"chain_{i}",
+            action="core.noop",
+            depends_on=["start" if i == 0 else f"chain_{i - 1}"],
+        )
+        for i in range(length)
+    )
+    return DSLInput(
+        title="benchmark",
+        description="benchmark",
+        entrypoint=DSLEntrypoint(ref="start"),
+        actions=actions,
+    )
+
+
+async def makespan(
+    dsl: DSLInput, *, max_pending_tasks: int, unit: float, critical_path: bool
+) -> float:
+    async def executor(_: ActionStatement) -> None:
+        await asyncio.sleep(unit)
+
+    wf_id = WorkflowUUID.new_uuid4()
+    scheduler = DSLScheduler(
+        executor=executor,
+        dsl=dsl,
+        max_pending_tasks=max_pending_tasks,
+        context=ExecutionContext(ACTIONS={}, TRIGGER=None),
+        role=Role(
+            type="service",
+            service_id="tracecat-runner",
+            workspace_id=uuid.uuid4(),
+            user_id=uuid.uuid4(),
+        ),
+        run_context=RunContext(
+            wf_id=wf_id,
+            wf_exec_id=f"{wf_id.short()}/exec_benchmark",
+            wf_run_id=uuid.uuid4(),
+            environment="benchmark",
+            logical_time=datetime.now(UTC),
+        ),
+        critical_path_ordering=critical_path,
+    )
+    start = time.perf_counter()
+    if await scheduler.start() is not None:
+        raise RuntimeError("Scheduler reported task exceptions")
+    return time.perf_counter() - start
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--unit-ms", type=float, default=5.0)
+    args = parser.parse_args()
+    unit = args.unit_ms / 1000
+
+    print(
+        f"{'width':>6} {'chain':>6} {'cap':>4} {'fifo':>8} {'critical':>9} {'gain':>6}"
+    )
+    for width, length, cap in SHAPES:
+        dsl = build_dsl(width, length)
+        fifo = await makespan(
+            dsl, max_pending_tasks=cap, unit=unit, critical_path=False
+        )
+        critical = await makespan(
+            dsl, max_pending_tasks=cap, unit=unit, critical_path=True
+        )
+        print(
+            f"{width:>6} {length:>6} {cap:>4} {fifo / unit:>7.1f}u "
+            f"{critical / unit:>8.1f}u {fifo / critical:>5.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,93 @@
+#!/usr/bin/env python
+"""Micro-benchmark for template expression evaluation.
+
+Compares the reference tree-walking `ExprEvaluator` against compiled expression
+closures over a for_each-style workload, where the same expressions are
+evaluated once per item with a different `var` binding.
+
+Run with:
+    uv run python scripts/benchmark/expression_eval_benchmark.py --items 5000
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from collections.abc import Callable
+from typing import Any
+
+from tracecat.expressions.common import ExprContext
+from tracecat.expressions.parser.compiler import ExprCompiler
+from tracecat.expressions.parser.core import parser
+from tracecat.expressions.parser.evaluator import ExprEvaluator
+
+DEFAULT_EXPRESSIONS = (
+    "var.item.id",
+    "var.item.score > 5 && ACTIONS.fetch.result.ok",
+    "FN.uppercase(var.item.name) if var.item.score > 5 else 'low'",
+    "ACTIONS.fetch.result.meta.tags[0]",
+    "var.item.score * 2 + 1",
+)
+
+
+def build_operands(n_items: int) -> list[dict[str, Any]]:
+    base = {
+        ExprContext.ACTIONS: {
+            "fetch": {"result": {"ok": True, "meta": {"tags": ["x", "y"]}}}
+        },
+    }
+    return [
+        {
+            **base,
+            ExprContext.LOCAL_VARS: {
+                "item": {"id": i, "name": f"item-{i}", "score": i % 10}
+            },
+        }
+        for i in range(n_items)
+    ]
+
+
+def time_it(fn: Callable[[], Any], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser_ = argparse.ArgumentParser(description=__doc__)
+    parser_.add_argument("--items", type=int, default=5000)
+    parser_.add_argument("--repeat", type=int, default=5)
+    args = parser_.parse_args()
+
+    operands = build_operands(args.items)
+    trees = [(expr, parser.parse(expr)) for expr in DEFAULT_EXPRESSIONS]
+    compiler = ExprCompiler()
+    compiled = [compiler.compile(tree) for _, tree in trees if tree is not None]
+
+    def run_evaluator() -> None:
+        for operand in operands:
+            for _, tree in trees:
+                if tree is not None:
+                    ExprEvaluator(operand=operand).evaluate(tree)
+
+    def run_compiled() -> None:
+        for operand in operands:
+            for fn in compiled:
+                fn(operand)
+
+    n_evals = args.items * len(trees)
+    evaluator_s = time_it(run_evaluator, args.repeat)
+    compiled_s = time_it(run_compiled, args.repeat)
+    print(f"evaluations: {n_evals}")
+    print(
+        f"evaluator:   {evaluator_s:.3f}s ({evaluator_s / n_evals * 1e6:.1f} us/eval)"
+    )
+    print(f"compiled:    {compiled_s:.3f}s ({compiled_s / n_evals * 1e6:.1f} us/eval)")
+    print(f"speedup:     {evaluator_s / compiled_s:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+#!/usr/bin/env python
+"""Micro-benchmark for simple dotted-path resolution in `eval_jsonpath`.
+
+Resolves `ACTIONS.<ref>.result...` lookups against a large action result, once
+through the direct dict/list fast path and once through jsonpath_ng's `find()`.
+Also compares resolving many fields of the same result one path at a time with
+a single shared `resolve_jsonpaths` walk.
+
+Run with:
+    uv run python scripts/benchmark/jsonpath_fast_path_benchmark.py --records 50000
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from collections.abc import Callable
+from typing import Any
+from unittest import mock
+
+from tracecat.expressions import common
+from tracecat.expressions.common import eval_jsonpath, resolve_jsonpaths
+
+DEFAULT_PATHS = (
+    "ACTIONS.fetch.result.data.records[0].name",
+    "ACTIONS.fetch.result.data.records[100].attributes.owner.email",
+    "ACTIONS.fetch.result.data.total",
+    "ACTIONS.fetch.result.meta.page.next",
+)
+
+
+def build_operand(n_records: int) -> dict[str, Any]:
+    records = [
+        {
+            "id": i,
+            "name": f"record-{i}",
+            "attributes": {"owner": {"email": f"user{i}@example.com"}, "score": i},
+            "tags": ["a", "b", "c"],
+        }
+        for i in range(n_records)
+    ]
+    return {
+        "ACTIONS": {
+            "fetch": {
+                "result": {
+                    "data": {"records": records, "total": n_records},
+                    "meta": {"page": {"next": "cursor"}},
+                }
+            }
+        }
+    }
+
+
+def time_it(fn: Callable[[], Any], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--records", type=int, default=50_000)
+    parser.add_argument("--iterations", type=int, default=2_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--batch-fields",
+        type=int,
+        default=20,
+        help="Fields of one record resolved together in the batch comparison.",
+    )
+    args = parser.parse_args()
+
+    operand = build_operand(args.records)
+
+    def run() -> None:
+        for _ in range(args.iterations):
+            for path in DEFAULT_PATHS:
+                eval_jsonpath(path, operand)
+
+    n_evals = args.iterations * len(DEFAULT_PATHS)
+    fast_s = time_it(run, args.repeat)
+    with mock.patch.object(common, "_simple_path_segments", lambda expr: None):
+        slow_s = time_it(run, args.repeat)
+
+    print(f"records:     {args.records}")
+    print(f"lookups:     {n_evals}")
+    print(f"jsonpath_ng: {slow_s:.3f}s ({slow_s / n_evals * 1e6:.2f} us/lookup)")
+    print(f"fast path:   {fast_s:.3f}s ({fast_s / n_evals * 1e6:.2f} us/lookup)")
+    print(f"speedup:     {slow_s / fast_s:.1f}x")
+
+    batch_paths = [
+        f"ACTIONS.fetch.result.data.records[{i}].attributes.owner.email"
+        for i in range(args.batch_fields)
+    ]
+
+    def run_each() -> None:
+        for _ in range(args.iterations):
+            for path in batch_paths:
+                eval_jsonpath(path, operand)
+
+    def run_batch() -> None:
+        for _ in range(args.iterations):
+            resolve_jsonpaths(batch_paths, operand)
+
+    each_s = time_it(run_each, args.repeat)
+    batch_s = time_it(run_batch, args.repeat)
+    print(f"batch of {len(batch_paths)} paths:")
+    print(f"  per path:  {each_s:.3f}s")
+    print(f"  one walk:  {batch_s:.3f}s")
+    print(f"  speedup:   {each_s / batch_s:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
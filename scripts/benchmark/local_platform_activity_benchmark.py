@@ -0,0 +1,174 @@
+#!/usr/bin/env python
+"""Benchmark DSL platform activities as regular vs local Temporal activities.
+
+Runs a DSL workflow of N `core.transform.reshape` nodes through `DSLWorkflow`
+on a worker configured like production (`get_activities()` and the sandboxed
+workflow runner). Every node has a `run_if` condition that calls `FN.now()`,
+which can't be evaluated in the workflow, so each node makes the
+`evaluate_single_expression_activity` platform call and is then skipped. The
+nodes never reach the executor, so no executor worker or database is needed.
+
+The workflow runs once with regular and once with local platform activities,
+selected through `DSLRunArgs.execution_settings`. For each mode it reports
+end-to-end latency, history event count and history size.
+
+Runs against a Temporal dev server started by the Temporal test environment,
+or against an existing server with `--address`.
+
+Run with:
+    uv run python scripts/benchmark/local_platform_activity_benchmark.py --nodes 50
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from temporalio.client import Client
+from temporalio.common import RetryPolicy
+from temporalio.testing import WorkflowEnvironment
+from temporalio.worker import Worker
+
+from tracecat import config
+from tracecat.auth.types import Role
+from tracecat.dsl._converter import get_data_converter
+from tracecat.dsl.common import DSLEntrypoint, DSLInput, DSLRunArgs
+from tracecat.dsl.schemas import ActionStatement, DSLExecutionSettings
+from tracecat.dsl.worker import get_activities, new_sandbox_runner
+from tracecat.dsl.workflow import DSLWorkflow
+from tracecat.identifiers.workflow import WorkflowUUID, generate_exec_id
+from tracecat.registry.lock.types import RegistryLock
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+TASK_QUEUE = "local-platform-activity-benchmark"
+
+
+def build_dsl(n_nodes: int) -> DSLInput:
+    return DSLInput(
+        title=f"{n_nodes} guarded nodes",
+        description="Every node evaluates its run_if in a platform activity",
+        entrypoint=DSLEntrypoint(ref=None),
+        actions=[
+            ActionStatement(
+                ref=f"node_{i}",
+                action="core.transform.reshape",
+                args={"value": i},
+                run_if="${{ FN.now() == 'never' }}",
+            )
+            for i in range(n_nodes)
+        ],
+    )
+
+
+def build_role() -> Role:
+    return Role(
+        type="service",
+        organization_id=uuid.uuid4(),
+        workspace_id=uuid.uuid4(),
+        service_id="tracecat-runner",
+    )
+
+
+@dataclass(frozen=True)
+class RunStats:
+    mode: str
+    seconds: float
+    n_events: int
+    history_bytes: int
+
+
+async def run_once(
+    client: Client, *, dsl: DSLInput, role: Role, local: bool
+) -> RunStats:
+    wf_id = WorkflowUUID.new_uuid4()
+    handle = await client.start_workflow(
+        DSLWorkflow.run,
+        DSLRunArgs(
+            dsl=dsl,
+            role=role,
+            wf_id=wf_id,
+            registry_lock=RegistryLock(
+                origins={"tracecat_registry": "benchmark"},
+                actions={"core.transform.reshape": "tracecat_registry"},
+            ),
+            execution_settings=DSLExecutionSettings(local_platform_activities=local),
+        ),
+        id=generate_exec_id(wf_id),
+        task_queue=TASK_QUEUE,
+        retry_policy=RetryPolicy(maximum_attempts=1),
+    )
+    start = time.perf_counter()
+    await handle.result()
+    seconds = time.perf_counter() - start
+    n_events = 0
+    history_bytes = 0
+    async for event in handle.fetch_history_events():
+        n_events += 1
+        history_bytes += event.ByteSize()
+    return RunStats(
+        mode="local" if local else "regular",
+        seconds=seconds,
+        n_events=n_events,
+        history_bytes=history_bytes,
+    )
+
+
+@asynccontextmanager
+async def temporal_client(address: str | None) -> AsyncIterator[Client]:
+    data_converter = get_data_converter(
+        compression_enabled=config.TRACECAT__CONTEXT_COMPRESSION_ENABLED
+    )
+    if address is not None:
+        yield await Client.connect(address, data_converter=data_converter)
+        return
+    async with await WorkflowEnvironment.start_local(
+        data_converter=data_converter
+    ) as env:
+        yield env.client
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--nodes", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument(
+        "--address", help="Existing Temporal server, e.g. localhost:7233"
+    )
+    args = parser.parse_args()
+
+    dsl = build_dsl(args.nodes)
+    role = build_role()
+    async with temporal_client(args.address) as client:
+        with ThreadPoolExecutor(max_workers=4) as activity_executor:
+            async with Worker(
+                client,
+                task_queue=TASK_QUEUE,
+                workflows=[DSLWorkflow],
+                activities=get_activities(),
+                activity_executor=activity_executor,
+                workflow_runner=new_sandbox_runner(),
+            ):
+                print(f"{args.nodes} nodes, best of {args.repeat} runs")
+                print(f"{'mode':<8} {'latency':>10} {'events':>8} {'bytes':>10}")
+                for local in (False, True):
+                    runs = [
+                        await run_once(client, dsl=dsl, role=role, local=local)
+                        for _ in range(args.repeat)
+                    ]
+                    best = min(runs, key=lambda run: run.seconds)
+                    print(
+                        f"{best.mode:<8} {best.seconds * 1000:>8.1f}ms "
+                        f"{best.n_events:>8} {best.history_bytes:>10}"
+                    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
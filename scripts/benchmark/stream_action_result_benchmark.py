@@ -0,0 +1,139 @@
+#!/usr/bin/env python
+"""Micro-benchmark for stream-aware action result resolution in `DSLScheduler`.
+
+Builds a stream hierarchy of nested scatters, then resolves the actions every
+leaf stream references: a few root actions plus one result at each scatter
+level. Compares memoized resolution through `action_result_owners` against a
+full leaf-to-root walk per lookup (the index is cleared before every lookup).
+
+Run with:
+    uv run python scripts/benchmark/stream_action_result_benchmark.py --depth 6 --fanout 6
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+import uuid
+from collections.abc import Callable
+from datetime import UTC, datetime
+from typing import Any
+
+from tracecat.auth.types import Role
+from tracecat.authz.scopes import SERVICE_PRINCIPAL_SCOPES
+from tracecat.dsl.common import DSLEntrypoint, DSLInput
+from tracecat.dsl.scheduler import DSLScheduler
+from tracecat.dsl.schemas import (
+    ROOT_STREAM,
+    ActionStatement,
+    ExecutionContext,
+    RunContext,
+    StreamID,
+    TaskResult,
+)
+from tracecat.identifiers.workflow import WorkflowUUID
+
+ROOT_REFS = ("webhook", "lookup", "config")
+
+
+def build_scheduler(depth: int, fanout: int) -> tuple[DSLScheduler, list[StreamID]]:
+    async def executor(_: ActionStatement) -> None:
+        return None
+
+    wf_id = WorkflowUUID.new_uuid4()
+    scheduler = DSLScheduler(
+        executor=executor,
+        dsl=DSLInput(
+            title="benchmark",
+            description="benchmark",
+            entrypoint=DSLEntrypoint(ref="webhook"),
+            actions=[ActionStatement(ref="webhook", action="core.noop")],
+        ),
+        max_pending_tasks=16,
+        context=ExecutionContext(
+            ACTIONS={ref: TaskResult.from_result({"ref": ref}) for ref in ROOT_REFS},
+            TRIGGER=None,
+        ),
+        role=Role(
+            type="service",
+            service_id="tracecat-runner",
+            workspace_id=uuid.uuid4(),
+            user_id=uuid.uuid4(),
+            scopes=SERVICE_PRINCIPAL_SCOPES["tracecat-runner"],
+        ),
+        run_context=RunContext(
+            wf_id=wf_id,
+            wf_exec_id=f"{wf_id.short()}/exec_benchmark",
+            wf_run_id=uuid.uuid4(),
+            environment="benchmark",
+            logical_time=datetime.now(UTC),
+        ),
+    )
+
+    level = [ROOT_STREAM]
+    for d in range(depth):
+        scatter_ref = f"scatter_{d}"
+        next_level: list[StreamID] = []
+        for parent in level:
+            for i in range(fanout):
+                stream_id = StreamID.new(scatter_ref, i, base_stream_id=parent)
+                scheduler.stream_hierarchy[stream_id] = parent
+                scheduler.streams[stream_id] = ExecutionContext(
+                    ACTIONS={scatter_ref: TaskResult.from_result(i)}, TRIGGER=None
+                )
+                next_level.append(stream_id)
+        level = next_level
+    return scheduler, level
+
+
+def time_it(fn: Callable[[], Any], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--depth", type=int, default=6)
+    parser.add_argument("--fanout", type=int, default=6)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    scheduler, leaves = build_scheduler(args.depth, args.fanout)
+    refs = (*ROOT_REFS, *(f"scatter_{d}" for d in range(args.depth)))
+    resolve = scheduler.get_stream_aware_action_result
+
+    def run_walk() -> None:
+        owners = scheduler.action_result_owners
+        for leaf in leaves:
+            for ref in refs:
+                owners.clear()
+                resolve(ref, leaf)
+
+    def run_memoized() -> None:
+        scheduler.action_result_owners.clear()
+        for leaf in leaves:
+            for ref in refs:
+                resolve(ref, leaf)
+
+    walk = time_it(run_walk, args.repeat)
+    memoized = time_it(run_memoized, args.repeat)
+
+    lookups = len(leaves) * len(refs)
+    print(
+        f"{len(leaves)} leaf streams, depth {args.depth}, {len(refs)} refs/leaf, "
+        f"{lookups} lookups"
+    )
+    print(f"full walk: {walk * 1e3:9.2f} ms  ({walk / lookups * 1e6:.2f} us/lookup)")
+    print(
+        f"memoized:  {memoized * 1e3:9.2f} ms  "
+        f"({memoized / lookups * 1e6:.2f} us/lookup)"
+    )
+    print(f"speedup:   {walk / memoized:9.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+#!/usr/bin/env python
+"""Measure what passing a module through the workflow sandbox saves.
+
+Every new DSLWorkflow run creates a sandbox and re-imports the workflow module
+in it, except for passthrough modules, which are shared with the worker. This
+times creating a DSLWorkflow sandbox with WORKFLOW_PASSTHROUGH_MODULES, and
+with that list plus each candidate module. Runs are interleaved so that a
+change in machine load affects every variant alike.
+
+A candidate is only worth passing through if its median is clearly below the
+baseline. Modules that passthrough packages import are already shared
+transitively and show no gain.
+
+Run with:
+    uv run python scripts/benchmark/workflow_sandbox_startup_benchmark.py --runs 50
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import time
+
+from temporalio import workflow
+from temporalio.worker.workflow_sandbox import SandboxedWorkflowRunner
+
+from tracecat.dsl.worker import WORKFLOW_PASSTHROUGH_MODULES, new_sandbox_runner
+from tracecat.dsl.workflow import DSLWorkflow
+
+CANDIDATE_MODULES = (
+    "ply",
+    "lark",
+    "pydantic_core",
+    "pydantic_extra_types",
+    "orjson",
+    "yaml",
+    "loguru",
+    "sentry_sdk",
+)
+
+
+def sandbox_seconds(runner: SandboxedWorkflowRunner) -> float:
+    defn = workflow._Definition.must_from_class(DSLWorkflow)
+    start = time.perf_counter()
+    runner.prepare_workflow(defn)
+    return time.perf_counter() - start
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=50)
+    parser.add_argument("modules", nargs="*", default=CANDIDATE_MODULES)
+    args = parser.parse_args()
+
+    runners = {"baseline": new_sandbox_runner()}
+    for module in args.modules:
+        runners[f"+{module}"] = new_sandbox_runner(
+            WORKFLOW_PASSTHROUGH_MODULES | {module}
+        )
+    if len(args.modules) > 1:
+        runners["+all"] = new_sandbox_runner(
+            WORKFLOW_PASSTHROUGH_MODULES | set(args.modules)
+        )
+
+    # Workflow instances attach to the running event loop when they're created.
+    # The first sandbox of each runner also pays one-off imports in the worker
+    for runner in runners.values():
+        sandbox_seconds(runner)
+    durations: dict[str, list[float]] = {name: [] for name in runners}
+    for _ in range(args.runs):
+        for name, runner in runners.items():
+            durations[name].append(sandbox_seconds(runner))
+
+    baseline = statistics.median(durations["baseline"])
+    print(f"{args.runs} interleaved runs per variant")
+    print(f"{'passthrough':<24} {'median':>9} {'p95':>9} {'vs baseline':>12}")
+    for name, values in durations.items():
+        values.sort()
+        median = statistics.median(values)
+        p95 = values[min(len(values) - 1, int(len(values) * 0.95))]
+        print(
+            f"{name:<24} {median * 1000:>7.1f}ms {p95 * 1000:>7.1f}ms "
+            f"{(median - baseline) / baseline:>+11.1%}"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
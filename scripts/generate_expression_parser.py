@@ -0,0 +1,97 @@
+"""Generate the serialized LALR parser for the template expression grammar.
+
+Building `Lark(grammar, parser="lalr")` computes the LALR tables on every
+process start. This script serializes the tables into
+`tracecat/expressions/parser/_generated.py`, which `ExprParser` loads instead
+of compiling the grammar, as long as the grammar digest and lark version match.
+
+Usage:
+    uv run python scripts/generate_expression_parser.py          # regenerate
+    uv run python scripts/generate_expression_parser.py --check  # verify in sync
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+import lark
+from lark import Lark
+from lark.grammar import Rule
+from lark.lexer import TerminalDef
+
+from tracecat.expressions.parser.grammar import grammar, grammar_sha256
+
+START_RULE = "root"
+OUTPUT_PATH = (
+    Path(__file__).resolve().parents[1]
+    / "tracecat"
+    / "expressions"
+    / "parser"
+    / "_generated.py"
+)
+
+
+def render() -> str:
+    parser = Lark(grammar, start=START_RULE, parser="lalr")
+    data, memo = parser.memo_serialize([TerminalDef, Rule])
+    lines = [
+        '"""Serialized LALR parser for the template expression grammar.',
+        "",
+        "Generated by scripts/generate_expression_parser.py. Do not edit.",
+        '"""',
+        "",
+        "from lark import Token",
+        "",
+        f"LARK_VERSION = {lark.__version__!r}",
+        f"GRAMMAR_SHA256 = {grammar_sha256()!r}",
+        f"START = {START_RULE!r}",
+        f"DATA = {data!r}",
+        f"MEMO = {memo!r}",
+        "",
+    ]
+    return "\n".join(lines)
+
+
+def is_up_to_date() -> bool:
+    try:
+        from tracecat.expressions.parser import _generated
+    except ImportError:
+        return False
+    return (
+        _generated.GRAMMAR_SHA256 == grammar_sha256()
+        and _generated.LARK_VERSION == lark.__version__
+        and _generated.START == START_RULE
+    )
+
+
+def main() -> int:
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument(
+        "--check",
+        action="store_true",
+        help="Exit non-zero if the generated parser is out of date.",
+    )
+    args = arg_parser.parse_args()
+
+    if args.check:
+        # LALR table serialization is not byte-for-byte deterministic across
+        # runs, so compare the recorded grammar digest and lark version instead.
+        if not is_up_to_date():
+            print(
+                f"{OUTPUT_PATH} is out of date. "
+                "Run `just gen-expression-parser` to regenerate it.",
+                file=sys.stderr,
+            )
+            return 1
+        print(f"{OUTPUT_PATH} is up to date.")
+        return 0
+
+    OUTPUT_PATH.write_text(render())
+    print(f"Wrote {OUTPUT_PATH}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,10 +3,18 @@
 from __future__ import annotations
 
 import uuid
+from datetime import timedelta
 from types import SimpleNamespace
 from typing import Any, cast
 
-from tracecat.dsl.common import build_action_statements_from_actions
+import pytest
+
+from tracecat.dsl import common as common_module
+from tracecat.dsl.common import (
+    RETRY_POLICIES,
+    build_action_statements_from_actions,
+    execute_platform_activity,
+)
 from tracecat.dsl.view import (
     RFEdge,
     RFGraph,
@@ -186,3 +194,47 @@ api_version: 2025-09-01
     assert statements[0].args["api_version"] == "2025-09-01"
     validated_args = expectation_model.model_validate(statements[0].args)
     assert validated_args.model_dump()["api_version"] == "2025-09-01"
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize(
+    ("local", "patched", "expected_kind"),
+    [
+        (True, True, "local"),
+        (True, False, "regular"),
+        (False, True, "regular"),
+    ],
+)
+async def test_execute_platform_activity_selects_activity_kind(
+    monkeypatch: pytest.MonkeyPatch, local: bool, patched: bool, expected_kind: str
+) -> None:
+    calls: list[tuple[str, Any]] = []
+
+    def activity_fn(expression: str, context: dict[str, Any]) -> Any:
+        raise AssertionError("The activity is dispatched, not called")
+
+    async def execute_local_activity(fn: Any, *, args: Any, **_: Any) -> str:
+        calls.append(("local", args))
+        return "result"
+
+    async def execute_activity(fn: Any, *, args: Any, **_: Any) -> str:
+        calls.append(("regular", args))
+        return "result"
+
+    monkeypatch.setattr(common_module.workflow, "patched", lambda _: patched)
+    monkeypatch.setattr(
+        common_module.workflow, "execute_local_activity", execute_local_activity
+    )
+    monkeypatch.setattr(common_module.workflow, "execute_activity", execute_activity)
+
+    result = await execute_platform_activity(
+        activity_fn,
+        "${{ 1 }}",
+        {},
+        local=local,
+        start_to_close_timeout=timedelta(seconds=5),
+        retry_policy=RETRY_POLICIES["activity:fail_fast"],
+    )
+
+    assert result == "result"
+    assert calls == [(expected_kind, ("${{ 1 }}", {}))]
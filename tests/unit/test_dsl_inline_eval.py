@@ -0,0 +1,189 @@
+import uuid
+from datetime import UTC, datetime
+from typing import Any
+
+import pytest
+
+from tracecat.auth.types import Role
+from tracecat.authz.scopes import SERVICE_PRINCIPAL_SCOPES
+from tracecat.dsl import scheduler as scheduler_module
+from tracecat.dsl._converter import PydanticPayloadConverter
+from tracecat.dsl.action import DSLActivities
+from tracecat.dsl.common import DSLEntrypoint, DSLInput
+from tracecat.dsl.inline_eval import (
+    InlineEvaluationUnavailable,
+    evaluate_expression_inline,
+)
+from tracecat.dsl.scheduler import DSLScheduler
+from tracecat.dsl.schemas import (
+    ActionStatement,
+    ExecutionContext,
+    RunContext,
+    TaskResult,
+)
+from tracecat.identifiers.workflow import WorkflowUUID
+from tracecat.storage.object import ExternalObject, InlineObject, ObjectRef
+
+
+def _external() -> ExternalObject:
+    return ExternalObject(
+        ref=ObjectRef(
+            bucket="tracecat-workflow",
+            key="results/large.json",
+            size_bytes=1_000_000,
+            sha256="0" * 64,
+        )
+    )
+
+
+@pytest.fixture
+def context() -> ExecutionContext:
+    return ExecutionContext(
+        ACTIONS={
+            "a": TaskResult.from_result(
+                {"ok": True, "count": 3, "items": ["x", "y"], "pair": (1, 2)}
+            ),
+            "item": TaskResult.from_collection_item(
+                InlineObject(data=[{"id": 1}, {"id": 2}]), 1, "dict"
+            ),
+        },
+        TRIGGER=InlineObject(data={"severity": "high"}),
+        ENV={
+            "workflow": {"start_time": datetime(2024, 1, 1, tzinfo=UTC)},
+            "environment": "default",
+        },
+        var={"x": 5},
+    )
+
+
+def _evaluate_in_activity(expression: str, context: ExecutionContext) -> Any:
+    """Evaluate with the activity, on the context as the activity receives it."""
+    converter = PydanticPayloadConverter()
+    payload = converter.to_payload(context)
+    assert payload is not None
+    return DSLActivities.evaluate_single_expression_activity(
+        expression, converter.from_payload(payload, ExecutionContext)
+    )
+
+
+@pytest.mark.parametrize(
+    "expression",
+    [
+        "${{ ACTIONS.a.result.ok == True }}",
+        "${{ ACTIONS.a.result.count > 2 && TRIGGER.severity == 'high' }}",
+        "${{ FN.length(ACTIONS.a.result.items) }}",
+        "${{ ACTIONS.a.result.pair }}",
+        "${{ ACTIONS.item.result.id }}",
+        "${{ ACTIONS.missing.result }}",
+        "${{ ENV.workflow.start_time }}",
+        "${{ var.x + 1 }}",
+        "  ${{ FN.regex_match('^h', TRIGGER.severity) }}  ",
+    ],
+)
+def test_inline_evaluation_matches_activity(
+    expression: str, context: ExecutionContext
+) -> None:
+    assert evaluate_expression_inline(expression, context) == _evaluate_in_activity(
+        expression, context
+    )
+
+
+def test_externalized_action_result_is_unavailable(context: ExecutionContext) -> None:
+    context["ACTIONS"]["big"] = TaskResult(result=_external(), result_typename="dict")
+
+    with pytest.raises(InlineEvaluationUnavailable):
+        evaluate_expression_inline("${{ ACTIONS.big.result.ok }}", context)
+    # Externalized results the expression does not read are not materialized.
+    assert evaluate_expression_inline("${{ ACTIONS.a.result.ok }}", context) is True
+
+
+@pytest.mark.parametrize(
+    "expression",
+    [
+        # Non-deterministic functions
+        "${{ FN.now() > ACTIONS.a.result.count }}",
+        "${{ FN.uuid4() }}",
+        # Errors are reported by the activity
+        "${{ ACTIONS.a.result.count + 'x' }}",
+        "${{ ACTIONS.a.result. }}",
+        "",
+        "ACTIONS.a.result.ok",
+    ],
+)
+def test_inline_evaluation_unavailable(
+    expression: str, context: ExecutionContext
+) -> None:
+    with pytest.raises(InlineEvaluationUnavailable):
+        evaluate_expression_inline(expression, context)
+
+
+def test_externalized_trigger_is_unavailable(context: ExecutionContext) -> None:
+    context["TRIGGER"] = _external()
+
+    with pytest.raises(InlineEvaluationUnavailable):
+        evaluate_expression_inline("${{ TRIGGER.severity }}", context)
+    assert evaluate_expression_inline("${{ ACTIONS.a.result.count }}", context) == 3
+
+
+@pytest.fixture
+def scheduler(context: ExecutionContext) -> DSLScheduler:
+    async def executor(_: ActionStatement) -> None:
+        return None
+
+    wf_id = WorkflowUUID.new_uuid4()
+    return DSLScheduler(
+        executor=executor,
+        dsl=DSLInput(
+            title="test",
+            description="test",
+            entrypoint=DSLEntrypoint(ref="a"),
+            actions=[ActionStatement(ref="a", action="core.noop")],
+        ),
+        max_pending_tasks=16,
+        context=context,
+        role=Role(
+            type="service",
+            service_id="tracecat-runner",
+            workspace_id=uuid.uuid4(),
+            scopes=SERVICE_PRINCIPAL_SCOPES["tracecat-runner"],
+        ),
+        run_context=RunContext(
+            wf_id=wf_id,
+            wf_exec_id=f"{wf_id.short()}/exec_test",
+            wf_run_id=uuid.uuid4(),
+            environment="test",
+            logical_time=datetime.now(UTC),
+        ),
+    )
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize(
+    ("patched", "expression", "uses_activity"),
+    [
+        (True, "${{ ACTIONS.a.result.ok }}", False),
+        (True, "${{ FN.now() }}", True),
+        (False, "${{ ACTIONS.a.result.ok }}", True),
+    ],
+)
+async def test_resolve_condition_falls_back_to_activity(
+    monkeypatch: pytest.MonkeyPatch,
+    scheduler: DSLScheduler,
+    context: ExecutionContext,
+    patched: bool,
+    expression: str,
+    uses_activity: bool,
+) -> None:
+    activity_calls: list[str] = []
+
+    async def resolve_expression(expression: str, context: ExecutionContext) -> Any:
+        activity_calls.append(expression)
+        return "from-activity"
+
+    monkeypatch.setattr(scheduler_module.workflow, "patched", lambda patch_id: patched)
+    monkeypatch.setattr(scheduler, "resolve_expression", resolve_expression)
+
+    result = await scheduler.resolve_condition(expression, context)
+
+    assert activity_calls == ([expression] if uses_activity else [])
+    assert (result == "from-activity") is uses_activity
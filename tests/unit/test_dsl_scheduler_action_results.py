@@ -0,0 +1,236 @@
+from __future__ import annotations
+
+import uuid
+from datetime import UTC, datetime
+from typing import Any
+
+import pytest
+
+from tracecat.auth.types import Role
+from tracecat.authz.scopes import SERVICE_PRINCIPAL_SCOPES
+from tracecat.dsl.common import DSLEntrypoint, DSLInput
+from tracecat.dsl.scheduler import DSLScheduler, LoopRegion
+from tracecat.dsl.schemas import (
+    ROOT_STREAM,
+    ActionStatement,
+    ExecutionContext,
+    RunContext,
+    StreamID,
+    TaskResult,
+)
+from tracecat.dsl.types import Task
+from tracecat.identifiers.workflow import WorkflowUUID
+from tracecat.storage.object import ExternalObject, InlineObject, ObjectRef
+
+
+@pytest.fixture
+def scheduler() -> DSLScheduler:
+    async def executor(_: ActionStatement) -> None:
+        return None
+
+    wf_id = WorkflowUUID.new_uuid4()
+    return DSLScheduler(
+        executor=executor,
+        dsl=DSLInput(
+            title="test",
+            description="test",
+            entrypoint=DSLEntrypoint(ref="a"),
+            actions=[ActionStatement(ref="a", action="core.noop")],
+        ),
+        max_pending_tasks=16,
+        context=ExecutionContext(
+            ACTIONS={"a": TaskResult.from_result("root")}, TRIGGER=None
+        ),
+        role=Role(
+            type="service",
+            service_id="tracecat-runner",
+            workspace_id=uuid.uuid4(),
+            user_id=uuid.uuid4(),
+            scopes=SERVICE_PRINCIPAL_SCOPES["tracecat-runner"],
+        ),
+        run_context=RunContext(
+            wf_id=wf_id,
+            wf_exec_id=f"{wf_id.short()}/exec_test",
+            wf_run_id=uuid.uuid4(),
+            environment="test",
+            logical_time=datetime.now(UTC),
+        ),
+    )
+
+
+def _add_stream(
+    scheduler: DSLScheduler, scope: str, index: int, parent: StreamID
+) -> StreamID:
+    stream_id = StreamID.new(scope, index, base_stream_id=parent)
+    scheduler.stream_hierarchy[stream_id] = parent
+    scheduler.streams[stream_id] = ExecutionContext(
+        ACTIONS={scope: TaskResult.from_result(index)}, TRIGGER=None
+    )
+    return stream_id
+
+
+def _result(scheduler: DSLScheduler, ref: str, stream_id: StreamID) -> Any:
+    result = scheduler.get_stream_aware_action_result(ref, stream_id)
+    return None if result is None else result.get_data()
+
+
+def test_stream_aware_result_memoizes_owner_of_visited_streams(
+    scheduler: DSLScheduler,
+) -> None:
+    outer = _add_stream(scheduler, "outer", 0, ROOT_STREAM)
+    inner = _add_stream(scheduler, "inner", 1, outer)
+
+    assert _result(scheduler, "a", inner) == "root"
+    assert _result(scheduler, "outer", inner) == 0
+    assert _result(scheduler, "missing", inner) is None
+    assert scheduler.action_result_owners["a"] == {
+        inner: ROOT_STREAM,
+        outer: ROOT_STREAM,
+        ROOT_STREAM: ROOT_STREAM,
+    }
+    assert scheduler.action_result_owners["outer"] == {inner: outer, outer: outer}
+    assert scheduler.action_result_owners["missing"] == {}
+
+    # A sibling stops at the first memoized ancestor.
+    sibling = _add_stream(scheduler, "inner", 2, outer)
+    assert _result(scheduler, "a", sibling) == "root"
+    assert scheduler.action_result_owners["a"][sibling] == ROOT_STREAM
+
+
+def test_stream_aware_result_sees_overwrites_and_shadowing(
+    scheduler: DSLScheduler,
+) -> None:
+    outer = _add_stream(scheduler, "outer", 0, ROOT_STREAM)
+    inner = _add_stream(scheduler, "inner", 0, outer)
+    assert _result(scheduler, "a", inner) == "root"
+
+    # Overwriting the owner's result keeps the memoized owner valid.
+    scheduler.set_action_result(ROOT_STREAM, "a", TaskResult.from_result("again"))
+    assert scheduler.action_result_owners["a"][inner] == ROOT_STREAM
+    assert _result(scheduler, "a", inner) == "again"
+
+    # A new result closer to the leaf shadows the memoized ancestor.
+    scheduler.set_action_result(outer, "a", TaskResult.from_result("outer"))
+    assert _result(scheduler, "a", inner) == "outer"
+    assert _result(scheduler, "a", ROOT_STREAM) == "again"
+
+
+def test_loop_stream_cleanup_drops_memoized_owners(scheduler: DSLScheduler) -> None:
+    outer = _add_stream(scheduler, "outer", 0, ROOT_STREAM)
+    inner = _add_stream(scheduler, "inner", 0, outer)
+    scheduler.task_streams[Task(ref="outer", stream_id=ROOT_STREAM)] = [outer]
+    assert _result(scheduler, "a", inner) == "root"
+    assert _result(scheduler, "outer", inner) == 0
+
+    region = LoopRegion(
+        start_ref="loop",
+        end_ref="loop_end",
+        scope_ref="loop",
+        members=frozenset({"outer", "loop_end"}),
+    )
+    scheduler._cleanup_loop_descendant_streams(region, ROOT_STREAM)
+
+    assert scheduler.action_result_owners["a"] == {ROOT_STREAM: ROOT_STREAM}
+    assert scheduler.action_result_owners["outer"] == {}
+
+    # A stream recreated with the same ID resolves against its new context.
+    outer = _add_stream(scheduler, "outer", 0, ROOT_STREAM)
+    scheduler.streams[outer]["ACTIONS"]["outer"] = TaskResult.from_result("new")
+    inner = _add_stream(scheduler, "inner", 0, outer)
+    assert _result(scheduler, "outer", inner) == "new"
+
+
+def test_task_expressions_are_extracted_once_per_definition(
+    scheduler: DSLScheduler, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    import tracecat.dsl.scheduler as scheduler_module
+
+    calls: list[str] = []
+    extract = scheduler_module.extract_expressions
+
+    def counting_extract(args):
+        calls.append(args["ref"])
+        return extract(args)
+
+    monkeypatch.setattr(scheduler_module, "extract_expressions", counting_extract)
+    stmt = ActionStatement(
+        ref="b",
+        action="core.transform.reshape",
+        args={"value": "${{ ACTIONS.a.result }}"},
+    )
+    scheduler.tasks[stmt.ref] = stmt
+
+    streams = [_add_stream(scheduler, "outer", i, ROOT_STREAM) for i in range(3)]
+    for stream_id in streams:
+        context = scheduler.build_stream_aware_context(stmt, stream_id)
+        assert context["ACTIONS"]["a"].get_data() == "root"
+    assert calls == ["b"]
+
+    # A statement that isn't the scheduler's own definition is never cached.
+    other = stmt.model_copy()
+    scheduler.build_stream_aware_context(other, streams[0])
+    scheduler.build_stream_aware_context(other, streams[0])
+    assert calls == ["b", "b", "b"]
+
+
+@pytest.mark.parametrize(
+    ("args", "expected"),
+    [
+        pytest.param({}, None, id="unreferenced"),
+        pytest.param(
+            {"value": "${{ TRIGGER.alert.id }}", "n": "${{ TRIGGER.count + 1 }}"},
+            {"alert": {"id": 1}, "count": 2},
+            id="keys",
+        ),
+        pytest.param(
+            {"value": "${{ TRIGGER.missing }}"},
+            {},
+            id="missing-key",
+        ),
+        pytest.param(
+            {"value": "${{ TRIGGER.alert }}", "all": "${{ TRIGGER }}"},
+            {"alert": {"id": 1}, "count": 2, "blob": "x" * 1024},
+            id="whole-trigger",
+        ),
+    ],
+)
+def test_action_input_context_prunes_trigger(
+    scheduler: DSLScheduler, args: dict[str, Any], expected: Any
+) -> None:
+    trigger = InlineObject(data={"alert": {"id": 1}, "count": 2, "blob": "x" * 1024})
+    scheduler._root_context["TRIGGER"] = trigger
+    args = {**args, "a": "${{ ACTIONS.a.result }}"}
+    stmt = ActionStatement(ref="b", action="core.transform.reshape", args=args)
+    scheduler.tasks[stmt.ref] = stmt
+
+    context = scheduler.build_action_input_context(stmt, ROOT_STREAM)
+
+    pruned = context["TRIGGER"]
+    if expected is None:
+        assert pruned is None
+    else:
+        assert isinstance(pruned, InlineObject)
+        assert pruned.data == expected
+    assert context["ACTIONS"]["a"].get_data() == "root"
+    # The root context and other consumers still see the full trigger
+    assert scheduler._root_context["TRIGGER"] is trigger
+    full_context = scheduler.build_stream_aware_context(stmt, ROOT_STREAM)
+    assert full_context["TRIGGER"] is trigger
+
+
+def test_action_input_context_keeps_external_trigger_handle(
+    scheduler: DSLScheduler,
+) -> None:
+    trigger = ExternalObject(
+        ref=ObjectRef(bucket="b", key="trigger.json", size_bytes=1, sha256="0" * 64)
+    )
+    scheduler._root_context["TRIGGER"] = trigger
+    stmt = ActionStatement(
+        ref="b",
+        action="core.transform.reshape",
+        args={"value": "${{ TRIGGER.alert }}"},
+    )
+
+    context = scheduler.build_action_input_context(stmt, ROOT_STREAM)
+
+    assert context["TRIGGER"] is trigger
@@ -21,15 +21,19 @@ def _build_scheduler(
     total_tasks: int,
     executor: Callable[[ActionStatement], Awaitable[None]],
     max_pending_tasks: int | None = None,
+    actions: list[ActionStatement] | None = None,
+    critical_path_ordering: bool = False,
 ) -> DSLScheduler:
+    if actions is None:
+        actions = [
+            ActionStatement(ref=f"task_{index}", action="core.noop")
+            for index in range(total_tasks)
+        ]
     dsl = DSLInput(
         title="test",
         description="test",
-        entrypoint=DSLEntrypoint(ref="task_0"),
-        actions=[
-            ActionStatement(ref=f"task_{index}", action="core.noop")
-            for index in range(total_tasks)
-        ],
+        entrypoint=DSLEntrypoint(ref=actions[0].ref),
+        actions=actions,
     )
     wf_id = WorkflowUUID.new_uuid4()
     test_role = Role(
@@ -52,6 +56,7 @@ def _build_scheduler(
         context=ExecutionContext(ACTIONS={}, TRIGGER=None),
         role=test_role,
         run_context=test_run_context,
+        critical_path_ordering=critical_path_ordering,
     )
 
 
@@ -184,3 +189,97 @@ async def test_scheduler_stops_spawning_after_failure_during_spawn_yield() -> No
     first_unstarted_ref = f"task_{scheduler_module._SCHEDULER_TASK_SPAWN_YIELD_EVERY}"
     assert len(started_refs) == scheduler_module._SCHEDULER_TASK_SPAWN_YIELD_EVERY
     assert first_unstarted_ref not in started_refs
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize(
+    ("critical_path_ordering", "expected"),
+    [
+        pytest.param(
+            False,
+            ["start", "a_fan_0", "a_fan_1", "a_fan_2", "chain_0", "chain_1", "chain_2"],
+            id="fifo",
+        ),
+        pytest.param(
+            True,
+            ["start", "chain_0", "chain_1", "a_fan_0", "a_fan_1", "a_fan_2", "chain_2"],
+            id="critical-path",
+        ),
+    ],
+)
+async def test_scheduler_orders_ready_tasks(
+    critical_path_ordering: bool, expected: list[str]
+) -> None:
+    started_refs: list[str] = []
+
+    async def executor(stmt: ActionStatement) -> None:
+        started_refs.append(stmt.ref)
+
+    actions = [
+        ActionStatement(ref="start", action="core.noop"),
+        *(
+            ActionStatement(ref=f"a_fan_{i}", action="core.noop", depends_on=["start"])
+            for i in range(3)
+        ),
+        ActionStatement(ref="chain_0", action="core.noop", depends_on=["start"]),
+        ActionStatement(ref="chain_1", action="core.noop", depends_on=["chain_0"]),
+        ActionStatement(ref="chain_2", action="core.noop", depends_on=["chain_1"]),
+    ]
+    scheduler = _build_scheduler(
+        total_tasks=len(actions),
+        max_pending_tasks=1,
+        executor=executor,
+        actions=actions,
+        critical_path_ordering=critical_path_ordering,
+    )
+
+    result = await asyncio.wait_for(scheduler.start(), timeout=2)
+
+    assert result is None
+    assert scheduler.critical_path_lengths["start"] == 4
+    # Ties (the fan-out and the end of the chain) keep FIFO order
+    assert started_refs == expected
+
+
+def test_scheduler_prefetch_hint_covers_next_actions() -> None:
+    async def executor(stmt: ActionStatement) -> None:
+        return None
+
+    actions = [
+        ActionStatement(ref="start", action="core.noop"),
+        ActionStatement(
+            ref="fetch",
+            action="core.http_request",
+            args={
+                "url": "${{ VARS.settings.url }}",
+                "headers": {"Authorization": "${{ SECRETS.api.TOKEN }}"},
+            },
+            depends_on=["start"],
+        ),
+        ActionStatement(
+            ref="other_env",
+            action="core.noop",
+            args={"value": "${{ SECRETS.staging_api.TOKEN }}"},
+            environment="staging",
+            depends_on=["start"],
+        ),
+        ActionStatement(
+            ref="after",
+            action="core.noop",
+            args={"value": "${{ SECRETS.later.TOKEN }}"},
+            depends_on=["fetch"],
+        ),
+    ]
+    scheduler = _build_scheduler(
+        total_tasks=len(actions), executor=executor, actions=actions
+    )
+
+    hint = scheduler.get_prefetch_hint(scheduler.tasks["start"])
+
+    assert hint is not None
+    assert hint.actions == ["core.http_request"]
+    assert hint.secrets == ["api"]
+    assert hint.variables == ["settings"]
+    assert scheduler.get_prefetch_hint(scheduler.tasks["start"]) is hint
+    assert scheduler.get_prefetch_hint(scheduler.tasks["other_env"]) is None
+    assert scheduler.get_prefetch_hint(scheduler.tasks["after"]) is None
@@ -0,0 +1,355 @@
+from __future__ import annotations
+
+import asyncio
+import uuid
+from datetime import UTC, datetime
+from typing import Any
+
+import pytest
+
+from tracecat.auth.types import Role
+from tracecat.contexts import ctx_stream_id
+from tracecat.dsl import scheduler as scheduler_module
+from tracecat.dsl.action import DSLActivities, FinalizeGatherActivityResult
+from tracecat.dsl.common import DSLEntrypoint, DSLInput
+from tracecat.dsl.scheduler import DSLScheduler, DSLSchedulerCheckpoint
+from tracecat.dsl.schemas import (
+    ROOT_STREAM,
+    ActionStatement,
+    DSLExecutionSettings,
+    ExecutionContext,
+    RunContext,
+    StreamID,
+    TaskResult,
+)
+from tracecat.identifiers.workflow import WorkflowUUID
+from tracecat.storage.collection import CollectionActivities
+from tracecat.storage.object import CollectionObject, InlineObject, ObjectRef
+
+_stored_chunks: dict[str, list[Any]] = {}
+"""Gather chunks stored by the fake activity, by manifest key"""
+
+
+async def _fake_execute_activity(fn: Any, *, args: Any, **_: Any) -> Any:
+    arg = args[0]
+    if fn is DSLActivities.handle_scatter_input_activity:
+        return InlineObject(data=arg.collection)
+    if fn is DSLActivities.evaluate_templated_object_activity:
+        return InlineObject(data=arg.operand["ACTIONS"]["s"].get_data() * 10)
+    if fn is CollectionActivities.store_collection_activity:
+        prefix, items, element_kind = args
+        key = f"{prefix}/manifest.json"
+        _stored_chunks[key] = list(items)
+        return CollectionObject(
+            manifest_ref=ObjectRef(bucket="test", key=key, size_bytes=0, sha256=""),
+            count=len(items),
+            chunk_size=len(items),
+            element_kind=element_kind,
+        )
+    if fn is DSLActivities.finalize_gather_activity:
+        items = list(arg.collection)
+        for part in arg.parts:
+            if isinstance(part, CollectionObject):
+                part = _stored_chunks[part.manifest_ref.key]
+            items.extend(item for item in part if item is not None)
+        return FinalizeGatherActivityResult(
+            result=InlineObject(data=[item.data for item in items])
+        )
+    raise AssertionError(f"Unexpected activity {fn}")
+
+
+@pytest.fixture
+def lazy_scatter(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(scheduler_module.workflow, "patched", lambda _: True)
+    monkeypatch.setattr(
+        scheduler_module.workflow, "execute_local_activity", _fake_execute_activity
+    )
+
+
+def _build_scheduler(
+    *,
+    items: list[int],
+    max_pending_tasks: int,
+    executor: Any,
+    batch_size: int | None = None,
+    batch_executor: Any = None,
+    should_checkpoint: Any = None,
+    run_if: str | None = None,
+    chunk_size: int = 256,
+) -> DSLScheduler:
+    dsl = DSLInput(
+        title="test",
+        description="test",
+        entrypoint=DSLEntrypoint(ref="s"),
+        actions=[
+            ActionStatement(
+                ref="s",
+                action="core.transform.scatter",
+                args={"collection": items, "batch_size": batch_size},
+            ),
+            ActionStatement(
+                ref="b", action="core.noop", depends_on=["s"], run_if=run_if
+            ),
+            ActionStatement(
+                ref="g",
+                action="core.transform.gather",
+                args={"items": "${{ ACTIONS.b.result }}"},
+                depends_on=["b"],
+            ),
+            ActionStatement(ref="after", action="core.noop", depends_on=["g"]),
+        ],
+    )
+    wf_id = WorkflowUUID.new_uuid4()
+    return DSLScheduler(
+        executor=executor,
+        dsl=dsl,
+        max_pending_tasks=max_pending_tasks,
+        context=ExecutionContext(ACTIONS={}, TRIGGER=None),
+        role=Role(
+            type="service",
+            service_id="tracecat-runner",
+            workspace_id=uuid.uuid4(),
+            user_id=uuid.uuid4(),
+        ),
+        run_context=RunContext(
+            wf_id=wf_id,
+            wf_exec_id=f"{wf_id.short()}/exec_test",
+            wf_run_id=uuid.uuid4(),
+            environment="test",
+            logical_time=datetime.now(UTC),
+        ),
+        batch_executor=batch_executor,
+        should_checkpoint=should_checkpoint,
+        execution_settings=DSLExecutionSettings(
+            local_platform_activities=True,
+            result_externalization_enabled=True,
+            collection_chunk_size=chunk_size,
+        ),
+    )
+
+
+@pytest.mark.anyio
+@pytest.mark.usefixtures("lazy_scatter")
+async def test_lazy_scatter_bounds_live_streams() -> None:
+    n_items = 100
+    max_pending_tasks = 4
+    executed: list[tuple[str, str]] = []
+    peak_streams = 0
+
+    async def executor(stmt: ActionStatement) -> None:
+        nonlocal peak_streams
+        executed.append((stmt.ref, ctx_stream_id.get()))
+        peak_streams = max(peak_streams, len(scheduler.streams))
+        await asyncio.sleep(0)
+
+    scheduler = _build_scheduler(
+        items=list(range(n_items)),
+        max_pending_tasks=max_pending_tasks,
+        executor=executor,
+    )
+
+    result = await asyncio.wait_for(scheduler.start(), timeout=5)
+
+    assert result is None
+    assert [ref for ref, _ in executed].count("b") == n_items
+    assert executed[-2:] == [("g", ROOT_STREAM), ("after", ROOT_STREAM)]
+    assert scheduler.get_context(ROOT_STREAM)["ACTIONS"]["g"].get_data() == [
+        i * 10 for i in range(n_items)
+    ]
+    # Live streams are bounded by the scheduling window, not the collection
+    assert peak_streams <= max_pending_tasks + 2
+    # Finished streams leave no bookkeeping behind
+    assert set(scheduler.streams) == {ROOT_STREAM}
+    assert scheduler.stream_work == {}
+    assert scheduler.stream_refs == {}
+    assert not scheduler.pending_scatters
+    assert all(task.stream_id == ROOT_STREAM for task in scheduler.indegrees)
+    assert all(edge.stream_id == ROOT_STREAM for edge in scheduler.edges)
+
+
+@pytest.mark.anyio
+@pytest.mark.usefixtures("lazy_scatter")
+async def test_lazy_scatter_preserves_item_order_with_single_slot() -> None:
+    executed_streams: list[str] = []
+
+    async def executor(stmt: ActionStatement) -> None:
+        if stmt.ref == "b":
+            executed_streams.append(ctx_stream_id.get())
+
+    scheduler = _build_scheduler(
+        items=[3, 1, 2], max_pending_tasks=1, executor=executor
+    )
+
+    result = await asyncio.wait_for(scheduler.start(), timeout=5)
+
+    assert result is None
+    assert executed_streams == [
+        StreamID.new("s", i, base_stream_id=ROOT_STREAM) for i in range(3)
+    ]
+    assert scheduler.get_context(ROOT_STREAM)["ACTIONS"]["g"].get_data() == [
+        30,
+        10,
+        20,
+    ]
+
+
+@pytest.mark.anyio
+@pytest.mark.usefixtures("lazy_scatter")
+async def test_lazy_scatter_batches_cheap_actions() -> None:
+    n_items = 10
+    executed: list[str] = []
+    batches: list[list[StreamID]] = []
+
+    async def executor(stmt: ActionStatement) -> None:
+        executed.append(stmt.ref)
+
+    async def batch_executor(
+        stmt: ActionStatement, stream_ids: list[StreamID]
+    ) -> list[BaseException | None]:
+        assert stmt.ref == "b"
+        batches.append(stream_ids)
+        await asyncio.sleep(0)
+        errors: list[BaseException | None] = []
+        for stream_id in stream_ids:
+            _, index = stream_id.leaf
+            if index == 3:
+                errors.append(ValueError("boom"))
+            else:
+                scheduler.set_action_result(
+                    stream_id, "b", TaskResult.from_result(index)
+                )
+                errors.append(None)
+        return errors
+
+    scheduler = _build_scheduler(
+        items=list(range(n_items)),
+        max_pending_tasks=8,
+        executor=executor,
+        batch_size=4,
+        batch_executor=batch_executor,
+    )
+
+    result = await asyncio.wait_for(scheduler.start(), timeout=5)
+
+    assert result is None
+    # The action only ran through the batch executor, a few items at a time
+    assert "b" not in executed
+    assert 1 < len(batches) < n_items
+    assert all(len(batch) <= 4 for batch in batches)
+    assert sorted(stream_id for batch in batches for stream_id in batch) == sorted(
+        StreamID.new("s", i, base_stream_id=ROOT_STREAM) for i in range(n_items)
+    )
+    # Each item's error stays in its own stream
+    gathered = scheduler.get_context(ROOT_STREAM)["ACTIONS"]["g"].get_data()
+    assert [item for item in gathered if isinstance(item, int)] == [
+        i * 10 for i in range(n_items) if i != 3
+    ]
+    assert not scheduler.action_batches
+
+
+@pytest.mark.anyio
+@pytest.mark.usefixtures("lazy_scatter")
+async def test_scheduler_resumes_from_checkpoint() -> None:
+    n_items = 12
+    executed: list[tuple[str, str]] = []
+
+    async def executor(stmt: ActionStatement) -> None:
+        executed.append((stmt.ref, ctx_stream_id.get()))
+        await asyncio.sleep(0)
+
+    first = _build_scheduler(
+        items=list(range(n_items)),
+        max_pending_tasks=3,
+        executor=executor,
+        should_checkpoint=lambda: len(executed) >= 5,
+    )
+    assert await asyncio.wait_for(first.start(), timeout=5) is None
+    assert first.suspended
+    assert len(executed) < n_items
+
+    # The checkpoint survives a JSON round trip, as it does through storage
+    checkpoint = DSLSchedulerCheckpoint.model_validate(
+        first.checkpoint().model_dump(mode="json")
+    )
+    second = _build_scheduler(
+        items=list(range(n_items)), max_pending_tasks=3, executor=executor
+    )
+    second.restore(checkpoint)
+    assert await asyncio.wait_for(second.start(), timeout=5) is None
+
+    assert not second.suspended
+    # No task runs twice across the two runs
+    assert len(executed) == len(set(executed))
+    assert [ref for ref, _ in executed].count("b") == n_items
+    assert executed[-2:] == [("g", ROOT_STREAM), ("after", ROOT_STREAM)]
+    assert second.get_context(ROOT_STREAM)["ACTIONS"]["g"].get_data() == [
+        i * 10 for i in range(n_items)
+    ]
+
+
+@pytest.mark.anyio
+@pytest.mark.usefixtures("lazy_scatter")
+async def test_gather_streams_items_to_collection_chunks(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    _stored_chunks.clear()
+    n_items = 30
+    peak_buffered = 0
+
+    async def executor(stmt: ActionStatement) -> None:
+        nonlocal peak_buffered
+        for buffer in scheduler.gather_buffers.values():
+            peak_buffered = max(peak_buffered, len(buffer.items))
+        await asyncio.sleep(0)
+
+    scheduler = _build_scheduler(
+        items=list(range(n_items)),
+        max_pending_tasks=3,
+        executor=executor,
+        chunk_size=4,
+    )
+
+    result = await asyncio.wait_for(scheduler.start(), timeout=5)
+
+    assert result is None
+    assert scheduler.get_context(ROOT_STREAM)["ACTIONS"]["g"].get_data() == [
+        i * 10 for i in range(n_items)
+    ]
+    # Completed chunks left the workflow, so only a few items were ever held
+    assert any("/gather/" in key for key in _stored_chunks)
+    assert peak_buffered <= 8
+    assert not scheduler.gather_buffers
+
+
+@pytest.mark.anyio
+@pytest.mark.usefixtures("lazy_scatter")
+async def test_gather_flushes_chunk_completed_by_skipped_stream() -> None:
+    _stored_chunks.clear()
+
+    async def executor(stmt: ActionStatement) -> None:
+        await asyncio.sleep(0)
+
+    # Every stream of the second chunk is skipped, so its last arrival is too
+    scheduler = _build_scheduler(
+        items=list(range(12)),
+        max_pending_tasks=3,
+        executor=executor,
+        run_if="${{ ACTIONS.s.result < 4 || ACTIONS.s.result >= 8 }}",
+        chunk_size=4,
+    )
+
+    result = await asyncio.wait_for(scheduler.start(), timeout=5)
+
+    assert result is None
+    assert scheduler.get_context(ROOT_STREAM)["ACTIONS"]["g"].get_data() == [
+        0,
+        10,
+        20,
+        30,
+        80,
+        90,
+        100,
+        110,
+    ]
+    flushed = {key for key in _stored_chunks if "/gather/" in key}
+    assert any(key.endswith("/gather/1/manifest.json") for key in flushed)
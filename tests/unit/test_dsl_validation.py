@@ -4,6 +4,7 @@ import pytest
 
 from tracecat import config
 from tracecat.dsl.init_activities import (
+    resolve_execution_settings_activity,
     resolve_workflow_concurrency_limits_enabled_activity,
 )
 from tracecat.feature_flags import FeatureFlag
@@ -27,3 +28,20 @@ def test_resolve_workflow_concurrency_limits_enabled_activity_false(
     monkeypatch.setattr(config, "TRACECAT__FEATURE_FLAGS", set())
 
     assert resolve_workflow_concurrency_limits_enabled_activity() is False
+
+
+@pytest.mark.parametrize("enabled", [True, False])
+def test_resolve_execution_settings_activity(
+    monkeypatch: pytest.MonkeyPatch, enabled: bool
+) -> None:
+    monkeypatch.setattr(config, "TRACECAT__DSL_LOCAL_PLATFORM_ACTIVITIES", enabled)
+    monkeypatch.setattr(config, "TRACECAT__RESULT_EXTERNALIZATION_ENABLED", enabled)
+    monkeypatch.setattr(config, "TRACECAT__COLLECTION_CHUNK_SIZE", 64)
+    monkeypatch.setattr(config, "TRACECAT__DSL_CONTINUE_AS_NEW_HISTORY_LENGTH", 100)
+
+    settings = resolve_execution_settings_activity()
+
+    assert settings.local_platform_activities is enabled
+    assert settings.result_externalization_enabled is enabled
+    assert settings.collection_chunk_size == 64
+    assert settings.continue_as_new_history_length == 100
@@ -0,0 +1,260 @@
+from __future__ import annotations
+
+import uuid
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+from typing import Any, cast
+from unittest.mock import patch
+
+import pytest
+from temporalio.exceptions import ApplicationError
+
+import tracecat.dsl.workflow as dsl_workflow_module
+from tracecat.auth.types import Role
+from tracecat.dsl.action import DSLActivities
+from tracecat.dsl.common import DSLEntrypoint, DSLInput, DSLRunArgs
+from tracecat.dsl.scheduler import DSLSchedulerCheckpoint
+from tracecat.dsl.schemas import (
+    ROOT_STREAM,
+    ActionStatement,
+    DSLEnvironment,
+    DSLExecutionSettings,
+    ExecutionContext,
+    TaskResult,
+)
+from tracecat.dsl.workflow import DSLWorkflow, DSLWorkflowCheckpoint
+from tracecat.dsl.workflow_logging import get_workflow_logger
+from tracecat.identifiers.workflow import WorkflowUUID
+from tracecat.registry.lock.types import RegistryLock
+from tracecat.storage.object import ExternalObject, InlineObject, ObjectRef
+
+WF_EXEC_ID = "wf-00000000000000000000000000000001:exec-00000000000000000000000000000001"
+
+
+class ContinuedAsNew(Exception):
+    pass
+
+
+def _checkpoint(*, result_chars: int = 10) -> DSLWorkflowCheckpoint:
+    context = ExecutionContext(
+        ACTIONS={"a": TaskResult.from_result("x" * result_chars)},
+        TRIGGER=None,
+        ENV=DSLEnvironment(
+            workflow={
+                "start_time": "2025-01-01T00:00:00Z",
+                "execution_id": WF_EXEC_ID,
+                "run_id": "first-run",
+            },
+            environment="default",
+            variables={},
+        ),
+    )
+    return DSLWorkflowCheckpoint(
+        scheduler=DSLSchedulerCheckpoint(
+            queue=[],
+            indegrees=[],
+            completed_tasks=[],
+            edges=[],
+            streams={ROOT_STREAM: context},
+            stream_hierarchy={ROOT_STREAM: None},
+            stream_errors={},
+            task_streams=[],
+            open_streams=[],
+            loop_indices=[],
+            loop_start_skips=[],
+            scatter_regions=[],
+            pending_scatters=[],
+            stream_work={},
+        ),
+        wf_start_time=datetime(2025, 1, 1, tzinfo=UTC),
+        action_execution_count=0,
+    )
+
+
+def _dsl() -> DSLInput:
+    return DSLInput(
+        title="test",
+        description="test",
+        entrypoint=DSLEntrypoint(ref="a"),
+        actions=[ActionStatement(ref="a", action="core.noop")],
+    )
+
+
+def _run_args() -> DSLRunArgs:
+    return DSLRunArgs(
+        dsl=_dsl(),
+        role=Role(
+            type="service",
+            service_id="tracecat-runner",
+            workspace_id=uuid.uuid4(),
+            organization_id=uuid.uuid4(),
+        ),
+        wf_id=WorkflowUUID.new_uuid4(),
+    )
+
+
+def _build_workflow(
+    *,
+    run_id: str,
+    checkpoint: DSLWorkflowCheckpoint | None = None,
+    max_size: int = 0,
+) -> DSLWorkflow:
+    workflow = object.__new__(DSLWorkflow)
+    workflow.logger = get_workflow_logger()
+    workflow.workspace_id = uuid.uuid4()
+    workflow.wf_exec_id = WF_EXEC_ID
+    workflow.wf_run_id = run_id
+    workflow.start_to_close_timeout = timedelta(seconds=60)
+    workflow.execution_settings = DSLExecutionSettings(
+        continue_as_new_history_length=1000,
+        continue_as_new_history_size_bytes=max_size,
+    )
+    workflow.dsl = _dsl()
+    workflow.registry_lock = RegistryLock(origins={}, actions={})
+    workflow.time_anchor = datetime(2025, 1, 1, tzinfo=UTC)
+    if checkpoint is not None:
+        workflow.wf_start_time = checkpoint.wf_start_time
+        workflow.scheduler = cast(
+            Any, SimpleNamespace(checkpoint=lambda: checkpoint.scheduler)
+        )
+    return workflow
+
+
+def _history_info(length: int, *, suggested: bool = False) -> Any:
+    return SimpleNamespace(
+        get_current_history_length=lambda: length,
+        get_current_history_size=lambda: length * 100,
+        is_continue_as_new_suggested=lambda: suggested,
+    )
+
+
+async def _continue_as_new(
+    workflow: DSLWorkflow, *, externalize: bool, stored: dict[str, str]
+) -> DSLRunArgs:
+    async def execute_activity(fn: Any, *, args: Any, **_: Any) -> Any:
+        assert fn is DSLActivities.store_workflow_payload_activity
+        key, part = args
+        stored[key] = part
+        if not externalize:
+            return InlineObject(data=part)
+        return ExternalObject(
+            ref=ObjectRef(bucket="test", key=key, size_bytes=len(part), sha256="")
+        )
+
+    def continue_as_new(args: DSLRunArgs) -> None:
+        raise ContinuedAsNew(args)
+
+    with (
+        patch.object(
+            dsl_workflow_module.workflow, "execute_activity", new=execute_activity
+        ),
+        patch.object(
+            dsl_workflow_module.workflow, "continue_as_new", new=continue_as_new
+        ),
+        patch.object(
+            dsl_workflow_module.workflow, "info", return_value=_history_info(10)
+        ),
+        pytest.raises(ContinuedAsNew) as exc_info,
+    ):
+        await workflow._continue_as_new(_run_args())
+    return exc_info.value.args[0]
+
+
+@pytest.mark.anyio
+async def test_checkpoint_is_stored_and_loaded_in_bounded_parts(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(dsl_workflow_module, "CHECKPOINT_PART_CHARS", 1000)
+    checkpoint = _checkpoint(result_chars=5000)
+    stored: dict[str, str] = {}
+
+    next_args = await _continue_as_new(
+        _build_workflow(run_id="first-run", checkpoint=checkpoint),
+        externalize=True,
+        stored=stored,
+    )
+
+    assert next_args.checkpoint is not None
+    assert len(next_args.checkpoint) == len(stored) > 5
+    assert all(isinstance(part, ExternalObject) for part in next_args.checkpoint)
+    assert all(len(part) <= 1000 for part in stored.values())
+
+    async def retrieve(fn: Any, *, arg: ExternalObject, **_: Any) -> str:
+        assert fn is DSLActivities.retrieve_workflow_payload_activity
+        return stored[arg.ref.key]
+
+    resumed = _build_workflow(run_id="second-run")
+    with patch.object(dsl_workflow_module.workflow, "execute_activity", new=retrieve):
+        loaded = await resumed._load_checkpoint(next_args.checkpoint)
+
+    assert loaded.model_dump() == checkpoint.model_dump()
+
+
+def test_restored_context_describes_current_run() -> None:
+    workflow = _build_workflow(run_id="second-run")
+
+    context = workflow._restore_context(_checkpoint())
+
+    env = context.get("ENV")
+    assert env is not None
+    wf_env = env.get("workflow")
+    assert wf_env is not None
+    assert wf_env.get("run_id") == "second-run"
+    assert wf_env.get("execution_id") == WF_EXEC_ID
+    assert wf_env.get("start_time") == "2025-01-01T00:00:00Z"
+
+
+@pytest.mark.anyio
+async def test_continue_as_new_fails_when_checkpoint_stays_inline(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(dsl_workflow_module, "CHECKPOINT_MAX_INLINE_CHARS", 1000)
+    checkpoint = _checkpoint(result_chars=5000)
+
+    with pytest.raises(ApplicationError, match="without result externalization"):
+        await _continue_as_new(
+            _build_workflow(run_id="first-run", checkpoint=checkpoint),
+            externalize=False,
+            stored={},
+        )
+
+
+@pytest.mark.anyio
+async def test_continue_as_new_fails_when_checkpoint_exceeds_history_size() -> None:
+    checkpoint = _checkpoint(result_chars=5000)
+    stored: dict[str, str] = {}
+
+    with pytest.raises(ApplicationError, match="too large to continue as new"):
+        await _continue_as_new(
+            _build_workflow(run_id="first-run", checkpoint=checkpoint, max_size=4000),
+            externalize=True,
+            stored=stored,
+        )
+    assert not stored
+
+
+@pytest.mark.parametrize(
+    ("length", "suggested", "expected"),
+    [
+        (900, False, False),
+        (1400, False, True),
+        (700, True, False),
+        (800, True, True),
+    ],
+)
+def test_continue_as_new_counts_history_added_by_run(
+    length: int, suggested: bool, expected: bool
+) -> None:
+    workflow = _build_workflow(run_id="second-run")
+    workflow._history_length_at_start = 400
+    workflow._history_size_at_start = 400 * 100
+
+    with (
+        patch.object(
+            dsl_workflow_module.workflow,
+            "info",
+            return_value=_history_info(length, suggested=suggested),
+        ),
+        patch.object(dsl_workflow_module.workflow, "patched", return_value=True),
+    ):
+        assert workflow._should_continue_as_new() is expected
@@ -23,8 +23,10 @@ from tracecat.dsl.schemas import (
     ActionRetryPolicy,
     ActionStatement,
     DSLConfig,
+    DSLExecutionSettings,
     ExecutionContext,
     RunContext,
+    StreamID,
     TaskResult,
 )
 from tracecat.dsl.workflow import DSLWorkflow
@@ -67,6 +69,7 @@ def _build_workflow(*, limits: EffectiveLimits | None = None) -> DSLWorkflow:
     workflow._workflow_permit_acquired = False
     workflow._workflow_permit_heartbeat_task = None
     workflow._action_execution_count = 0
+    workflow.execution_settings = DSLExecutionSettings()
     workflow.execution_type = ExecutionType.PUBLISHED
     workflow.run_context = RunContext(
         wf_id=WorkflowUUID.new("wf-00000000000000000000000000000001"),
@@ -77,7 +80,14 @@ def _build_workflow(*, limits: EffectiveLimits | None = None) -> DSLWorkflow:
     )
     context = ExecutionContext(ACTIONS={}, TRIGGER=None)
     workflow.context = context
-    workflow.scheduler = cast(Any, SimpleNamespace(streams={ROOT_STREAM: context}))
+    streams = {ROOT_STREAM: context}
+
+    def set_action_result(stream_id: StreamID, ref: str, result: TaskResult) -> None:
+        streams[stream_id]["ACTIONS"][ref] = result
+
+    workflow.scheduler = cast(
+        Any, SimpleNamespace(streams=streams, set_action_result=set_action_result)
+    )
     assert workflow.role.workspace_id is not None
     workflow.workspace_id = workflow.role.workspace_id
     workflow.wf_exec_id = workflow.run_context.wf_exec_id
@@ -163,6 +173,7 @@ async def test_retry_until_counts_action_execution_limit_per_iteration() -> None
     with (
         patch.object(workflow, "_execute_task", new=AsyncMock(side_effect=attempts)),
         patch.object(workflow, "_set_logical_time_context", return_value=None),
+        patch("tracecat.dsl.workflow.workflow.patched", return_value=False),
         patch(
             "tracecat.dsl.workflow.workflow.execute_activity",
             new=AsyncMock(side_effect=[False, False, True]),
@@ -198,6 +209,7 @@ async def test_retry_until_enforces_action_execution_limit() -> None:
     with (
         patch.object(workflow, "_execute_task", new=execute_task_mock),
         patch.object(workflow, "_set_logical_time_context", return_value=None),
+        patch("tracecat.dsl.workflow.workflow.patched", return_value=False),
         patch(
             "tracecat.dsl.workflow.workflow.execute_activity",
             new=AsyncMock(side_effect=[False, False, True]),
@@ -354,6 +366,7 @@ async def test_prepare_subflow_activity_failure_in_scatter_fails_workflow() -> N
         return InlineObject(data={"handled": True})
 
     with (
+        patch("tracecat.dsl.scheduler.workflow.patched", return_value=False),
         patch(
             "tracecat.dsl.scheduler.workflow.execute_activity",
             new=AsyncMock(side_effect=execute_activity),
@@ -423,6 +436,7 @@ async def test_prepare_subflow_user_error_in_scatter_uses_error_path() -> None:
         return InlineObject(data={"handled": True})
 
     with (
+        patch("tracecat.dsl.scheduler.workflow.patched", return_value=False),
         patch(
             "tracecat.dsl.scheduler.workflow.execute_activity",
             new=AsyncMock(side_effect=execute_activity),
@@ -496,6 +510,7 @@ async def test_prepare_subflow_user_error_cause_in_scatter_uses_error_path() ->
         return InlineObject(data={"handled": True})
 
     with (
+        patch("tracecat.dsl.scheduler.workflow.patched", return_value=False),
         patch(
             "tracecat.dsl.scheduler.workflow.execute_activity",
             new=AsyncMock(side_effect=execute_activity),
@@ -568,6 +583,7 @@ async def test_run_skips_tier_limit_enforcement_when_flag_disabled() -> None:
             "tracecat.dsl.workflow.workflow.execute_local_activity",
             new=AsyncMock(return_value=False),
         ),
+        patch("tracecat.dsl.workflow.workflow.patched", return_value=False),
         patch(
             "tracecat.dsl.workflow.workflow.execute_activity",
             new=execute_activity_mock,
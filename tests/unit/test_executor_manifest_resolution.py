@@ -279,7 +279,7 @@ async def test_prepare_resolved_context_includes_projected_secret_masks(
     )
     mocker.patch(
         "tracecat.executor.service.collect_expressions",
-        return_value=SimpleNamespace(secrets=set(), variables=set()),
+        return_value=SimpleNamespace(secrets=set(), variables=set(), paths=set()),
     )
     mocker.patch(
         "tracecat.executor.service.secrets_manager.get_action_secrets",
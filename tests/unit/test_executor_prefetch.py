@@ -0,0 +1,205 @@
+import uuid
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime
+from types import SimpleNamespace
+from uuid import UUID
+
+import pytest
+from tracecat_registry import RegistryOAuthSecret, RegistrySecret
+
+from tracecat.auth.types import Role
+from tracecat.dsl.schemas import PrefetchHint, RunContext
+from tracecat.executor import prefetch
+from tracecat.executor import service as executor_service
+from tracecat.identifiers.workflow import WorkflowUUID, generate_exec_id
+from tracecat.registry.lock.types import RegistryLock
+
+
+@pytest.fixture(autouse=True)
+def clear_run_caches():
+    prefetch.clear()
+    yield
+    prefetch.clear()
+
+
+def _role() -> Role:
+    return Role(
+        type="service",
+        organization_id=UUID(int=1),
+        workspace_id=UUID(int=2),
+        service_id="tracecat-executor",
+    )
+
+
+def _run_context(environment: str = "default") -> RunContext:
+    wf_id = WorkflowUUID.new_uuid4()
+    return RunContext(
+        wf_id=wf_id,
+        wf_exec_id=generate_exec_id(wf_id),
+        wf_run_id=uuid.uuid4(),
+        environment=environment,
+        logical_time=datetime(2025, 1, 1, tzinfo=UTC),
+    )
+
+
+def _patch_service(mocker, path: str, method: str, result: list[object]):
+    service = mocker.AsyncMock()
+    getattr(service, method).return_value = result
+
+    @asynccontextmanager
+    async def service_cm(*args, **kwargs):
+        yield service
+
+    mocker.patch(path, side_effect=service_cm)
+    return service
+
+
+def test_run_cache_is_per_run_and_environment() -> None:
+    role = _role()
+    run_context = _run_context()
+
+    cache = prefetch.get_run_cache(role, run_context)
+
+    assert cache is not None
+    assert prefetch.get_run_cache(role, run_context) is cache
+    assert prefetch.get_run_cache(role, _run_context()) is not cache
+    other_env = run_context.model_copy(update={"environment": "staging"})
+    assert prefetch.get_run_cache(role, other_env) is not cache
+
+
+def test_run_cache_expires(mocker) -> None:
+    role = _role()
+    run_context = _run_context()
+    cache = prefetch.get_run_cache(role, run_context)
+    assert cache is not None
+
+    mocker.patch.object(prefetch.time, "monotonic", return_value=cache.expires_at)
+
+    assert prefetch.get_run_cache(role, run_context) is not cache
+
+
+def test_run_cache_disabled(mocker) -> None:
+    mocker.patch.object(prefetch.config, "TRACECAT__EXECUTOR_PREFETCH_TTL_SECONDS", 0)
+
+    assert prefetch.get_run_cache(_role(), _run_context()) is None
+
+
+def test_run_cache_refetches_missing_required_secrets() -> None:
+    cache = prefetch.RunPrefetchCache(expires_at=0)
+    row = SimpleNamespace(name="present")
+    cache.put_secrets({"present", "missing"}, [row])  # type: ignore[list-item]
+
+    rows, to_fetch = cache.get_secrets({"present", "missing", "unknown"})
+    assert rows == [row]
+    assert to_fetch == {"unknown"}
+
+    _, to_fetch = cache.get_secrets({"present", "missing"}, required={"missing"})
+    assert to_fetch == {"missing"}
+
+
+@pytest.mark.anyio
+async def test_prefetch_loads_hint_into_run_cache(mocker) -> None:
+    mocker.patch.object(
+        prefetch.registry_resolver,
+        "collect_action_secrets_from_manifest",
+        new=mocker.AsyncMock(
+            return_value={
+                RegistrySecret(name="declared", keys=["KEY"]),
+                RegistryOAuthSecret(
+                    provider_id="microsoft_teams", grant_type="client_credentials"
+                ),
+            }
+        ),
+    )
+    secrets_service = _patch_service(
+        mocker,
+        "tracecat.executor.prefetch.SecretsService.with_session",
+        "search_secrets",
+        [SimpleNamespace(name="declared")],
+    )
+    variables_service = _patch_service(
+        mocker,
+        "tracecat.executor.prefetch.VariablesService.with_session",
+        "search_variables",
+        [SimpleNamespace(name="settings", values={"url": "https://example.com"})],
+    )
+    role = _role()
+    run_context = _run_context()
+    cache = prefetch.get_run_cache(role, run_context)
+    assert cache is not None
+    hint = PrefetchHint(
+        actions=["tools.example.lookup"],
+        secrets=["from_args", "teams_oauth"],
+        variables=["settings"],
+    )
+
+    for _ in range(2):
+        await prefetch.prefetch(
+            hint,
+            cache=cache,
+            role=role,
+            environment=run_context.environment,
+            registry_lock=RegistryLock(origins={}, actions={}),
+        )
+
+    secrets_service.search_secrets.assert_awaited_once()
+    search = secrets_service.search_secrets.await_args.args[0]
+    assert search.names == {"declared", "from_args"}
+    assert search.environment == "default"
+    assert cache.secrets["from_args"] is None
+    declared = cache.secrets["declared"]
+    assert declared is not None
+    assert declared.name == "declared"
+    variables_service.search_variables.assert_awaited_once()
+    assert cache.variables == {"settings": {"url": "https://example.com"}}
+    assert not cache.loading
+
+
+@pytest.mark.anyio
+async def test_get_workspace_variables_reads_run_cache(mocker) -> None:
+    cache = prefetch.RunPrefetchCache(expires_at=0)
+    cache.put_variables({"cached"}, {"cached": {"key": "cached-value"}})
+    service = _patch_service(
+        mocker,
+        "tracecat.executor.service.VariablesService.with_session",
+        "search_variables",
+        [SimpleNamespace(name="fetched", values={"key": "fetched-value"})],
+    )
+
+    variables = await executor_service.get_workspace_variables(
+        {"cached", "fetched"}, environment="default", role=_role(), cache=cache
+    )
+
+    assert variables == {
+        "cached": {"key": "cached-value"},
+        "fetched": {"key": "fetched-value"},
+    }
+    assert service.search_variables.await_args.args[0].names == {"fetched"}
+    assert cache.variables["fetched"] == {"key": "fetched-value"}
+
+    service.search_variables.reset_mock()
+    await executor_service.get_workspace_variables(
+        {"cached"}, environment="default", role=_role(), cache=cache
+    )
+    service.search_variables.assert_not_awaited()
+
+
+@pytest.mark.anyio
+async def test_get_workspace_variables_without_names_bypasses_run_cache(
+    mocker,
+) -> None:
+    cache = prefetch.RunPrefetchCache(expires_at=0)
+    service = _patch_service(
+        mocker,
+        "tracecat.executor.service.VariablesService.with_session",
+        "search_variables",
+        [SimpleNamespace(name="settings", values={"url": "https://example.com"})],
+    )
+
+    variables = await executor_service.get_workspace_variables(
+        set(), environment="default", role=_role(), cache=cache
+    )
+
+    assert variables == {"settings": {"url": "https://example.com"}}
+    assert service.search_variables.await_args.args[0].names == set()
+    assert cache.variables == {}
@@ -557,6 +557,7 @@ async def test_prepare_resolved_context_preserves_only_mapped_parameter(
     assert get_action_secrets.await_args.kwargs == {
         "secret_exprs": {"runtime.TOKEN"},
         "action_secrets": action_secrets,
+        "cache": mocker.ANY,
     }
     assert get_workspace_variables.await_args.kwargs["variable_exprs"] == {"runtime"}
     assert prepared.mask_values == {"runtime-secret"}
@@ -609,6 +610,7 @@ async def test_prepare_resolved_context_redacts_secrets_before_collection(
     assert get_action_secrets.await_args.kwargs == {
         "secret_exprs": {"runtime.TOKEN"},
         "action_secrets": action_secrets,
+        "cache": mocker.ANY,
     }
     assert get_workspace_variables.await_args.kwargs["variable_exprs"] == {"runtime"}
 
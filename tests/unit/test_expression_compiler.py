@@ -0,0 +1,190 @@
+"""Differential tests: compiled expressions must match `ExprEvaluator`."""
+
+from typing import Any
+
+import pytest
+
+from tracecat.exceptions import TracecatExpressionError
+from tracecat.expressions.common import ExprContext, IterableExpr
+from tracecat.expressions.parser.compiler import ExprCompiler
+from tracecat.expressions.parser.core import parser
+from tracecat.expressions.parser.evaluator import ExprEvaluator
+
+OPERAND: dict[str, Any] = {
+    ExprContext.ACTIONS: {
+        "fetch": {
+            "result": {
+                "items": [{"name": "a", "score": 1}, {"name": "b", "score": 7}],
+                "ok": True,
+                "count": 2,
+                "meta": {"tags": ["x", "y"]},
+            }
+        },
+    },
+    ExprContext.TRIGGER: {"user": {"id": 42, "email": "alice@example.com"}},
+    ExprContext.SECRETS: {"api": {"KEY": "s3cr3t"}},
+    ExprContext.VARS: {"settings": {"region": "us-east-1"}},
+    ExprContext.ENV: {"workflow": {"name": "wf"}},
+    ExprContext.LOCAL_VARS: {"x": 3, "item": {"id": 9}},
+    ExprContext.TEMPLATE_ACTION_INPUTS: {"limit": 10},
+    ExprContext.TEMPLATE_ACTION_STEPS: {"first": {"result": "done"}},
+}
+
+VALID_EXPRESSIONS = [
+    "1",
+    "1.5",
+    "'hello'",
+    '"double"',
+    "True",
+    "False",
+    "None",
+    "[1, 'a', None]",
+    "{'a': 1, 'b': [True]}",
+    "1 + 2 * 3",
+    "(1 + 2) * 3",
+    "10 / 4",
+    "10 % 4",
+    "-5",
+    "+5",
+    "not True",
+    "True && False",
+    "True || False",
+    "1 == 1",
+    "1 != 2",
+    "1 < 2",
+    "1 <= 1",
+    "2 > 1",
+    "2 >= 3",
+    "1 in [1, 2]",
+    "3 not in [1, 2]",
+    "None is None",
+    "1 is not None",
+    "'yes' if ACTIONS.fetch.result.ok else 'no'",
+    "'yes' if False else 'no'",
+    "ACTIONS.fetch.result",
+    "ACTIONS.fetch.result.items[1].name",
+    "ACTIONS.fetch.result.items[*].score",
+    "ACTIONS.fetch.result.items[?(@.score > 3)].name",
+    "ACTIONS.fetch.result.meta.tags[0]",
+    "ACTIONS.fetch.result.missing",
+    "ACTIONS.fetch.result.count + 1",
+    "ACTIONS.fetch.result.count == 2 && ACTIONS.fetch.result.ok",
+    "TRIGGER",
+    "TRIGGER.user.email",
+    "SECRETS.api.KEY",
+    "VARS.settings.region",
+    "ENV.workflow.name",
+    "var.x * 2",
+    "var.item.id",
+    "inputs.limit",
+    "steps.first.result",
+    "int('3')",
+    "str(1)",
+    "float('2.5')",
+    "bool('true')",
+    "ACTIONS.fetch.result.count -> str",
+    "FN.add(1, 2)",
+    "FN.length(ACTIONS.fetch.result.items)",
+    "FN.uppercase(TRIGGER.user.email)",
+    "FN.uppercase.map(['a', 'b'])",
+    "FN.uppercase(FN.concat('a', 'b'))",
+    "[10, 20, 30][1]",
+    "{'k': 'v'}['k']",
+    "FN.split('a,b', ',')[1]",
+    "for var.item in ACTIONS.fetch.result.items",
+]
+
+INVALID_EXPRESSIONS = [
+    "[]",
+    "{}",
+    "1 / 0",
+    "FN.does_not_exist(1)",
+    "int('abc')",
+    "[1, 2][5]",
+    "{'a': 1}['b']",
+    "[1, 2]['x']",
+    "1[0]",
+    "'a' + 1",
+    "VARS.settings.region.nested",
+    "for var.x in 5",
+]
+
+
+def _reference(expression: str, operand: dict[str, Any], strict: bool = False) -> Any:
+    tree = parser.parse(expression)
+    assert tree is not None
+    return ExprEvaluator(operand=operand, strict=strict).evaluate(tree)
+
+
+def _compiled(expression: str, operand: dict[str, Any], strict: bool = False) -> Any:
+    tree = parser.parse(expression)
+    assert tree is not None
+    return ExprCompiler().compile(tree, strict=strict)(operand)
+
+
+@pytest.mark.parametrize("expression", VALID_EXPRESSIONS)
+def test_compiled_matches_evaluator(expression: str) -> None:
+    expected = _reference(expression, OPERAND)
+    actual = _compiled(expression, OPERAND)
+
+    if isinstance(expected, IterableExpr):
+        assert isinstance(actual, IterableExpr)
+        assert actual.iterator == expected.iterator
+        assert list(actual.collection) == list(expected.collection)
+    else:
+        assert actual == expected
+        assert type(actual) is type(expected)
+
+
+@pytest.mark.parametrize("expression", INVALID_EXPRESSIONS)
+def test_compiled_errors_match_evaluator(expression: str) -> None:
+    with pytest.raises(TracecatExpressionError) as expected:
+        _reference(expression, OPERAND)
+    with pytest.raises(TracecatExpressionError) as actual:
+        _compiled(expression, OPERAND)
+
+    assert str(actual.value) == str(expected.value)
+    assert actual.value.detail == expected.value.detail
+
+
+def test_compiled_strict_mode_matches_evaluator() -> None:
+    expression = "ACTIONS.fetch.result.missing"
+
+    with pytest.raises(TracecatExpressionError) as expected:
+        _reference(expression, OPERAND, strict=True)
+    with pytest.raises(TracecatExpressionError) as actual:
+        _compiled(expression, OPERAND, strict=True)
+
+    assert str(actual.value) == str(expected.value)
+    assert _compiled(expression, OPERAND, strict=False) is None
+
+
+def test_ternary_only_evaluates_selected_branch() -> None:
+    expression = "FN.add(1, 2) if True else FN.does_not_exist()"
+
+    assert _compiled(expression, OPERAND) == _reference(expression, OPERAND) == 3
+
+
+def test_compiled_closure_is_reusable_across_operands() -> None:
+    tree = parser.parse("var.x + 1")
+    assert tree is not None
+    compiled = ExprCompiler().compile(tree)
+
+    assert [compiled({ExprContext.LOCAL_VARS: {"x": i}}) for i in range(3)] == [
+        1,
+        2,
+        3,
+    ]
+
+
+def test_get_or_compile_caches_per_source_and_strictness() -> None:
+    compiler = ExprCompiler(cache_maxsize=2)
+    tree = parser.parse("var.x")
+    assert tree is not None
+
+    first = compiler.get_or_compile("var.x", tree)
+    second = compiler.get_or_compile("var.x", tree)
+    strict = compiler.get_or_compile("var.x", tree, strict=True)
+
+    assert first is second
+    assert strict is not first
@@ -0,0 +1,45 @@
+import lark
+import pytest
+from lark import Lark
+
+from tracecat.expressions.parser import _generated
+from tracecat.expressions.parser.core import build_lark
+from tracecat.expressions.parser.grammar import grammar, grammar_sha256
+
+
+def test_generated_parser_is_in_sync_with_grammar() -> None:
+    # Regenerate with `just gen-expression-parser` if this fails.
+    assert _generated.GRAMMAR_SHA256 == grammar_sha256()
+    assert _generated.LARK_VERSION == lark.__version__
+    assert _generated.START == "root"
+
+
+@pytest.mark.parametrize(
+    "expression",
+    [
+        "ACTIONS.step.result",
+        "ACTIONS.step.result.items[0].name",
+        "TRIGGER.data || 'default'",
+        "FN.concat(ACTIONS.a.result, 'x', 1, 2.5, True, None)",
+        "var.item.n + 1 * 3 - 4 / 2 % 5",
+        "'a' if var.x > 1 else 'b'",
+        "[1, 2, 3]",
+        "{'k': var.v, 'n': [None]}",
+        "var.x in [1, 2] && not var.y",
+        "SECRETS.my_secret.API_KEY",
+        "ENV.workflow.run_id",
+        "for var.item in ACTIONS.list.result",
+        "FN.add(1, 2) -> int",
+        "ACTIONS.a.result.items[*].name",
+    ],
+)
+def test_generated_parser_matches_compiled_grammar(expression: str) -> None:
+    reference = Lark(grammar, start="root", parser="lalr")
+
+    assert build_lark().parse(expression) == reference.parse(expression)
+
+
+def test_non_default_start_rule_compiles_grammar() -> None:
+    parser = build_lark("expression")
+
+    assert parser.options.start == ["expression"]
@@ -0,0 +1,115 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from tracecat.exceptions import TracecatExpressionError
+from tracecat.expressions.core import Expression
+from tracecat.expressions.parser import core as parser_core
+from tracecat.expressions.parser.core import ExprParser
+
+
+class _CountingLark:
+    def __init__(self, parser: ExprParser) -> None:
+        self.calls = 0
+        self._inner = parser.parser
+
+    def parse(self, expression: str):
+        self.calls += 1
+        return self._inner.parse(expression)
+
+
+@pytest.fixture
+def counting_parser() -> tuple[ExprParser, _CountingLark]:
+    parser = ExprParser(cache_maxsize=4)
+    counter = _CountingLark(parser)
+    parser.parser = counter  # pyright: ignore[reportAttributeAccessIssue]
+    return parser, counter
+
+
+def test_parse_cache_returns_shared_tree(
+    counting_parser: tuple[ExprParser, _CountingLark],
+) -> None:
+    parser, counter = counting_parser
+
+    first = parser.parse("ACTIONS.a.result.b")
+    second = parser.parse("ACTIONS.a.result.b")
+
+    assert first is second
+    assert counter.calls == 1
+    info = parser.cache_info()
+    assert (info.hits, info.misses, info.currsize) == (1, 1, 1)
+
+
+def test_parse_cache_evicts_least_recently_used(
+    counting_parser: tuple[ExprParser, _CountingLark],
+) -> None:
+    parser, counter = counting_parser
+    expressions = [f"ACTIONS.a{index}.result" for index in range(4)]
+
+    for expr in expressions:
+        parser.parse(expr)
+    parser.parse(expressions[0])
+    parser.parse("ACTIONS.overflow.result")
+
+    assert set(parser._cache) == {
+        expressions[0],
+        expressions[2],
+        expressions[3],
+        "ACTIONS.overflow.result",
+    }
+    assert counter.calls == 5
+
+
+def test_parse_cache_skips_oversized_expressions(
+    counting_parser: tuple[ExprParser, _CountingLark],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    parser, counter = counting_parser
+    monkeypatch.setattr(parser_core, "_PARSE_CACHE_MAX_EXPR_LENGTH", 8)
+
+    parser.parse("'a long string literal'")
+    parser.parse("'a long string literal'")
+
+    assert counter.calls == 2
+    assert parser.cache_info().currsize == 0
+
+
+def test_parse_cache_does_not_cache_errors(
+    counting_parser: tuple[ExprParser, _CountingLark],
+) -> None:
+    parser, counter = counting_parser
+
+    for _ in range(2):
+        with pytest.raises(TracecatExpressionError):
+            parser.parse("ACTIONS.a.result ->")
+
+    assert counter.calls == 2
+    assert parser.cache_info().currsize == 0
+
+
+def test_parse_cache_clear_resets_counters(
+    counting_parser: tuple[ExprParser, _CountingLark],
+) -> None:
+    parser, _ = counting_parser
+    parser.parse("1 + 2")
+    parser.parse("1 + 2")
+
+    parser.cache_clear()
+
+    assert parser.cache_info() == parser_core.ParseCacheInfo(
+        hits=0, misses=0, maxsize=4, currsize=0
+    )
+
+
+def test_cached_tree_evaluates_against_different_operands() -> None:
+    expr = "ACTIONS.a.result.value + 1"
+
+    def evaluate(value: int) -> int:
+        return Expression(
+            expr, operand={"ACTIONS": {"a": {"result": {"value": value}}}}
+        ).result()
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(evaluate, range(100)))
+
+    assert results == [value + 1 for value in range(100)]
@@ -187,6 +187,36 @@ def test_unconfigured_parameters_retain_default_resolve_behavior(action: str) ->
     }
 
 
+def test_action_argument_plan_resolves_shared_paths_in_one_walk(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    from tracecat.expressions import common
+
+    fields = {f"field_{i}": i for i in range(20)}
+    arguments = {
+        "fields": {name: f"${{{{ ACTIONS.fetch.result.{name} }}}}" for name in fields},
+        "missing": "${{ ACTIONS.fetch.result.missing }}",
+        "first": "${{ ACTIONS.fetch.result.items[*] }}",
+    }
+    context = {"ACTIONS": {"fetch": {"result": {**fields, "items": [1]}}}}
+    resolved_paths: list[set[str]] = []
+    resolve_jsonpaths = common.resolve_jsonpaths
+
+    def spy(exprs: Any, operand: Any) -> dict[str, Any]:
+        resolved_paths.append(set(exprs))
+        return resolve_jsonpaths(exprs, operand)
+
+    monkeypatch.setattr(common, "resolve_jsonpaths", spy)
+
+    assert ActionArgumentPlan.build("core.transform.reshape", arguments).evaluate(
+        context
+    ) == {"fields": fields, "missing": None, "first": [1]}
+    assert resolved_paths == [
+        {f"ACTIONS.fetch.result.{name}" for name in fields}
+        | {"ACTIONS.fetch.result.missing", "ACTIONS.fetch.result.items[*]"}
+    ]
+
+
 @pytest.mark.parametrize(
     ("action", "parameter"),
     [
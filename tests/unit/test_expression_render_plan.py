@@ -0,0 +1,80 @@
+from typing import Any
+
+import pytest
+
+from tracecat.exceptions import TracecatExpressionError
+from tracecat.expressions.common import ExprContext
+from tracecat.expressions.eval import RenderPlan, eval_templated_object
+
+OPERAND: dict[str, Any] = {
+    ExprContext.ACTIONS: {"fetch": {"result": {"id": 7, "tags": ["a", "b"]}}},
+    ExprContext.LOCAL_VARS: {"item": {"name": "alice", "n": 3}},
+    ExprContext.TRIGGER: {"key": "dynamic_key"},
+}
+
+
+@pytest.mark.parametrize(
+    "template",
+    [
+        "plain string",
+        "${{ var.item.n }}",
+        "${{ var.item.n }} items",
+        "Hello ${{ var.item.name }}, id=${{ ACTIONS.fetch.result.id }}!",
+        "${{ var.item.n }}${{ var.item.n }}",
+        ["static", "${{ var.item.n }}", 1, None, {"nested": "${{ var.item.name }}"}],
+        {
+            "static": {"deep": [1, 2, {"x": "y"}]},
+            "dynamic": "${{ ACTIONS.fetch.result.tags }}",
+            "${{ TRIGGER.key }}": "keyed",
+            "mixed": ["${{ var.item.name }}", "literal"],
+            3: "${{ var.item.n + 1 }}",
+        },
+        {"url": "https://example.com/${{ var.item.name }}?id=${{ var.item.n }}"},
+        42,
+        None,
+    ],
+)
+def test_render_plan_matches_eval_templated_object(template: Any) -> None:
+    plan = RenderPlan(template)
+
+    assert plan.render(OPERAND) == eval_templated_object(template, operand=OPERAND)
+
+
+def test_render_plan_shares_static_subtrees() -> None:
+    static_subtree = {"headers": {"Accept": "application/json"}, "ids": [1, 2, 3]}
+    template = {"static": static_subtree, "name": "${{ var.item.name }}"}
+    plan = RenderPlan(template)
+
+    first = plan.render(OPERAND)
+    second = plan.render({**OPERAND, ExprContext.LOCAL_VARS: {"item": {"name": "bob"}}})
+
+    assert first["static"] is static_subtree
+    assert second["static"] is static_subtree
+    assert (first["name"], second["name"]) == ("alice", "bob")
+    assert first is not template
+
+
+def test_static_template_is_returned_by_reference() -> None:
+    template = {"a": [1, {"b": "no expressions here"}]}
+    plan = RenderPlan(template)
+
+    assert plan.is_static
+    assert plan.render(OPERAND) is template
+
+
+def test_render_plan_rejects_duplicate_keys() -> None:
+    plan = RenderPlan({"dynamic_key": 1, "${{ TRIGGER.key }}": 2})
+
+    with pytest.raises(TracecatExpressionError, match="duplicate dictionary key"):
+        plan.render(OPERAND)
+
+
+def test_render_plan_surfaces_evaluation_errors() -> None:
+    plan = RenderPlan({"value": "${{ FN.does_not_exist() }}"})
+
+    with pytest.raises(TracecatExpressionError) as actual:
+        plan.render(OPERAND)
+    with pytest.raises(TracecatExpressionError) as expected:
+        eval_templated_object({"value": "${{ FN.does_not_exist() }}"}, operand=OPERAND)
+
+    assert str(actual.value) == str(expected.value)
@@ -1,3 +1,4 @@
+import re
 from collections import Counter
 from datetime import UTC, date, datetime, time, timedelta
 from typing import Any, Literal
@@ -87,8 +88,12 @@ from tracecat.expressions.functions import (
     pow,
     prettify_json,
     regex_extract,
+    regex_extract_many,
+    regex_filter,
     regex_match,
+    regex_match_many,
     regex_not_match,
+    regex_not_match_many,
     seconds_between,
     serialize,
     serialize_json,
@@ -293,6 +298,38 @@ def test_regex_match(pattern: str, text: str, expected: bool) -> None:
     assert regex_not_match(pattern, text) == (not expected)
 
 
+def test_regex_batched_variants_match_per_item_functions() -> None:
+    texts = ["test123", "123test", "eventId=42", "", "TEST"]
+
+    for pattern in (r"^test", r"\d+", r"eventId=(\d+)", r"(a)|(\d)", r"[A-Z]+"):
+        assert regex_extract_many(pattern, texts) == [
+            regex_extract(pattern, text) for text in texts
+        ]
+        assert regex_match_many(pattern, texts) == [
+            regex_match(pattern, text) for text in texts
+        ]
+        assert regex_not_match_many(pattern, texts) == [
+            regex_not_match(pattern, text) for text in texts
+        ]
+        assert regex_filter(pattern, texts) == [
+            text for text in texts if regex_match(pattern, text)
+        ]
+
+
+def test_regex_batched_variants_empty_list() -> None:
+    assert regex_extract_many(r"\d+", []) == []
+    assert regex_match_many(r"\d+", []) == []
+    assert regex_not_match_many(r"\d+", []) == []
+    assert regex_filter(r"\d+", []) == []
+
+
+def test_regex_invalid_pattern_raises() -> None:
+    with pytest.raises(re.error):
+        regex_match("(", "text")
+    with pytest.raises(re.error):
+        regex_filter("(", ["text"])
+
+
 def test_generate_uuid() -> None:
     uuid1 = generate_uuid()
     uuid2 = generate_uuid()
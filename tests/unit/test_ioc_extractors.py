@@ -5,10 +5,12 @@ import pytest
 import yaml
 
 from tracecat.expressions.ioc_extractors import (
+    IOC_KINDS,
     extract_asns,
     extract_cves,
     extract_domains,
     extract_emails,
+    extract_iocs,
     extract_ipv4,
     extract_ipv6,
     extract_mac,
@@ -223,3 +225,101 @@ def test_extract_defanged_urls(text, expected):
 @pytest.mark.parametrize("text,expected", load_test_data("defanged/domain"))
 def test_extract_defanged_domains(text, expected):
     assert sorted(extract_domains(text, include_defanged=True)) == sorted(expected)
+
+
+### MULTI-IOC EXTRACTION
+
+SINGLE_KIND_EXTRACTORS = {
+    "asn": extract_asns,
+    "cve": extract_cves,
+    "domain": extract_domains,
+    "email": extract_emails,
+    "ipv4": extract_ipv4,
+    "ipv6": extract_ipv6,
+    "mac": extract_mac,
+    "md5": extract_md5,
+    "sha1": extract_sha1,
+    "sha256": extract_sha256,
+    "sha512": extract_sha512,
+    "url": extract_urls,
+}
+DEFANGED_KINDS = ("domain", "ipv4", "ipv6", "url")
+ALL_TEST_TEXTS = [
+    param
+    for ioc_type in (
+        "asn",
+        "cve",
+        "domain",
+        "email",
+        "ipv4",
+        "ipv6",
+        "mac",
+        "md5",
+        "sha1",
+        "sha256",
+        "sha512",
+        "url_any",
+        "url_http",
+        "defanged/domain",
+        "defanged/ipv4",
+        "defanged/ipv6",
+        "defanged/url",
+    )
+    for param in load_test_data(ioc_type)
+]
+
+
+@pytest.mark.parametrize("text,expected", ALL_TEST_TEXTS)
+def test_extract_iocs_matches_single_kind_extractors(text, expected):
+    extracted = extract_iocs(text)
+
+    assert list(extracted) == list(IOC_KINDS)
+    for kind, extractor in SINGLE_KIND_EXTRACTORS.items():
+        assert sorted(extracted[kind]) == sorted(extractor(text)), kind
+
+
+@pytest.mark.parametrize("text,expected", ALL_TEST_TEXTS)
+def test_extract_iocs_defanged_matches_single_kind_extractors(text, expected):
+    extracted = extract_iocs(text, kinds=list(DEFANGED_KINDS), include_defanged=True)
+
+    for kind in DEFANGED_KINDS:
+        extractor = SINGLE_KIND_EXTRACTORS[kind]
+        assert sorted(extracted[kind]) == sorted(
+            extractor(text, include_defanged=True)
+        ), kind
+
+
+def test_extract_iocs_mixed_text():
+    text = """
+    Alert from soc@example.com - host 10.0.0.5 (00:11:22:33:44:55) beaconed to
+    https://evil.example.org/payload.exe, exploiting CVE-2021-44228 via AS13335.
+    Dropped d41d8cd98f00b204e9800998ecf8427e and fe80::1ff:fe23:4567:890a.
+    Repeat: 10.0.0.5 CVE-2021-44228
+    """
+    assert extract_iocs(text) == {
+        "asn": ["AS13335"],
+        "cve": ["CVE-2021-44228"],
+        "domain": ["example.com"],
+        "email": ["soc@example.com"],
+        "ipv4": ["10.0.0.5"],
+        "ipv6": ["fe80::1ff:fe23:4567:890a"],
+        "mac": ["00:11:22:33:44:55"],
+        "md5": ["d41d8cd98f00b204e9800998ecf8427e"],
+        "sha1": [],
+        "sha256": [],
+        "sha512": [],
+        "url": ["https://evil.example.org/payload.exe"],
+    }
+
+
+def test_extract_iocs_selected_kinds():
+    text = "10.0.0.1 and CVE-2020-0001"
+    assert extract_iocs(text, kinds=["cve", "ipv4"]) == {
+        "cve": ["CVE-2020-0001"],
+        "ipv4": ["10.0.0.1"],
+    }
+
+
+def test_extract_iocs_rejects_unknown_kind():
+    with pytest.raises(ValueError, match="Unsupported IoC kinds"):
+        extract_iocs("text", kinds=["ipv4", "bitcoin"])  # type: ignore[list-item]
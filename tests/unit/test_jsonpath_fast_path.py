@@ -0,0 +1,158 @@
+from typing import Any
+
+import pytest
+
+from tracecat.exceptions import TracecatExpressionError
+from tracecat.expressions import common
+from tracecat.expressions.common import eval_jsonpath
+
+OPERAND: dict[str, Any] = {
+    "ACTIONS": {
+        "step": {
+            "result": {
+                "items": [{"name": "a", "tags": ["x"]}, {"name": "b", "tags": []}],
+                "empty": [],
+                "none": None,
+                "text": "hello",
+                "nested": {"list": [[1, 2], [3, 4]]},
+                "id": 1,
+            }
+        }
+    },
+    "TRIGGER": {"key-with-dash": 2},
+}
+
+
+def _reference(expr: str, *, strict: bool = False) -> Any:
+    """Evaluate through jsonpath_ng only."""
+    original = common._simple_path_segments
+    common._simple_path_segments = lambda expr: None  # type: ignore[assignment]
+    try:
+        return eval_jsonpath(expr, OPERAND, strict=strict)
+    finally:
+        common._simple_path_segments = original
+
+
+@pytest.mark.parametrize(
+    "expr",
+    [
+        "ACTIONS",
+        "ACTIONS.step.result",
+        "ACTIONS.step.result.items[0].name",
+        "ACTIONS.step.result.items[1].tags",
+        "ACTIONS.step.result.items[5].name",
+        "ACTIONS.step.result.empty[0]",
+        "ACTIONS.step.result.none",
+        "ACTIONS.step.result.none.field",
+        "ACTIONS.step.result.text[0]",
+        "ACTIONS.step.result.text.field",
+        "ACTIONS.step.result.nested.list[1][0]",
+        "ACTIONS.step.result.id",
+        "ACTIONS.step.result.missing",
+        "ACTIONS.missing.result",
+        "TRIGGER.key-with-dash",
+        "ACTIONS.step.result.items[*].name",
+        "ACTIONS.step.result.items[-1].name",
+        "ACTIONS.step.result.items[?(@.name == 'b')].name",
+        "ACTIONS.step.result.*",
+        "ACTIONS.step..name",
+        "ACTIONS.step.result.'id'",
+    ],
+)
+def test_fast_path_matches_jsonpath_ng(expr: str) -> None:
+    assert eval_jsonpath(expr, OPERAND) == _reference(expr)
+
+
+@pytest.mark.parametrize(
+    ("expr", "segments"),
+    [
+        ("ACTIONS.step.result", ("ACTIONS", "step", "result")),
+        (
+            "ACTIONS.step.result[0][12].name",
+            ("ACTIONS", "step", "result", 0, 12, "name"),
+        ),
+        ("TRIGGER", ("TRIGGER",)),
+        ("ACTIONS.step.result[*]", None),
+        ("ACTIONS.step.result[-1]", None),
+        ("ACTIONS.step..name", None),
+        ("ACTIONS.step.'quoted'", None),
+        ("ACTIONS.step.where", None),
+        ("$.step", None),
+    ],
+)
+def test_simple_path_segments(
+    expr: str, segments: tuple[str | int, ...] | None
+) -> None:
+    assert common._simple_path_segments(expr) == segments
+
+
+def test_fast_path_strict_no_match_matches_jsonpath_ng() -> None:
+    expr = "ACTIONS.step.result.items[9].name"
+
+    with pytest.raises(TracecatExpressionError) as expected:
+        _reference(expr, strict=True)
+    with pytest.raises(TracecatExpressionError) as actual:
+        eval_jsonpath(expr, OPERAND, strict=True)
+
+    assert str(actual.value) == str(expected.value)
+    assert actual.value.detail == expected.value.detail
+
+
+def test_fast_path_does_not_call_jsonpath_find(monkeypatch: pytest.MonkeyPatch) -> None:
+    expr = "ACTIONS.step.result.items[0].name"
+    common._simple_path_segments(expr)
+
+    def fail_parse(expr: str) -> Any:
+        raise AssertionError("jsonpath_ng should not be used for simple paths")
+
+    monkeypatch.setattr(common, "parse_jsonpath", fail_parse)
+
+    assert eval_jsonpath(expr, OPERAND) == "a"
+
+
+BATCH_PATHS = [
+    "ACTIONS.step.result.items[0].name",
+    "ACTIONS.step.result.items[1].tags",
+    "ACTIONS.step.result.items[5].name",
+    "ACTIONS.step.result.none",
+    "ACTIONS.step.result.none.field",
+    "ACTIONS.step.result.text[0]",
+    "ACTIONS.step.result.nested.list[1][0]",
+    "ACTIONS.step.result.missing",
+    "ACTIONS.step.result",
+    "ACTIONS.step.result.items[*].name",
+    "TRIGGER.key-with-dash",
+]
+
+
+def test_resolve_jsonpaths_matches_eval_jsonpath() -> None:
+    resolved = common.resolve_jsonpaths(BATCH_PATHS, OPERAND)
+
+    assert resolved == {
+        "ACTIONS.step.result.items[0].name": "a",
+        "ACTIONS.step.result.items[1].tags": [],
+        "ACTIONS.step.result.none": None,
+        "ACTIONS.step.result.nested.list[1][0]": 3,
+        "ACTIONS.step.result": OPERAND["ACTIONS"]["step"]["result"],
+    }
+    for expr, value in resolved.items():
+        assert eval_jsonpath(expr, OPERAND) == value
+
+
+def test_prefetched_jsonpaths_serves_matching_operand_only(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    paths = [path for path in BATCH_PATHS if common._simple_path_segments(path)]
+    other = {"ACTIONS": {"step": {"result": {"items": [{"name": "z"}]}}}}
+
+    with common.prefetched_jsonpaths(paths, OPERAND):
+        monkeypatch.setattr(common, "_resolve_simple_path", None)
+        assert eval_jsonpath("ACTIONS.step.result.items[0].name", OPERAND) == "a"
+        monkeypatch.undo()
+
+        assert eval_jsonpath("ACTIONS.step.result.items[0].name", other) == "z"
+        assert eval_jsonpath("ACTIONS.step.result.none.field", OPERAND) is None
+        with pytest.raises(TracecatExpressionError):
+            eval_jsonpath("ACTIONS.step.result.items[5].name", OPERAND, strict=True)
+
+    assert common._RESOLVED_PATHS.get() is None
@@ -6110,6 +6110,8 @@ async def test_run_case_task(monkeypatch):
             "config": {"scheduler": "static"},
         },
         registry_lock=None,
+        id=uuid.uuid4(),
+        version=1,
     )
 
     class _FakeSession:
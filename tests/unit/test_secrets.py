@@ -256,6 +256,31 @@ class TestObjectMasking:
 
         assert result == ["***", {"nested": "***"}]
 
+    def test_apply_masks_object_returns_unmasked_objects_unchanged(self):
+        masks = ["secret", "password"]
+        clean = {"key": ["public", ("value", 1)], "other": {"nested": "data"}}
+        input_data = {"clean": clean, "dirty": ["keep", "a secret"]}
+
+        assert apply_masks_object(clean, masks) is clean
+
+        result = apply_masks_object(input_data, masks)
+        assert result == {"clean": clean, "dirty": ["keep", "a ***"]}
+        assert result is not input_data
+        assert result["clean"] is clean
+
+    def test_apply_masks_object_with_no_masks_returns_input(self):
+        input_data = {"key": ["value"]}
+        assert apply_masks_object(input_data, []) is input_data
+
+    def test_apply_masks_prefers_longest_overlapping_secret(self):
+        masks = ["token", "token-suffix", "en-s", "x.y*"]
+        value = "token-suffix token tok en-suffix x.y* xzy"
+        assert apply_masks(value, masks) == "*** *** tok ***uffix *** xzy"
+
+    def test_apply_masks_handles_long_secrets(self):
+        pem = "-----BEGIN KEY-----\n" + "A" * 5000 + "\n-----END KEY-----"
+        assert apply_masks(f"key: {pem}.", [pem, "A" * 100]) == "key: ***."
+
 
 class TestSecurityFeatures:
     """Test suite for security-related masking features and vulnerability prevention."""
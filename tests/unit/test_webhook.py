@@ -327,6 +327,8 @@ class TestIncomingWebhook:
                     "config": {"enable_runtime_tests": False},
                 },
                 registry_lock=None,
+                id=uuid.uuid4(),
+                version=1,
             ),
         )
 
@@ -90,7 +90,9 @@ def _definition(**overrides: Any) -> WorkflowDefinition:
     content.update(overrides)
     return cast(
         WorkflowDefinition,
-        SimpleNamespace(content=content, registry_lock=None),
+        SimpleNamespace(
+            id=uuid.uuid4(), version=1, content=content, registry_lock=None
+        ),
     )
 
 
@@ -923,6 +925,8 @@ class TestWebhookRouterExecutionPath:
                     "config": {"enable_runtime_tests": False},
                 },
                 registry_lock=lock_data,
+                id=uuid.uuid4(),
+                version=1,
             ),
         )
 
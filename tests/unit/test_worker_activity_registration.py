@@ -405,3 +405,11 @@ async def test_agent_executor_worker_raises_when_runtime_service_reports_failure
 
     with pytest.raises(RuntimeError, match="LLM gateway became unhealthy"):
         await executor_worker.main(shutdown_event=shutdown_event)
+
+
+def test_dsl_worker_sandbox_passes_through_curated_modules() -> None:
+    from tracecat.dsl import worker
+
+    restrictions = worker.new_sandbox_runner().restrictions
+
+    assert worker.WORKFLOW_PASSTHROUGH_MODULES <= restrictions.passthrough_modules
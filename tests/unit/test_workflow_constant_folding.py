@@ -0,0 +1,148 @@
+from typing import Any
+
+import pytest
+
+from tracecat.dsl.common import DSLEntrypoint, DSLInput
+from tracecat.dsl.schemas import ActionStatement
+from tracecat.expressions.eval import eval_templated_object
+from tracecat.workflow.management.folding import (
+    MAX_FOLDED_VALUE_BYTES,
+    fold_constants,
+)
+
+
+def _dsl(
+    args: dict[str, Any], *, returns: Any = None, action: str = "core.http_request"
+) -> DSLInput:
+    return DSLInput(
+        title="Folding",
+        description="Constant folding",
+        entrypoint=DSLEntrypoint(ref="a"),
+        actions=[
+            ActionStatement(ref="a", action=action, args=args),
+            ActionStatement(
+                ref="b", action="core.transform.reshape", args={"value": 1}
+            ),
+        ],
+        returns=returns,
+    )
+
+
+@pytest.mark.parametrize(
+    ("template", "expected"),
+    [
+        ("${{ 60 * 5 }}", 300),
+        ("${{ FN.concat('a', 'b') }}", "ab"),
+        ("${{ FN.to_base64('user:pass') }}", "dXNlcjpwYXNz"),
+        ("${{ [1, 'x', None, True] }}", [1, "x", None, True]),
+        ("${{ {'k': FN.uppercase('v')} }}", {"k": "V"}),
+        ("${{ '5' -> int }}", 5),
+        ("${{ 1 if True else 2 }}", 1),
+        ("https://host/${{ FN.lowercase('API') }}/v1", "https://host/api/v1"),
+        ("${{ 1 + 1 }} and ${{ 2 + 2 }}", "2 and 4"),
+    ],
+)
+def test_fold_constant_templates(template: str, expected: Any) -> None:
+    dsl = _dsl({"value": template})
+
+    folded, report = fold_constants(dsl)
+
+    assert folded.actions[0].args["value"] == expected
+    assert folded.actions[0].args["value"] == eval_templated_object(template)
+    assert report.paths == ["actions.a.args.value"]
+
+
+@pytest.mark.parametrize(
+    "template",
+    [
+        "${{ TRIGGER.id }}",
+        "${{ ACTIONS.b.result }}",
+        "${{ SECRETS.api.KEY }}",
+        "${{ VARS.config.url }}",
+        "${{ ENV.workflow.run_id }}",
+        "${{ var.item }}",
+        "${{ FN.now() }}",
+        "${{ FN.uuid4() }}",
+        "${{ FN.range(0, 10) }}",
+        "${{ 'a' * 3 }}",
+        "${{ FN.div(1, 0) }}",
+        "${{ FN.to_datetime('2024-01-01') }}",
+        "${{ FN.concat('$', '{', '{ 1 }', '}') }}",
+        "${{ ACTIONS.b.result }}${{ '' }}",
+    ],
+)
+def test_non_constant_templates_are_preserved(template: str) -> None:
+    dsl = _dsl({"value": template})
+
+    folded, report = fold_constants(dsl)
+
+    assert folded is dsl
+    assert report.folded == 0
+
+
+def test_fold_partial_inline_template() -> None:
+    dsl = _dsl({"url": "https://x/${{ FN.concat('a', 'b') }}/${{ TRIGGER.id }}"})
+
+    folded, report = fold_constants(dsl)
+
+    assert folded.actions[0].args["url"] == "https://x/ab/${{ TRIGGER.id }}"
+    assert report.folded == 1
+
+
+def test_fold_report_counts_nested_values_and_returns() -> None:
+    dsl = _dsl(
+        {
+            "headers": {"X-Key": "${{ FN.to_base64('k') }}", "Static": "v"},
+            "items": ["${{ 2 + 3 }}", "${{ ACTIONS.b.result }}"],
+        },
+        returns={"total": "${{ 10 * 10 }}"},
+    )
+
+    folded, report = fold_constants(dsl)
+
+    assert report.paths == [
+        "actions.a.args.headers.X-Key",
+        "actions.a.args.items[0]",
+        "returns.total",
+    ]
+    assert folded.actions[0].args == {
+        "headers": {"X-Key": "aw==", "Static": "v"},
+        "items": [5, "${{ ACTIONS.b.result }}"],
+    }
+    assert folded.returns == {"total": 100}
+    # Untouched statements are shared, and the input is not mutated.
+    assert folded.actions[1] is dsl.actions[1]
+    assert dsl.actions[0].args["items"][0] == "${{ 2 + 3 }}"
+
+
+def test_preserved_parameters_are_not_folded() -> None:
+    dsl = _dsl(
+        {"definition_yaml": "${{ FN.concat('a', 'b') }}", "title": "${{ 1 + 1 }}"},
+        action="core.workflow.create_workflow",
+    )
+
+    folded, report = fold_constants(dsl)
+
+    assert folded.actions[0].args["definition_yaml"] == "${{ FN.concat('a', 'b') }}"
+    assert report.folded == 0
+
+
+def test_large_values_are_not_folded() -> None:
+    big = "x" * MAX_FOLDED_VALUE_BYTES
+    dsl = _dsl({"value": f"${{{{ FN.concat('{big}', 'y') }}}}"})
+
+    folded, report = fold_constants(dsl)
+
+    assert folded is dsl
+    assert report.folded == 0
+
+
+def test_folding_preserves_unset_fields() -> None:
+    dsl = _dsl({"value": "${{ 1 + 1 }}"})
+
+    folded, _ = fold_constants(dsl)
+
+    assert (
+        folded.model_dump(exclude_unset=True).keys()
+        == dsl.model_dump(exclude_unset=True).keys()
+    )
@@ -1,5 +1,7 @@
-from collections.abc import AsyncGenerator
+import uuid
+from collections.abc import AsyncGenerator, Iterator
 from datetime import datetime
+from unittest.mock import patch
 
 import pytest
 import yaml
@@ -7,11 +9,17 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from tracecat.auth.types import Role
-from tracecat.db.models import Workflow, Workspace
+from tracecat.db.models import Workflow, WorkflowDefinition, Workspace
 from tracecat.dsl.common import DSLInput
 from tracecat.exceptions import ScopeDeniedError
 from tracecat.identifiers.workflow import WorkflowUUID
-from tracecat.workflow.management.definitions import WorkflowDefinitionsService
+from tracecat.workflow.management import definitions as definitions_module
+from tracecat.workflow.management.definitions import (
+    WorkflowDefinitionCache,
+    WorkflowDefinitionsService,
+    load_definition,
+)
+from tracecat.workflow.management.schemas import WorkflowDefinitionActivityResult
 
 pytestmark = pytest.mark.usefixtures("db")
 
@@ -134,6 +142,94 @@ async def test_get_definition_falls_back_to_latest_when_current_version_missing(
     assert null_pointer_result.id == version_two.id
 
 
+@pytest.fixture
+def definition_cache() -> Iterator[WorkflowDefinitionCache]:
+    cache = WorkflowDefinitionCache(maxsize=2)
+    with patch.object(definitions_module, "definition_cache", cache):
+        yield cache
+
+
+@pytest.mark.anyio
+async def test_get_definition_result_caches_versions(
+    definitions_service: WorkflowDefinitionsService,
+    workflow_id: WorkflowUUID,
+    session: AsyncSession,
+    definition_cache: WorkflowDefinitionCache,
+):
+    await definitions_service.create_workflow_definition(
+        workflow_id=workflow_id,
+        dsl=_dsl_input("v1"),
+        commit=True,
+    )
+
+    first = await definitions_service.get_definition_result(workflow_id)
+    second = await definitions_service.get_definition_result(workflow_id)
+    assert first is not None
+    assert second is first
+    assert first.dsl.title == "Test Workflow v1"
+    assert (definition_cache.stats.hits, definition_cache.stats.misses) == (1, 1)
+
+    # Publishing a new version is picked up without invalidation
+    version_two = await definitions_service.create_workflow_definition(
+        workflow_id=workflow_id,
+        dsl=_dsl_input("v2"),
+        commit=True,
+    )
+    workflow = await session.scalar(select(Workflow).where(Workflow.id == workflow_id))
+    assert workflow is not None
+    workflow.version = version_two.version
+    await session.commit()
+
+    current = await definitions_service.get_definition_result(workflow_id)
+    assert current is not None
+    assert current.dsl.title == "Test Workflow v2"
+    pinned = await definitions_service.get_definition_result(workflow_id, version=1)
+    assert pinned is first
+    assert definition_cache.stats.hit_rate == 0.5
+
+    missing = await definitions_service.get_definition_result(workflow_id, version=99)
+    assert missing is None
+    assert len(definition_cache) == 2
+
+
+def test_definition_cache_evicts_least_recently_used():
+    cache = WorkflowDefinitionCache(maxsize=2)
+    keys = [(uuid.uuid4(), 1) for _ in range(3)]
+    results = [
+        WorkflowDefinitionActivityResult(dsl=_dsl_input(str(i))) for i in range(3)
+    ]
+
+    cache.put(keys[0], results[0])
+    cache.put(keys[1], results[1])
+    assert cache.get(keys[0]) is results[0]
+    cache.put(keys[2], results[2])
+
+    assert cache.get(keys[1]) is None
+    assert cache.get(keys[0]) is results[0]
+    assert cache.get(keys[2]) is results[2]
+    assert cache.stats.evictions == 1
+
+
+def test_load_definition_validates_each_definition_once(
+    definition_cache: WorkflowDefinitionCache,
+):
+    defn = WorkflowDefinition(
+        id=uuid.uuid4(),
+        version=1,
+        content=_dsl_input("v1").model_dump(exclude_unset=True),
+        registry_lock={"origins": {"tracecat_registry": "v1"}, "actions": {}},
+    )
+
+    with patch.object(definitions_module, "DSLInput", wraps=DSLInput) as dsl_input_cls:
+        first = load_definition(defn)
+        second = load_definition(defn)
+
+    assert second is first
+    assert first.dsl.title == "Test Workflow v1"
+    assert first.registry_lock is not None
+    assert dsl_input_cls.call_count == 1
+
+
 @pytest.mark.anyio
 async def test_create_workflow_definition_with_datetime_serialization(
     definitions_service: WorkflowDefinitionsService,
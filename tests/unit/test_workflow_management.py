@@ -1245,7 +1245,9 @@ async def test_run_workflow_published_latest_uses_definition_lock(
         "actions": {"core.transform.reshape": "tracecat_registry"},
         "origin_fingerprints": {},
     }
-    defn = SimpleNamespace(content=dsl.model_dump(), registry_lock=lock)
+    defn = SimpleNamespace(
+        id=uuid.uuid4(), version=1, content=dsl.model_dump(), registry_lock=lock
+    )
 
     captured: dict[str, Any] = {}
 
@@ -1276,7 +1278,9 @@ async def test_run_workflow_published_version_is_forwarded(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     dsl = _run_dsl()
-    defn = SimpleNamespace(content=dsl.model_dump(), registry_lock=None)
+    defn = SimpleNamespace(
+        id=uuid.uuid4(), version=3, content=dsl.model_dump(), registry_lock=None
+    )
     captured: dict[str, Any] = {}
 
     class _FakeDefnService:
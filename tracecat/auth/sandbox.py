@@ -5,7 +5,7 @@ from __future__ import annotations
 import asyncio
 from collections.abc import Iterable, Iterator, Sequence
 from types import TracebackType
-from typing import Any, Self
+from typing import TYPE_CHECKING, Any, Self
 
 from tracecat.auth.secrets import get_db_encryption_key
 from tracecat.auth.types import Role
@@ -18,6 +18,9 @@ from tracecat.secrets.encryption import decrypt_keyvalues
 from tracecat.secrets.schemas import SecretKeyValue, SecretSearch
 from tracecat.secrets.service import SecretsService
 
+if TYPE_CHECKING:
+    from tracecat.executor.prefetch import RunPrefetchCache
+
 
 class AuthSandbox:
     """Context manager to temporarily set secrets in the environment as env vars.
@@ -37,6 +40,8 @@ class AuthSandbox:
         environment: str = DEFAULT_SECRETS_ENVIRONMENT,
         # Keys specified here will tell the sandbox to ignore if they are missing
         optional_secrets: Iterable[str] | None = None,  # Base secret names only
+        # Secrets of the current workflow run and environment loaded ahead of time
+        cache: RunPrefetchCache | None = None,
     ):
         self._role = role or ctx_role.get()
         self._secret_paths = set(secrets or [])
@@ -44,6 +49,7 @@ class AuthSandbox:
         self._context: dict[str, Any] = {}
         self._environment = environment
         self._optional_secrets = set(optional_secrets or [])
+        self._cache = cache
         self._encryption_key = get_db_encryption_key()
 
     def __enter__(self) -> Self:
@@ -129,19 +135,30 @@ class AuthSandbox:
 
         # These are a combination of required and optional secrets
         unique_secret_names = {path.split(".")[0] for path in self._secret_paths}
-        async with SecretsService.with_session(role=self._role) as service:
-            logger.info("Retrieving secrets", secret_names=unique_secret_names)
-
-            secrets = await service.search_secrets(
-                SecretSearch(names=unique_secret_names, environment=self._environment)
-            )
-
         # Filter out optional secrets
         unique_req_secret_names = {
             secret_name
             for secret_name in unique_secret_names
             if secret_name not in self._optional_secrets
         }
+
+        secrets: Sequence[BaseSecret] = []
+        names_to_fetch = unique_secret_names
+        if self._cache is not None:
+            secrets, names_to_fetch = self._cache.get_secrets(
+                unique_secret_names, required=unique_req_secret_names
+            )
+        if names_to_fetch:
+            async with SecretsService.with_session(role=self._role) as service:
+                logger.info("Retrieving secrets", secret_names=names_to_fetch)
+
+                fetched = await service.search_secrets(
+                    SecretSearch(names=names_to_fetch, environment=self._environment)
+                )
+            if self._cache is not None:
+                self._cache.put_secrets(names_to_fetch, fetched)
+            secrets = [*secrets, *fetched]
+
         defined_req_secret_names = {
             secret.name
             for secret in secrets
@@ -113,6 +113,31 @@ TRACECAT__DSL_SCHEDULER_MAX_PENDING_TASKS = int(
 )
 """Maximum number of scheduler task coroutines allowed in-flight."""
 
+TRACECAT__DSL_CONTINUE_AS_NEW_HISTORY_LENGTH = int(
+    os.environ.get("TRACECAT__DSL_CONTINUE_AS_NEW_HISTORY_LENGTH") or 20_000
+)
+"""History events after which a DSL workflow checkpoints and continues as new.
+
+Set this and the size threshold to 0 to disable checkpointing.
+"""
+
+TRACECAT__DSL_CONTINUE_AS_NEW_HISTORY_SIZE_BYTES = int(
+    os.environ.get("TRACECAT__DSL_CONTINUE_AS_NEW_HISTORY_SIZE_BYTES")
+    or 20 * 1024 * 1024
+)
+"""History size after which a DSL workflow checkpoints and continues as new."""
+
+TRACECAT__DSL_LOCAL_PLATFORM_ACTIVITIES = env_bool(
+    "TRACECAT__DSL_LOCAL_PLATFORM_ACTIVITIES", default=True
+)
+"""Run short platform activities (expression evaluation, scatter input, gather
+finalization, collection sync) as local activities on the workflow worker."""
+
+TRACECAT__WORKFLOW_DEFINITION_CACHE_SIZE = int(
+    os.environ.get("TRACECAT__WORKFLOW_DEFINITION_CACHE_SIZE") or 256
+)
+"""Validated workflow definitions cached per process. Set to 0 to disable."""
+
 TRACECAT__CHILD_WORKFLOW_DISPATCH_WINDOW = bound_env(
     "TRACECAT__CHILD_WORKFLOW_DISPATCH_WINDOW",
     16,
@@ -176,6 +201,12 @@ TRACECAT__EXECUTOR_THREADPOOL_MAX_WORKERS = int(
 )
 """Activity thread-pool size for the ExecutorWorker; bounds concurrent CPU-bound sync activities competing for the GIL."""
 
+TRACECAT__EXECUTOR_PREFETCH_TTL_SECONDS = float(
+    os.environ.get("TRACECAT__EXECUTOR_PREFETCH_TTL_SECONDS") or 30
+)
+"""How long the executor keeps the secrets and variables it prefetched for a
+workflow run's next actions, in seconds. Set to 0 to disable prefetching."""
+
 TRACECAT__ACTIVITY_HEARTBEAT_TIMEOUT = int(
     os.environ.get("TRACECAT__ACTIVITY_HEARTBEAT_TIMEOUT") or 60
 )
@@ -1092,6 +1123,11 @@ TRACECAT__WORKFLOW_RETURN_STRATEGY: Literal["context", "minimal"] = cast(
 )
 """Strategy to use when returning a value from a workflow. Supported: context, minimal. Defaults to minimal."""
 
+TRACECAT__WORKFLOW_CONSTANT_FOLDING_ENABLED = env_bool(
+    "TRACECAT__WORKFLOW_CONSTANT_FOLDING_ENABLED", default=True
+)
+"""Pre-evaluate constant template expressions when committing a workflow. Defaults to true."""
+
 # === Redis config === #
 REDIS_CHAT_TTL_SECONDS = int(
     os.environ.get("REDIS_CHAT_TTL_SECONDS") or 3 * 24 * 60 * 60  # 3 days
@@ -19,7 +19,6 @@ from tracecat.auth.types import Role
 from tracecat.common import is_iterable
 from tracecat.dsl.common import (
     MAX_LOOP_ITERATIONS,
-    DSLInput,
     ExecuteSubflowArgs,
     PreparedSubflowResult,
     ResolvedSubflowBatch,
@@ -43,6 +42,7 @@ from tracecat.executor.service import get_workspace_variables
 from tracecat.expressions.common import ExprContext
 from tracecat.expressions.core import TemplateExpression
 from tracecat.expressions.eval import (
+    RenderPlan,
     collect_expressions,
     eval_templated_object,
     get_iterables_from_expression,
@@ -52,8 +52,8 @@ from tracecat.expressions.schemas import ExpectedField
 from tracecat.identifiers.workflow import WorkflowUUID
 from tracecat.integrations.mcp_validation import MCPValidationError
 from tracecat.logger import logger
-from tracecat.registry.lock.types import RegistryLock
 from tracecat.storage.collection import (
+    get_collection_page,
     materialize_collection_values,
     store_collection,
 )
@@ -188,6 +188,12 @@ class FinalizeGatherActivityInput(BaseModel):
     key: str
     drop_nulls: bool = False
     error_strategy: StreamErrorHandlingStrategy = StreamErrorHandlingStrategy.PARTITION
+    parts: list[CollectionObject | list[StoredObject]] = Field(default_factory=list)
+    """Items of a streamed gather, in stream order, following `collection`.
+
+    Flushed chunks are collections of item handles, with `None` for streams
+    that produced no item. Unflushed items are passed inline.
+    """
 
 
 class FinalizeGatherActivityResult(BaseModel):
@@ -494,6 +500,12 @@ class DSLActivities:
         storage = get_object_storage()
         return await storage.store(key, data)
 
+    @staticmethod
+    @activity.defn
+    async def retrieve_workflow_payload_activity(stored: StoredObject) -> Any:
+        """Retrieve a payload stored by `store_workflow_payload_activity`."""
+        return await retrieve_stored_object(stored)
+
     @staticmethod
     @activity.defn
     def evaluate_single_expression_activity(
@@ -636,9 +648,10 @@ class DSLActivities:
     ) -> FinalizeGatherActivityResult:
         """Finalize gather by materializing items and storing as CollectionObject.
 
-        Takes a list of StoredObjects (one per execution stream), materializes
-        each to its raw value, applies drop_nulls + error_strategy, and stores
-        the resulting list as a CollectionObject.
+        Takes a list of StoredObjects (one per execution stream, inline or in
+        chunks flushed by a streamed gather), materializes each to its raw
+        value, applies drop_nulls + error_strategy, and stores the resulting
+        list as a CollectionObject.
 
         Returns the CollectionObject handle and any partitioned errors.
         """
@@ -647,6 +660,16 @@ class DSLActivities:
         for obj in input.collection:
             value = await storage.retrieve(obj)
             values.append(value)
+        for part in input.parts:
+            if isinstance(part, CollectionObject):
+                part = [
+                    StoredObjectValidator.validate_python(item)
+                    for item in await get_collection_page(part)
+                    if item is not None
+                ]
+            for obj in part:
+                value = await storage.retrieve(obj)
+                values.append(value)
 
         if input.drop_nulls:
             values = [v for v in values if v is not None]
@@ -949,6 +972,7 @@ def _resolve_subflow_batch(
     # Evaluate args for each iteration in the batch
     configs: list[ResolvedSubflowConfig] = []
     trigger_inputs_list: list[Any] = []
+    args_plan = RenderPlan(dict(task.args))
 
     for items in batch_items:
         # Patch context with var.item (and other iterator variables)
@@ -961,7 +985,7 @@ def _resolve_subflow_batch(
             )
 
         # Evaluate the full task args with patched context
-        evaluated_args = eval_templated_object(dict(task.args), operand=patched_context)
+        evaluated_args = args_plan.render(patched_context)
 
         # Extract DSL config fields
         configs.append(
@@ -1102,17 +1126,15 @@ async def _prepare_subflow(input: PrepareSubflowActivityInput) -> PreparedSubflo
     else:
         raise UserError("Either workflow_id or workflow_alias must be provided")
 
-    # Fetch workflow definition
+    # Fetch workflow definition, usually from the worker's definition cache
     async with WorkflowDefinitionsService.with_session(role=input.role) as service:
-        defn = await service.get_definition_by_workflow_id(
+        defn = await service.get_definition_result(
             wf_id, version=evaluated_args.get("version")
         )
-        if not defn:
-            raise UserError(f"Workflow definition not found for {wf_id.short()}")
-    dsl = DSLInput(**defn.content)
-    registry_lock = (
-        RegistryLock.model_validate(defn.registry_lock) if defn.registry_lock else None
-    )
+    if not defn:
+        raise UserError(f"Workflow definition not found for {wf_id.short()}")
+    dsl = defn.dsl
+    registry_lock = defn.registry_lock
 
     # For single subflows (no for_each), evaluate args and return
     if not task.for_each:
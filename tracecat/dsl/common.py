@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from collections import deque
+from collections.abc import Callable
 from datetime import datetime, timedelta
 from pathlib import Path
 from tempfile import SpooledTemporaryFile
@@ -41,6 +42,7 @@ from tracecat.dsl.schemas import (
     DSLConfig,
     DSLEnvironment,
     DSLExecutionError,
+    DSLExecutionSettings,
     ExecutionContext,
     RunContext,
     StreamID,
@@ -900,6 +902,20 @@ class DSLRunArgs(BaseModel):
         default=None,
         description="Registry version lock for action execution. Contains origins (origin -> version) and actions (action_name -> origin) mappings.",
     )
+    checkpoint: list[StoredObject] | None = Field(
+        default=None,
+        description=(
+            "Stored parts of the workflow checkpoint to resume from. Set "
+            "internally when a workflow continues as new."
+        ),
+    )
+    execution_settings: DSLExecutionSettings | None = Field(
+        default=None,
+        description=(
+            "Worker settings resolved when the execution started. Set internally "
+            "when a workflow continues as new."
+        ),
+    )
 
     @field_validator("wf_id", mode="before")
     @classmethod
@@ -1437,3 +1453,36 @@ RETRY_POLICIES = {
         non_retryable_error_types=NON_RETRYABLE_ERROR_TYPES,
     ),
 }
+
+LOCAL_PLATFORM_ACTIVITIES_PATCH = "dsl-local-platform-activities-v1"
+"""Patch marker for running short platform activities as local activities."""
+
+
+async def execute_platform_activity(
+    activity: Callable[..., Any],
+    *args: Any,
+    local: bool,
+    start_to_close_timeout: timedelta,
+    retry_policy: RetryPolicy,
+) -> Any:
+    """Execute a short platform activity that runs on the workflow worker.
+
+    These activities only evaluate expressions or move stored objects, so they
+    run as local activities when `local` is set. That skips task queue
+    scheduling and records a single marker event instead of three activity
+    events. Pass the execution's `local_platform_activities` setting, never
+    the worker config, so that replays make the same choice.
+    """
+    if local and workflow.patched(LOCAL_PLATFORM_ACTIVITIES_PATCH):
+        return await workflow.execute_local_activity(
+            activity,
+            args=args,
+            start_to_close_timeout=start_to_close_timeout,
+            retry_policy=retry_policy,
+        )
+    return await workflow.execute_activity(
+        activity,
+        args=args,
+        start_to_close_timeout=start_to_close_timeout,
+        retry_policy=retry_policy,
+    )
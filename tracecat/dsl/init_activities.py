@@ -5,6 +5,8 @@ from datetime import datetime
 from pydantic import BaseModel
 from temporalio import activity
 
+from tracecat import config
+from tracecat.dsl.schemas import DSLExecutionSettings
 from tracecat.feature_flags import FeatureFlag, is_feature_enabled
 from tracecat.workflow.executions.enums import TriggerType
 
@@ -38,3 +40,19 @@ def resolve_time_anchor_activity(
 def resolve_workflow_concurrency_limits_enabled_activity() -> bool:
     """Resolve and freeze concurrency-limit flag state in workflow history."""
     return is_feature_enabled(FeatureFlag.WORKFLOW_CONCURRENCY_LIMITS)
+
+
+@activity.defn
+def resolve_execution_settings_activity() -> DSLExecutionSettings:
+    """Resolve and freeze the worker settings that workflow code branches on."""
+    return DSLExecutionSettings(
+        local_platform_activities=config.TRACECAT__DSL_LOCAL_PLATFORM_ACTIVITIES,
+        result_externalization_enabled=config.TRACECAT__RESULT_EXTERNALIZATION_ENABLED,
+        collection_chunk_size=config.TRACECAT__COLLECTION_CHUNK_SIZE,
+        continue_as_new_history_length=(
+            config.TRACECAT__DSL_CONTINUE_AS_NEW_HISTORY_LENGTH
+        ),
+        continue_as_new_history_size_bytes=(
+            config.TRACECAT__DSL_CONTINUE_AS_NEW_HISTORY_SIZE_BYTES
+        ),
+    )
@@ -0,0 +1,169 @@
+"""Deterministic in-workflow evaluation of single template expressions.
+
+`DSLActivities.evaluate_single_expression_activity` materializes the context
+and evaluates one expression in an activity. For conditions such as `run_if`
+and `core.loop.end` that only read inline results and call pure functions, that
+round trip is unnecessary: the data is already in workflow memory and the
+result is a pure function of it, so evaluating in the workflow replays
+identically.
+
+`evaluate_expression_inline` raises `InlineEvaluationUnavailable` whenever it
+cannot guarantee the same result as the activity, and the caller falls back to
+the activity.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from lark import Token, Tree
+
+from tracecat.dsl._converter import PydanticPayloadConverter
+from tracecat.dsl.schemas import (
+    DSLEnvironment,
+    ExecutionContext,
+    MaterializedExecutionContext,
+    MaterializedTaskResult,
+    TaskResult,
+)
+from tracecat.expressions import patterns
+from tracecat.expressions.core import TemplateExpression
+from tracecat.expressions.functions import NON_DETERMINISTIC_FUNCTIONS
+from tracecat.expressions.parser.core import parser
+from tracecat.storage.object import InlineObject, StoredObjectValidator
+
+_PAYLOAD_CONVERTER = PydanticPayloadConverter()
+
+
+class InlineEvaluationUnavailable(Exception):
+    """The expression must be evaluated by the activity instead."""
+
+
+def _referenced_contexts(tree: Tree[Token]) -> tuple[set[str], bool]:
+    """Return the action refs and whether ``TRIGGER`` is read by ``tree``."""
+    action_refs: set[str] = set()
+    uses_trigger = False
+    for node in tree.iter_subtrees():
+        match node.data:
+            case "function":
+                fn_name = str(node.children[0]).removesuffix(".map")
+                if fn_name in NON_DETERMINISTIC_FUNCTIONS:
+                    raise InlineEvaluationUnavailable(
+                        f"FN.{fn_name} is not deterministic"
+                    )
+            case "actions":
+                # Same ref extraction as `RegistryActionExtractor`.
+                path = str(node.children[0]).lstrip(".")
+                action_refs.add(path.split(".", 1)[0])
+            case "trigger":
+                uses_trigger = True
+    return action_refs, uses_trigger
+
+
+def _materialize_inline(task_result: Any) -> MaterializedTaskResult:
+    validated = TaskResult.model_validate(task_result)
+    match validated.result:
+        case InlineObject(data=data):
+            if validated.collection_index is not None and isinstance(data, list):
+                raw_result = data[validated.collection_index]
+            else:
+                raw_result = data
+        case _:
+            raise InlineEvaluationUnavailable("Action result is not stored inline")
+    return MaterializedTaskResult(
+        result=raw_result,
+        result_typename=validated.result_typename,
+        error=validated.error,
+        error_typename=validated.error_typename,
+        interaction=validated.interaction,
+        interaction_id=validated.interaction_id,
+        interaction_type=validated.interaction_type,
+    )
+
+
+def _referenced_context(
+    context: ExecutionContext, action_refs: set[str], uses_trigger: bool
+) -> ExecutionContext:
+    """The subset of ``context`` that the expression can read."""
+    actions = context.get("ACTIONS") or {}
+    referenced = ExecutionContext(
+        ACTIONS={ref: actions[ref] for ref in action_refs if ref in actions},
+        TRIGGER=context.get("TRIGGER") if uses_trigger else None,
+    )
+    if (env := context.get("ENV")) is not None:
+        referenced["ENV"] = DSLEnvironment(**env)
+    if (secrets := context.get("SECRETS")) is not None:
+        referenced["SECRETS"] = secrets
+    if (vars := context.get("VARS")) is not None:
+        referenced["VARS"] = vars
+    if (var := context.get("var")) is not None:
+        referenced["var"] = var
+    return referenced
+
+
+def _materialize_operand(context: ExecutionContext) -> MaterializedExecutionContext:
+    """Materialize ``context`` exactly as the activity would receive it.
+
+    The context is round-tripped through the payload converter first, so values
+    that are not JSON native in workflow memory (tuples, datetimes) have the
+    same form as in the activity.
+    """
+    try:
+        payload = _PAYLOAD_CONVERTER.to_payload(context)
+    except Exception as e:
+        raise InlineEvaluationUnavailable("Context is not serializable") from e
+    if payload is None:
+        raise InlineEvaluationUnavailable("Context is not serializable")
+    received: ExecutionContext = _PAYLOAD_CONVERTER.from_payload(
+        payload, ExecutionContext
+    )
+
+    operand: MaterializedExecutionContext = {}
+    if actions := received.get("ACTIONS"):
+        operand["ACTIONS"] = {
+            ref: _materialize_inline(task_result)
+            for ref, task_result in actions.items()
+        }
+    if trigger := received.get("TRIGGER"):
+        match StoredObjectValidator.validate_python(trigger):
+            case InlineObject(data=data):
+                operand["TRIGGER"] = data
+            case _:
+                raise InlineEvaluationUnavailable("Trigger is not stored inline")
+    if env := received.get("ENV"):
+        operand["ENV"] = env
+    if secrets := received.get("SECRETS"):
+        operand["SECRETS"] = secrets
+    if vars := received.get("VARS"):
+        operand["VARS"] = vars
+    if var := received.get("var"):
+        operand["var"] = var
+    return operand
+
+
+def evaluate_expression_inline(expression: str, context: ExecutionContext) -> Any:
+    """Evaluate a templated expression against inline context data.
+
+    Returns the same value as `evaluate_single_expression_activity`. Raises
+    `InlineEvaluationUnavailable` if the expression reads externalized data,
+    calls a non-deterministic function, or fails to evaluate, so that errors
+    are always reported by the activity.
+    """
+    expr_str = expression.strip()
+    if (match := patterns.TEMPLATE_STRING.match(expr_str)) is None:
+        raise InlineEvaluationUnavailable("Not a template expression")
+    try:
+        tree = parser.parse(match.group("expr"))
+    except Exception as e:
+        raise InlineEvaluationUnavailable("Expression failed to parse") from e
+    if tree is None:
+        raise InlineEvaluationUnavailable("Expression failed to parse")
+
+    action_refs, uses_trigger = _referenced_contexts(tree)
+    operand = _materialize_operand(
+        _referenced_context(context, action_refs, uses_trigger)
+    )
+    try:
+        return TemplateExpression(expr_str, operand=operand).result()
+    except Exception as e:
+        raise InlineEvaluationUnavailable("Expression failed to evaluate") from e
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
 import asyncio
-from collections import defaultdict
-from collections.abc import Awaitable, Callable
-from dataclasses import dataclass, replace
+import heapq
+import itertools
+import math
+from collections import defaultdict, deque
+from collections.abc import Awaitable, Callable, Coroutine, Mapping
+from dataclasses import dataclass, field, replace
 from datetime import timedelta
 from typing import Any
 
@@ -16,7 +19,17 @@ from tracecat.dsl.action import ScatterActionInput
 _SCHEDULER_TASK_SPAWN_YIELD_EVERY = 16
 """Yield while spawning ready task coroutines to avoid long workflow activations."""
 
+INLINE_CONDITION_EVAL_PATCH = "dsl-inline-condition-eval-v1"
+"""Patch marker for evaluating `run_if` and loop conditions in the workflow."""
+
+LAZY_SCATTER_STREAMS_PATCH = "dsl-lazy-scatter-streams-v1"
+"""Patch marker for opening scatter streams on demand instead of all at once."""
+
+STREAMING_GATHER_PATCH = "dsl-streaming-gather-v1"
+"""Patch marker for flushing gathered items to collection storage by chunk."""
+
 with workflow.unsafe.imports_passed_through():
+    from pydantic import BaseModel, Field
     from pydantic_core import to_json
     from temporalio.exceptions import ApplicationError
 
@@ -32,6 +45,7 @@ with workflow.unsafe.imports_passed_through():
         AdjDst,
         DSLInput,
         edge_components_from_dep,
+        execute_platform_activity,
     )
     from tracecat.dsl.constants import MAX_DO_WHILE_ITERATIONS
     from tracecat.dsl.enums import (
@@ -43,12 +57,18 @@ with workflow.unsafe.imports_passed_through():
         SkipStrategy,
         StreamErrorHandlingStrategy,
     )
+    from tracecat.dsl.inline_eval import (
+        InlineEvaluationUnavailable,
+        evaluate_expression_inline,
+    )
     from tracecat.dsl.schemas import (
         ROOT_STREAM,
         ActionStatement,
+        DSLExecutionSettings,
         ExecutionContext,
         GatherArgs,
         LoopEndArgs,
+        PrefetchHint,
         RunContext,
         ScatterArgs,
         StreamID,
@@ -64,6 +84,7 @@ with workflow.unsafe.imports_passed_through():
     from tracecat.exceptions import TaskUnreachable
     from tracecat.expressions.common import ExprContext
     from tracecat.expressions.core import extract_expressions
+    from tracecat.storage.collection import CollectionActivities
     from tracecat.storage.object import (
         CollectionObject,
         InlineObject,
@@ -71,6 +92,7 @@ with workflow.unsafe.imports_passed_through():
         StoredObjectValidator,
         action_collection_prefix,
         action_key,
+        gather_chunk_prefix,
     )
 
 
@@ -116,6 +138,145 @@ class LoopRegion:
     members: frozenset[str]
 
 
+@dataclass(slots=True)
+class ScatterRegion:
+    """Compact state of a scatter whose streams are opened on demand."""
+
+    task: Task
+    """The scatter task in its parent stream"""
+    collection: StoredObject
+    size: int
+    interval: float | None
+    started_at: float
+    """Workflow time of the scatter, used to keep `interval` staggering absolute"""
+    batch_size: int | None = None
+    """Run batchable actions of this scatter for up to this many items at once"""
+    next_index: int = 0
+    """Index of the next collection item to open a stream for"""
+
+
+@dataclass(slots=True)
+class GatherBuffer:
+    """Items of a gather in progress, flushed to collection storage by chunk.
+
+    Only items of chunks that still have open streams are held here. A chunk
+    whose streams have all reached the gather is replaced by the handle of a
+    small collection of its item handles.
+    """
+
+    task: Task
+    """The gather task in the parent stream"""
+    size: int
+    chunk_size: int
+    items: dict[int, StoredObject | None] = field(default_factory=dict)
+    """Items of unflushed chunks by stream index, `None` for streams without one"""
+    counts: dict[int, int] = field(default_factory=dict)
+    """Number of items received for each unflushed chunk"""
+    chunks: dict[int, CollectionObject] = field(default_factory=dict)
+    """Flushed chunks by chunk index"""
+
+    def chunk_indices(self, chunk_idx: int) -> range:
+        start = chunk_idx * self.chunk_size
+        return range(start, min(start + self.chunk_size, self.size))
+
+    def add(self, index: int, item: StoredObject | None) -> int | None:
+        """Record the item of a stream, returning its chunk index once complete."""
+        self.items[index] = item
+        chunk_idx = index // self.chunk_size
+        count = self.counts.get(chunk_idx, 0) + 1
+        self.counts[chunk_idx] = count
+        return chunk_idx if count == len(self.chunk_indices(chunk_idx)) else None
+
+    def flushed(self, chunk_idx: int, chunk: CollectionObject) -> None:
+        """Replace the items of a complete chunk with its stored collection."""
+        self.chunks[chunk_idx] = chunk
+        self.counts.pop(chunk_idx, None)
+        for index in self.chunk_indices(chunk_idx):
+            del self.items[index]
+
+    def parts(self) -> list[CollectionObject | list[StoredObject]]:
+        """Flushed chunks and unflushed items, in stream order."""
+        parts: list[CollectionObject | list[StoredObject]] = []
+        for chunk_idx in range(math.ceil(self.size / self.chunk_size)):
+            if (chunk := self.chunks.get(chunk_idx)) is not None:
+                parts.append(chunk)
+                continue
+            last = parts[-1] if parts else None
+            if isinstance(last, list):
+                inline = last
+            else:
+                inline = []
+                parts.append(inline)
+            for index in self.chunk_indices(chunk_idx):
+                if (item := self.items.get(index)) is not None:
+                    inline.append(item)
+        return parts
+
+
+class DSLSchedulerCheckpoint(BaseModel):
+    """Scheduler state between tasks, used to resume after continue-as-new.
+
+    Only taken while no task is running, so it holds no in-flight work. Keys that
+    aren't strings are stored as pairs. Memoized lookups are rebuilt on demand.
+    """
+
+    queue: list[Task]
+    indegrees: list[tuple[Task, int]]
+    completed_tasks: list[Task]
+    edges: list[tuple[DSLEdge, EdgeMarker]]
+    streams: dict[StreamID, ExecutionContext]
+    stream_hierarchy: dict[StreamID, StreamID | None]
+    stream_errors: dict[StreamID, ActionErrorInfo]
+    task_streams: list[tuple[Task, list[StreamID]]]
+    open_streams: list[tuple[Task, int]]
+    loop_indices: list[tuple[str, StreamID, int]]
+    loop_start_skips: list[tuple[str, StreamID]]
+    scatter_regions: list[ScatterRegion]
+    pending_scatters: list[Task]
+    """Scatter tasks with unopened streams, in scatter order"""
+    stream_work: dict[StreamID, int]
+    gather_buffers: list[GatherBuffer] = Field(default_factory=list)
+
+
+class CriticalPathQueue(asyncio.Queue[Task]):
+    """Ready tasks ordered by remaining critical path length, longest first.
+
+    Ties are broken by insertion order, so scheduling stays deterministic.
+    """
+
+    def __init__(self, path_lengths: Mapping[str, int]) -> None:
+        self._path_lengths = path_lengths
+        self._counter = itertools.count()
+        super().__init__()
+
+    def _init(self, maxsize: int) -> None:
+        # asyncio.Queue reads `_queue` directly, e.g. in empty()
+        self._queue: list[tuple[int, int, Task]] = []
+
+    def _qsize(self) -> int:
+        return len(self._queue)
+
+    def _put(self, item: Task) -> None:
+        priority = -self._path_lengths.get(item.ref, 0)
+        heapq.heappush(self._queue, (priority, next(self._counter), item))
+
+    def _get(self) -> Task:
+        return heapq.heappop(self._queue)[2]
+
+
+@dataclass(slots=True)
+class ActionBatch:
+    """Instances of one action across scatter streams, executed together."""
+
+    stmt: ActionStatement
+    size: int
+    tasks: list[Task] = field(default_factory=list)
+    errors: list[BaseException | None] = field(default_factory=list)
+    """Per-task outcome, in `tasks` order, once the batch has run"""
+    dispatched: bool = False
+    done: asyncio.Event = field(default_factory=asyncio.Event)
+
+
 class PlatformExecutionError(Exception):
     """Marks platform work that should fail the workflow, even inside a stream."""
 
@@ -138,10 +299,27 @@ class DSLScheduler:
         role: Role,
         run_context: RunContext,
         logger: WorkflowRuntimeLogger | None = None,
+        batch_executor: Callable[
+            [ActionStatement, list[StreamID]], Awaitable[list[BaseException | None]]
+        ]
+        | None = None,
+        should_checkpoint: Callable[[], bool] | None = None,
+        critical_path_ordering: bool = False,
+        execution_settings: DSLExecutionSettings | None = None,
     ):
         # Static
         self.dsl = dsl
         self.executor = executor
+        self.batch_executor = batch_executor
+        """Executes one action for several streams, returning per-stream errors"""
+        self.should_checkpoint = should_checkpoint
+        """Polled between tasks; once true, the scheduler drains and suspends"""
+        self.critical_path_ordering = critical_path_ordering
+        """Start ready tasks with the longest remaining dependency chain first"""
+        self.execution_settings = execution_settings or DSLExecutionSettings()
+        self.suspended = False
+        """Whether `start` stopped early with work left, ready for `checkpoint`"""
+        self._resumed = False
         if max_pending_tasks < 1:
             raise ValueError("max_pending_tasks must be greater than 0")
         self.max_pending_tasks = max_pending_tasks
@@ -152,11 +330,12 @@ class DSLScheduler:
         self.logger = logger or workflow_logger
         self.tasks: dict[str, ActionStatement] = {}
         """Task definitions"""
+        self.task_expressions: dict[str, Mapping[ExprContext, set[str]]] = {}
+        """Expression contexts referenced by each task, extracted on first use"""
+        self.prefetch_hints: dict[str, PrefetchHint | None] = {}
+        """Secrets and variables of each task's next actions, built on first use"""
 
         # Dynamic: Handle instances
-        # Mut: Queue is used to schedule tasks
-        self.queue: asyncio.Queue[Task] = asyncio.Queue()
-
         # Mut: Use to
         self.indegrees: dict[Task, int] = {}
         # Mut
@@ -198,6 +377,10 @@ class DSLScheduler:
         }
         self.loop_indices: dict[tuple[str, StreamID], int] = {}
         self.loop_start_skips: set[tuple[str, StreamID]] = set()
+        self.critical_path_lengths = self._build_critical_path_lengths()
+        """Number of tasks on the longest path from each task to a sink"""
+        # Mut: Queue is used to schedule tasks
+        self.queue: asyncio.Queue[Task] = self._new_queue()
 
         # Scope management
         self._root_context = context
@@ -208,9 +391,26 @@ class DSLScheduler:
 
         self.stream_hierarchy: dict[StreamID, StreamID | None] = {ROOT_STREAM: None}
         """Points to the parent stream ID for each stream ID"""
+        self.action_result_owners: defaultdict[str, dict[StreamID, StreamID]] = (
+            defaultdict(dict)
+        )
+        """Memoized owning stream of each action result, per action ref and stream"""
         self.task_streams: defaultdict[Task, list[StreamID]] = defaultdict(list)
         self.open_streams: dict[Task, int] = {}
         """Used to track the number of scopes that have been closed for an scatter"""
+        self.scatter_regions: dict[Task, ScatterRegion] = {}
+        """Scatters whose streams are opened on demand, by scatter task"""
+        self.pending_scatters: deque[ScatterRegion] = deque()
+        """Scatters that still have unopened streams, in scatter order"""
+        self.stream_work: dict[StreamID, int] = {}
+        """Queued or running tasks plus live child streams, per non-root stream"""
+        self.stream_refs: dict[StreamID, set[str]] = {}
+        """Refs of the tasks that have state in each non-root stream"""
+        self.gather_buffers: dict[Task, GatherBuffer] = {}
+        """Streamed gathers in progress, by gather task in the parent stream"""
+        self.action_batches: dict[tuple[str, Task], ActionBatch] = {}
+        """Open action batches, by action ref and scatter task"""
+        self.batch_runs: set[asyncio.Task[None]] = set()
 
         self.logger.debug(
             "Scheduler config",
@@ -225,6 +425,41 @@ class DSLScheduler:
         dst_ref, edge_type = adj
         return dst_ref, edge_type.value
 
+    def _build_critical_path_lengths(self) -> dict[str, int]:
+        """Compute the longest remaining dependency chain from each task.
+
+        Every task counts as one unit, as actions have no known cost up front.
+        Edges that would close a cycle are ignored.
+        """
+        lengths: dict[str, int] = {}
+        visiting: set[str] = set()
+        for root in self.adj:
+            if root in lengths:
+                continue
+            # Iterative post-order DFS, deep chains would exceed the recursion limit
+            stack: list[tuple[str, bool]] = [(root, False)]
+            while stack:
+                ref, expanded = stack.pop()
+                if expanded:
+                    visiting.discard(ref)
+                    lengths[ref] = 1 + max(
+                        (lengths.get(dst, 0) for dst, _ in self.adj[ref]), default=0
+                    )
+                    continue
+                if ref in lengths or ref in visiting:
+                    continue
+                visiting.add(ref)
+                stack.append((ref, True))
+                for dst, _ in self.adj[ref]:
+                    if dst not in lengths and dst not in visiting:
+                        stack.append((dst, False))
+        return lengths
+
+    def _new_queue(self) -> asyncio.Queue[Task]:
+        if self.critical_path_ordering:
+            return CriticalPathQueue(self.critical_path_lengths)
+        return asyncio.Queue()
+
     def _build_loop_regions(self) -> dict[str, LoopRegion]:
         # Phase 1: validate each loop.end and map loop scope -> end ref.
         loop_end_by_scope: dict[str, str] = {}
@@ -314,10 +549,26 @@ class DSLScheduler:
                     streams_to_remove.add(candidate)
                     changed = True
 
+        orphaned_parents: list[StreamID] = []
         for stream in streams_to_remove:
             self.streams.pop(stream, None)
-            self.stream_hierarchy.pop(stream, None)
+            self.stream_refs.pop(stream, None)
+            parent = self.stream_hierarchy.pop(stream, None)
             self.stream_exceptions.pop(stream, None)
+            if (
+                self.stream_work.pop(stream, None) is not None
+                and parent is not None
+                and parent not in streams_to_remove
+            ):
+                orphaned_parents.append(parent)
+
+        for owners in self.action_result_owners.values():
+            for stream in [
+                stream
+                for stream, owner in owners.items()
+                if stream in streams_to_remove or owner in streams_to_remove
+            ]:
+                del owners[stream]
 
         self.completed_tasks = {
             task
@@ -350,6 +601,14 @@ class DSLScheduler:
             for task, n_open in self.open_streams.items()
             if task.stream_id not in streams_to_remove
         }
+        self.scatter_regions = {
+            task: region
+            for task, region in self.scatter_regions.items()
+            if task.stream_id not in streams_to_remove
+        }
+        # Removed streams that were still live no longer hold their parents open
+        for parent in orphaned_parents:
+            self._release_stream(parent)
 
     def _reset_loop_iteration_state(
         self, region: LoopRegion, stream_id: StreamID
@@ -367,6 +626,25 @@ class DSLScheduler:
         for task_key in list(self.open_streams.keys()):
             if task_key.ref in region.members and task_key.stream_id == stream_id:
                 self.open_streams.pop(task_key, None)
+        for task_key in list(self.scatter_regions.keys()):
+            if task_key.ref in region.members and self._stream_within(
+                task_key.stream_id, stream_id
+            ):
+                self.scatter_regions.pop(task_key, None)
+        dropped_scatters = [
+            scatter
+            for scatter in self.pending_scatters
+            if self.scatter_regions.get(scatter.task) is not scatter
+        ]
+        if dropped_scatters:
+            self.pending_scatters = deque(
+                scatter
+                for scatter in self.pending_scatters
+                if self.scatter_regions.get(scatter.task) is scatter
+            )
+            # Unopened streams no longer hold their parent streams open
+            for scatter in dropped_scatters:
+                self._release_stream(scatter.task.stream_id)
 
         # Reset edge markers within the loop region for this stream.
         for edge in list(self.edges.keys()):
@@ -656,13 +934,14 @@ class DSLScheduler:
             # We dynamically add the indegree of the next task to the indegrees dict
             if next_task not in self.indegrees:
                 self.indegrees[next_task] = len(self.tasks[next_ref].depends_on)
+                self._track_task(next_ref, stream_id)
             self.indegrees[next_task] -= 1
             if self.indegrees[next_task] == 0:
                 # Schedule the next task
                 self.logger.debug(
                     "Adding task to queue; mark visited", next_ref=next_ref
                 )
-                await self.queue.put(next_task)
+                await self._put_task(next_task)
         self.logger.trace(
             "Queued tasks",
             visited_tasks=list(self.completed_tasks),
@@ -670,6 +949,85 @@ class DSLScheduler:
             queue_size=self.queue.qsize(),
         )
 
+    async def _put_task(self, task: Task) -> None:
+        """Queue a task instance, holding its stream open until the task completes."""
+        self._acquire_stream(task.stream_id)
+        self._track_task(task.ref, task.stream_id)
+        await self.queue.put(task)
+
+    def _track_task(self, ref: str, stream_id: StreamID) -> None:
+        """Record that a task has state in a stream, for `_discard_stream`."""
+        if stream_id != ROOT_STREAM:
+            self.stream_refs.setdefault(stream_id, set()).add(ref)
+
+    def _acquire_stream(self, stream_id: StreamID) -> None:
+        if stream_id != ROOT_STREAM:
+            self.stream_work[stream_id] = self.stream_work.get(stream_id, 0) + 1
+
+    def _release_stream(self, stream_id: StreamID) -> None:
+        """Drop one unit of work from a stream and discard it once it's finished.
+
+        A stream is finished when it has no queued or running tasks and no live
+        child streams. Nothing reads a finished stream's state again: results it
+        contributes to its parent have already been written there. Releasing a
+        child may finish its parent, so this walks up the hierarchy.
+        """
+        curr_stream: StreamID | None = stream_id
+        while curr_stream is not None and curr_stream in self.stream_work:
+            remaining = self.stream_work.get(curr_stream, 0) - 1
+            if remaining > 0:
+                self.stream_work[curr_stream] = remaining
+                return
+            parent_stream = self.stream_hierarchy.get(curr_stream)
+            self._discard_stream(curr_stream)
+            curr_stream = parent_stream
+
+    def _open_stream(
+        self, stream_id: StreamID, parent_stream_id: StreamID, context: ExecutionContext
+    ) -> None:
+        """Register a child stream.
+
+        The new stream starts with one unit of work, which the caller releases
+        after queueing the stream's first tasks.
+        """
+        if stream_id not in self.stream_work:
+            self._acquire_stream(parent_stream_id)
+        self.stream_hierarchy[stream_id] = parent_stream_id
+        self.streams[stream_id] = context
+        self._acquire_stream(stream_id)
+
+    def _discard_stream(self, stream_id: StreamID) -> None:
+        """Forget all bookkeeping of a finished stream."""
+        self.logger.trace("Discarding finished stream", stream_id=stream_id)
+        self.stream_work.pop(stream_id, None)
+        self.streams.pop(stream_id, None)
+        parent_stream_id = self.stream_hierarchy.pop(stream_id, None)
+        self.stream_exceptions.pop(stream_id, None)
+        for owners in self.action_result_owners.values():
+            owners.pop(stream_id, None)
+        for ref in self.stream_refs.pop(stream_id, ()):
+            task_key = Task(ref=ref, stream_id=stream_id)
+            self.indegrees.pop(task_key, None)
+            self.completed_tasks.discard(task_key)
+            self.task_streams.pop(task_key, None)
+            self.open_streams.pop(task_key, None)
+            self.scatter_regions.pop(task_key, None)
+            self.loop_indices.pop((ref, stream_id), None)
+            self.loop_start_skips.discard((ref, stream_id))
+            for dst, edge_type in self.adj.get(ref, ()):
+                self.edges.pop(
+                    DSLEdge(src=ref, dst=dst, type=edge_type, stream_id=stream_id),
+                    None,
+                )
+        # Lazy scatters only track their live streams
+        if parent_stream_id is not None:
+            scatter_ref, _ = stream_id.leaf
+            scatter_task = Task(ref=scatter_ref, stream_id=parent_stream_id)
+            if scatter_task in self.scatter_regions:
+                streams = self.task_streams[scatter_task]
+                if stream_id in streams:
+                    streams.remove(stream_id)
+
     async def _execute(self, task: Task, stmt: ActionStatement) -> None:
         """Execute a task."""
         token = ctx_stream_id.set(task.stream_id)
@@ -678,6 +1036,106 @@ class DSLScheduler:
         finally:
             ctx_stream_id.reset(token)
 
+    @staticmethod
+    def _is_batchable(stmt: ActionStatement) -> bool:
+        """Whether an action only needs the executor, with no per-item control flow."""
+        action = stmt.action
+        return (
+            (
+                not PlatformAction.is_interface(action)
+                or action == PlatformAction.RUN_PYTHON
+            )
+            and stmt.retry_policy.retry_until is None
+            and stmt.retry_policy.max_attempts == 1
+            and stmt.wait_until is None
+            and stmt.start_delay == 0
+            and stmt.environment is None
+            and stmt.interaction is None
+        )
+
+    def _get_batch_scatter(
+        self, task: Task, stmt: ActionStatement
+    ) -> ScatterRegion | None:
+        """Get the batched scatter whose item stream directly runs this task."""
+        if self.batch_executor is None or not self._is_batchable(stmt):
+            return None
+        if (parent_stream_id := self.stream_hierarchy.get(task.stream_id)) is None:
+            return None
+        scatter_ref, _ = task.stream_id.leaf
+        if self.action_scopes.get(stmt.ref) != scatter_ref:
+            return None
+        scatter = self.scatter_regions.get(
+            Task(ref=scatter_ref, stream_id=parent_stream_id)
+        )
+        if scatter is None or (scatter.batch_size or 0) < 2:
+            return None
+        return scatter
+
+    async def _execute_batched(
+        self, task: Task, stmt: ActionStatement, scatter: ScatterRegion
+    ) -> None:
+        """Execute a task as part of a batch of the same action across streams.
+
+        The batch is dispatched once it is full, or once a scheduling pass adds
+        no more tasks to it. A task's own error is raised here, so the usual
+        per-stream error handling applies.
+        """
+        key = (stmt.ref, scatter.task)
+        batch = self.action_batches.get(key)
+        if batch is None:
+            batch = ActionBatch(stmt=stmt, size=scatter.batch_size or 1)
+            self.action_batches[key] = batch
+            self._spawn_batch_run(self._dispatch_batch_when_idle(key, batch))
+        index = len(batch.tasks)
+        batch.tasks.append(task)
+        if len(batch.tasks) >= batch.size:
+            self._dispatch_batch(key, batch)
+
+        await batch.done.wait()
+        if index >= len(batch.errors):
+            raise ApplicationError(
+                f"Action batch for {stmt.ref!r} did not complete", non_retryable=True
+            )
+        if (error := batch.errors[index]) is not None:
+            raise error
+
+    def _spawn_batch_run(self, coro: Coroutine[Any, Any, None]) -> None:
+        run = asyncio.create_task(coro)
+        self.batch_runs.add(run)
+        run.add_done_callback(self.batch_runs.discard)
+
+    async def _dispatch_batch_when_idle(
+        self, key: tuple[str, Task], batch: ActionBatch
+    ) -> None:
+        # Tasks spawned in the same scheduling pass join before this resumes.
+        n_tasks = 0
+        while not batch.dispatched and len(batch.tasks) != n_tasks:
+            n_tasks = len(batch.tasks)
+            await asyncio.sleep(0)
+        self._dispatch_batch(key, batch)
+
+    def _dispatch_batch(self, key: tuple[str, Task], batch: ActionBatch) -> None:
+        if batch.dispatched:
+            return
+        batch.dispatched = True
+        if self.action_batches.get(key) is batch:
+            del self.action_batches[key]
+        self._spawn_batch_run(self._run_batch(batch))
+
+    async def _run_batch(self, batch: ActionBatch) -> None:
+        if self.batch_executor is None:
+            raise RuntimeError("Action batches require a batch executor")
+        stream_ids = [task.stream_id for task in batch.tasks]
+        self.logger.debug(
+            "Executing action batch", ref=batch.stmt.ref, batch_size=len(stream_ids)
+        )
+        try:
+            batch.errors = list(await self.batch_executor(batch.stmt, stream_ids))
+        except Exception as e:
+            batch.errors = [e] * len(stream_ids)
+        finally:
+            batch.done.set()
+
     async def _schedule_task(self, task: Task) -> None:
         """Schedule a task for execution.
 
@@ -754,7 +1212,10 @@ class DSLScheduler:
             # NOTE: If an exception is thrown from this coroutine, it signals that
             # the task failed after all attempts. Adding the exception to the task
             # exceptions set will cause the workflow to fail.
-            await self._execute(task, stmt)
+            if (scatter := self._get_batch_scatter(task, stmt)) is not None:
+                await self._execute_batched(task, stmt, scatter)
+            else:
+                await self._execute(task, stmt)
             # NOTE: Moved this here to handle single success path
             await self._handle_success_path(task)
         except Exception as e:
@@ -773,22 +1234,32 @@ class DSLScheduler:
             # 5) Regardless of the outcome, the task is now complete
             self.logger.debug("Task completed", task=task)
             self.completed_tasks.add(task)
+            self._release_stream(task.stream_id)
 
     async def start(self) -> dict[str, TaskExceptionInfo] | None:
-        """Run the scheduler and return any exceptions that occurred."""
+        """Run the scheduler and return any exceptions that occurred.
+
+        If `should_checkpoint` becomes true, no new tasks are started. Once the
+        running ones finish with work left over, this returns early and sets
+        `suspended`.
+        """
         # Instead of explicitly setting the entrypoint, we set all zero-indegree
-        # tasks to the queue.
-        for task_instance, indegree in self.indegrees.items():
-            if indegree == 0:
-                self.queue.put_nowait(task_instance)
+        # tasks to the queue. A resumed scheduler restores its queue instead.
+        if not self._resumed:
+            for task_instance, indegree in self.indegrees.items():
+                if indegree == 0:
+                    self.queue.put_nowait(task_instance)
 
         pending_tasks: set[asyncio.Task[None]] = set()
+        draining = False
 
         def discard_done_tasks() -> None:
             done_tasks = {task for task in pending_tasks if task.done()}
             pending_tasks.difference_update(done_tasks)
 
-        while not self.task_exceptions and (not self.queue.empty() or pending_tasks):
+        while not self.task_exceptions and (
+            not self.queue.empty() or pending_tasks or self.pending_scatters
+        ):
             self.logger.trace(
                 "Waiting for tasks",
                 qsize=self.queue.qsize(),
@@ -797,6 +1268,26 @@ class DSLScheduler:
 
             # Clean up completed tasks
             discard_done_tasks()
+            if (
+                not draining
+                and self.should_checkpoint is not None
+                and self.should_checkpoint()
+            ):
+                self.logger.info(
+                    "Draining scheduler for checkpoint",
+                    n_pending=len(pending_tasks),
+                    qsize=self.queue.qsize(),
+                )
+                draining = True
+            if draining:
+                if not pending_tasks:
+                    self.suspended = True
+                    break
+                await workflow.wait(pending_tasks, return_when=asyncio.FIRST_COMPLETED)
+                continue
+            # Advance lazy scatters into the free scheduling capacity
+            if self.pending_scatters:
+                await self._open_pending_scatter_streams(len(pending_tasks))
 
             spawned_since_yield = 0
             while (
@@ -839,6 +1330,7 @@ class DSLScheduler:
                 n_tasks=len(self.tasks),
             )
             # Cancel all pending tasks and wait for them to complete
+            pending_tasks.update(self.batch_runs)
             for task in pending_tasks:
                 if not task.done():
                     task.cancel()
@@ -850,6 +1342,13 @@ class DSLScheduler:
                     self.logger.warning("Error while canceling tasks", error=e)
 
             return self.task_exceptions
+        if self.suspended:
+            self.logger.info(
+                "Scheduler suspended for checkpoint",
+                qsize=self.queue.qsize(),
+                n_visited=len(self.completed_tasks),
+            )
+            return None
         self.logger.info(
             "All tasks completed",
             n_tasks=len(self.tasks),
@@ -860,6 +1359,107 @@ class DSLScheduler:
         )
         return None
 
+    def checkpoint(self) -> DSLSchedulerCheckpoint:
+        """Snapshot the state of a suspended scheduler."""
+        if not self.suspended or self.action_batches or self.batch_runs:
+            raise RuntimeError("Only a suspended scheduler can be checkpointed")
+        queue: list[Task] = []
+        while not self.queue.empty():
+            queue.append(self.queue.get_nowait())
+        for task in queue:
+            self.queue.put_nowait(task)
+        return DSLSchedulerCheckpoint(
+            queue=queue,
+            indegrees=list(self.indegrees.items()),
+            completed_tasks=list(self.completed_tasks),
+            edges=[
+                (edge, marker)
+                for edge, marker in self.edges.items()
+                if marker != EdgeMarker.PENDING
+            ],
+            streams=self.streams,
+            stream_hierarchy=self.stream_hierarchy,
+            stream_errors={
+                stream_id: info.details
+                for stream_id, info in self.stream_exceptions.items()
+            },
+            task_streams=list(self.task_streams.items()),
+            open_streams=list(self.open_streams.items()),
+            loop_indices=[
+                (ref, stream_id, index)
+                for (ref, stream_id), index in self.loop_indices.items()
+            ],
+            loop_start_skips=list(self.loop_start_skips),
+            scatter_regions=list(self.scatter_regions.values()),
+            pending_scatters=[region.task for region in self.pending_scatters],
+            stream_work=self.stream_work,
+            gather_buffers=list(self.gather_buffers.values()),
+        )
+
+    def restore(self, checkpoint: DSLSchedulerCheckpoint) -> None:
+        """Resume from a checkpoint of the same DSL, before calling `start`.
+
+        The checkpoint's root stream context replaces the one passed to the
+        constructor.
+        """
+        self.queue = self._new_queue()
+        for task in checkpoint.queue:
+            self.queue.put_nowait(task)
+        self.indegrees = dict(checkpoint.indegrees)
+        self.completed_tasks = set(checkpoint.completed_tasks)
+        self.edges = defaultdict(lambda: EdgeMarker.PENDING, checkpoint.edges)
+        self.streams = dict(checkpoint.streams)
+        self._root_context = self.streams[ROOT_STREAM]
+        self.stream_hierarchy = dict(checkpoint.stream_hierarchy)
+        # Gathers only need the error details of failed streams
+        self.stream_exceptions = {
+            stream_id: TaskExceptionInfo(
+                exception=ApplicationError(
+                    details.message, type=details.type, non_retryable=True
+                ),
+                details=details,
+            )
+            for stream_id, details in checkpoint.stream_errors.items()
+        }
+        self.action_result_owners = defaultdict(dict)
+        self.task_streams = defaultdict(list, checkpoint.task_streams)
+        self.open_streams = dict(checkpoint.open_streams)
+        self.loop_indices = {
+            (ref, stream_id): index for ref, stream_id, index in checkpoint.loop_indices
+        }
+        self.loop_start_skips = set(checkpoint.loop_start_skips)
+        self.scatter_regions = {
+            region.task: region for region in checkpoint.scatter_regions
+        }
+        self.pending_scatters = deque(
+            self.scatter_regions[task] for task in checkpoint.pending_scatters
+        )
+        self.stream_work = dict(checkpoint.stream_work)
+        self.stream_refs = {}
+        for task_key in itertools.chain(
+            checkpoint.queue,
+            self.indegrees,
+            self.completed_tasks,
+            self.task_streams,
+            self.open_streams,
+            self.scatter_regions,
+        ):
+            self._track_task(task_key.ref, task_key.stream_id)
+        for edge in self.edges:
+            self._track_task(edge.src, edge.stream_id)
+        for ref, stream_id in itertools.chain(self.loop_indices, self.loop_start_skips):
+            self._track_task(ref, stream_id)
+        self.gather_buffers = {
+            buffer.task: buffer for buffer in checkpoint.gather_buffers
+        }
+        self.suspended = False
+        self._resumed = True
+        self.logger.info(
+            "Scheduler restored from checkpoint",
+            qsize=self.queue.qsize(),
+            n_streams=len(self.streams),
+        )
+
     def _is_reachable(self, task: Task, stmt: ActionStatement) -> bool:
         """Check whether a task is reachable based on its dependencies' outcomes.
 
@@ -932,6 +1532,7 @@ class DSLScheduler:
         )
 
     def _mark_edge(self, edge: DSLEdge, marker: EdgeMarker) -> None:
+        self._track_task(edge.src, edge.stream_id)
         self.logger.debug("Marking edge", edge=edge, marker=marker)
         self.edges[edge] = marker
 
@@ -966,7 +1567,7 @@ class DSLScheduler:
             context = self.build_stream_aware_context(stmt, task.stream_id)
             self.logger.debug("`run_if` condition", run_if=run_if)
             try:
-                expr_result = await self.resolve_expression(run_if, context)
+                expr_result = await self.resolve_condition(run_if, context)
             except Exception as e:
                 raise ApplicationError(
                     f"Error evaluating `run_if` condition: {e}",
@@ -981,8 +1582,9 @@ class DSLScheduler:
     async def _queue_skip_stream(self, task: Task, stream_id: StreamID) -> None:
         """Queue a skip stream for a task."""
         new_stream_id = StreamID.skip(task.ref, base_stream_id=stream_id)
-        self.stream_hierarchy[new_stream_id] = stream_id
-        self.streams[new_stream_id] = ExecutionContext(ACTIONS={}, TRIGGER=None)
+        self._open_stream(
+            new_stream_id, stream_id, ExecutionContext(ACTIONS={}, TRIGGER=None)
+        )
         unreachable = {
             DSLEdge(src=task.ref, dst=dst, type=edge_type, stream_id=new_stream_id)
             for dst, edge_type in self.adj[task.ref]
@@ -990,7 +1592,8 @@ class DSLScheduler:
         skip_task = Task(ref=task.ref, stream_id=new_stream_id)
         self.logger.debug("Queueing skip stream", skip_task=skip_task)
         # Acknowledge the new scope
-        return await self._queue_tasks(skip_task, unreachable=unreachable)
+        await self._queue_tasks(skip_task, unreachable=unreachable)
+        self._release_stream(new_stream_id)
 
     async def _handle_scatter_skip_stream(
         self, task: Task, stream_id: StreamID
@@ -999,8 +1602,9 @@ class DSLScheduler:
         self.logger.debug(
             "Creating skip stream", task=task, new_stream_id=new_stream_id
         )
-        self.stream_hierarchy[new_stream_id] = stream_id
-        self.streams[new_stream_id] = ExecutionContext(ACTIONS={}, TRIGGER=None)
+        self._open_stream(
+            new_stream_id, stream_id, ExecutionContext(ACTIONS={}, TRIGGER=None)
+        )
         all_next = {
             DSLEdge(src=task.ref, dst=dst, type=edge_type, stream_id=new_stream_id)
             for dst, edge_type in self.adj[task.ref]
@@ -1008,7 +1612,8 @@ class DSLScheduler:
         skip_task = Task(ref=task.ref, stream_id=new_stream_id)
         self.logger.debug("Queueing skip stream", skip_task=skip_task)
         # Acknowledge the new scope
-        return await self._queue_tasks(skip_task, unreachable=all_next)
+        await self._queue_tasks(skip_task, unreachable=all_next)
+        self._release_stream(new_stream_id)
 
     async def _handle_loop_start(
         self, task: Task, stmt: ActionStatement, *, is_skipping: bool = False
@@ -1027,8 +1632,9 @@ class DSLScheduler:
 
         self.loop_start_skips.discard(loop_key)
         index = self.loop_indices.get(loop_key, 0)
-        action_context = self._get_action_context(task.stream_id)
-        action_context[task.ref] = TaskResult.from_result({"iteration": index})
+        self.set_action_result(
+            task.stream_id, task.ref, TaskResult.from_result({"iteration": index})
+        )
         await self._execute(task, stmt)
         await self._handle_success_path(task)
 
@@ -1069,7 +1675,7 @@ class DSLScheduler:
         else:
             context = self.build_stream_aware_context(stmt, task.stream_id)
             try:
-                expr_result = await self.resolve_expression(args.condition, context)
+                expr_result = await self.resolve_condition(args.condition, context)
             except Exception as e:
                 raise ApplicationError(
                     f"Error evaluating `condition` in `core.loop.end`: {e}",
@@ -1077,8 +1683,11 @@ class DSLScheduler:
                 ) from e
             should_continue = bool(expr_result)
 
-        action_context = self._get_action_context(task.stream_id)
-        action_context[task.ref] = TaskResult.from_result({"continue": should_continue})
+        self.set_action_result(
+            task.stream_id,
+            task.ref,
+            TaskResult.from_result({"continue": should_continue}),
+        )
 
         if not is_skipping:
             await self._execute(task, stmt)
@@ -1095,7 +1704,7 @@ class DSLScheduler:
                 )
             self._reset_loop_iteration_state(region, task.stream_id)
             self.loop_indices[loop_key] = next_index
-            await self.queue.put(Task(ref=region.start_ref, stream_id=task.stream_id))
+            await self._put_task(Task(ref=region.start_ref, stream_id=task.stream_id))
             return
 
         self.loop_indices.pop(loop_key, None)
@@ -1139,15 +1748,16 @@ class DSLScheduler:
         )
 
         try:
-            collection = await workflow.execute_activity(
+            collection = await execute_platform_activity(
                 DSLActivities.handle_scatter_input_activity,
-                arg=ScatterActionInput(
+                ScatterActionInput(
                     task=stmt,
                     stream_id=curr_stream_id,
                     collection=args.collection,
                     operand=context,
                     key=collection_key,
                 ),
+                local=self.execution_settings.local_platform_activities,
                 start_to_close_timeout=timedelta(seconds=60),
                 retry_policy=RETRY_POLICIES["activity:fail_fast"],
             )
@@ -1183,34 +1793,34 @@ class DSLScheduler:
             interval=args.interval,
         )
 
-        async for i in cooperative(range(collection_size)):
-            new_stream_id = StreamID.new(task.ref, i, base_stream_id=curr_stream_id)
-            streams.append(new_stream_id)
-
-            # Initialize stream with indexed reference to stored collection
-            self.stream_hierarchy[new_stream_id] = curr_stream_id
-            self.streams[new_stream_id] = ExecutionContext(
-                ACTIONS={
-                    task.ref: TaskResult.from_collection_item(
-                        stored=collection,
-                        index=i,
-                        item_typename="collection_item",
-                    )
-                },
-                TRIGGER=None,
+        if workflow.patched(LAZY_SCATTER_STREAMS_PATCH):
+            # Streams are opened by `start` as scheduling capacity frees up, so
+            # memory scales with in-flight items rather than the collection size.
+            region = ScatterRegion(
+                task=task,
+                collection=collection,
+                size=collection_size,
+                interval=args.interval,
+                started_at=workflow.time() if args.interval else 0.0,
+                batch_size=args.batch_size,
             )
+            self.scatter_regions[task] = region
+            self.pending_scatters.append(region)
+            # Unopened streams hold the parent stream open
+            self._acquire_stream(curr_stream_id)
+            self.open_streams[task] = collection_size
+            self.logger.debug(
+                "Scatter deferred",
+                task=task,
+                collection_size=collection_size,
+            )
+            return
 
+        async for i in cooperative(range(collection_size)):
             # Create tasks for all tasks in this stream
             # Calculate the task delay
             delay = i * (args.interval or 0)
-            new_scoped_task = Task(ref=task.ref, stream_id=new_stream_id, delay=delay)
-            self.logger.debug(
-                "Creating stream",
-                stream_id=new_stream_id,
-                task=new_scoped_task,
-            )
-            # This will queue the task for execution stream
-            await self._queue_tasks(new_scoped_task)
+            await self._open_scatter_stream(task, collection, i, delay)
 
         self.open_streams[task] = len(streams)
         # Get the next tasks to queue
@@ -1221,6 +1831,79 @@ class DSLScheduler:
             scopes_created=len(streams),
         )
 
+    async def _open_scatter_stream(
+        self, task: Task, collection: StoredObject, index: int, delay: float
+    ) -> None:
+        """Open the execution stream of one scatter item and queue its tasks."""
+        new_stream_id = StreamID.new(task.ref, index, base_stream_id=task.stream_id)
+        self.task_streams[task].append(new_stream_id)
+
+        # Initialize stream with indexed reference to stored collection
+        self._open_stream(
+            new_stream_id,
+            task.stream_id,
+            ExecutionContext(
+                ACTIONS={
+                    task.ref: TaskResult.from_collection_item(
+                        stored=collection,
+                        index=index,
+                        item_typename="collection_item",
+                    )
+                },
+                TRIGGER=None,
+            ),
+        )
+        new_scoped_task = Task(ref=task.ref, stream_id=new_stream_id, delay=delay)
+        self.logger.debug(
+            "Creating stream",
+            stream_id=new_stream_id,
+            task=new_scoped_task,
+        )
+        # This will queue the task for execution stream
+        await self._queue_tasks(new_scoped_task)
+        self._release_stream(new_stream_id)
+
+    async def _open_pending_scatter_streams(self, n_pending: int) -> None:
+        """Open streams of deferred scatters while the scheduler has spare capacity.
+
+        Streams are opened in scatter order until the queued and running tasks
+        fill the `max_pending_tasks` window.
+        """
+        n_opened = 0
+        while (
+            self.pending_scatters
+            and self.queue.qsize() + n_pending < self.max_pending_tasks
+        ):
+            region = self.pending_scatters[0]
+            index = region.next_index
+            region.next_index += 1
+            if region.next_index == region.size:
+                self.pending_scatters.popleft()
+
+            delay = 0.0
+            if region.interval:
+                # Stagger relative to the scatter, not to when the stream opens
+                delay = max(
+                    0.0, region.started_at + index * region.interval - workflow.time()
+                )
+            await self._open_scatter_stream(
+                region.task, region.collection, index, delay
+            )
+            if region.next_index == region.size:
+                self._release_stream(region.task.stream_id)
+
+            n_opened += 1
+            if n_opened % _SCHEDULER_TASK_SPAWN_YIELD_EVERY == 0:
+                # Streams without queued work finish immediately; don't open a
+                # whole collection in one activation.
+                await asyncio.sleep(0)
+
+    def _scatter_size(self, scatter_task: Task) -> int:
+        """Get the number of execution streams a scatter fans out to."""
+        if (region := self.scatter_regions.get(scatter_task)) is not None:
+            return region.size
+        return len(self.task_streams[scatter_task])
+
     def get_context(self, stream_id: StreamID) -> ExecutionContext:
         context = self.streams[stream_id]
         self.logger.trace("Getting stream context", stream_id=stream_id)
@@ -1234,30 +1917,52 @@ class DSLScheduler:
         parent_action_context = self._get_action_context(parent_stream_id)
 
         scatter_ref, stream_idx = stream_id.leaf
+        if not isinstance(stream_idx, int):
+            # Skip streams are closed by `_handle_gather` and never get here
+            raise ApplicationError(f"Invalid gather state in skip stream: {task}")
         gather_ref = task.ref
         parent_scatter = Task(ref=scatter_ref, stream_id=parent_stream_id)
 
+        buffer = self._get_gather_buffer(parent_scatter, gather_ref)
+        chunk_idx: int | None = None
         if err_info := self.stream_exceptions.get(stream_id):
             # We reached gather because of an irrecoverable error
             self.logger.debug("Found matching error in skip stream", task=task)
-            if gather_ref not in parent_action_context:
-                # NOTE: This block is executed by the first execution stream that finishes.
-                # We need to initialize the result with the cardinality of the scatter
-                # This is the number of execution streams that will be synchronized by this gather
-                size = len(self.task_streams[parent_scatter])
-                result = [Sentinel.GATHER_UNSET for _ in range(size)]
-                parent_action_context[gather_ref] = TaskResult.from_result(result)
-
             # Place an error object in the result
             # Do not pass the full object as some exceptions aren't serializable
-            # Access the raw list via get_data() and modify in place
-            parent_action_context[gather_ref].get_data()[stream_idx] = InlineObject(
+            error_item = InlineObject(
                 data=ActionErrorInfoAdapter.dump_python(err_info.details)
             )
+            if buffer is not None:
+                chunk_idx = buffer.add(stream_idx, error_item)
+            else:
+                if gather_ref not in parent_action_context:
+                    # NOTE: This block is executed by the first execution stream that finishes.
+                    # We need to initialize the result with the cardinality of the scatter
+                    # This is the number of execution streams that will be synchronized by this gather
+                    size = self._scatter_size(parent_scatter)
+                    result = [Sentinel.GATHER_UNSET for _ in range(size)]
+                    self.set_action_result(
+                        parent_stream_id, gather_ref, TaskResult.from_result(result)
+                    )
+                # Access the raw list via get_data() and modify in place
+                parent_action_context[gather_ref].get_data()[stream_idx] = error_item
             self.logger.debug("Set error object as result", task=task)
         else:
             # Regular skip path
             self.logger.debug("No matching error in skip stream", task=task)
+            if buffer is not None:
+                chunk_idx = buffer.add(stream_idx, None)
+
+        # A skipped or errored stream can be the last arrival of a chunk
+        if (
+            buffer is not None
+            and chunk_idx is not None
+            and self.open_streams[parent_scatter] > 1
+        ):
+            await self._flush_gather_chunk(buffer, chunk_idx)
+        # As in `_handle_gather`, only close the stream after the await
+        self.open_streams[parent_scatter] -= 1
 
         # We still have to handle the last gather
         if self.open_streams[parent_scatter] == 0:
@@ -1291,6 +1996,55 @@ class DSLScheduler:
             )
         return parent_stream
 
+    def _get_gather_buffer(
+        self, parent_scatter: Task, gather_ref: str
+    ) -> GatherBuffer | None:
+        """Get the buffer of a streamed gather, creating it for the first stream.
+
+        Returns None if the gather collects its items in the parent stream
+        context instead, either because result externalization is disabled or
+        because the workflow started before gathers were streamed.
+        """
+        gather_task = Task(ref=gather_ref, stream_id=parent_scatter.stream_id)
+        if (buffer := self.gather_buffers.get(gather_task)) is not None:
+            return buffer
+        if not self.execution_settings.result_externalization_enabled or not (
+            workflow.patched(STREAMING_GATHER_PATCH)
+        ):
+            return None
+        buffer = GatherBuffer(
+            task=gather_task,
+            size=self._scatter_size(parent_scatter),
+            chunk_size=self.execution_settings.collection_chunk_size,
+        )
+        self.gather_buffers[gather_task] = buffer
+        return buffer
+
+    async def _flush_gather_chunk(self, buffer: GatherBuffer, chunk_idx: int) -> None:
+        """Move the item handles of a complete chunk to collection storage."""
+        prefix = action_collection_prefix(
+            self.workspace_id,
+            self.wf_exec_id,
+            str(buffer.task.stream_id),
+            buffer.task.ref,
+        )
+        chunk = await execute_platform_activity(
+            CollectionActivities.store_collection_activity,
+            gather_chunk_prefix(prefix, chunk_idx),
+            [buffer.items[index] for index in buffer.chunk_indices(chunk_idx)],
+            "stored_object",
+            local=self.execution_settings.local_platform_activities,
+            start_to_close_timeout=timedelta(seconds=60),
+            retry_policy=RETRY_POLICIES["activity:fail_fast"],
+        )
+        buffer.flushed(chunk_idx, chunk)
+        self.logger.debug(
+            "Flushed gather chunk",
+            gather=buffer.task,
+            chunk_idx=chunk_idx,
+            buffered_items=len(buffer.items),
+        )
+
     def _task_observed(self, task: Task) -> bool:
         return task in self.open_streams
 
@@ -1354,9 +2108,9 @@ class DSLScheduler:
                         task=task,
                     )
                     parent_action_context = self._get_action_context(parent_stream)
-                    finalized = await workflow.execute_activity(
+                    finalized = await execute_platform_activity(
                         DSLActivities.finalize_gather_activity,
-                        arg=FinalizeGatherActivityInput(
+                        FinalizeGatherActivityInput(
                             collection=[],
                             key=action_collection_prefix(
                                 self.workspace_id,
@@ -1365,12 +2119,17 @@ class DSLScheduler:
                                 task.ref,
                             ),
                         ),
+                        local=self.execution_settings.local_platform_activities,
                         start_to_close_timeout=timedelta(seconds=60),
                         retry_policy=RETRY_POLICIES["activity:fail_fast"],
                     )
-                    parent_action_context[task.ref] = TaskResult(
-                        result=finalized.result,
-                        result_typename=finalized.result.typename or "list",
+                    self.set_action_result(
+                        parent_stream,
+                        task.ref,
+                        TaskResult(
+                            result=finalized.result,
+                            result_typename=finalized.result.typename or "list",
+                        ),
                     )
                 else:
                     self.logger.debug(
@@ -1412,6 +2171,9 @@ class DSLScheduler:
         # What are we doing here?
         # We are in an execution stream. Need to close it now.
         scatter_ref, stream_idx = stream_id.leaf
+        if not isinstance(stream_idx, int):
+            # Skip streams are matched above and return before this point
+            raise ApplicationError(f"Invalid gather state in skip stream: {task}")
         # This operation should return the parent stream
         parent_scatter = Task(ref=scatter_ref, stream_id=parent_stream_id)
 
@@ -1423,7 +2185,6 @@ class DSLScheduler:
         )
         # Close the execution stream regardless of whether we skipped our way to this point.
         if is_skipping:
-            self.open_streams[parent_scatter] -= 1
             self.logger.debug("Skipped gather in execution stream", task=task)
             # Return early to avoid setting the result as null.
             await self._handle_gather_skip_stream(task, stmt, stream_id)
@@ -1436,9 +2197,9 @@ class DSLScheduler:
         # We should only compute the items to store if we aren't skipping
         current_context = self.get_context(stream_id)
         try:
-            item = await workflow.execute_activity(
+            item = await execute_platform_activity(
                 DSLActivities.evaluate_templated_object_activity,
-                arg=EvaluateTemplatedObjectActivityInput(
+                EvaluateTemplatedObjectActivityInput(
                     obj=args.items,
                     operand=current_context,
                     key=action_key(
@@ -1448,6 +2209,7 @@ class DSLScheduler:
                         gather_ref,
                     ),
                 ),
+                local=self.execution_settings.local_platform_activities,
                 start_to_close_timeout=timedelta(seconds=60),
                 retry_policy=RETRY_POLICIES["activity:fail_fast"],
             )
@@ -1457,6 +2219,15 @@ class DSLScheduler:
                 non_retryable=True,
             ) from e
 
+        parent_action_context = self._get_action_context(parent_stream_id)
+        if (buffer := self._get_gather_buffer(parent_scatter, gather_ref)) is not None:
+            # Streamed gather: once every stream of a chunk has reached the
+            # gather, move the chunk to collection storage. The last stream
+            # skips the flush and hands the remaining items to finalize inline.
+            chunk_idx = buffer.add(stream_idx, item)
+            if chunk_idx is not None and self.open_streams[parent_scatter] > 1:
+                await self._flush_gather_chunk(buffer, chunk_idx)
+
         # XXX(concurrency): It's important we only decrement open_streams after
         # await block. If not, streams at the current level will observe 0
         # for the parent open_streams when resumed, and will not close the
@@ -1466,22 +2237,24 @@ class DSLScheduler:
         # Once we have the item, we go down 1 level in the stream hierarchy
         # and set the item as the result of the action in that stream
         # We do this for each item in the collection
-        parent_action_context = self._get_action_context(parent_stream_id)
 
         # We set the item as the result of the action in that stream
         # We should actually be placing this in parent.result[i]
 
         # Set result array if this is the first stream
-        if gather_ref not in parent_action_context:
-            # NOTE: This block is executed by the first execution stream that finishes.
-            # We need to initialize the result with the cardinality of the scatter
-            # This is the number of execution streams that will be synchronized by this gather
-            size = len(self.task_streams[parent_scatter])
-            result = [Sentinel.GATHER_UNSET for _ in range(size)]
-            parent_action_context[gather_ref] = TaskResult.from_result(result)
+        if buffer is None:
+            if gather_ref not in parent_action_context:
+                # NOTE: This block is executed by the first execution stream that finishes.
+                # We need to initialize the result with the cardinality of the scatter
+                # This is the number of execution streams that will be synchronized by this gather
+                size = self._scatter_size(parent_scatter)
+                result = [Sentinel.GATHER_UNSET for _ in range(size)]
+                self.set_action_result(
+                    parent_stream_id, gather_ref, TaskResult.from_result(result)
+                )
 
-        # Access the raw list via get_data() and modify in place
-        parent_action_context[gather_ref].get_data()[stream_idx] = item
+            # Access the raw list via get_data() and modify in place
+            parent_action_context[gather_ref].get_data()[stream_idx] = item
 
         if self.open_streams[parent_scatter] == 0:
             await self._handle_gather_result(
@@ -1515,22 +2288,34 @@ class DSLScheduler:
         # Inline filter for gather operation.
         # Keeps items unless drop_nulls is True and item is None.
         # Automatically remove unset values (Sentinel.IMPLODE_UNSET).
-        if gather_ref not in parent_action_context:
-            parent_action_context[gather_ref] = TaskResult.from_result([])
-        task_result = parent_action_context[gather_ref]
-
-        # Gather items are StoredObjects produced in each execution stream.
-        # Filter out unset values (Sentinel.GATHER_UNSET) here, then materialize + filter
-        # (drop_nulls, error strategy) inside an activity to avoid large payloads in history.
-        stored_items = [
-            StoredObjectValidator.validate_python(item)
-            for item in task_result.get_data()
-            if item != Sentinel.GATHER_UNSET
-        ]
-
-        finalized = await workflow.execute_activity(
+        buffer = self.gather_buffers.pop(
+            Task(ref=gather_ref, stream_id=parent_stream_id), None
+        )
+        if buffer is not None:
+            # Streamed gather: items are in flushed chunks and the buffer
+            task_result = TaskResult.from_result([])
+            stored_items: list[StoredObject] = []
+            parts: list[CollectionObject | list[StoredObject]] = buffer.parts()
+        else:
+            if gather_ref not in parent_action_context:
+                self.set_action_result(
+                    parent_stream_id, gather_ref, TaskResult.from_result([])
+                )
+            task_result = parent_action_context[gather_ref]
+
+            # Gather items are StoredObjects produced in each execution stream.
+            # Filter out unset values (Sentinel.GATHER_UNSET) here, then materialize + filter
+            # (drop_nulls, error strategy) inside an activity to avoid large payloads in history.
+            stored_items = [
+                StoredObjectValidator.validate_python(item)
+                for item in task_result.get_data()
+                if item != Sentinel.GATHER_UNSET
+            ]
+            parts = []
+
+        finalized = await execute_platform_activity(
             DSLActivities.finalize_gather_activity,
-            arg=FinalizeGatherActivityInput(
+            FinalizeGatherActivityInput(
                 collection=stored_items,
                 key=action_collection_prefix(
                     self.workspace_id,
@@ -1540,7 +2325,9 @@ class DSLScheduler:
                 ),
                 drop_nulls=gather_args.drop_nulls,
                 error_strategy=gather_args.error_strategy,
+                parts=parts,
             ),
+            local=self.execution_settings.local_platform_activities,
             start_to_close_timeout=timedelta(seconds=120),
             retry_policy=RETRY_POLICIES["activity:fail_fast"],
         )
@@ -1593,7 +2380,7 @@ class DSLScheduler:
         if finalized.errors:
             task_result = task_result.with_error(finalized.errors)
 
-        parent_action_context[gather_ref] = task_result
+        self.set_action_result(parent_stream_id, gather_ref, task_result)
         self.logger.debug(
             "Gather complete. Go back up to parent stream",
             task=task,
@@ -1609,11 +2396,79 @@ class DSLScheduler:
         context = self.get_context(stream_id)
         return context.get("ACTIONS", {})
 
+    def get_task_expressions(
+        self, task: ActionStatement
+    ) -> Mapping[ExprContext, set[str]]:
+        """Get the expression contexts a task definition references.
+
+        Every stream runs the same statement, so the extraction is done once per
+        task definition and shared. Statements that aren't the scheduler's own
+        definitions are extracted without caching.
+        """
+        if self.tasks.get(task.ref) is not task:
+            return extract_expressions(task.model_dump())
+        if (expr_ctxs := self.task_expressions.get(task.ref)) is None:
+            expr_ctxs = extract_expressions(task.model_dump())
+            self.task_expressions[task.ref] = expr_ctxs
+        return expr_ctxs
+
+    def get_prefetch_hint(self, task: ActionStatement) -> PrefetchHint | None:
+        """Get the secrets and variables to load while a task runs for its next actions.
+
+        Control flow actions are looked through to the actions they lead to.
+        Other interface actions and actions that override the environment are
+        left out, since their secrets aren't resolved in the task's environment.
+        """
+        if task.environment is not None:
+            return None
+        if task.ref in self.prefetch_hints:
+            return self.prefetch_hints[task.ref]
+        control_flow = (
+            PlatformAction.TRANSFORM_SCATTER,
+            PlatformAction.TRANSFORM_GATHER,
+            PlatformAction.LOOP_START,
+            PlatformAction.LOOP_END,
+        )
+        actions: set[str] = set()
+        secrets: set[str] = set()
+        variables: set[str] = set()
+        seen = {task.ref}
+        pending = deque(dst for dst, _ in self.adj.get(task.ref, ()))
+        while pending:
+            ref = pending.popleft()
+            if ref in seen:
+                continue
+            seen.add(ref)
+            stmt = self.tasks[ref]
+            if stmt.action in control_flow:
+                pending.extend(dst for dst, _ in self.adj[ref])
+                continue
+            if stmt.environment is not None or (
+                PlatformAction.is_interface(stmt.action)
+                and stmt.action != PlatformAction.RUN_PYTHON
+            ):
+                continue
+            expr_ctxs = self.get_task_expressions(stmt)
+            actions.add(stmt.action)
+            secrets.update(expr_ctxs.get(ExprContext.SECRETS, ()))
+            variables.update(expr_ctxs.get(ExprContext.VARS, ()))
+        hint = (
+            PrefetchHint(
+                actions=sorted(actions),
+                secrets=sorted(secrets),
+                variables=sorted(variables),
+            )
+            if actions
+            else None
+        )
+        self.prefetch_hints[task.ref] = hint
+        return hint
+
     def build_stream_aware_context(
         self, task: ActionStatement, stream_id: StreamID
     ) -> ExecutionContext:
         """Build a context that is aware of the stream hierarchy."""
-        expr_ctxs = extract_expressions(task.model_dump())
+        expr_ctxs = self.get_task_expressions(task)
         resolved_actions: dict[str, TaskResult] = {}
         for action_ref in expr_ctxs[ExprContext.ACTIONS]:
             result = self.get_stream_aware_action_result(action_ref, stream_id)
@@ -1626,6 +2481,52 @@ class DSLScheduler:
         new_context.update(ACTIONS=resolved_actions)
         return new_context
 
+    def build_action_input_context(
+        self, task: ActionStatement, stream_id: StreamID
+    ) -> ExecutionContext:
+        """Build the context shipped to the executor for a task.
+
+        Same as `build_stream_aware_context`, but TRIGGER is pruned to what the
+        task references: dropped when unreferenced, and reduced to the
+        referenced top-level keys when it's an inline object. Externalized
+        triggers are already small handles and are passed through as-is.
+        """
+        new_context = self.build_stream_aware_context(task, stream_id)
+        trigger_keys = self.get_task_expressions(task).get(ExprContext.TRIGGER)
+        trigger = new_context["TRIGGER"]
+        if not trigger_keys:
+            new_context["TRIGGER"] = None
+        elif (
+            "" not in trigger_keys
+            and isinstance(trigger, InlineObject)
+            and isinstance(trigger.data, dict)
+        ):
+            new_context["TRIGGER"] = trigger.model_copy(
+                update={
+                    "data": {
+                        key: trigger.data[key]
+                        for key in trigger_keys
+                        if key in trigger.data
+                    }
+                }
+            )
+        return new_context
+
+    def set_action_result(
+        self, stream_id: StreamID, action_ref: str, result: TaskResult
+    ) -> None:
+        """Store an action result in a stream and keep the owner index coherent.
+
+        Overwriting an existing result (e.g. a loop iteration re-running an
+        action) keeps every memoized owner valid. A result landing in a stream
+        for the first time can shadow an owner further up the hierarchy, so
+        the memoized owners of that action ref are dropped.
+        """
+        actions_context = self._get_action_context(stream_id)
+        if action_ref not in actions_context:
+            self.action_result_owners.pop(action_ref, None)
+        actions_context[action_ref] = result
+
     def get_stream_aware_action_result(
         self, action_ref: str, stream_id: StreamID
     ) -> TaskResult | None:
@@ -1651,42 +2552,65 @@ class DSLScheduler:
 
         Performance
         -----------
-        WE SHOULD TOTALLY CACHE THIS FUNCTION BTW
+        The owning stream of every stream visited on the way up is memoized in
+        `action_result_owners`, so sibling streams stop at their first shared
+        ancestor and repeated lookups are a single dict hit. The index stores
+        owners rather than results, which keeps overwritten results fresh.
+        This runs for every action a task references, so only misses are
+        logged.
         """
-        self.logger.trace(
-            "Resolving action expression",
-            action_ref=action_ref,
-            stream_id=stream_id,
-        )
+        owners = self.action_result_owners[action_ref]
+        visited: list[StreamID] = []
+        owner: StreamID | None = None
 
         # Start from the current stream and work upwards
-        curr_stream = stream_id
-
+        curr_stream: StreamID | None = stream_id
         while curr_stream is not None:
+            if (owner := owners.get(curr_stream)) is not None:
+                break
             # Check if the action exists in the current stream
             if stream_context := self.streams.get(curr_stream):
-                actions_context = stream_context.get("ACTIONS", {})
-                if action_ref in actions_context:
-                    self.logger.trace(
-                        "Found action in stream",
-                        action_ref=action_ref,
-                        stream_id=curr_stream,
-                    )
-                    return actions_context[action_ref]
-
+                if action_ref in stream_context.get("ACTIONS", {}):
+                    owner = curr_stream
+                    break
+            visited.append(curr_stream)
             # Move to parent stream
             curr_stream = self.stream_hierarchy.get(curr_stream)
-            self.logger.trace(
-                "Moving to parent stream",
+
+        if owner is None:
+            # Action not found in any stream
+            self.logger.debug(
+                "Action not found in any stream",
                 action_ref=action_ref,
-                parent_stream=curr_stream,
+                stream_id=stream_id,
             )
+            return None
 
-        # Action not found in any stream
-        self.logger.debug(
-            "Action not found in any stream", action_ref=action_ref, stream_id=stream_id
-        )
-        return None
+        owners[owner] = owner
+        for stream in visited:
+            owners[stream] = owner
+        return self.streams[owner]["ACTIONS"][action_ref]
+
+    async def resolve_condition(
+        self, expression: str, context: ExecutionContext
+    ) -> Any:
+        """Evaluate a condition, in the workflow when it is safe to do so.
+
+        Conditions that only read inline results and call deterministic
+        functions are evaluated directly, which saves an activity round trip
+        and its history events. Everything else, including every condition that
+        fails, goes through `resolve_expression`.
+        """
+        if workflow.patched(INLINE_CONDITION_EVAL_PATCH):
+            try:
+                return evaluate_expression_inline(expression, context)
+            except InlineEvaluationUnavailable as e:
+                self.logger.trace(
+                    "Evaluating condition in activity",
+                    expression=expression,
+                    reason=str(e),
+                )
+        return await self.resolve_expression(expression, context)
 
     async def resolve_expression(
         self, expression: str, context: ExecutionContext
@@ -1696,9 +2620,11 @@ class DSLScheduler:
             "Resolving expression", expression=expression, context=context
         )
         try:
-            return await workflow.execute_activity(
+            return await execute_platform_activity(
                 DSLActivities.evaluate_single_expression_activity,
-                args=(expression, context),
+                expression,
+                context,
+                local=self.execution_settings.local_platform_activities,
                 start_to_close_timeout=timedelta(seconds=60),
                 retry_policy=RETRY_POLICIES["activity:fail_fast"],
             )
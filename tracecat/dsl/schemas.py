@@ -16,6 +16,7 @@ from pydantic_core import CoreSchema, core_schema
 
 from tracecat.dsl.constants import DEFAULT_ACTION_TIMEOUT, MAX_DO_WHILE_ITERATIONS
 from tracecat.dsl.enums import JoinStrategy, StreamErrorHandlingStrategy
+from tracecat.dsl.types import ActionErrorInfo
 from tracecat.exceptions import TracecatValidationError
 from tracecat.expressions.validation import ExpressionStr, RequiredExpressionStr
 from tracecat.identifiers import WorkflowExecutionID, WorkflowRunID
@@ -449,6 +450,27 @@ class RunContext(BaseModel):
         return WorkflowUUID.new(v)
 
 
+class DSLExecutionSettings(BaseModel):
+    """Worker configuration that DSL workflow code branches on.
+
+    Resolved once when an execution starts and carried across continue-as-new,
+    so replays and later runs take the same branches even if the worker
+    configuration changes. The defaults are the behavior of executions that
+    started before these settings existed.
+    """
+
+    local_platform_activities: bool = False
+    """Run short platform activities as local activities"""
+    result_externalization_enabled: bool = False
+    """Stream gathered items to collection storage by chunk"""
+    collection_chunk_size: int = 256
+    """Number of items per chunk of a streamed gather"""
+    continue_as_new_history_length: int = 0
+    """History events a run adds before it continues as new, 0 to disable"""
+    continue_as_new_history_size_bytes: int = 0
+    """History bytes a run adds before it continues as new, 0 to disable"""
+
+
 type SkipToken = Literal["skip"]
 
 
@@ -543,6 +565,21 @@ class StreamID(str):
 ROOT_STREAM = StreamID.new("<root>", 0)
 
 
+class PrefetchHint(BaseModel):
+    """Secrets and variables that the actions after this one are likely to use.
+
+    The executor loads them in the background, so that the next actions of the
+    run can skip those lookups.
+    """
+
+    actions: list[str] = Field(default_factory=list)
+    """Downstream action names, whose declared secrets are resolved by the executor"""
+    secrets: list[str] = Field(default_factory=list)
+    """Secret names referenced in the downstream actions' expressions"""
+    variables: list[str] = Field(default_factory=list)
+    """Workspace variable names referenced in the downstream actions' expressions"""
+
+
 class RunActionInput(BaseModel):
     """This object contains all the information needed to execute an action."""
 
@@ -556,6 +593,8 @@ class RunActionInput(BaseModel):
     """ID for a streamable session, if any."""
     registry_lock: RegistryLock
     """Registry version lock from workflow definition. Required and must be non-empty."""
+    prefetch: PrefetchHint | None = None
+    """Secrets and variables to load ahead of the next actions, if any."""
 
     @model_validator(mode="before")
     @classmethod
@@ -568,6 +607,43 @@ class RunActionInput(BaseModel):
         return data
 
 
+class RunActionBatchItem(BaseModel):
+    """One scatter item of an action batch."""
+
+    stream_id: StreamID
+    exec_context: ExecutionContext
+
+
+class RunActionBatchInput(BaseModel):
+    """Runs one action for consecutive scatter items in a single activity."""
+
+    task: ActionStatement
+    run_context: RunContext
+    interaction_context: InteractionContext | None = None
+    registry_lock: RegistryLock
+    items: list[RunActionBatchItem]
+    prefetch: PrefetchHint | None = None
+
+    def item_input(self, item: RunActionBatchItem) -> RunActionInput:
+        """Get the equivalent single-item input for one batch item."""
+        return RunActionInput(
+            task=self.task,
+            exec_context=item.exec_context,
+            run_context=self.run_context,
+            interaction_context=self.interaction_context,
+            stream_id=item.stream_id,
+            registry_lock=self.registry_lock,
+            prefetch=self.prefetch,
+        )
+
+
+class ActionBatchItemResult(BaseModel):
+    """The outcome of one batch item. Exactly one of `result` and `error` is set."""
+
+    result: StoredObject | None = None
+    error: ActionErrorInfo | None = None
+
+
 class DSLExecutionError(TypedDict, total=False):
     """A proxy for an exception.
 
@@ -591,6 +667,14 @@ class ScatterArgs(BaseModel):
     interval: float | None = Field(
         default=None, description="The interval in seconds between each scatter task"
     )
+    batch_size: int | None = Field(
+        default=None,
+        ge=1,
+        description=(
+            "Run each action in the scatter for up to this many consecutive items"
+            " in one executor call"
+        ),
+    )
 
 
 class GatherArgs(BaseModel):
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from typing import TYPE_CHECKING, Any, Literal, NotRequired, TypedDict
 
-from pydantic import TypeAdapter
+from pydantic import GetCoreSchemaHandler, TypeAdapter
+from pydantic_core import core_schema
 
 from tracecat.expressions.common import ExprContext
 
@@ -50,6 +51,23 @@ class Task:
     stream_id: StreamID
     delay: float = field(default=0.0, compare=False)
 
+    @classmethod
+    def __get_pydantic_core_schema__(
+        cls, source_type: Any, handler: GetCoreSchemaHandler
+    ) -> core_schema.CoreSchema:
+        # StreamID can't be imported at module level, so the generated schema
+        # validates `stream_id` as Any. Restore the StreamID after validation.
+        from tracecat.dsl.schemas import StreamID
+
+        def validate_stream_id(task: Task) -> Task:
+            if isinstance(task.stream_id, StreamID):
+                return task
+            return replace(task, stream_id=StreamID(task.stream_id))
+
+        return core_schema.no_info_after_validator_function(
+            validate_stream_id, handler(source_type)
+        )
+
 
 @dataclass(frozen=True, slots=True)
 class ActionErrorInfo:
@@ -28,6 +28,7 @@ with workflow.unsafe.imports_passed_through():
     from tracecat.dsl.action import DSLActivities
     from tracecat.dsl.client import get_temporal_client
     from tracecat.dsl.init_activities import (
+        resolve_execution_settings_activity,
         resolve_time_anchor_activity,
         resolve_workflow_concurrency_limits_enabled_activity,
     )
@@ -48,12 +49,35 @@ with workflow.unsafe.imports_passed_through():
     from tracecat.workspaces.activities import get_workspace_organization_id_activity
 
 
+WORKFLOW_PASSTHROUGH_MODULES = frozenset(
+    {
+        # Our own packages. Passing them through also avoids class identity
+        # mismatches when Pydantic validates discriminated unions (e.g.,
+        # StoredObject = InlineObject | ExternalObject).
+        "tracecat",
+        "tracecat_ee",
+        "tracecat_registry",
+        # Expression evaluation in workflow code
+        "jsonpath_ng",
+        "dateparser",
+        # beartype's import hooks conflict with Temporal's sandbox importer and
+        # cause circular import issues
+        "beartype",
+    }
+)
+"""Modules that workflow runs share with the worker instead of importing them
+again in each run's sandbox. These are deterministic and only read after
+import, so sharing them across runs is safe."""
+
+
 # Due to known issues with Pydantic's use of issubclass and our inability to
 # override the check in sandbox, Pydantic will think datetime is actually date
 # in the sandbox. At the expense of protecting against datetime.now() use in
 # workflows, we're going to remove datetime module restrictions. See sdk-python
 # README's discussion of known sandbox issues for more details.
-def new_sandbox_runner() -> SandboxedWorkflowRunner:
+def new_sandbox_runner(
+    passthrough_modules: frozenset[str] = WORKFLOW_PASSTHROUGH_MODULES,
+) -> SandboxedWorkflowRunner:
     # TODO(cretz): Use with_child_unrestricted when https://github.com/temporalio/sdk-python/issues/254
     # is fixed and released
     invalid_module_member_children = dict(
@@ -61,20 +85,6 @@ def new_sandbox_runner() -> SandboxedWorkflowRunner:
     )
     del invalid_module_member_children["datetime"]
 
-    # Pass through tracecat modules to avoid class identity mismatches
-    # when Pydantic validates discriminated unions (e.g., StoredObject = InlineObject | ExternalObject)
-    # Also pass through jsonpath_ng which is used for expression evaluation in workflows
-    # Add beartype to passthrough modules to avoid circular import issues
-    # with its custom import hooks conflicting with Temporal's sandbox
-    passthrough_modules = SandboxRestrictions.passthrough_modules_default | {
-        "tracecat",
-        "tracecat_ee",
-        "tracecat_registry",
-        "jsonpath_ng",
-        "dateparser",
-        "beartype",
-    }
-
     return SandboxedWorkflowRunner(
         restrictions=dataclasses.replace(
             SandboxRestrictions.default,
@@ -82,7 +92,8 @@ def new_sandbox_runner() -> SandboxedWorkflowRunner:
                 SandboxRestrictions.invalid_module_members_default,
                 children=invalid_module_member_children,
             ),
-            passthrough_modules=passthrough_modules,
+            passthrough_modules=SandboxRestrictions.passthrough_modules_default
+            | passthrough_modules,
         )
     )
 
@@ -98,6 +109,7 @@ def get_activities() -> list[Callable]:
         *WorkflowSchedulesService.get_activities(),
         resolve_time_anchor_activity,
         resolve_workflow_concurrency_limits_enabled_activity,
+        resolve_execution_settings_activity,
         *WorkflowsManagementService.get_activities(),
         *InteractionService.get_activities(),
         *TierActivities.get_activities(),
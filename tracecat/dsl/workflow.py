@@ -1,11 +1,12 @@
 from __future__ import annotations
 
 import asyncio
+import json
 import re
 import uuid
 from collections.abc import Awaitable, Coroutine
 from datetime import UTC, datetime, timedelta
-from typing import Any
+from typing import Any, NoReturn
 
 from temporalio import workflow
 from temporalio.common import (
@@ -31,7 +32,7 @@ with workflow.unsafe.imports_passed_through():
     import jsonpath_ng.lexer  # noqa  # pyright: ignore[reportUnusedImport]
     import jsonpath_ng.parser  # noqa  # pyright: ignore[reportUnusedImport]
     import tracecat_registry  # noqa  # pyright: ignore[reportUnusedImport]
-    from pydantic import ValidationError
+    from pydantic import BaseModel, ValidationError
     from tracecat_ee.agent.types import AgentWorkflowID
     from tracecat_ee.agent.workflows.durable import (
         AgentWorkflowArgs,
@@ -71,6 +72,7 @@ with workflow.unsafe.imports_passed_through():
         DSLRunArgs,
         PreparedSubflowResult,
         dsl_execution_error_from_exception,
+        execute_platform_activity,
         get_trigger_type,
     )
     from tracecat.dsl.enums import (
@@ -81,16 +83,26 @@ with workflow.unsafe.imports_passed_through():
     )
     from tracecat.dsl.init_activities import (
         ResolveTimeAnchorActivityInputs,
+        resolve_execution_settings_activity,
         resolve_time_anchor_activity,
         resolve_workflow_concurrency_limits_enabled_activity,
     )
-    from tracecat.dsl.scheduler import DSLScheduler, PlatformExecutionError
+    from tracecat.dsl.scheduler import (
+        DSLScheduler,
+        DSLSchedulerCheckpoint,
+        PlatformExecutionError,
+    )
     from tracecat.dsl.schemas import (
         ROOT_STREAM,
+        ActionBatchItemResult,
         ActionStatement,
         DSLConfig,
         DSLEnvironment,
+        DSLExecutionSettings,
         ExecutionContext,
+        PrefetchHint,
+        RunActionBatchInput,
+        RunActionBatchItem,
         RunActionInput,
         RunContext,
         StreamID,
@@ -122,6 +134,7 @@ with workflow.unsafe.imports_passed_through():
         StoredObjectValidator,
         action_collection_prefix,
         action_key,
+        checkpoint_key,
         return_key,
         trigger_key,
     )
@@ -168,6 +181,30 @@ with workflow.unsafe.imports_passed_through():
 
 _CHILD_RUN_ARG_PREP_YIELD_EVERY = 8
 ACTION_HEARTBEAT_TIMEOUT_RETRY_PATCH = "dsl-action-heartbeat-timeout-retry-v1"
+CONTINUE_AS_NEW_CHECKPOINT_PATCH = "dsl-continue-as-new-checkpoint-v1"
+CRITICAL_PATH_QUEUE_PATCH = "dsl-critical-path-queue-v1"
+ACTION_PREFETCH_HINT_PATCH = "dsl-action-prefetch-hint-v1"
+EXECUTION_SETTINGS_PATCH = "dsl-execution-settings-v1"
+
+CHECKPOINT_PART_CHARS = 512 * 1024
+"""Characters in each stored part of a checkpoint.
+
+Checkpoints are serialized as ASCII JSON, so a part is as many bytes. Even
+with every character escaped again in the activity payload, a part stays
+under Temporal's 2 MB payload limit.
+"""
+
+CHECKPOINT_MAX_INLINE_CHARS = 512 * 1024
+"""Checkpoint characters that may be carried inline in the continue-as-new input"""
+
+
+class DSLWorkflowCheckpoint(BaseModel):
+    """Workflow state carried across continue-as-new."""
+
+    scheduler: DSLSchedulerCheckpoint
+    wf_start_time: datetime
+    """Start time of the first run, so logical time keeps advancing"""
+    action_execution_count: int
 
 
 def _inherit_search_attributes_with_alias(
@@ -227,9 +264,12 @@ class DSLWorkflow:
     # Tier limit tracking
     _tier_limits: EffectiveLimits | None = None
     workflow_concurrency_limits_enabled: bool
+    execution_settings: DSLExecutionSettings
     _workflow_permit_acquired: bool = False
     _workflow_permit_heartbeat_task: asyncio.Task[None] | None = None
     _action_execution_count: int = 0
+    _history_length_at_start: int = 0
+    _history_size_at_start: int = 0
 
     @workflow.init
     def __init__(self, args: DSLRunArgs) -> None:
@@ -388,6 +428,19 @@ class DSLWorkflow:
             )
         )
 
+        # Snapshot worker settings once per execution. Later runs of the
+        # execution inherit them through continue-as-new.
+        if args.execution_settings is not None:
+            self.execution_settings = args.execution_settings
+        elif workflow.patched(EXECUTION_SETTINGS_PATCH):
+            self.execution_settings = await workflow.execute_local_activity(
+                resolve_execution_settings_activity,
+                start_to_close_timeout=timedelta(seconds=5),
+                retry_policy=RETRY_POLICIES["activity:fail_fast"],
+            )
+        else:
+            self.execution_settings = DSLExecutionSettings()
+
         # Fetch tier limits for this organization
         if self.workflow_concurrency_limits_enabled:
             self._tier_limits = await workflow.execute_activity(
@@ -529,70 +582,19 @@ class DSLWorkflow:
             self.runtime_config = self.dsl.config
         self.logger.debug("Runtime config after", runtime_config=self.runtime_config)
 
-        # Consolidate trigger inputs
-        if args.schedule_id:
-            self.logger.debug("Fetching schedule trigger inputs")
-            try:
-                trigger_inputs = await self._get_schedule_trigger_inputs(
-                    schedule_id=args.schedule_id, worflow_id=args.wf_id
-                )
-            except TracecatNotFoundError as e:
-                raise ApplicationError(
-                    "Failed to fetch trigger inputs as the schedule was not found",
-                    non_retryable=True,
-                    type=e.__class__.__name__,
-                ) from e
+        checkpoint: DSLWorkflowCheckpoint | None = None
+        trigger_inputs: StoredObject | None = None
+        if args.checkpoint is not None:
+            # The checkpoint's root context already holds the trigger inputs
+            checkpoint = await self._load_checkpoint(args.checkpoint)
+            self._action_execution_count = checkpoint.action_execution_count
         else:
-            self.logger.debug("Using provided trigger inputs")
-            trigger_inputs = (
-                StoredObjectValidator.validate_python(args.trigger_inputs)
-                if args.trigger_inputs is not None
-                else None
-            )
-        # Validate and apply defaults from input schema to trigger inputs
-        if input_schema := self.dsl.entrypoint.expects:
-            try:
-                trigger_inputs = await workflow.execute_activity(
-                    DSLActivities.normalize_trigger_inputs_activity,
-                    arg=NormalizeTriggerInputsActivityInputs(
-                        input_schema=input_schema,
-                        trigger_inputs=trigger_inputs,
-                        key=trigger_key(str(self.workspace_id), self.wf_exec_id),
-                    ),
-                    start_to_close_timeout=timedelta(seconds=10),
-                    retry_policy=RETRY_POLICIES["activity:fail_fast"],
-                )
-            except ActivityError as e:
-                match cause := e.cause:
-                    case ApplicationError(type=t, details=details) if (
-                        t == ValidationError.__name__
-                    ):
-                        self.logger.warning(
-                            "Validation error when normalizing trigger inputs",
-                            error=e,
-                            details=details,
-                        )
-                        [val_detail] = details
-                        validated = ValidationDetailListTA.validate_python(val_detail)
-                        raise ApplicationError(
-                            format_input_schema_validation_error(validated),
-                            details,
-                            non_retryable=True,
-                            type=ValidationError.__name__,
-                        ) from cause
-                    case _:
-                        self.logger.warning(
-                            "Unexpected error cause when normalizing trigger inputs",
-                            error=e,
-                        )
-                        raise ApplicationError(
-                            "Failed to normalize trigger inputs",
-                            non_retryable=True,
-                            type=e.__class__.__name__,
-                        ) from cause
+            trigger_inputs = await self._resolve_trigger_inputs(args)
 
         # Store workflow start time for computing elapsed time
-        self.wf_start_time = wf_info.start_time
+        self.wf_start_time = (
+            checkpoint.wf_start_time if checkpoint is not None else wf_info.start_time
+        )
 
         # Resolve time anchor - recorded in history for replay/reset determinism
         if args.time_anchor is not None:
@@ -614,22 +616,25 @@ class DSLWorkflow:
         # Prepare user facing context
         # trigger_inputs is already a StoredObject from args or normalize_trigger_inputs_activity
         # TRIGGER is always present - None signals no trigger inputs were provided
-        self.context = ExecutionContext(
-            ACTIONS={},
-            TRIGGER=trigger_inputs,
-            ENV=DSLEnvironment(
-                workflow={
-                    "start_time": wf_info.start_time,
-                    "time_anchor": self.time_anchor,
-                    "dispatch_type": self.dispatch_type,
-                    "execution_id": self.wf_exec_id,
-                    "run_id": self.wf_run_id,
-                    "trigger_type": get_trigger_type(wf_info),
-                },
-                environment=self.runtime_config.environment,
-                variables={},
-            ),
-        )
+        if checkpoint is not None:
+            self.context = self._restore_context(checkpoint)
+        else:
+            self.context = ExecutionContext(
+                ACTIONS={},
+                TRIGGER=trigger_inputs,
+                ENV=DSLEnvironment(
+                    workflow={
+                        "start_time": wf_info.start_time,
+                        "time_anchor": self.time_anchor,
+                        "dispatch_type": self.dispatch_type,
+                        "execution_id": self.wf_exec_id,
+                        "run_id": self.wf_run_id,
+                        "trigger_type": get_trigger_type(wf_info),
+                    },
+                    environment=self.runtime_config.environment,
+                    variables={},
+                ),
+            )
 
         # All the starting config has been consolidated, can safely set the run context
         # Internal facing context
@@ -651,6 +656,10 @@ class DSLWorkflow:
             execution_timeout=wf_info.execution_timeout,
         )
 
+        # Continue-as-new thresholds count what this run adds to the history,
+        # not the checkpoint it loaded
+        self._history_length_at_start = wf_info.get_current_history_length()
+        self._history_size_at_start = wf_info.get_current_history_size()
         self.scheduler = DSLScheduler(
             executor=self.execute_task,
             dsl=self.dsl,
@@ -659,7 +668,13 @@ class DSLWorkflow:
             role=self.role,
             run_context=self.run_context,
             logger=self.logger.bind(unit="dsl-scheduler"),
+            batch_executor=self._execute_task_batch,
+            should_checkpoint=self._should_continue_as_new,
+            critical_path_ordering=workflow.patched(CRITICAL_PATH_QUEUE_PATCH),
+            execution_settings=self.execution_settings,
         )
+        if checkpoint is not None:
+            self.scheduler.restore(checkpoint.scheduler)
         try:
             task_exceptions = await self.scheduler.start()
         except Exception as e:
@@ -668,6 +683,9 @@ class DSLWorkflow:
                 msg, non_retryable=True, type=e.__class__.__name__
             ) from e
 
+        if self.scheduler.suspended:
+            await self._continue_as_new(args)
+
         if task_exceptions:
             n_exc = len(task_exceptions)
             formatted_exc = "\n".join(
@@ -701,6 +719,195 @@ class DSLWorkflow:
                 type=e.__class__.__name__,
             ) from e
 
+    async def _resolve_trigger_inputs(self, args: DSLRunArgs) -> StoredObject | None:
+        """Get the trigger inputs of a new run, validated against the input schema."""
+        if args.schedule_id:
+            self.logger.debug("Fetching schedule trigger inputs")
+            try:
+                trigger_inputs = await self._get_schedule_trigger_inputs(
+                    schedule_id=args.schedule_id, worflow_id=args.wf_id
+                )
+            except TracecatNotFoundError as e:
+                raise ApplicationError(
+                    "Failed to fetch trigger inputs as the schedule was not found",
+                    non_retryable=True,
+                    type=e.__class__.__name__,
+                ) from e
+        else:
+            self.logger.debug("Using provided trigger inputs")
+            trigger_inputs = (
+                StoredObjectValidator.validate_python(args.trigger_inputs)
+                if args.trigger_inputs is not None
+                else None
+            )
+        # Validate and apply defaults from input schema to trigger inputs
+        if input_schema := self.dsl.entrypoint.expects:
+            try:
+                trigger_inputs = await workflow.execute_activity(
+                    DSLActivities.normalize_trigger_inputs_activity,
+                    arg=NormalizeTriggerInputsActivityInputs(
+                        input_schema=input_schema,
+                        trigger_inputs=trigger_inputs,
+                        key=trigger_key(str(self.workspace_id), self.wf_exec_id),
+                    ),
+                    start_to_close_timeout=timedelta(seconds=10),
+                    retry_policy=RETRY_POLICIES["activity:fail_fast"],
+                )
+            except ActivityError as e:
+                match cause := e.cause:
+                    case ApplicationError(type=t, details=details) if (
+                        t == ValidationError.__name__
+                    ):
+                        self.logger.warning(
+                            "Validation error when normalizing trigger inputs",
+                            error=e,
+                            details=details,
+                        )
+                        [val_detail] = details
+                        validated = ValidationDetailListTA.validate_python(val_detail)
+                        raise ApplicationError(
+                            format_input_schema_validation_error(validated),
+                            details,
+                            non_retryable=True,
+                            type=ValidationError.__name__,
+                        ) from cause
+                    case _:
+                        self.logger.warning(
+                            "Unexpected error cause when normalizing trigger inputs",
+                            error=e,
+                        )
+                        raise ApplicationError(
+                            "Failed to normalize trigger inputs",
+                            non_retryable=True,
+                            type=e.__class__.__name__,
+                        ) from cause
+
+        return trigger_inputs
+
+    def _should_continue_as_new(self) -> bool:
+        """Whether this run has grown the history enough to continue as new.
+
+        Growth is measured from the history when the run started scheduling, so
+        a run that loaded a large checkpoint doesn't continue as new again
+        before making progress.
+        """
+        max_length = self.execution_settings.continue_as_new_history_length
+        max_size = self.execution_settings.continue_as_new_history_size_bytes
+        if max_length <= 0 and max_size <= 0:
+            return False
+        wf_info = workflow.info()
+        length = wf_info.get_current_history_length()
+        size = wf_info.get_current_history_size()
+        exceeded = (0 < max_length <= length - self._history_length_at_start) or (
+            0 < max_size <= size - self._history_size_at_start
+        )
+        # The server's suggestion also counts the loaded checkpoint. Only follow
+        # it once the run has added at least as much history as it started with.
+        if not exceeded and wf_info.is_continue_as_new_suggested():
+            exceeded = length >= 2 * self._history_length_at_start
+        return exceeded and workflow.patched(CONTINUE_AS_NEW_CHECKPOINT_PATCH)
+
+    def _restore_context(self, checkpoint: DSLWorkflowCheckpoint) -> ExecutionContext:
+        """Get the root context of a checkpoint, updated for the current run."""
+        context = checkpoint.scheduler.streams[ROOT_STREAM]
+        if (env := context.get("ENV")) is not None and "workflow" in env:
+            env["workflow"]["run_id"] = self.wf_run_id
+        return context
+
+    async def _load_checkpoint(
+        self, parts: list[StoredObject]
+    ) -> DSLWorkflowCheckpoint:
+        """Load a checkpoint stored in parts by `_continue_as_new`.
+
+        Each part is a separate activity result, so no single payload holds
+        the whole checkpoint.
+        """
+        self.logger.info("Resuming workflow from checkpoint", n_parts=len(parts))
+        data: list[str] = []
+        for part in parts:
+            match part:
+                case InlineObject(data=inline):
+                    data.append(inline)
+                case _:
+                    data.append(
+                        await workflow.execute_activity(
+                            DSLActivities.retrieve_workflow_payload_activity,
+                            arg=part,
+                            start_to_close_timeout=self.start_to_close_timeout,
+                            retry_policy=RETRY_POLICIES["activity:fail_slow"],
+                        )
+                    )
+        return DSLWorkflowCheckpoint.model_validate_json("".join(data))
+
+    async def _continue_as_new(self, args: DSLRunArgs) -> NoReturn:
+        """Store the workflow state and continue as new from it.
+
+        The next run keeps the workflow ID, definition, registry lock and time
+        anchor, so users see one execution. The state is stored in parts of at
+        most `CHECKPOINT_PART_CHARS`, so neither storing nor loading it puts a
+        payload over Temporal's size limit in the history.
+        """
+        checkpoint = DSLWorkflowCheckpoint(
+            scheduler=self.scheduler.checkpoint(),
+            wf_start_time=self.wf_start_time,
+            action_execution_count=self._action_execution_count,
+        )
+        data = json.dumps(checkpoint.model_dump(mode="json"), separators=(",", ":"))
+        # The next run adds the whole checkpoint to its history when loading it
+        max_size = self.execution_settings.continue_as_new_history_size_bytes
+        if 0 < max_size <= len(data):
+            raise ApplicationError(
+                f"Workflow state of {len(data)} bytes is too large to continue as"
+                f" new. The limit is {max_size} bytes"
+                " (TRACECAT__DSL_CONTINUE_AS_NEW_HISTORY_SIZE_BYTES).",
+                non_retryable=True,
+            )
+        parts: list[StoredObject] = []
+        inline_chars = 0
+        for i, start in enumerate(range(0, len(data), CHECKPOINT_PART_CHARS)):
+            part = data[start : start + CHECKPOINT_PART_CHARS]
+            stored = await workflow.execute_activity(
+                DSLActivities.store_workflow_payload_activity,
+                args=(
+                    checkpoint_key(
+                        str(self.workspace_id), self.wf_exec_id, self.wf_run_id, i
+                    ),
+                    part,
+                ),
+                start_to_close_timeout=self.start_to_close_timeout,
+                retry_policy=RETRY_POLICIES["activity:fail_slow"],
+            )
+            stored = StoredObjectValidator.validate_python(stored)
+            if isinstance(stored, InlineObject):
+                inline_chars += len(part)
+            parts.append(stored)
+        # Parts come back inline when result externalization is disabled
+        if inline_chars > CHECKPOINT_MAX_INLINE_CHARS:
+            raise ApplicationError(
+                f"Workflow state of {len(data)} bytes is too large to continue as"
+                " new without result externalization"
+                " (TRACECAT__RESULT_EXTERNALIZATION_ENABLED).",
+                non_retryable=True,
+            )
+        wf_info = workflow.info()
+        self.logger.info(
+            "Continuing workflow as new from checkpoint",
+            history_events_length=wf_info.get_current_history_length(),
+            history_events_size_bytes=wf_info.get_current_history_size(),
+        )
+        workflow.continue_as_new(
+            args.model_copy(
+                update={
+                    "dsl": self.dsl,
+                    "registry_lock": self.registry_lock,
+                    "time_anchor": self.time_anchor,
+                    "trigger_inputs": None,
+                    "checkpoint": parts,
+                    "execution_settings": self.execution_settings,
+                }
+            )
+        )
+
     async def _handle_timers(self, task: ActionStatement) -> None:
         """Perform any timing control flow logic (start_delay, wait_until).
 
@@ -777,9 +984,11 @@ class DSLWorkflow:
             result = await self._execute_task(task)
             ctx["ACTIONS"][task.ref] = result
             self._set_logical_time_context()
-            retry_until_result = await workflow.execute_activity(
+            retry_until_result = await execute_platform_activity(
                 DSLActivities.evaluate_single_expression_activity,
-                args=(retry_until.strip(), ctx),
+                retry_until.strip(),
+                ctx,
+                local=self.execution_settings.local_platform_activities,
                 start_to_close_timeout=timedelta(seconds=60),
                 retry_policy=RETRY_POLICIES["activity:fail_fast"],
             )
@@ -1276,8 +1485,7 @@ class DSLWorkflow:
                     operation="release_action_permit",
                 )
             self.logger.trace("Setting action result", task_result=task_result)
-            context = self.get_context(stream_id)
-            context["ACTIONS"][task.ref] = task_result
+            self.scheduler.set_action_result(stream_id, task.ref, task_result)
         return task_result
 
     ERROR_TYPE_TO_MESSAGE = {
@@ -1309,13 +1517,14 @@ class DSLWorkflow:
             key = action_key(
                 str(self.workspace_id), self.wf_exec_id, stream_id, task.ref
             )
-            trigger_inputs = await workflow.execute_activity(
+            trigger_inputs = await execute_platform_activity(
                 DSLActivities.evaluate_templated_object_activity,
-                arg=EvaluateTemplatedObjectActivityInput(
+                EvaluateTemplatedObjectActivityInput(
                     obj=task.args.get("trigger_inputs"),
                     operand=self._build_action_context(task, stream_id),
                     key=key,
                 ),
+                local=self.execution_settings.local_platform_activities,
                 start_to_close_timeout=timedelta(seconds=60),
                 retry_policy=RETRY_POLICIES["activity:fail_fast"],
             )
@@ -1414,7 +1623,7 @@ class DSLWorkflow:
 
         # Synchronize by converting Sequence[StoredObject] -> CollectionObject
         stream_id = ctx_stream_id.get()
-        collection = await workflow.execute_activity(
+        collection = await execute_platform_activity(
             DSLActivities.synchronize_collection_object_activity,
             SynchronizeCollectionObjectActivityInput(
                 collection=all_results,
@@ -1422,6 +1631,7 @@ class DSLWorkflow:
                     str(self.workspace_id), self.wf_exec_id, stream_id, task.ref
                 ),
             ),
+            local=self.execution_settings.local_platform_activities,
             start_to_close_timeout=timedelta(seconds=60),
             retry_policy=RETRY_POLICIES["activity:fail_fast"],
         )
@@ -1755,16 +1965,21 @@ class DSLWorkflow:
         """Set ctx_logical_time for deterministic FN.now() in template evaluations."""
         ctx_logical_time.set(self._compute_logical_time())
 
-    async def _run_action(self, task: ActionStatement) -> StoredObject:
-        # XXX(perf): We shouldn't pass the full execution context to the activity
-        # We should only keep the contexts that are needed for the action
-        stream_id = ctx_stream_id.get()
-        new_context = self._build_action_context(task, stream_id)
+    def _build_run_action_context(
+        self, task: ActionStatement, stream_id: StreamID
+    ) -> ExecutionContext:
+        # Only ship the ACTIONS results and TRIGGER keys the action references
+        new_context = self.scheduler.build_action_input_context(task, stream_id)
 
         # Inject current logical_time into the workflow context for FN.now() etc.
         if env_context := new_context.get("ENV"):
             if workflow_ctx := env_context.get("workflow"):
                 workflow_ctx["logical_time"] = self._compute_logical_time()
+        return new_context
+
+    async def _run_action(self, task: ActionStatement) -> StoredObject:
+        stream_id = ctx_stream_id.get()
+        new_context = self._build_run_action_context(task, stream_id)
 
         # Check if action has environment override
         run_context = self.run_context
@@ -1774,9 +1989,11 @@ class DSLWorkflow:
             if is_template_only(environment):
                 # Evaluate the environment expression
                 self._set_logical_time_context()
-                environment = await workflow.execute_activity(
+                environment = await execute_platform_activity(
                     DSLActivities.evaluate_single_expression_activity,
-                    args=(task.environment, new_context),
+                    task.environment,
+                    new_context,
+                    local=self.execution_settings.local_platform_activities,
                     start_to_close_timeout=timedelta(seconds=60),
                     retry_policy=RETRY_POLICIES["activity:fail_fast"],
                 )
@@ -1798,10 +2015,17 @@ class DSLWorkflow:
             stream_id=stream_id,
             session_id=session_id,
             registry_lock=self.registry_lock,
+            prefetch=self._get_prefetch_hint(task),
         )
 
         return await self._execute_action_activity(task, arg)
 
+    def _get_prefetch_hint(self, task: ActionStatement) -> PrefetchHint | None:
+        """Secrets and variables for the executor to load ahead of the next actions."""
+        if not workflow.patched(ACTION_PREFETCH_HINT_PATCH):
+            return None
+        return self.scheduler.get_prefetch_hint(task)
+
     async def _execute_action_activity(
         self, task: ActionStatement, arg: RunActionInput
     ) -> StoredObject:
@@ -1849,6 +2073,144 @@ class DSLWorkflow:
             ),
         )
 
+    async def _execute_task_batch(
+        self, task: ActionStatement, stream_ids: list[StreamID]
+    ) -> list[BaseException | None]:
+        """Execute one action for several scatter streams in one executor activity.
+
+        The scheduler only batches actions that `_execute_task` would send straight
+        to the executor (no timers, retries, interactions or environment overrides).
+        Results are set per stream, and each stream's error is returned in order.
+        """
+        errors: list[BaseException | None] = [None] * len(stream_ids)
+        items: list[RunActionBatchItem] = []
+        item_indices: list[int] = []
+        for i, stream_id in enumerate(stream_ids):
+            try:
+                self._check_action_execution_limit()
+            except ApplicationError as e:
+                errors[i] = e
+                continue
+            items.append(
+                RunActionBatchItem(
+                    stream_id=stream_id,
+                    exec_context=self._build_run_action_context(task, stream_id),
+                )
+            )
+            item_indices.append(i)
+        if not items:
+            return errors
+
+        self.logger.debug(
+            "Begin task batch execution", task_ref=task.ref, batch_size=len(items)
+        )
+        task_results = [TaskResult.from_result(None) for _ in items]
+        action_permit_id: str | None = None
+        action_permit_heartbeat_task: asyncio.Task[None] | None = None
+        try:
+            max_concurrent_actions = (
+                self._tier_limits.max_concurrent_actions
+                if self._tier_limits is not None
+                else None
+            )
+            if max_concurrent_actions is not None:
+                # One executor call holds one action slot for the whole batch
+                action_permit_id = self._action_permit_id(
+                    task=task, stream_id=items[0].stream_id
+                )
+                await self._acquire_action_permit(
+                    action_id=action_permit_id,
+                    limit=max_concurrent_actions,
+                )
+                action_permit_heartbeat_task = asyncio.create_task(
+                    self._action_permit_heartbeat_loop(action_id=action_permit_id)
+                )
+
+            arg = RunActionBatchInput(
+                task=task,
+                run_context=self.run_context,
+                interaction_context=ctx_interaction.get(),
+                registry_lock=self.registry_lock,
+                items=items,
+                prefetch=self._get_prefetch_hint(task),
+            )
+            raw_results = await workflow.execute_activity(
+                "execute_action_batch_activity",
+                args=(arg, self.role),
+                task_queue=config.TRACECAT__EXECUTOR_QUEUE,
+                start_to_close_timeout=timedelta(
+                    seconds=task.retry_policy.timeout * len(items)
+                ),
+                heartbeat_timeout=timedelta(
+                    seconds=config.TRACECAT__ACTIVITY_HEARTBEAT_TIMEOUT
+                )
+                if config.TRACECAT__ACTIVITY_HEARTBEAT_TIMEOUT > 0
+                else None,
+                retry_policy=RetryPolicy(maximum_attempts=1),
+            )
+            for j, raw_result in enumerate(raw_results):
+                item_result = ActionBatchItemResult.model_validate(raw_result)
+                if (err_info := item_result.error) is not None:
+                    details = ActionErrorInfoAdapter.dump_python(err_info)
+                    task_results[j] = task_results[j].with_error(details, err_info.type)
+                    errors[item_indices[j]] = ApplicationError(
+                        err_info.format("execute_action"),
+                        details,
+                        type=err_info.type,
+                        non_retryable=True,
+                    )
+                    continue
+                match stored_result := item_result.result:
+                    case InlineObject(data=data) as inline:
+                        result_typename = inline.typename or type(data).__name__
+                    case ExternalObject() as external:
+                        result_typename = external.typename or "external"
+                    case CollectionObject() as collection:
+                        result_typename = collection.typename or "list"
+                    case _:
+                        raise ApplicationError(
+                            "Action batch item has neither a result nor an error",
+                            non_retryable=True,
+                        )
+                task_results[j] = TaskResult(
+                    result=stored_result, result_typename=result_typename
+                )
+        except ActivityError as e:
+            cause = e.cause
+            root_error, root_message = self._unwrap_temporal_failure_cause(
+                cause if isinstance(cause, BaseException) else e
+            )
+            err_type = (
+                cause.type
+                if isinstance(cause, ApplicationError) and cause.type
+                else root_error.__class__.__name__
+            )
+            self.logger.warning(
+                self.ERROR_TYPE_TO_MESSAGE[e.__class__.__name__],
+                task_ref=task.ref,
+                root_message=root_message,
+                type=err_type,
+            )
+            for j, i in enumerate(item_indices):
+                task_results[j] = task_results[j].with_error(root_message, err_type)
+                errors[i] = ApplicationError(
+                    root_message, non_retryable=True, type=err_type
+                )
+        finally:
+            if action_permit_heartbeat_task is not None:
+                await self._run_cancellation_safe_cleanup(
+                    self._stop_action_permit_heartbeat(action_permit_heartbeat_task),
+                    operation="stop_action_permit_heartbeat",
+                )
+            if action_permit_id is not None:
+                await self._run_cancellation_safe_cleanup(
+                    self._release_action_permit(action_id=action_permit_id),
+                    operation="release_action_permit",
+                )
+            for item, task_result in zip(items, task_results, strict=True):
+                self.scheduler.set_action_result(item.stream_id, task.ref, task_result)
+        return errors
+
     async def _run_child_workflow(
         self, task: ActionStatement, run_args: DSLRunArgs, loop_index: int | None = None
     ) -> StoredObject:
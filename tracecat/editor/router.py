@@ -3,7 +3,7 @@ import re
 from typing import Any, Union, get_type_hints
 
 from fastapi import APIRouter, HTTPException, status
-from lark import Lark, LarkError, Token, Tree
+from lark import LarkError, Token, Tree
 from lark.visitors import Interpreter
 from pydantic import BaseModel
 
@@ -16,7 +16,7 @@ from tracecat.editor.schemas import (
     EditorParamRead,
 )
 from tracecat.expressions.functions import FUNCTION_MAPPING
-from tracecat.expressions.parser.grammar import grammar
+from tracecat.expressions.parser.core import build_lark
 from tracecat.identifiers.workflow import AnyWorkflowIDQuery
 from tracecat.registry.fields import EditorComponent
 from tracecat.workflow.management.management import WorkflowsManagementService
@@ -121,7 +121,7 @@ class TokenExtractor(Interpreter):
 
 # Initialize the Lark parser
 try:
-    expression_parser = Lark(grammar, start="root", parser="lalr")
+    expression_parser = build_lark("root")
 except Exception as e:
     print(f"Failed to initialize expression parser: {e}")
     expression_parser = None
@@ -8,7 +8,7 @@ from __future__ import annotations
 
 import asyncio
 from collections.abc import Callable
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from temporalio import activity
 from temporalio.exceptions import ApplicationError
@@ -24,7 +24,11 @@ from tracecat.auth.types import Role
 from tracecat.authz.scopes import backfill_legacy_role_scopes
 from tracecat.contexts import ctx_logger, ctx_role, ctx_run
 from tracecat.dsl.action import materialize_context
-from tracecat.dsl.schemas import RunActionInput
+from tracecat.dsl.schemas import (
+    ActionBatchItemResult,
+    RunActionBatchInput,
+    RunActionInput,
+)
 from tracecat.dsl.types import ActionErrorInfo
 from tracecat.exceptions import (
     EntitlementRequired,
@@ -33,11 +37,14 @@ from tracecat.exceptions import (
     RateLimitExceeded,
     ScopeDeniedError,
 )
-from tracecat.executor.backends import get_executor_backend
+from tracecat.executor.backends import ExecutorBackend, get_executor_backend
 from tracecat.executor.service import dispatch_action
 from tracecat.logger import logger
 from tracecat.storage.object import StoredObject, action_key, get_object_storage
 
+if TYPE_CHECKING:
+    import loguru
+
 
 async def _heartbeat_loop(interval: int, task_ref: str, action_name: str) -> None:
     """Send periodic heartbeats to Temporal until cancelled.
@@ -133,41 +140,157 @@ class ExecutorActivities:
             )
 
         try:
-            backend = get_executor_backend()
+            return await _dispatch_and_store(
+                get_executor_backend(),
+                materialized_input,
+                role,
+                log,
+                heartbeat=heartbeat_interval > 0,
+            )
+        except Exception as e:
+            err_info, err_type, non_retryable = _action_error_info(
+                e, input=input, attempt=act_attempt, log=log
+            )
+            err_msg = err_info.format("execute_action")
+            raise ApplicationError(
+                err_msg, err_info, type=err_type, non_retryable=non_retryable
+            ) from e
+        finally:
+            if heartbeat_task is not None:
+                heartbeat_task.cancel()
+                try:
+                    await heartbeat_task
+                except asyncio.CancelledError:
+                    pass
+
+    @staticmethod
+    @activity.defn
+    async def execute_action_batch_activity(
+        input: RunActionBatchInput, role: Role
+    ) -> list[ActionBatchItemResult]:
+        """Execute one action for a batch of scatter items on the ExecutorWorker.
+
+        Items run one after another with the same rate limit retries and result
+        storage as `execute_action_activity`. A failing item records its error
+        instead of failing the activity, so the other items keep their results
+        and the workflow routes each error to its own execution stream.
+        """
+        ctx_run.set(input.run_context)
+        role = backfill_legacy_role_scopes(role)
+        ctx_role.set(role)
+
+        task = input.task
+        action_name = task.action
+        log = logger.bind(
+            task_ref=task.ref,
+            action_name=action_name,
+            wf_id=input.run_context.wf_id,
+            role=role,
+            environment=input.run_context.environment,
+            batch_size=len(input.items),
+        )
+        ctx_logger.set(log)
+        act_attempt = activity.info().attempt
+
+        heartbeat_interval = config.TRACECAT__ACTIVITY_HEARTBEAT_INTERVAL
+        heartbeat_task: asyncio.Task[None] | None = None
+        if heartbeat_interval > 0:
+            activity.heartbeat(f"{action_name} ({task.ref}) batch starting")
+            heartbeat_task = asyncio.create_task(
+                _heartbeat_loop(heartbeat_interval, task.ref, action_name)
+            )
 
-            async for attempt_manager in AsyncRetrying(
-                retry=retry_if_exception_type(RateLimitExceeded),
-                stop=stop_after_attempt(20),
-                wait=wait_exponential(min=4, max=300),
-            ):
-                with attempt_manager:
-                    log.debug(
-                        "Begin action attempt",
-                        attempt_number=attempt_manager.retry_state.attempt_number,
+        results: list[ActionBatchItemResult] = []
+        try:
+            backend = get_executor_backend()
+            for item in input.items:
+                item_input = input.item_input(item)
+                try:
+                    materialized_input = item_input.model_copy(
+                        update={
+                            "exec_context": await materialize_context(item.exec_context)
+                        }
                     )
-                    result = await dispatch_action(
-                        backend=backend, input=materialized_input
+                    stored = await _dispatch_and_store(
+                        backend,
+                        materialized_input,
+                        role,
+                        log,
+                        heartbeat=heartbeat_interval > 0,
                     )
-
-                    if heartbeat_interval > 0:
-                        activity.heartbeat(
-                            f"{action_name} ({task.ref}) completed, storing result"
-                        )
-
-                    # Always wrap result in StoredObject envelope
-                    # - get_object_storage() returns S3ObjectStorage when externalization is enabled
-                    #   (externalizes if above threshold), else InlineObjectStorage (always inline)
-                    key = action_key(
-                        workspace_id=str(role.workspace_id),
-                        wf_exec_id=input.run_context.wf_exec_id,
-                        stream_id=input.stream_id,
-                        ref=task.ref,
+                except Exception as e:
+                    err_info, _, _ = _action_error_info(
+                        e, input=item_input, attempt=act_attempt, log=log
                     )
-                    stored = await get_object_storage().store(key, result)
-                    return stored
-        except ScopeDeniedError as e:
+                    results.append(ActionBatchItemResult(error=err_info))
+                else:
+                    results.append(ActionBatchItemResult(result=stored))
+        finally:
+            if heartbeat_task is not None:
+                heartbeat_task.cancel()
+                try:
+                    await heartbeat_task
+                except asyncio.CancelledError:
+                    pass
+        return results
+
+
+async def _dispatch_and_store(
+    backend: ExecutorBackend,
+    input: RunActionInput,
+    role: Role,
+    log: loguru.Logger,
+    *,
+    heartbeat: bool,
+) -> StoredObject:
+    """Dispatch an action, retrying rate limits, and store its result."""
+    task = input.task
+    async for attempt_manager in AsyncRetrying(
+        retry=retry_if_exception_type(RateLimitExceeded),
+        stop=stop_after_attempt(20),
+        wait=wait_exponential(min=4, max=300),
+    ):
+        with attempt_manager:
+            log.debug(
+                "Begin action attempt",
+                attempt_number=attempt_manager.retry_state.attempt_number,
+            )
+            result = await dispatch_action(backend=backend, input=input)
+
+            if heartbeat:
+                activity.heartbeat(
+                    f"{task.action} ({task.ref}) completed, storing result"
+                )
+
+            # Always wrap result in StoredObject envelope
+            # - get_object_storage() returns S3ObjectStorage when externalization is enabled
+            #   (externalizes if above threshold), else InlineObjectStorage (always inline)
+            key = action_key(
+                workspace_id=str(role.workspace_id),
+                wf_exec_id=input.run_context.wf_exec_id,
+                stream_id=input.stream_id,
+                ref=task.ref,
+            )
+            return await get_object_storage().store(key, result)
+
+    # Unreachable: AsyncRetrying either returns in the loop or raises RetryError
+    # (caught by the caller's Exception handler) when retries are exhausted
+    raise AssertionError("Unreachable: AsyncRetrying loop must return or raise")
+
+
+def _action_error_info(
+    e: Exception, *, input: RunActionInput, attempt: int, log: loguru.Logger
+) -> tuple[ActionErrorInfo, str | None, bool]:
+    """Map an action failure to its error info, error type and retryability."""
+    task = input.task
+    action_name = task.action
+    kind = e.__class__.__name__
+    err_type: str | None = kind
+    non_retryable = True
+    match e:
+        case ScopeDeniedError():
             # ScopeDeniedError from dispatch_action (user lacks action permission)
-            kind = e.__class__.__name__
+            # Non-retryable: retrying won't help if user lacks permission
             msg = f"Permission denied: missing scope(s) {e.missing_scopes} to execute action '{action_name}'"
             log.warning(
                 "Action scope denied",
@@ -175,104 +298,37 @@ class ExecutorActivities:
                 required_scopes=e.required_scopes,
                 missing_scopes=e.missing_scopes,
             )
-            err_info = ActionErrorInfo(
-                ref=task.ref,
-                message=msg,
-                type=kind,
-                attempt=act_attempt,
-                stream_id=input.stream_id,
-            )
-            err_msg = err_info.format("execute_action")
-            # Non-retryable: retrying won't help if user lacks permission
-            raise ApplicationError(
-                err_msg, err_info, type=kind, non_retryable=True
-            ) from e
-        except EntitlementRequired as e:
+        case EntitlementRequired():
             # Entitlement errors are user-facing and non-retryable
-            kind = e.__class__.__name__
             msg = str(e)
             log.warning("Action entitlement denied", action=action_name, error=msg)
-            err_info = ActionErrorInfo(
-                ref=task.ref,
-                message=msg,
-                type=kind,
-                attempt=act_attempt,
-                stream_id=input.stream_id,
-            )
-            err_msg = err_info.format("execute_action")
-            raise ApplicationError(
-                err_msg,
-                err_info,
-                type=kind,
-                non_retryable=True,
-            ) from e
-        except ExecutionError as e:
+        case ExecutionError():
             # ExecutionError from dispatch_action (single action failure)
-            kind = e.__class__.__name__
             msg = str(e)
             log.info("Execution error", error=msg, info=e.info)
-            err_info = ActionErrorInfo(
-                ref=task.ref,
-                message=msg,
-                type=kind,
-                attempt=act_attempt,
-                stream_id=input.stream_id,
-            )
-            err_msg = err_info.format("execute_action")
-            raise ApplicationError(err_msg, err_info, type=kind) from e
-        except LoopExecutionError as e:
+            non_retryable = False
+        case LoopExecutionError():
             # LoopExecutionError from dispatch_action (for_each loop failure)
-            kind = e.__class__.__name__
             msg = str(e)
             log.info("Loop execution error", error=msg, loop_errors=e.loop_errors)
-            err_info = ActionErrorInfo(
-                ref=task.ref,
-                message=msg,
-                type=kind,
-                attempt=act_attempt,
-                stream_id=input.stream_id,
-            )
-            err_msg = err_info.format("execute_action")
-            raise ApplicationError(err_msg, err_info, type=kind) from e
-        except ApplicationError as e:
+            non_retryable = False
+        case ApplicationError():
             # Pass through ApplicationError
             log.error("ApplicationError occurred", error=e)
-            err_info = ActionErrorInfo(
-                ref=task.ref,
-                message=str(e),
-                type=e.type or e.__class__.__name__,
-                attempt=act_attempt,
-                stream_id=input.stream_id,
-            )
-            err_msg = err_info.format("execute_action")
-            raise ApplicationError(
-                err_msg, err_info, non_retryable=e.non_retryable, type=e.type
-            ) from e
-        except Exception as e:
+            msg = str(e)
+            kind = e.type or kind
+            err_type = e.type
+            non_retryable = e.non_retryable
+        case _:
             # Unexpected errors - non-retryable
-            kind = e.__class__.__name__
-            raw_msg = f"Unexpected {kind} occurred:\n{e}"
-            log.error(raw_msg)
-
-            err_info = ActionErrorInfo(
-                ref=task.ref,
-                message=raw_msg,
-                type=kind,
-                attempt=act_attempt,
-                stream_id=input.stream_id,
-            )
-            err_msg = err_info.format("execute_action")
-            raise ApplicationError(
-                err_msg, err_info, type=kind, non_retryable=True
-            ) from e
-        finally:
-            if heartbeat_task is not None:
-                heartbeat_task.cancel()
-                try:
-                    await heartbeat_task
-                except asyncio.CancelledError:
-                    pass
+            msg = f"Unexpected {kind} occurred:\n{e}"
+            log.error(msg)
 
-        # Unreachable: AsyncRetrying either returns in the loop or raises RetryError
-        # (caught by Exception handler above) when retries are exhausted
-        raise AssertionError("Unreachable: AsyncRetrying loop must return or raise")
+    err_info = ActionErrorInfo(
+        ref=task.ref,
+        message=msg,
+        type=kind,
+        attempt=attempt,
+        stream_id=input.stream_id,
+    )
+    return err_info, err_type, non_retryable
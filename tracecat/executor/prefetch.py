@@ -0,0 +1,233 @@
+"""Speculative loading of secrets and workspace variables for upcoming actions.
+
+Actions that run after the current one often read the same few secrets and
+variables. The workflow sends their names with each action as a
+`PrefetchHint`, and the executor loads them in the background while the
+current action runs. Later actions of the run on this executor then read them
+from a short-lived per-run cache instead of the database.
+
+Secrets are cached as the encrypted rows returned by the secrets service. Only
+the action that uses a secret decrypts it.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import OrderedDict
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass, field
+
+from tracecat import config
+from tracecat.auth.types import Role
+from tracecat.db.models import BaseSecret
+from tracecat.dsl.schemas import PrefetchHint, RunActionInput, RunContext
+from tracecat.executor import registry_resolver
+from tracecat.logger import logger
+from tracecat.registry.lock.types import RegistryLock
+from tracecat.secrets.schemas import SecretSearch
+from tracecat.secrets.service import SecretsService
+from tracecat.variables.schemas import VariableSearch
+from tracecat.variables.service import VariablesService
+
+RunCacheKey = tuple[str, str, str]
+"""Workspace ID, workflow run ID and environment"""
+
+MAX_CACHED_RUNS = 1024
+"""Runs with a live cache in this process. The oldest run is evicted first."""
+
+
+@dataclass(slots=True)
+class RunPrefetchCache:
+    """Secrets and variables loaded for one workflow run and environment.
+
+    A name mapped to None is known not to exist.
+    """
+
+    expires_at: float
+    secrets: dict[str, BaseSecret | None] = field(default_factory=dict)
+    variables: dict[str, dict[str, str] | None] = field(default_factory=dict)
+    loading: set[str] = field(default_factory=set)
+    """Secret and variable names being loaded, prefixed with their kind"""
+
+    @property
+    def expired(self) -> bool:
+        return time.monotonic() >= self.expires_at
+
+    def get_secrets(
+        self, names: Iterable[str], *, required: Iterable[str] = ()
+    ) -> tuple[list[BaseSecret], set[str]]:
+        """Get the cached rows of `names`, and the names to look up.
+
+        Required secrets cached as missing are looked up again, so a secret
+        created after it was prefetched is found before the action fails.
+        """
+        required = set(required)
+        rows: list[BaseSecret] = []
+        to_fetch: set[str] = set()
+        for name in names:
+            if name not in self.secrets:
+                to_fetch.add(name)
+            elif (row := self.secrets[name]) is not None:
+                rows.append(row)
+            elif name in required:
+                to_fetch.add(name)
+        return rows, to_fetch
+
+    def put_secrets(self, names: Iterable[str], rows: Sequence[BaseSecret]) -> None:
+        found = {row.name: row for row in rows}
+        for name in names:
+            self.secrets[name] = found.get(name)
+
+    def get_variables(
+        self, names: Iterable[str]
+    ) -> tuple[dict[str, dict[str, str]], set[str]]:
+        """Get the cached values of `names`, and the names to look up.
+
+        Variables cached as missing are always looked up again.
+        """
+        values: dict[str, dict[str, str]] = {}
+        to_fetch: set[str] = set()
+        for name in names:
+            if (value := self.variables.get(name)) is None:
+                to_fetch.add(name)
+            else:
+                values[name] = value
+        return values, to_fetch
+
+    def put_variables(
+        self, names: Iterable[str], values: dict[str, dict[str, str]]
+    ) -> None:
+        for name in names:
+            self.variables[name] = values.get(name)
+
+
+_run_caches: OrderedDict[RunCacheKey, RunPrefetchCache] = OrderedDict()
+_prefetch_tasks: set[asyncio.Task[None]] = set()
+
+
+def get_run_cache(role: Role, run_context: RunContext) -> RunPrefetchCache | None:
+    """Get the cache of a workflow run, or None if prefetching is disabled."""
+    ttl = config.TRACECAT__EXECUTOR_PREFETCH_TTL_SECONDS
+    if ttl <= 0 or role.workspace_id is None:
+        return None
+    key = (
+        str(role.workspace_id),
+        str(run_context.wf_run_id),
+        run_context.environment,
+    )
+    # Entries are created in expiry order, so expired runs are at the front
+    while _run_caches and next(iter(_run_caches.values())).expired:
+        _run_caches.popitem(last=False)
+    if (cache := _run_caches.get(key)) is None:
+        cache = RunPrefetchCache(expires_at=time.monotonic() + ttl)
+        _run_caches[key] = cache
+        while len(_run_caches) > MAX_CACHED_RUNS:
+            _run_caches.popitem(last=False)
+    return cache
+
+
+def clear() -> None:
+    _run_caches.clear()
+
+
+def start_prefetch(input: RunActionInput, role: Role) -> None:
+    """Start loading the secrets and variables in an input's prefetch hint."""
+    if input.prefetch is None:
+        return
+    if (cache := get_run_cache(role, input.run_context)) is None:
+        return
+    task = asyncio.create_task(
+        prefetch(
+            input.prefetch,
+            cache=cache,
+            role=role,
+            environment=input.run_context.environment,
+            registry_lock=input.registry_lock,
+        )
+    )
+    _prefetch_tasks.add(task)
+    task.add_done_callback(_prefetch_tasks.discard)
+
+
+async def prefetch(
+    hint: PrefetchHint,
+    *,
+    cache: RunPrefetchCache,
+    role: Role,
+    environment: str,
+    registry_lock: RegistryLock,
+) -> None:
+    """Load the secrets and variables in a prefetch hint into a run cache.
+
+    This is best effort. Failures are logged, and the actions look up whatever
+    is missing from the cache themselves.
+    """
+    secret_names = set(hint.secrets)
+    if role.organization_id is not None:
+        for action_name in hint.actions:
+            try:
+                action_secrets = (
+                    await registry_resolver.collect_action_secrets_from_manifest(
+                        action_name, registry_lock, role.organization_id
+                    )
+                )
+            except Exception as e:
+                logger.debug(
+                    "Skipping secrets prefetch for action",
+                    action=action_name,
+                    error=e,
+                )
+                continue
+            secret_names.update(
+                secret.name for secret in action_secrets if secret.type != "oauth"
+            )
+    # OAuth tokens come from integrations and are refreshed on use
+    secret_names = {
+        name
+        for name in secret_names
+        if not name.endswith("_oauth")
+        and name not in cache.secrets
+        and f"secret:{name}" not in cache.loading
+    }
+    variable_names = {
+        name
+        for name in hint.variables
+        if name not in cache.variables and f"var:{name}" not in cache.loading
+    }
+    if not secret_names and not variable_names:
+        return
+    loading = {f"secret:{name}" for name in secret_names} | {
+        f"var:{name}" for name in variable_names
+    }
+    cache.loading |= loading
+    try:
+        if secret_names:
+            async with SecretsService.with_session(role=role) as service:
+                secrets = await service.search_secrets(
+                    SecretSearch(names=secret_names, environment=environment)
+                )
+            cache.put_secrets(secret_names, secrets)
+        if variable_names:
+            async with VariablesService.with_session(role=role) as service:
+                variables = await service.search_variables(
+                    VariableSearch(names=variable_names, environment=environment)
+                )
+            cache.put_variables(
+                variable_names,
+                {variable.name: variable.values for variable in variables},
+            )
+        logger.debug(
+            "Prefetched secrets and variables",
+            secrets=secret_names,
+            variables=variable_names,
+        )
+    except Exception as e:
+        logger.warning(
+            "Failed to prefetch secrets and variables",
+            secrets=secret_names,
+            variables=variable_names,
+            error=e,
+        )
+    finally:
+        cache.loading -= loading
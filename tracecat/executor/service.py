@@ -43,7 +43,7 @@ from tracecat.exceptions import (
     TracecatAuthorizationError,
     TracecatException,
 )
-from tracecat.executor import registry_resolver
+from tracecat.executor import prefetch, registry_resolver
 from tracecat.executor.backends.base import ExecutorBackend
 from tracecat.executor.schemas import (
     ExecutorActionErrorInfo,
@@ -56,6 +56,7 @@ from tracecat.executor.secret_preprocessors import (
 )
 from tracecat.expressions.common import ExprContext, ExprOperand
 from tracecat.expressions.eval import (
+    RenderPlan,
     collect_expressions,
     eval_templated_object,
     get_iterables_from_expression,
@@ -720,14 +721,18 @@ async def prepare_resolved_context(
     provenance = build_provenance(task.args) if action_impl.type == "template" else None
     collected = collect_expressions(argument_plan.evaluable)
 
-    # Fetch secrets and variables
+    # Fetch secrets and variables, reusing any prefetched for this run
+    run_cache = prefetch.get_run_cache(role, input.run_context)
     secrets = await secrets_manager.get_action_secrets(
-        secret_exprs=collected.secrets, action_secrets=action_secrets
+        secret_exprs=collected.secrets,
+        action_secrets=action_secrets,
+        cache=run_cache,
     )
     workspace_variables = await get_workspace_variables(
         variable_exprs=collected.variables,
         environment=input.run_context.environment,
         role=role,
+        cache=run_cache,
     )
 
     # Build execution context for SDK calls (uses raw secrets for expression eval)
@@ -758,7 +763,7 @@ async def prepare_resolved_context(
             logical_time=logical_time,
             has_interaction=input.interaction_context is not None,
         )
-        evaluated_args = argument_plan.evaluate(context)
+        evaluated_args = argument_plan.evaluate(context, paths=collected.paths)
     finally:
         ctx_logical_time.reset(logical_time_token)
         ctx_interaction.reset(interaction_token)
@@ -919,6 +924,9 @@ async def dispatch_action(backend: ExecutorBackend, input: RunActionInput) -> An
     # Scope matching supports wildcards (e.g., action:core.*:execute, action:*:execute)
     require_action_scope(task.action)
 
+    # Load what the next actions need while this one runs
+    prefetch.start_prefetch(input, role)
+
     logger.info("Preparing runtime environment", ctx=ctx)
     # If there's no for_each, execute normally
     if not task.for_each:
@@ -996,7 +1004,20 @@ async def dispatch_action(backend: ExecutorBackend, input: RunActionInput) -> An
 """Utilities"""
 
 
-def evaluate_templated_args(task: ActionStatement, context: ExecutionContext) -> ArgsT:
+def evaluate_templated_args(
+    task: ActionStatement,
+    context: ExecutionContext,
+    *,
+    plan: RenderPlan | None = None,
+) -> ArgsT:
+    """Evaluate the task args against the context.
+
+    When evaluating the same args repeatedly (e.g. once per loop iteration),
+    pass a `RenderPlan` compiled from `task.args` so that only the templated
+    leaves are re-evaluated. Static subtrees are then shared with `task.args`.
+    """
+    if plan is not None:
+        return cast(ArgsT, plan.render(context))
     return cast(ArgsT, eval_templated_object(task.args, operand=context))
 
 
@@ -1028,6 +1049,7 @@ def iter_for_each(
     # In the future, we may have other sources of action-local expressions
     # XXX: ENV is the only context that should be shared
     patched_context = context.copy() if patch else create_default_execution_context()
+    plan = RenderPlan(task.args)
 
     # Create a generator that zips the iterables together
     for i, items in enumerate(zip(*iterators, strict=False)):
@@ -1038,7 +1060,9 @@ def iter_for_each(
                 path=assign_context + iterator_path,
                 value=iterator_value,
             )
-        patched_args = evaluate_templated_args(task=task, context=patched_context)
+        patched_args = evaluate_templated_args(
+            task=task, context=patched_context, plan=plan
+        )
         yield patched_args
 
 
@@ -1067,13 +1091,27 @@ async def get_workspace_variables(
     *,
     environment: str | None = None,
     role: Role | None = None,
+    cache: prefetch.RunPrefetchCache | None = None,
 ) -> dict[str, dict[str, str]]:
+    workspace_variables: dict[str, dict[str, str]] = {}
+    names_to_fetch = variable_exprs
+    # Searching without names returns every variable in the environment, which
+    # template actions rely on, so only named lookups go through the cache
+    if not variable_exprs:
+        cache = None
+    if cache is not None:
+        workspace_variables, names_to_fetch = cache.get_variables(variable_exprs)
+        if not names_to_fetch:
+            return workspace_variables
     try:
         async with VariablesService.with_session(role=role) as service:
             variables = await service.search_variables(
-                VariableSearch(names=variable_exprs, environment=environment)
+                VariableSearch(names=names_to_fetch, environment=environment)
             )
     except TracecatAuthorizationError as e:
         logger.warning("No access to workspace variables", error=e)
         return {}
-    return {variable.name: variable.values for variable in variables}
+    fetched = {variable.name: variable.values for variable in variables}
+    if cache is not None:
+        cache.put_variables(names_to_fetch, fetched)
+    return workspace_variables | fetched
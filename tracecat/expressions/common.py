@@ -1,8 +1,12 @@
+import functools
+import re
 import threading
 from collections import OrderedDict
 from collections.abc import Iterable, Iterator, Mapping
+from contextlib import contextmanager
+from contextvars import ContextVar
 from dataclasses import dataclass
-from enum import StrEnum, auto
+from enum import Enum, StrEnum, auto
 from typing import Any, TypeVar
 
 import jsonpath_ng.jsonpath as jsonpath_nodes
@@ -70,6 +74,174 @@ def parse_jsonpath(expr: str) -> jsonpath_nodes.JSONPath:
         return parsed
 
 
+# Most expressions are plain `ACTIONS.step.result.field[0].name` lookups. For
+# paths made only of field names and non-negative integer indices we walk the
+# operand directly instead of going through jsonpath_ng's `find()`, which wraps
+# every step in `DatumInContext` objects. Anything else (wildcards, filters,
+# quoted fields, slices, recursive descent) falls back to jsonpath_ng.
+_SIMPLE_PATH_PATTERN = re.compile(
+    r"[A-Za-z_][A-Za-z0-9_]*(?:\.[A-Za-z_][A-Za-z0-9_]*|\[\d+\])*"
+)
+_SIMPLE_PATH_CACHE_MAXSIZE = 1024
+
+type PathSegment = str | int
+
+
+class _Sentinel(Enum):
+    NO_MATCH = auto()
+    FALLBACK = auto()
+
+
+@functools.lru_cache(maxsize=_SIMPLE_PATH_CACHE_MAXSIZE)
+def _simple_path_segments(expr: str) -> tuple[PathSegment, ...] | None:
+    """Return the field/index segments of a simple path, or None if not simple.
+
+    Segments are read back from the parsed JSONPath so that the fast path only
+    applies where jsonpath_ng itself sees a plain chain of fields and indices.
+    """
+    if _SIMPLE_PATH_PATTERN.fullmatch(expr) is None:
+        return None
+    try:
+        path = parse_jsonpath(expr)
+    except JsonPathParserError:
+        return None
+
+    segments: list[PathSegment] = []
+    stack: list[jsonpath_nodes.JSONPath] = [path]
+    while stack:
+        current = stack.pop()
+        if type(current) is jsonpath_nodes.Child:
+            stack.append(current.right)
+            stack.append(current.left)
+        elif type(current) is jsonpath_nodes.Fields and len(current.fields) == 1:
+            (name,) = current.fields
+            if name == "*":
+                return None
+            segments.append(name)
+        elif type(current) is jsonpath_nodes.Index and current.index >= 0:
+            segments.append(current.index)
+        else:
+            return None
+    return tuple(segments)
+
+
+def _resolve_simple_path(segments: tuple[PathSegment, ...], operand: Any) -> Any:
+    """Resolve segments with jsonpath_ng's semantics for plain dicts and lists.
+
+    Returns `_Sentinel.FALLBACK` when a step hits a value whose jsonpath_ng
+    semantics are not replicated here (e.g. indexing into a string).
+    """
+    value = operand
+    for segment in segments:
+        if type(segment) is int:
+            if type(value) is not list:
+                return _Sentinel.FALLBACK
+            if len(value) <= segment:
+                return _Sentinel.NO_MATCH
+            value = value[segment]
+        else:
+            if not isinstance(value, dict):
+                return _Sentinel.FALLBACK
+            value = value.get(segment, _Sentinel.NO_MATCH)
+            if value is _Sentinel.NO_MATCH:
+                return value
+    return value
+
+
+# Trie node: the paths ending at this node, and the outgoing edges. Each edge is
+# labeled with a run of segments, so chains without branches are walked in a
+# tight loop rather than one node at a time.
+type _PathTrie = tuple[
+    tuple[str, ...], tuple[tuple[tuple[PathSegment, ...], _PathTrie], ...]
+]
+
+
+@functools.lru_cache(maxsize=_SIMPLE_PATH_CACHE_MAXSIZE)
+def _path_trie(exprs: frozenset[str]) -> _PathTrie:
+    paths = {
+        expr: segments
+        for expr in exprs
+        if (segments := _simple_path_segments(expr)) is not None
+    }
+
+    def build(group: dict[str, tuple[PathSegment, ...]], depth: int) -> _PathTrie:
+        ends = tuple(expr for expr, segments in group.items() if len(segments) == depth)
+        branches: dict[PathSegment, dict[str, tuple[PathSegment, ...]]] = {}
+        for expr, segments in group.items():
+            if len(segments) > depth:
+                branches.setdefault(segments[depth], {})[expr] = segments
+        edges: list[tuple[tuple[PathSegment, ...], _PathTrie]] = []
+        for branch in branches.values():
+            # Extend the edge while every path in the branch continues together.
+            end = depth + 1
+            first = next(iter(branch.values()))
+            while all(
+                len(segments) > end and segments[end] == first[end]
+                for segments in branch.values()
+            ):
+                end += 1
+            edges.append((first[depth:end], build(branch, end)))
+        return ends, tuple(edges)
+
+    return build(paths, 0)
+
+
+def _resolve_path_trie(node: _PathTrie, value: Any, resolved: dict[str, Any]) -> None:
+    for segments, child_node in node[1]:
+        # Same per-step semantics as `_resolve_simple_path`; subtrees under a
+        # missing or unsupported step are left to `eval_jsonpath`.
+        child = _resolve_simple_path(segments, value)
+        if child is _Sentinel.NO_MATCH or child is _Sentinel.FALLBACK:
+            continue
+        ends, edges = child_node
+        for expr in ends:
+            resolved[expr] = child
+        if edges:
+            _resolve_path_trie(child_node, child, resolved)
+
+
+def resolve_jsonpaths(exprs: Iterable[str], operand: Any) -> dict[str, Any]:
+    """Resolve many simple paths against ``operand`` in one shared walk.
+
+    Paths are merged into a trie of their segments, so a prefix shared by
+    several paths (e.g. ``ACTIONS.fetch.result``) is looked up once rather than
+    once per path. Returns the value of every path that resolved on the fast
+    path. Paths that are not simple, do not match, or need jsonpath_ng
+    semantics are omitted and must be evaluated with `eval_jsonpath`.
+    """
+    resolved: dict[str, Any] = {}
+    _resolve_path_trie(_path_trie(frozenset(exprs)), operand, resolved)
+    return resolved
+
+
+@dataclass(frozen=True, slots=True)
+class _ResolvedPaths:
+    operand: Any
+    values: Mapping[str, Any]
+
+
+_RESOLVED_PATHS: ContextVar[_ResolvedPaths | None] = ContextVar(
+    "resolved_jsonpaths", default=None
+)
+
+
+@contextmanager
+def prefetched_jsonpaths(exprs: Iterable[str], operand: Any) -> Iterator[None]:
+    """Resolve ``exprs`` against ``operand`` once for the duration of the block.
+
+    While active, `eval_jsonpath` calls on the same operand object return the
+    prefetched value instead of walking the operand again. Other operands and
+    paths that were not prefetched are evaluated as usual.
+    """
+    token = _RESOLVED_PATHS.set(
+        _ResolvedPaths(operand=operand, values=resolve_jsonpaths(exprs, operand))
+    )
+    try:
+        yield
+    finally:
+        _RESOLVED_PATHS.reset(token)
+
+
 # Maximum number of key segments allowed after the variable name in VARS expressions.
 # This is currently limited to support `VARS.<name>.<key>` paths, and can be increased
 # when deeper variable nesting is officially supported.
@@ -182,6 +354,18 @@ def eval_jsonpath(
         raise TracecatExpressionError(
             f"A dict or list operand is required as jsonpath target. Got {type(operand)}"
         )
+    if (
+        (prefetched := _RESOLVED_PATHS.get()) is not None
+        and prefetched.operand is operand
+        and expr in prefetched.values
+    ):
+        return prefetched.values[expr]
+    if (segments := _simple_path_segments(expr)) is not None:
+        value = _resolve_simple_path(segments, operand)
+        if value is _Sentinel.NO_MATCH:
+            return _handle_no_match(expr, operand, context_type, strict)
+        if value is not _Sentinel.FALLBACK:
+            return value
     try:
         # Try to evaluate the expression
         jsonpath_expr = parse_jsonpath(expr)
@@ -234,16 +418,24 @@ def eval_jsonpath(
         return matches[0]
     else:
         # We should only reach this point if the jsonpath didn't match
-        # If there are no matches, raise an error if strict is True
-
-        if strict:
-            # We know that if this function is called, there was a templated field.
-            # Therefore, it means the jsonpath was valid but there was no match.
-            logger.error("Jsonpath no match", expr=repr(expr), operand=operand)
-            formatted_expr = _expr_with_context(expr, context_type)
-            raise TracecatExpressionError(
-                f"Couldn't resolve expression {formatted_expr!r} in the context",
-                detail={"expression": formatted_expr, "operand": operand},
-            )
-        # Return None instead of empty list
-        return None
+        return _handle_no_match(expr, operand, context_type, strict)
+
+
+def _handle_no_match(
+    expr: str,
+    operand: Mapping[str | StrEnum, Any],
+    context_type: ExprContext | None,
+    strict: bool,
+) -> None:
+    """If there are no matches, raise an error if strict is True."""
+    if strict:
+        # We know that if this function is called, there was a templated field.
+        # Therefore, it means the jsonpath was valid but there was no match.
+        logger.error("Jsonpath no match", expr=repr(expr), operand=operand)
+        formatted_expr = _expr_with_context(expr, context_type)
+        raise TracecatExpressionError(
+            f"Couldn't resolve expression {formatted_expr!r} in the context",
+            detail={"expression": formatted_expr, "operand": operand},
+        )
+    # Return None instead of empty list
+    return None
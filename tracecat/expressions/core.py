@@ -12,8 +12,8 @@ from lark import Token, Tree, Visitor
 from tracecat.exceptions import TracecatExpressionError
 from tracecat.expressions import patterns
 from tracecat.expressions.common import ExprContext, ExprOperand, ExprType
+from tracecat.expressions.parser.compiler import compiler
 from tracecat.expressions.parser.core import parser
-from tracecat.expressions.parser.evaluator import ExprEvaluator
 from tracecat.expressions.validator.validator import BaseExprValidator
 from tracecat.logger import logger
 from tracecat.parse import traverse_expressions
@@ -106,12 +106,12 @@ class Expression:
             ) from e
 
         try:
-            visitor = ExprEvaluator(operand=self._operand)
             if parse_tree is None:
                 raise ValueError(f"Parser returned None for expression `{self._expr}`")
+            program = compiler.get_or_compile(self._expr, parse_tree)
 
             def default() -> Any:
-                return visitor.evaluate(parse_tree)
+                return program(self._operand)
 
             if self._policy is not None:
                 return self._policy.resolve(
@@ -266,6 +266,17 @@ class RegistryActionExtractor(ExprExtractor[Mapping[ExprContext, set[str]]]):
         var_name = jsonpath.split(".", 1)[0]
         self._results[ExprContext.VARS].add(var_name)
 
+    def trigger(self, node: Tree[Token]) -> None:
+        token = node.children[0] if node.children else None
+        self.logger.trace("Visit trigger expression", node=node, child=token)
+        if token is not None and not isinstance(token, Token):
+            raise ValueError("Expected a string token")
+        # TRIGGER.<key>.<jsonpath...>
+        # An empty key means the expression reads the whole trigger payload
+        # (e.g. `TRIGGER`, `TRIGGER[0]` or `TRIGGER..key`).
+        match = patterns.JSONPATH_TOP_LEVEL_KEY.match(token or "")
+        self._results[ExprContext.TRIGGER].add(match.group(1) if match else "")
+
 
 def extract_expressions(args: Mapping[str, Any]) -> Mapping[ExprContext, set[str]]:
     extractor = RegistryActionExtractor()
@@ -299,10 +310,12 @@ class SecretPathExtractor(ExprExtractor[Mapping[ExprContext, set[str]]]):
 class CollectedExprs:
     secrets: set[str] = field(default_factory=set)
     variables: set[str] = field(default_factory=set)
+    paths: set[str] = field(default_factory=set)
+    """Full context paths read by the expressions, e.g. ``ACTIONS.a.result``."""
 
 
 class ExprPathCollector(ExprExtractor[CollectedExprs]):
-    """Collects secrets and variables from expressions."""
+    """Collects secrets, variables, and context paths from expressions."""
 
     def __init__(self) -> None:
         self._results = CollectedExprs()
@@ -311,6 +324,13 @@ class ExprPathCollector(ExprExtractor[CollectedExprs]):
     def results(self) -> CollectedExprs:
         return self._results
 
+    def _add_path(self, context: ExprContext, node: Tree[Token]) -> None:
+        token = node.children[0] if node.children else None
+        if token is not None and not isinstance(token, Token):
+            raise ValueError("Expected a string token")
+        # Same path string the evaluator passes to `eval_jsonpath`.
+        self._results.paths.add(context + (token or ""))
+
     def secrets(self, node: Tree[Token]) -> None:
         token = node.children[0]
         self.logger.trace("Visit secret expression", node=node, child=token)
@@ -320,6 +340,7 @@ class ExprPathCollector(ExprExtractor[CollectedExprs]):
         jsonpath = token.lstrip(".")
         # Store the full path (e.g., "a.K1" not just "a")
         self._results.secrets.add(jsonpath)
+        self._add_path(ExprContext.SECRETS, node)
 
     def vars(self, node: Tree[Token]) -> None:
         token = node.children[0]
@@ -329,3 +350,22 @@ class ExprPathCollector(ExprExtractor[CollectedExprs]):
         jsonpath = token.lstrip(".")
         var_name = jsonpath.split(".", 1)[0]
         self._results.variables.add(var_name)
+        self._add_path(ExprContext.VARS, node)
+
+    def actions(self, node: Tree[Token]) -> None:
+        self._add_path(ExprContext.ACTIONS, node)
+
+    def env(self, node: Tree[Token]) -> None:
+        self._add_path(ExprContext.ENV, node)
+
+    def local_vars(self, node: Tree[Token]) -> None:
+        self._add_path(ExprContext.LOCAL_VARS, node)
+
+    def trigger(self, node: Tree[Token]) -> None:
+        self._add_path(ExprContext.TRIGGER, node)
+
+    def template_action_inputs(self, node: Tree[Token]) -> None:
+        self._add_path(ExprContext.TEMPLATE_ACTION_INPUTS, node)
+
+    def template_action_steps(self, node: Tree[Token]) -> None:
+        self._add_path(ExprContext.TEMPLATE_ACTION_STEPS, node)
@@ -114,6 +114,144 @@ def eval_templated_object(
     return processed_kwargs
 
 
+type _RenderFn = Callable[[ExprOperand | None], Any]
+
+
+def _render_standalone(template: str) -> _RenderFn:
+    match = patterns.TEMPLATE_STRING.match(template)
+    if match is None or (expr := match.group("expr")) is None:
+        # Defer to TemplateExpression so that the error surfaces at render time.
+        def render_invalid(operand: ExprOperand | None) -> Any:
+            return TemplateExpression(template, operand=operand).result()
+
+        return render_invalid
+
+    def render(operand: ExprOperand | None) -> Any:
+        return Expression(expr, operand=operand).result()
+
+    return render
+
+
+def _render_inline(template: str) -> _RenderFn:
+    render_value = _render_standalone(template)
+
+    def render(operand: ExprOperand | None) -> str:
+        result = render_value(operand)
+        try:
+            return str(result)
+        except Exception as e:
+            raise ValueError(f"Error evaluating str expression: {template!r}") from e
+
+    return render
+
+
+def _compile_render_str(line: str, pattern: re.Pattern[str]) -> _RenderFn | None:
+    matches = list(pattern.finditer(line))
+    if not matches:
+        return None
+    if is_template_only(line) and len(matches) == 1:
+        return _render_standalone(line)
+
+    parts: list[str | _RenderFn] = []
+    position = 0
+    for match in matches:
+        if match.start() > position:
+            parts.append(line[position : match.start()])
+        parts.append(_render_inline(match.group("template")))
+        position = match.end()
+    if position < len(line):
+        parts.append(line[position:])
+    segments = tuple(parts)
+
+    def render(operand: ExprOperand | None) -> str:
+        return "".join(
+            part if isinstance(part, str) else part(operand) for part in segments
+        )
+
+    return render
+
+
+def _compile_render_node(obj: Any, pattern: re.Pattern[str]) -> _RenderFn | None:
+    """Compile ``obj`` into a render function, or None if it has no templates."""
+    match obj:
+        case str():
+            return _compile_render_str(obj, pattern)
+        case list():
+            items = [(item, _compile_render_node(item, pattern)) for item in obj]
+            if all(render is None for _, render in items):
+                return None
+
+            def render_list(operand: ExprOperand | None) -> list[Any]:
+                return [
+                    item if render is None else render(operand)
+                    for item, render in items
+                ]
+
+            return render_list
+        case dict():
+            entries = [
+                (
+                    key,
+                    _compile_render_str(key, pattern) if isinstance(key, str) else None,
+                    value,
+                    _compile_render_node(value, pattern),
+                )
+                for key, value in obj.items()
+            ]
+            if all(
+                render_key is None and render_value is None
+                for _, render_key, _, render_value in entries
+            ):
+                return None
+
+            def render_dict(operand: ExprOperand | None) -> dict[Any, Any]:
+                processed: dict[Any, Any] = {}
+                for key, render_key, value, render_value in entries:
+                    processed_key = key if render_key is None else render_key(operand)
+                    if processed_key in processed:
+                        raise TracecatExpressionError(
+                            "Expression resolution produced a duplicate dictionary key",
+                            detail={"code": "expression_key_collision"},
+                        )
+                    processed[processed_key] = (
+                        value if render_value is None else render_value(operand)
+                    )
+                return processed
+
+            return render_dict
+        case _:
+            return None
+
+
+class RenderPlan:
+    """A templated object compiled once and rendered against many operands.
+
+    Equivalent to calling `eval_templated_object` (without resolution policies)
+    on the same object, except that subtrees containing no template expressions
+    are returned by reference instead of being copied. Template strings are
+    pre-split into literal and expression segments, so rendering only touches
+    dynamic leaves. Callers must treat rendered output as read-only.
+    """
+
+    __slots__ = ("template", "_render")
+
+    def __init__(
+        self, template: Any, *, pattern: re.Pattern[str] = patterns.TEMPLATE_STRING
+    ) -> None:
+        self.template = template
+        self._render = _compile_render_node(template, pattern)
+
+    @property
+    def is_static(self) -> bool:
+        """Whether the template contains no expressions at all."""
+        return self._render is None
+
+    def render(self, operand: ExprOperand | None = None) -> Any:
+        if self._render is None:
+            return self.template
+        return self._render(operand)
+
+
 def is_template_only(template: str) -> bool:
     return template.startswith("${{") and template.endswith("}}")
 
@@ -12,7 +12,7 @@ import urllib.parse
 import zoneinfo
 from collections.abc import Callable, Iterable, Sequence
 from datetime import UTC, date, datetime, time, timedelta
-from functools import wraps
+from functools import lru_cache, wraps
 from ipaddress import IPv4Address, IPv4Network, IPv6Address, IPv6Network
 from typing import Any, Literal, ParamSpec, TypeVar
 from uuid import uuid4
@@ -35,6 +35,7 @@ from tracecat.expressions.ioc_extractors import (
     extract_cves,
     extract_domains,
     extract_emails,
+    extract_iocs,
     extract_ip,
     extract_ipv4,
     extract_ipv6,
@@ -215,9 +216,16 @@ def replace(x: str, old: str, new: str) -> str:
     return x.replace(old, new)
 
 
-def regex_extract(pattern: str, text: str) -> str | None:
-    """Extract the first captured group from text; fallback to full match if none."""
-    match = re.search(pattern, text)
+# Upper bound on compiled patterns kept by the FN regex functions.
+_REGEX_CACHE_MAXSIZE = 512
+
+
+@lru_cache(maxsize=_REGEX_CACHE_MAXSIZE)
+def _compile_regex(pattern: str) -> re.Pattern[str]:
+    return re.compile(pattern)
+
+
+def _first_group(match: re.Match[str] | None) -> str | None:
     if not match:
         return None
     if match.lastindex:
@@ -227,14 +235,43 @@ def regex_extract(pattern: str, text: str) -> str | None:
     return match.group(0)
 
 
+def regex_extract(pattern: str, text: str) -> str | None:
+    """Extract the first captured group from text; fallback to full match if none."""
+    return _first_group(_compile_regex(pattern).search(text))
+
+
 def regex_match(pattern: str, text: str) -> bool:
     """Check if text matches regex pattern."""
-    return bool(re.match(pattern, text))
+    return _compile_regex(pattern).match(text) is not None
 
 
 def regex_not_match(pattern: str, text: str) -> bool:
     """Check if text does not match regex pattern."""
-    return not bool(re.match(pattern, text))
+    return _compile_regex(pattern).match(text) is None
+
+
+def regex_extract_many(pattern: str, texts: Sequence[str]) -> list[str | None]:
+    """Apply regex_extract to each text in a list, compiling the pattern once."""
+    search = _compile_regex(pattern).search
+    return [_first_group(search(text)) for text in texts]
+
+
+def regex_match_many(pattern: str, texts: Sequence[str]) -> list[bool]:
+    """Apply regex_match to each text in a list, compiling the pattern once."""
+    match = _compile_regex(pattern).match
+    return [match(text) is not None for text in texts]
+
+
+def regex_not_match_many(pattern: str, texts: Sequence[str]) -> list[bool]:
+    """Apply regex_not_match to each text in a list, compiling the pattern once."""
+    match = _compile_regex(pattern).match
+    return [match(text) is None for text in texts]
+
+
+def regex_filter(pattern: str, texts: Sequence[str]) -> list[str]:
+    """Keep the texts in a list that match regex pattern, as in regex_match."""
+    match = _compile_regex(pattern).match
+    return [text for text in texts if match(text) is not None]
 
 
 def generate_uuid() -> str:
@@ -1090,8 +1127,12 @@ _FUNCTION_MAPPING = {
     "not_null": not_null,
     # Regex
     "regex_extract": regex_extract,
+    "regex_extract_many": regex_extract_many,
+    "regex_filter": regex_filter,
     "regex_match": regex_match,
+    "regex_match_many": regex_match_many,
     "regex_not_match": regex_not_match,
+    "regex_not_match_many": regex_not_match_many,
     # Arrays
     "compact": compact,
     "contains": is_in,  # alias for is_in
@@ -1213,6 +1254,7 @@ _FUNCTION_MAPPING = {
     "extract_cves": extract_cves,
     "extract_domains": extract_domains,
     "extract_emails": extract_emails,
+    "extract_iocs": extract_iocs,
     "extract_md5": extract_md5,
     "extract_sha1": extract_sha1,
     "extract_sha256": extract_sha256,
@@ -1225,6 +1267,17 @@ _FUNCTION_MAPPING = {
     "normalize_email": normalize_email,
 }
 
+NON_DETERMINISTIC_FUNCTIONS = frozenset(
+    {"get_interaction", "now", "today", "utcnow", "uuid4", "wall_clock"}
+)
+"""Functions whose result depends on when, where, or in which context they run."""
+
+NON_FOLDABLE_FUNCTIONS = NON_DETERMINISTIC_FUNCTIONS | frozenset(
+    # Can build arbitrarily large values from small literals
+    {"iter_product", "mul", "pow", "range"}
+)
+"""Functions that are never pre-evaluated when folding constant expressions."""
+
 OPERATORS = {
     "||": or_,
     "&&": and_,
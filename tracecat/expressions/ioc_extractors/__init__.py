@@ -9,6 +9,7 @@ from .asn import extract_asns
 from .cve import extract_cves
 from .domain import extract_domains
 from .email import extract_emails, normalize_email
+from .engine import IOC_KINDS, IocKind, extract_iocs
 from .hash import (
     extract_md5,
     extract_sha1,
@@ -24,10 +25,13 @@ from .mac import extract_mac
 from .url import extract_urls
 
 __all__ = [
+    "IOC_KINDS",
+    "IocKind",
     "extract_asns",
     "extract_cves",
     "extract_domains",
     "extract_emails",
+    "extract_iocs",
     "extract_md5",
     "extract_sha1",
     "extract_sha256",
@@ -67,25 +67,27 @@ def is_domain(domain: str) -> bool:
         return False
 
 
+DOMAIN_DEFANG_REPLACEMENTS = {
+    # Domain defanging
+    "[.]": ".",
+    "(.)": ".",
+    "[dot]": ".",
+    "(dot)": ".",
+    " dot ": ".",
+    r"\.": ".",  # Handle escaped dots
+}
+
+
 def extract_domains(text: str, include_defanged: bool = False) -> list[str]:
     """Extract domain names from a string."""
     matched_domains = re.findall(DOMAIN_REGEX, text)
     if include_defanged:
         # Normalize the text to handle defanged domains
-        replacements = {
-            # Domain defanging
-            "[.]": ".",
-            "(.)": ".",
-            "[dot]": ".",
-            "(dot)": ".",
-            " dot ": ".",
-            r"\.": ".",  # Handle escaped dots
-        }
         normalized_text = functools.reduce(
             lambda substring, replacement: substring.replace(
                 replacement[0], replacement[1]
             ),
-            replacements.items(),
+            DOMAIN_DEFANG_REPLACEMENTS.items(),
             text,
         )
         matched_normalized_domains = re.findall(DOMAIN_REGEX, normalized_text)
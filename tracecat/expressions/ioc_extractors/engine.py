@@ -0,0 +1,210 @@
+"""Extract every supported IoC type from a string in a single scan.
+
+Running each `extract_*` function over the same text rescans the whole input
+once per indicator type. `extract_iocs` instead makes one pass over the text to
+keep only the whitespace-delimited tokens that could contain an indicator (a
+digit, `.`, `:`, `@`, `-`, or a run long enough to be a hash). Each per-type
+pattern then only runs over the candidate tokens containing a substring that
+all of its matches share, such as `@` for emails or `://` for URLs. No indicator pattern
+matches across ASCII whitespace, and whitespace behaves like a string boundary
+for every lookaround they use, so the results are the same as calling the
+individual extractors.
+
+Indicators are deduplicated before validation, so each unique candidate is
+validated once, and returned in first-seen order.
+"""
+
+import functools
+import re
+from collections.abc import Callable, Iterable
+from typing import Literal, get_args
+
+from pydantic import ValidationError
+
+from .asn import ASN_REGEX
+from .cve import CVE_REGEX
+from .domain import DOMAIN_DEFANG_REPLACEMENTS, DOMAIN_REGEX, is_domain
+from .email import EMAIL_REGEX, is_email
+from .ip import (
+    IPV4_DEFANG_REPLACEMENTS,
+    IPV4_REGEX,
+    IPV6_DEFANG_REPLACEMENTS,
+    IPV6_REGEX,
+    is_ipv4,
+    is_ipv6,
+)
+from .mac import MAC_REGEX, MacAddressTypeAdapter
+from .url import URL_DEFANG_REPLACEMENTS, URL_REGEX, is_url
+
+type IocKind = Literal[
+    "asn",
+    "cve",
+    "domain",
+    "email",
+    "ipv4",
+    "ipv6",
+    "mac",
+    "md5",
+    "sha1",
+    "sha256",
+    "sha512",
+    "url",
+]
+
+IOC_KINDS: tuple[IocKind, ...] = get_args(IocKind.__value__)
+
+# Tokens are split on ASCII whitespace only: the URL pattern accepts any
+# character in \u00A0-\uFFFF, which includes non-ASCII whitespace.
+_TOKEN_CHAR = r"[^ \t\n\r\f\v]"
+# A token is a candidate if it contains a character that some indicator
+# requires, or is long enough to hold a hash made of hex letters only. The
+# lookbehind anchors matches at token starts so rejection stays linear.
+CANDIDATE_REGEX = re.compile(
+    rf"(?<!{_TOKEN_CHAR})(?:{_TOKEN_CHAR}*[0-9.:@-]{_TOKEN_CHAR}*|{_TOKEN_CHAR}{{32,}})"
+)
+# One pattern for all hash lengths; matches are bucketed by length. A maximal
+# hex run bounded by word boundaries is exactly what the fixed-length patterns
+# in `hash.py` match.
+HASH_REGEX = re.compile(r"\b[a-fA-F0-9]{32,128}\b")
+_HASH_LENGTHS: dict[IocKind, int] = {
+    "md5": 32,
+    "sha1": 40,
+    "sha256": 64,
+    "sha512": 128,
+}
+
+_ASN_PATTERN = re.compile(ASN_REGEX)
+_CVE_PATTERN = re.compile(CVE_REGEX)
+_EMAIL_PATTERN = re.compile(EMAIL_REGEX)
+_IPV4_PATTERN = re.compile(IPV4_REGEX)
+_IPV6_PATTERN = re.compile(IPV6_REGEX)
+_MAC_PATTERN = re.compile(MAC_REGEX)
+_URL_PATTERN = re.compile(URL_REGEX)
+
+_DEFANG_BY_KIND: dict[IocKind, dict[str, str]] = {
+    "ipv4": IPV4_DEFANG_REPLACEMENTS,
+    "ipv6": IPV6_DEFANG_REPLACEMENTS,
+    "domain": DOMAIN_DEFANG_REPLACEMENTS,
+    "url": URL_DEFANG_REPLACEMENTS,
+}
+
+
+def _normalize_mac(mac: str) -> str | None:
+    parts = mac.replace(":", "").replace("-", "")
+    normalized = ":".join(parts[i : i + 2] for i in range(0, 12, 2))
+    try:
+        return MacAddressTypeAdapter.validate_python(normalized)
+    except ValidationError:
+        return None
+
+
+def _is_valid(validator: Callable[[str], bool]) -> Callable[[str], str | None]:
+    def check(value: str) -> str | None:
+        return value if validator(value) else None
+
+    return check
+
+
+# Pattern, substrings of which every match contains at least one, and a function
+# returning the validated indicator or None.
+_SPECS: dict[
+    IocKind, tuple[re.Pattern[str], tuple[str, ...], Callable[[str], str | None]]
+] = {
+    "asn": (_ASN_PATTERN, ("AS",), lambda value: value),
+    "cve": (_CVE_PATTERN, ("CVE-",), lambda value: value),
+    "domain": (DOMAIN_REGEX, (".",), _is_valid(is_domain)),
+    "email": (_EMAIL_PATTERN, ("@",), _is_valid(is_email)),
+    "ipv4": (_IPV4_PATTERN, (".",), _is_valid(is_ipv4)),
+    "ipv6": (_IPV6_PATTERN, (":",), _is_valid(is_ipv6)),
+    "mac": (_MAC_PATTERN, (":", "-"), _normalize_mac),
+    "url": (_URL_PATTERN, ("://",), _is_valid(is_url)),
+}
+
+
+def _defang(text: str, replacements: dict[str, str]) -> str:
+    return functools.reduce(
+        lambda substring, replacement: substring.replace(*replacement),
+        replacements.items(),
+        text,
+    )
+
+
+def _select(tokens: list[str], required: tuple[str, ...]) -> str:
+    """Join the tokens containing any of ``required`` into one searchable string."""
+    if len(required) == 1:
+        (substring,) = required
+        return " ".join([token for token in tokens if substring in token])
+    return " ".join(
+        [token for token in tokens if any(sub in token for sub in required)]
+    )
+
+
+def _validate(
+    matches: Iterable[str], validate: Callable[[str], str | None]
+) -> list[str]:
+    results: dict[str, None] = {}
+    for match in dict.fromkeys(matches):
+        if (value := validate(match)) is not None:
+            results[value] = None
+    return list(results)
+
+
+def extract_iocs(
+    text: str,
+    kinds: list[IocKind] | None = None,
+    include_defanged: bool = False,
+) -> dict[str, list[str]]:
+    """Extract indicators of compromise of several types from a string at once.
+
+    Returns a mapping from each requested kind (all kinds by default) to its
+    unique indicators. Results match the corresponding `extract_*` function.
+    """
+    if kinds is None:
+        requested: tuple[IocKind, ...] = IOC_KINDS
+    else:
+        if unknown := sorted(set(kinds) - set(IOC_KINDS)):
+            raise ValueError(
+                f"Unsupported IoC kinds: {unknown}. Expected any of {list(IOC_KINDS)}"
+            )
+        requested = tuple(dict.fromkeys(kinds))
+
+    tokens = CANDIDATE_REGEX.findall(text)
+    # Defanged text is normalized per kind, exactly like the individual
+    # extractors, and tokenized once per distinct normalization.
+    defanged_tokens: dict[int, list[str]] = {}
+    if include_defanged:
+        for kind in requested:
+            if (replacements := _DEFANG_BY_KIND.get(kind)) is not None:
+                key = id(replacements)
+                if key not in defanged_tokens:
+                    defanged_tokens[key] = CANDIDATE_REGEX.findall(
+                        _defang(text, replacements)
+                    )
+
+    results: dict[str, list[str]] = {}
+    hash_kinds: tuple[IocKind, ...] = tuple(
+        kind for kind in requested if kind in _HASH_LENGTHS
+    )
+    if hash_kinds:
+        by_length: dict[int, list[str]] = {}
+        hash_text = " ".join([token for token in tokens if len(token) >= 32])
+        for match in HASH_REGEX.findall(hash_text):
+            by_length.setdefault(len(match), []).append(match)
+        for kind in hash_kinds:
+            results[kind] = list(dict.fromkeys(by_length.get(_HASH_LENGTHS[kind], ())))
+
+    for kind in requested:
+        if kind in _HASH_LENGTHS:
+            continue
+        pattern, required, validate = _SPECS[kind]
+        sources = [tokens]
+        if include_defanged and (replacements := _DEFANG_BY_KIND.get(kind)):
+            sources.append(defanged_tokens[id(replacements)])
+        matches = [
+            match
+            for source in sources
+            for match in pattern.findall(_select(source, required))
+        ]
+        results[kind] = _validate(matches, validate)
+
+    return {kind: results[kind] for kind in requested}
@@ -91,24 +91,26 @@ def is_ip(ip: str) -> bool:
     return is_ipv4(ip) or is_ipv6(ip)
 
 
+IPV4_DEFANG_REPLACEMENTS = {
+    "[.]": ".",
+    "(.)": ".",
+    "\\.": ".",
+    "[dot]": ".",
+    " dot ": ".",
+}
+
+
 def extract_ipv4(text: str, include_defanged: bool = False) -> list[str]:
     """Extract unique IPv4 addresses from a string."""
 
     matched_ips = re.findall(IPV4_REGEX, text)
     if include_defanged:
         # Normalize the text
-        replacements = {
-            "[.]": ".",
-            "(.)": ".",
-            "\\.": ".",
-            "[dot]": ".",
-            " dot ": ".",
-        }
         normalized_text = functools.reduce(
             lambda substring, replacement: substring.replace(
                 replacement[0], replacement[1]
             ),
-            replacements.items(),
+            IPV4_DEFANG_REPLACEMENTS.items(),
             text,
         )
         matched_normalized_ips = re.findall(IPV4_REGEX, normalized_text)
@@ -118,42 +120,44 @@ def extract_ipv4(text: str, include_defanged: bool = False) -> list[str]:
     return unique_ips
 
 
+IPV6_DEFANG_REPLACEMENTS = {
+    "[:]": ":",
+    "(:)": ":",
+    "\\:": ":",
+    "(colon)": ":",
+    "[colon]": ":",
+    " colon colon ": "::",
+    " colon ": ":",
+    "(dot)": ".",
+    "[dot]": ".",
+    " dot ": ".",
+    " period ": ".",
+    "[::]": "::",
+    "(::)": "::",
+    "\\::": "::",
+    "\\[": "[",
+    "\\]": "]",
+    # Handle URLs with IPv6
+    "https://[": "[",
+    "http://[": "[",
+    "ftp://[": "[",
+    # Handle ports
+    "]:[0-9]+": "]",
+    "] port [0-9]+": "]",
+}
+
+
 def extract_ipv6(text: str, include_defanged: bool = False) -> list[str]:
     """Extract unique IPv6 addresses from a string. Includes defanged variants as an option."""
 
     matched_ips = re.findall(IPV6_REGEX, text)
     if include_defanged:
         # Normalize the text for defanged variants
-        replacements = {
-            "[:]": ":",
-            "(:)": ":",
-            "\\:": ":",
-            "(colon)": ":",
-            "[colon]": ":",
-            " colon colon ": "::",
-            " colon ": ":",
-            "(dot)": ".",
-            "[dot]": ".",
-            " dot ": ".",
-            " period ": ".",
-            "[::]": "::",
-            "(::)": "::",
-            "\\::": "::",
-            "\\[": "[",
-            "\\]": "]",
-            # Handle URLs with IPv6
-            "https://[": "[",
-            "http://[": "[",
-            "ftp://[": "[",
-            # Handle ports
-            "]:[0-9]+": "]",
-            "] port [0-9]+": "]",
-        }
         normalized_text = functools.reduce(
             lambda substring, replacement: substring.replace(
                 replacement[0], replacement[1]
             ),
-            replacements.items(),
+            IPV6_DEFANG_REPLACEMENTS.items(),
             text,
         )
         # Find IPv6 addresses in the defanged normalized text
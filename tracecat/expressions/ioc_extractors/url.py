@@ -52,6 +52,32 @@ def is_http_url(url: str) -> bool:
         return False
 
 
+URL_DEFANG_REPLACEMENTS = {
+    # Domain defanging
+    "[.]": ".",
+    "(.)": ".",
+    "[dot]": ".",
+    "(dot)": ".",
+    " dot ": ".",
+    " colon ": ":",
+    # Protocol defanging
+    "hxxp://": "http://",
+    "hxxps://": "https://",
+    "xxp://": "http://",
+    "xxps://": "https://",
+    "xxxp://": "http://",
+    "xxxps://": "https://",
+    "http[:]//": "http://",
+    "https[:]//": "https://",
+    "http(:)//": "http://",
+    "https(:)//": "https://",
+    "http:[/][/]": "http://",
+    "https:[/][/]": "https://",
+    "http:(/)(/)": "http://",
+    "https:(/)(/)": "https://",
+}
+
+
 def extract_urls(
     text: str, http_only: bool = False, include_defanged: bool = False
 ) -> list[str]:
@@ -65,35 +91,11 @@ def extract_urls(
 
     if include_defanged:
         # Normalize the text
-        replacements = {
-            # Domain defanging
-            "[.]": ".",
-            "(.)": ".",
-            "[dot]": ".",
-            "(dot)": ".",
-            " dot ": ".",
-            " colon ": ":",
-            # Protocol defanging
-            "hxxp://": "http://",
-            "hxxps://": "https://",
-            "xxp://": "http://",
-            "xxps://": "https://",
-            "xxxp://": "http://",
-            "xxxps://": "https://",
-            "http[:]//": "http://",
-            "https[:]//": "https://",
-            "http(:)//": "http://",
-            "https(:)//": "https://",
-            "http:[/][/]": "http://",
-            "https:[/][/]": "https://",
-            "http:(/)(/)": "http://",
-            "https:(/)(/)": "https://",
-        }
         normalized_text = functools.reduce(
             lambda substring, replacement: substring.replace(
                 replacement[0], replacement[1]
             ),
-            replacements.items(),
+            URL_DEFANG_REPLACEMENTS.items(),
             text,
         )
         matched_normalized_urls = re.findall(_regex_pattern, normalized_text)
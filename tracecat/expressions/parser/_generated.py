@@ -0,0 +1,12 @@
+"""Serialized LALR parser for the template expression grammar.
+
+Generated by scripts/generate_expression_parser.py. Do not edit.
+"""
+
+from lark import Token
+
+LARK_VERSION = '1.1.9'
+GRAMMAR_SHA256 = '7f63fd936c6fee74e52c7368a1b2ba34004da39de81e605baf3877d96e2b6011'
+START = 'root'
+DATA = {'parser': {'lexer_conf': {'terminals': [{'@': 0}, {'@': 1}, {'@': 2}, {'@': 3}, {'@': 4}, {'@': 5}, {'@': 6}, {'@': 7}, {'@': 8}, {'@': 9}, {'@': 10}, {'@': 11}, {'@': 12}, {'@': 13}, {'@': 14}, {'@': 15}, {'@': 16}, {'@': 17}, {'@': 18}, {'@': 19}, {'@': 20}, {'@': 21}, {'@': 22}, {'@': 23}, {'@': 24}, {'@': 25}, {'@': 26}, {'@': 27}, {'@': 28}, {'@': 29}, {'@': 30}, {'@': 31}, {'@': 32}, {'@': 33}, {'@': 34}, {'@': 35}, {'@': 36}, {'@': 37}, {'@': 38}, {'@': 39}, {'@': 40}, {'@': 41}, {'@': 42}, {'@': 43}, {'@': 44}, {'@': 45}], 'ignore': ['WS'], 'g_regex_flags': 0, 'use_bytes': False, 'lexer_type': 'contextual', '__type__': 'LexerConf'}, 'parser_conf': {'rules': [{'@': 46}, {'@': 47}, {'@': 48}, {'@': 49}, {'@': 50}, {'@': 51}, {'@': 52}, {'@': 53}, {'@': 54}, {'@': 55}, {'@': 56}, {'@': 57}, {'@': 58}, {'@': 59}, {'@': 60}, {'@': 61}, {'@': 62}, {'@': 63}, {'@': 64}, {'@': 65}, {'@': 66}, {'@': 67}, {'@': 68}, {'@': 69}, {'@': 70}, {'@': 71}, {'@': 72}, {'@': 73}, {'@': 74}, {'@': 75}, {'@': 76}, {'@': 77}, {'@': 78}, {'@': 79}, {'@': 80}, {'@': 81}, {'@': 82}, {'@': 83}, {'@': 84}, {'@': 85}, {'@': 86}, {'@': 87}, {'@': 88}, {'@': 89}, {'@': 90}, {'@': 91}, {'@': 92}, {'@': 93}, {'@': 94}, {'@': 95}, {'@': 96}, {'@': 97}, {'@': 98}, {'@': 99}, {'@': 100}, {'@': 101}, {'@': 102}, {'@': 103}, {'@': 104}, {'@': 105}, {'@': 106}, {'@': 107}, {'@': 108}, {'@': 109}, {'@': 110}, {'@': 111}, {'@': 112}, {'@': 113}, {'@': 114}, {'@': 115}, {'@': 116}, {'@': 117}, {'@': 118}, {'@': 119}, {'@': 120}, {'@': 121}, {'@': 122}, {'@': 123}, {'@': 124}, {'@': 125}, {'@': 126}, {'@': 127}, {'@': 128}, {'@': 129}, {'@': 130}, {'@': 131}, {'@': 132}], 'start': ['root'], 'parser_type': 'lalr', '__type__': 'ParserConf'}, 'parser': {'tokens': {0: 'PARTIAL_JSONPATH_EXPR', 1: 'RPAR', 2: '__ANON_3', 3: 'LESSTHAN', 4: 'RBRACE', 5: 'MINUS', 6: 'NOT', 7: '$END', 8: 'IS', 9: 'IF', 10: '__ANON_2', 11: 'STAR', 12: 'IN', 13: '__ANON_0', 14: 'RSQB', 15: '__ANON_4', 16: 'LSQB', 17: 'ELSE', 18: '__ANON_5', 19: 'MORETHAN', 20: '__ANON_1', 21: 'PERCENT', 22: 'COMMA', 23: 'PLUS', 24: '__ANON_6', 25: 'SLASH', 26: 'kvpair', 27: 'STRING_LITERAL', 28: 'context', 29: 'template_action_steps', 30: 'comparison_expr', 31: 'list', 32: 'inclusion_expr', 33: 'and_expr', 34: 'LBRACE', 35: 'addition_expr', 36: 'local_vars', 37: 'multiplication_expr', 38: 'LPAR', 39: 'TRIGGER', 40: 'literal', 41: 'identity_expr', 42: 'dict', 43: 'ACTIONS', 44: '__ANON_7', 45: 'or_expr', 46: 'NUMERIC_LITERAL', 47: 'atom', 48: 'not_expr', 49: 'NONE_LITERAL', 50: 'VARS', 51: 'INPUTS', 52: 'SECRETS', 53: 'primary_expr', 54: 'env', 55: 'BOOL_LITERAL', 56: 'STEPS', 57: 'vars', 58: 'secrets', 59: 'template_action_inputs', 60: 'ENV', 61: 'function', 62: 'TYPE_SPECIFIER', 63: 'VAR', 64: 'base_expr', 65: 'unary_expr', 66: 'actions', 67: 'trigger', 68: 'ternary_expr', 69: 'expression', 70: '__arg_list_star_1', 71: 'ATTRIBUTE_PATH', 72: 'indexer', 73: '__primary_expr_star_0', 74: 'COLON', 75: 'FN_NAME_WITH_TRANSFORM', 76: '__dict_star_2', 77: 'arg_list', 78: 'local_vars_assignment', 79: 'iterator', 80: 'trailing_typecast_expression', 81: 'root', 82: 'FOR'}, 'states': {0: {0: (0, 3)}, 1: {1: (1, {'@': 88}), 2: (1, {'@': 88}), 3: (1, {'@': 88}), 4: (1, {'@': 88}), 5: (1, {'@': 88}), 6: (1, {'@': 88}), 7: (1, {'@': 88}), 8: (1, {'@': 88}), 9: (1, {'@': 88}), 10: (1, {'@': 88}), 11: (1, {'@': 88}), 12: (1, {'@': 88}), 13: (1, {'@': 88}), 14: (1, {'@': 88}), 15: (1, {'@': 88}), 16: (1, {'@': 88}), 17: (1, {'@': 88}), 18: (1, {'@': 88}), 19: (1, {'@': 88}), 20: (1, {'@': 88}), 21: (1, {'@': 88}), 22: (1, {'@': 88}), 23: (1, {'@': 88}), 24: (1, {'@': 88}), 25: (1, {'@': 88})}, 2: {26: (0, 53), 4: (0, 57), 27: (0, 35)}, 3: {2: (1, {'@': 105}), 3: (1, {'@': 105}), 5: (1, {'@': 105}), 6: (1, {'@': 105}), 8: (1, {'@': 105}), 10: (1, {'@': 105}), 11: (1, {'@': 105}), 17: (1, {'@': 105}), 16: (1, {'@': 105}), 12: (1, {'@': 105}), 18: (1, {'@': 105}), 15: (1, {'@': 105}), 19: (1, {'@': 105}), 20: (1, {'@': 105}), 21: (1, {'@': 105}), 23: (1, {'@': 105}), 24: (1, {'@': 105}), 25: (1, {'@': 105}), 1: (1, {'@': 105}), 4: (1, {'@': 105}), 7: (1, {'@': 105}), 9: (1, {'@': 105}), 13: (1, {'@': 105}), 14: (1, {'@': 105}), 22: (1, {'@': 105})}, 4: {1: (1, {'@': 129}), 14: (1, {'@': 129}), 22: (1, {'@': 129})}, 5: {2: (1, {'@': 76}), 3: (1, {'@': 76}), 5: (1, {'@': 76}), 6: (1, {'@': 76}), 8: (1, {'@': 76}), 10: (1, {'@': 76}), 11: (1, {'@': 76}), 17: (1, {'@': 76}), 12: (1, {'@': 76}), 18: (1, {'@': 76}), 15: (1, {'@': 76}), 19: (1, {'@': 76}), 20: (1, {'@': 76}), 21: (1, {'@': 76}), 23: (1, {'@': 76}), 24: (1, {'@': 76}), 25: (1, {'@': 76}), 1: (1, {'@': 76}), 9: (1, {'@': 76}), 4: (1, {'@': 76}), 7: (1, {'@': 76}), 13: (1, {'@': 76}), 14: (1, {'@': 76}), 22: (1, {'@': 76})}, 6: {12: (0, 79)}, 7: {0: (0, 76)}, 8: {28: (0, 77), 29: (0, 73), 30: (0, 132), 31: (0, 51), 32: (0, 145), 33: (0, 122), 34: (0, 2), 27: (0, 62), 35: (0, 58), 36: (0, 106), 37: (0, 107), 38: (0, 108), 39: (0, 89), 16: (0, 75), 40: (0, 42), 41: (0, 13), 42: (0, 15), 43: (0, 0), 44: (0, 37), 45: (0, 97), 46: (0, 134), 5: (0, 9), 6: (0, 109), 47: (0, 135), 48: (0, 136), 49: (0, 18), 50: (0, 55), 51: (0, 7), 52: (0, 87), 23: (0, 141), 53: (0, 95), 54: (0, 98), 55: (0, 45), 56: (0, 48), 57: (0, 119), 58: (0, 104), 59: (0, 67), 60: (0, 103), 61: (0, 121), 62: (0, 123), 63: (0, 84), 64: (0, 30), 65: (0, 5), 66: (0, 16), 67: (0, 50)}, 9: {28: (0, 77), 5: (0, 9), 47: (0, 135), 29: (0, 73), 31: (0, 51), 49: (0, 18), 50: (0, 55), 51: (0, 7), 52: (0, 87), 44: (0, 37), 34: (0, 2), 27: (0, 62), 23: (0, 141), 53: (0, 95), 55: (0, 45), 54: (0, 98), 36: (0, 106), 56: (0, 48), 57: (0, 119), 58: (0, 104), 59: (0, 67), 60: (0, 103), 61: (0, 121), 62: (0, 123), 38: (0, 108), 63: (0, 84), 39: (0, 89), 16: (0, 75), 40: (0, 42), 64: (0, 30), 42: (0, 15), 43: (0, 0), 65: (0, 114), 66: (0, 16), 46: (0, 134), 67: (0, 50)}, 10: {28: (0, 77), 29: (0, 73), 30: (0, 132), 31: (0, 51), 32: (0, 145), 33: (0, 122), 34: (0, 2), 27: (0, 62), 35: (0, 58), 36: (0, 106), 37: (0, 107), 38: (0, 108), 39: (0, 89), 16: (0, 75), 40: (0, 42), 41: (0, 13), 42: (0, 15), 43: (0, 0), 45: (0, 82), 44: (0, 37), 46: (0, 134), 68: (0, 110), 5: (0, 9), 6: (0, 109), 47: (0, 135), 48: (0, 136), 49: (0, 18), 50: (0, 55), 51: (0, 7), 52: (0, 87), 23: (0, 141), 53: (0, 95), 54: (0, 98), 55: (0, 45), 56: (0, 48), 57: (0, 119), 58: (0, 104), 59: (0, 67), 60: (0, 103), 61: (0, 121), 62: (0, 123), 63: (0, 84), 64: (0, 30), 65: (0, 5), 66: (0, 16), 69: (0, 88), 67: (0, 50)}, 11: {21: (0, 78), 25: (0, 59), 11: (0, 81), 15: (1, {'@': 74}), 2: (1, {'@': 74}), 3: (1, {'@': 74}), 19: (1, {'@': 74}), 17: (1, {'@': 74}), 5: (1, {'@': 74}), 20: (1, {'@': 74}), 6: (1, {'@': 74}), 8: (1, {'@': 74}), 23: (1, {'@': 74}), 10: (1, {'@': 74}), 24: (1, {'@': 74}), 12: (1, {'@': 74}), 18: (1, {'@': 74}), 1: (1, {'@': 74}), 9: (1, {'@': 74}), 4: (1, {'@': 74}), 7: (1, {'@': 74}), 13: (1, {'@': 74}), 14: (1, {'@': 74}), 22: (1, {'@': 74})}, 12: {2: (1, {'@': 112}), 3: (1, {'@': 112}), 5: (1, {'@': 112}), 6: (1, {'@': 112}), 8: (1, {'@': 112}), 10: (1, {'@': 112}), 11: (1, {'@': 112}), 17: (1, {'@': 112}), 16: (1, {'@': 112}), 12: (1, {'@': 112}), 18: (1, {'@': 112}), 15: (1, {'@': 112}), 19: (1, {'@': 112}), 20: (1, {'@': 112}), 21: (1, {'@': 112}), 23: (1, {'@': 112}), 24: (1, {'@': 112}), 25: (1, {'@': 112}), 1: (1, {'@': 112}), 4: (1, {'@': 112}), 7: (1, {'@': 112}), 9: (1, {'@': 112}), 13: (1, {'@': 112}), 14: (1, {'@': 112}), 22: (1, {'@': 112})}, 13: {8: (0, 116), 15: (1, {'@': 67}), 2: (1, {'@': 67}), 3: (1, {'@': 67}), 19: (1, {'@': 67}), 17: (1, {'@': 67}), 20: (1, {'@': 67}), 6: (1, {'@': 67}), 10: (1, {'@': 67}), 24: (1, {'@': 67}), 12: (1, {'@': 67}), 18: (1, {'@': 67}), 1: (1, {'@': 67}), 9: (1, {'@': 67}), 4: (1, {'@': 67}), 7: (1, {'@': 67}), 13: (1, {'@': 67}), 14: (1, {'@': 67}), 22: (1, {'@': 67})}, 14: {1: (0, 80)}, 15: {2: (1, {'@': 92}), 3: (1, {'@': 92}), 5: (1, {'@': 92}), 6: (1, {'@': 92}), 8: (1, {'@': 92}), 10: (1, {'@': 92}), 11: (1, {'@': 92}), 17: (1, {'@': 92}), 16: (1, {'@': 92}), 12: (1, {'@': 92}), 18: (1, {'@': 92}), 15: (1, {'@': 92}), 19: (1, {'@': 92}), 20: (1, {'@': 92}), 21: (1, {'@': 92}), 23: (1, {'@': 92}), 24: (1, {'@': 92}), 25: (1, {'@': 92}), 1: (1, {'@': 92}), 4: (1, {'@': 92}), 7: (1, {'@': 92}), 9: (1, {'@': 92}), 13: (1, {'@': 92}), 14: (1, {'@': 92}), 22: (1, {'@': 92})}, 16: {2: (1, {'@': 93}), 3: (1, {'@': 93}), 5: (1, {'@': 93}), 6: (1, {'@': 93}), 8: (1, {'@': 93}), 10: (1, {'@': 93}), 11: (1, {'@': 93}), 17: (1, {'@': 93}), 16: (1, {'@': 93}), 12: (1, {'@': 93}), 18: (1, {'@': 93}), 15: (1, {'@': 93}), 19: (1, {'@': 93}), 20: (1, {'@': 93}), 21: (1, {'@': 93}), 23: (1, {'@': 93}), 24: (1, {'@': 93}), 25: (1, {'@': 93}), 1: (1, {'@': 93}), 4: (1, {'@': 93}), 7: (1, {'@': 93}), 9: (1, {'@': 93}), 13: (1, {'@': 93}), 14: (1, {'@': 93}), 22: (1, {'@': 93})}, 17: {27: (0, 35), 26: (0, 112)}, 18: {2: (1, {'@': 120}), 3: (1, {'@': 120}), 5: (1, {'@': 120}), 6: (1, {'@': 120}), 8: (1, {'@': 120}), 10: (1, {'@': 120}), 11: (1, {'@': 120}), 17: (1, {'@': 120}), 16: (1, {'@': 120}), 12: (1, {'@': 120}), 18: (1, {'@': 120}), 15: (1, {'@': 120}), 19: (1, {'@': 120}), 20: (1, {'@': 120}), 21: (1, {'@': 120}), 23: (1, {'@': 120}), 24: (1, {'@': 120}), 25: (1, {'@': 120}), 1: (1, {'@': 120}), 4: (1, {'@': 120}), 7: (1, {'@': 120}), 9: (1, {'@': 120}), 13: (1, {'@': 120}), 14: (1, {'@': 120}), 22: (1, {'@': 120})}, 19: {28: (0, 77), 5: (0, 9), 47: (0, 135), 29: (0, 73), 31: (0, 51), 49: (0, 18), 50: (0, 55), 32: (0, 124), 51: (0, 7), 52: (0, 87), 44: (0, 37), 34: (0, 2), 27: (0, 62), 23: (0, 141), 53: (0, 95), 41: (0, 13), 54: (0, 98), 55: (0, 45), 35: (0, 58), 36: (0, 106), 37: (0, 107), 56: (0, 48), 57: (0, 119), 58: (0, 104), 59: (0, 67), 60: (0, 103), 61: (0, 121), 62: (0, 123), 38: (0, 108), 63: (0, 84), 39: (0, 89), 16: (0, 75), 40: (0, 42), 64: (0, 30), 42: (0, 15), 43: (0, 0), 65: (0, 5), 66: (0, 16), 46: (0, 134), 67: (0, 50)}, 20: {1: (0, 12)}, 21: {22: (0, 54), 70: (0, 43), 14: (1, {'@': 103}), 1: (1, {'@': 103})}, 22: {2: (1, {'@': 113}), 3: (1, {'@': 113}), 5: (1, {'@': 113}), 6: (1, {'@': 113}), 8: (1, {'@': 113}), 10: (1, {'@': 113}), 11: (1, {'@': 113}), 17: (1, {'@': 113}), 16: (1, {'@': 113}), 12: (1, {'@': 113}), 18: (1, {'@': 113}), 15: (1, {'@': 113}), 19: (1, {'@': 113}), 20: (1, {'@': 113}), 21: (1, {'@': 113}), 23: (1, {'@': 113}), 24: (1, {'@': 113}), 25: (1, {'@': 113}), 1: (1, {'@': 113}), 4: (1, {'@': 113}), 7: (1, {'@': 113}), 9: (1, {'@': 113}), 13: (1, {'@': 113}), 14: (1, {'@': 113}), 22: (1, {'@': 113})}, 23: {28: (0, 77), 5: (0, 9), 47: (0, 135), 29: (0, 73), 31: (0, 51), 49: (0, 18), 50: (0, 55), 51: (0, 7), 52: (0, 87), 44: (0, 37), 34: (0, 2), 27: (0, 62), 23: (0, 141), 53: (0, 95), 55: (0, 45), 54: (0, 98), 36: (0, 106), 37: (0, 11), 56: (0, 48), 57: (0, 119), 58: (0, 104), 59: (0, 67), 60: (0, 103), 61: (0, 121), 62: (0, 123), 38: (0, 108), 63: (0, 84), 39: (0, 89), 16: (0, 75), 40: (0, 42), 64: (0, 30), 42: (0, 15), 43: (0, 0), 65: (0, 5), 66: (0, 16), 46: (0, 134), 67: (0, 50)}, 24: {71: (0, 49)}, 25: {2: (1, {'@': 82}), 3: (1, {'@': 82}), 5: (1, {'@': 82}), 6: (1, {'@': 82}), 8: (1, {'@': 82}), 10: (1, {'@': 82}), 11: (1, {'@': 82}), 17: (1, {'@': 82}), 12: (1, {'@': 82}), 18: (1, {'@': 82}), 15: (1, {'@': 82}), 19: (1, {'@': 82}), 20: (1, {'@': 82}), 21: (1, {'@': 82}), 23: (1, {'@': 82}), 24: (1, {'@': 82}), 25: (1, {'@': 82}), 4: (1, {'@': 82}), 7: (1, {'@': 82}), 22: (1, {'@': 82}), 1: (1, {'@': 82}), 9: (1, {'@': 82}), 13: (1, {'@': 82}), 14: (1, {'@': 82})}, 26: {32: (0, 138), 28: (0, 77), 5: (0, 9), 47: (0, 135), 29: (0, 73), 31: (0, 51), 49: (0, 18), 50: (0, 55), 51: (0, 7), 52: (0, 87), 44: (0, 37), 34: (0, 2), 27: (0, 62), 23: (0, 141), 53: (0, 95), 41: (0, 13), 54: (0, 98), 55: (0, 45), 35: (0, 58), 36: (0, 106), 37: (0, 107), 56: (0, 48), 57: (0, 119), 58: (0, 104), 59: (0, 67), 60: (0, 103), 61: (0, 121), 62: (0, 123), 38: (0, 108), 63: (0, 84), 39: (0, 89), 16: (0, 75), 40: (0, 42), 64: (0, 30), 42: (0, 15), 43: (0, 0), 65: (0, 5), 66: (0, 16), 46: (0, 134), 67: (0, 50)}, 27: {28: (0, 77), 5: (0, 9), 47: (0, 135), 29: (0, 73), 31: (0, 51), 49: (0, 18), 50: (0, 55), 32: (0, 126), 51: (0, 7), 52: (0, 87), 44: (0, 37), 34: (0, 2), 27: (0, 62), 23: (0, 141), 53: (0, 95), 41: (0, 13), 54: (0, 98), 55: (0, 45), 35: (0, 58), 36: (0, 106), 37: (0, 107), 56: (0, 48), 57: (0, 119), 58: (0, 104), 59: (0, 67), 60: (0, 103), 61: (0, 121), 62: (0, 123), 38: (0, 108), 63: (0, 84), 39: (0, 89), 16: (0, 75), 40: (0, 42), 64: (0, 30), 42: (0, 15), 43: (0, 0), 65: (0, 5), 66: (0, 16), 46: (0, 134), 67: (0, 50)}, 28: {14: (0, 44)}, 29: {4: (1, {'@': 128}), 5: (1, {'@': 128}), 6: (1, {'@': 128}), 7: (1, {'@': 128}), 8: (1, {'@': 128}), 10: (1, {'@': 128}), 11: (1, {'@': 128}), 12: (1, {'@': 128}), 15: (1, {'@': 128}), 20: (1, {'@': 128}), 22: (1, {'@': 128}), 23: (1, {'@': 128}), 25: (1, {'@': 128}), 1: (1, {'@': 128}), 2: (1, {'@': 128}), 3: (1, {'@': 128}), 9: (1, {'@': 128}), 13: (1, {'@': 128}), 14: (1, {'@': 128}), 16: (1, {'@': 128}), 17: (1, {'@': 128}), 18: (1, {'@': 128}), 19: (1, {'@': 128}), 21: (1, {'@': 128}), 24: (1, {'@': 128})}, 30: {72: (0, 56), 16: (0, 46), 73: (0, 31), 2: (1, {'@': 84}), 3: (1, {'@': 84}), 5: (1, {'@': 84}), 6: (1, {'@': 84}), 8: (1, {'@': 84}), 10: (1, {'@': 84}), 11: (1, {'@': 84}), 17: (1, {'@': 84}), 12: (1, {'@': 84}), 18: (1, {'@': 84}), 15: (1, {'@': 84}), 19: (1, {'@': 84}), 20: (1, {'@': 84}), 21: (1, {'@': 84}), 23: (1, {'@': 84}), 24: (1, {'@': 84}), 25: (1, {'@': 84}), 1: (1, {'@': 84}), 4: (1, {'@': 84}), 7: (1, {'@': 84}), 9: (1, {'@': 84}), 13: (1, {'@': 84}), 14: (1, {'@': 84}), 22: (1, {'@': 84})}, 31: {72: (0, 29), 16: (0, 46), 2: (1, {'@': 83}), 3: (1, {'@': 83}), 5: (1, {'@': 83}), 6: (1, {'@': 83}), 8: (1, {'@': 83}), 10: (1, {'@': 83}), 11: (1, {'@': 83}), 17: (1, {'@': 83}), 12: (1, {'@': 83}), 18: (1, {'@': 83}), 15: (1, {'@': 83}), 19: (1, {'@': 83}), 20: (1, {'@': 83}), 21: (1, {'@': 83}), 23: (1, {'@': 83}), 24: (1, {'@': 83}), 25: (1, {'@': 83}), 1: (1, {'@': 83}), 4: (1, {'@': 83}), 7: (1, {'@': 83}), 9: (1, {'@': 83}), 13: (1, {'@': 83}), 14: (1, {'@': 83}), 22: (1, {'@': 83})}, 32: {2: (1, {'@': 122}), 3: (1, {'@': 122}), 5: (1, {'@': 122}), 6: (1, {'@': 122}), 8: (1, {'@': 122}), 10: (1, {'@': 122}), 11: (1, {'@': 122}), 17: (1, {'@': 122}), 16: (1, {'@': 122}), 12: (1, {'@': 122}), 18: (1, {'@': 122}), 15: (1, {'@': 122}), 19: (1, {'@': 122}), 20: (1, {'@': 122}), 21: (1, {'@': 122}), 23: (1, {'@': 122}), 24: (1, {'@': 122}), 25: (1, {'@': 122}), 1: (1, {'@': 122}), 4: (1, {'@': 122}), 7: (1, {'@': 122}), 9: (1, {'@': 122}), 13: (1, {'@': 122}), 14: (1, {'@': 122}), 22: (1, {'@': 122})}, 33: {28: (0, 77), 5: (0, 9), 47: (0, 135), 29: (0, 73), 31: (0, 51), 32: (0, 133), 49: (0, 18), 50: (0, 55), 51: (0, 7), 52: (0, 87), 44: (0, 37), 34: (0, 2), 27: (0, 62), 23: (0, 141), 53: (0, 95), 41: (0, 13), 54: (0, 98), 55: (0, 45), 35: (0, 58), 36: (0, 106), 37: (0, 107), 56: (0, 48), 57: (0, 119), 58: (0, 104), 59: (0, 67), 60: (0, 103), 61: (0, 121), 62: (0, 123), 38: (0, 108), 63: (0, 84), 39: (0, 89), 16: (0, 75), 40: (0, 42), 64: (0, 30), 42: (0, 15), 43: (0, 0), 65: (0, 5), 66: (0, 16), 46: (0, 134), 67: (0, 50)}, 34: {7: (1, {'@': 47})}, 35: {74: (0, 102)}, 36: {2: (1, {'@': 77}), 3: (1, {'@': 77}), 5: (1, {'@': 77}), 6: (1, {'@': 77}), 8: (1, {'@': 77}), 10: (1, {'@': 77}), 11: (1, {'@': 77}), 17: (1, {'@': 77}), 12: (1, {'@': 77}), 18: (1, {'@': 77}), 15: (1, {'@': 77}), 19: (1, {'@': 77}), 20: (1, {'@': 77}), 21: (1, {'@': 77}), 23: (1, {'@': 77}), 24: (1, {'@': 77}), 25: (1, {'@': 77}), 1: (1, {'@': 77}), 9: (1, {'@': 77}), 4: (1, {'@': 77}), 7: (1, {'@': 77}), 13: (1, {'@': 77}), 14: (1, {'@': 77}), 22: (1, {'@': 77})}, 37: {75: (0, 39)}, 38: {2: (1, {'@': 116}), 3: (1, {'@': 116}), 5: (1, {'@': 116}), 6: (1, {'@': 116}), 8: (1, {'@': 116}), 10: (1, {'@': 116}), 11: (1, {'@': 116}), 17: (1, {'@': 116}), 16: (1, {'@': 116}), 12: (1, {'@': 116}), 18: (1, {'@': 116}), 15: (1, {'@': 116}), 19: (1, {'@': 116}), 20: (1, {'@': 116}), 21: (1, {'@': 116}), 23: (1, {'@': 116}), 24: (1, {'@': 116}), 25: (1, {'@': 116}), 1: (1, {'@': 116}), 4: (1, {'@': 116}), 7: (1, {'@': 116}), 9: (1, {'@': 116}), 13: (1, {'@': 116}), 14: (1, {'@': 116}), 22: (1, {'@': 116})}, 39: {38: (0, 99)}, 40: {2: (1, {'@': 110}), 3: (1, {'@': 110}), 5: (1, {'@': 110}), 6: (1, {'@': 110}), 8: (1, {'@': 110}), 10: (1, {'@': 110}), 11: (1, {'@': 110}), 17: (1, {'@': 110}), 16: (1, {'@': 110}), 12: (1, {'@': 110}), 18: (1, {'@': 110}), 15: (1, {'@': 110}), 19: (1, {'@': 110}), 20: (1, {'@': 110}), 21: (1, {'@': 110}), 23: (1, {'@': 110}), 24: (1, {'@': 110}), 25: (1, {'@': 110}), 1: (1, {'@': 110}), 4: (1, {'@': 110}), 7: (1, {'@': 110}), 9: (1, {'@': 110}), 13: (1, {'@': 110}), 14: (1, {'@': 110}), 22: (1, {'@': 110})}, 41: {24: (0, 96), 3: (0, 26), 15: (0, 19), 2: (0, 33), 19: (0, 27), 18: (0, 61), 10: (1, {'@': 59}), 17: (1, {'@': 59}), 20: (1, {'@': 59}), 1: (1, {'@': 59}), 9: (1, {'@': 59}), 14: (1, {'@': 59}), 4: (1, {'@': 59}), 7: (1, {'@': 59}), 13: (1, {'@': 59}), 22: (1, {'@': 59})}, 42: {2: (1, {'@': 90}), 3: (1, {'@': 90}), 5: (1, {'@': 90}), 6: (1, {'@': 90}), 8: (1, {'@': 90}), 10: (1, {'@': 90}), 11: (1, {'@': 90}), 17: (1, {'@': 90}), 16: (1, {'@': 90}), 12: (1, {'@': 90}), 18: (1, {'@': 90}), 15: (1, {'@': 90}), 19: (1, {'@': 90}), 20: (1, {'@': 90}), 21: (1, {'@': 90}), 23: (1, {'@': 90}), 24: (1, {'@': 90}), 25: (1, {'@': 90}), 1: (1, {'@': 90}), 4: (1, {'@': 90}), 7: (1, {'@': 90}), 9: (1, {'@': 90}), 13: (1, {'@': 90}), 14: (1, {'@': 90}), 22: (1, {'@': 90})}, 43: {22: (0, 93), 14: (1, {'@': 102}), 1: (1, {'@': 102})}, 44: {2: (1, {'@': 121}), 3: (1, {'@': 121}), 5: (1, {'@': 121}), 6: (1, {'@': 121}), 8: (1, {'@': 121}), 10: (1, {'@': 121}), 11: (1, {'@': 121}), 17: (1, {'@': 121}), 16: (1, {'@': 121}), 12: (1, {'@': 121}), 18: (1, {'@': 121}), 15: (1, {'@': 121}), 19: (1, {'@': 121}), 20: (1, {'@': 121}), 21: (1, {'@': 121}), 23: (1, {'@': 121}), 24: (1, {'@': 121}), 25: (1, {'@': 121}), 1: (1, {'@': 121}), 4: (1, {'@': 121}), 7: (1, {'@': 121}), 9: (1, {'@': 121}), 13: (1, {'@': 121}), 14: (1, {'@': 121}), 22: (1, {'@': 121})}, 45: {2: (1, {'@': 118}), 3: (1, {'@': 118}), 5: (1, {'@': 118}), 6: (1, {'@': 118}), 8: (1, {'@': 118}), 10: (1, {'@': 118}), 11: (1, {'@': 118}), 17: (1, {'@': 118}), 16: (1, {'@': 118}), 12: (1, {'@': 118}), 18: (1, {'@': 118}), 15: (1, {'@': 118}), 19: (1, {'@': 118}), 20: (1, {'@': 118}), 21: (1, {'@': 118}), 23: (1, {'@': 118}), 24: (1, {'@': 118}), 25: (1, {'@': 118}), 1: (1, {'@': 118}), 4: (1, {'@': 118}), 7: (1, {'@': 118}), 9: (1, {'@': 118}), 13: (1, {'@': 118}), 14: (1, {'@': 118}), 22: (1, {'@': 118})}, 46: {28: (0, 77), 29: (0, 73), 30: (0, 132), 31: (0, 51), 32: (0, 145), 33: (0, 122), 34: (0, 2), 27: (0, 62), 35: (0, 58), 36: (0, 106), 37: (0, 107), 38: (0, 108), 39: (0, 89), 16: (0, 75), 40: (0, 42), 41: (0, 13), 42: (0, 15), 43: (0, 0), 45: (0, 82), 44: (0, 37), 46: (0, 134), 68: (0, 110), 5: (0, 9), 6: (0, 109), 47: (0, 135), 48: (0, 136), 49: (0, 18), 50: (0, 55), 51: (0, 7), 52: (0, 87), 23: (0, 141), 53: (0, 95), 54: (0, 98), 55: (0, 45), 56: (0, 48), 57: (0, 119), 58: (0, 104), 59: (0, 67), 60: (0, 103), 61: (0, 121), 62: (0, 123), 63: (0, 84), 64: (0, 30), 65: (0, 5), 69: (0, 125), 66: (0, 16), 67: (0, 50)}, 47: {}, 48: {0: (0, 38)}, 49: {12: (1, {'@': 114})}, 50: {2: (1, {'@': 98}), 3: (1, {'@': 98}), 5: (1, {'@': 98}), 6: (1, {'@': 98}), 8: (1, {'@': 98}), 10: (1, {'@': 98}), 11: (1, {'@': 98}), 17: (1, {'@': 98}), 16: (1, {'@': 98}), 12: (1, {'@': 98}), 18: (1, {'@': 98}), 15: (1, {'@': 98}), 19: (1, {'@': 98}), 20: (1, {'@': 98}), 21: (1, {'@': 98}), 23: (1, {'@': 98}), 24: (1, {'@': 98}), 25: (1, {'@': 98}), 1: (1, {'@': 98}), 4: (1, {'@': 98}), 7: (1, {'@': 98}), 9: (1, {'@': 98}), 13: (1, {'@': 98}), 14: (1, {'@': 98}), 22: (1, {'@': 98})}, 51: {2: (1, {'@': 91}), 3: (1, {'@': 91}), 5: (1, {'@': 91}), 6: (1, {'@': 91}), 8: (1, {'@': 91}), 10: (1, {'@': 91}), 11: (1, {'@': 91}), 17: (1, {'@': 91}), 16: (1, {'@': 91}), 12: (1, {'@': 91}), 18: (1, {'@': 91}), 15: (1, {'@': 91}), 19: (1, {'@': 91}), 20: (1, {'@': 91}), 21: (1, {'@': 91}), 23: (1, {'@': 91}), 24: (1, {'@': 91}), 25: (1, {'@': 91}), 1: (1, {'@': 91}), 4: (1, {'@': 91}), 7: (1, {'@': 91}), 9: (1, {'@': 91}), 13: (1, {'@': 91}), 14: (1, {'@': 91}), 22: (1, {'@': 91})}, 52: {28: (0, 77), 29: (0, 73), 30: (0, 132), 31: (0, 51), 32: (0, 145), 34: (0, 2), 27: (0, 62), 35: (0, 58), 36: (0, 106), 37: (0, 107), 38: (0, 108), 39: (0, 89), 16: (0, 75), 48: (0, 70), 40: (0, 42), 41: (0, 13), 42: (0, 15), 43: (0, 0), 44: (0, 37), 46: (0, 134), 5: (0, 9), 6: (0, 109), 47: (0, 135), 49: (0, 18), 50: (0, 55), 51: (0, 7), 52: (0, 87), 23: (0, 141), 53: (0, 95), 54: (0, 98), 55: (0, 45), 56: (0, 48), 57: (0, 119), 58: (0, 104), 59: (0, 67), 60: (0, 103), 61: (0, 121), 62: (0, 123), 63: (0, 84), 64: (0, 30), 65: (0, 5), 66: (0, 16), 67: (0, 50)}, 53: {4: (0, 60), 76: (0, 128), 22: (0, 17)}, 54: {28: (0, 77), 29: (0, 73), 30: (0, 132), 31: (0, 51), 32: (0, 145), 33: (0, 122), 34: (0, 2), 27: (0, 62), 35: (0, 58), 36: (0, 106), 37: (0, 107), 38: (0, 108), 39: (0, 89), 16: (0, 75), 40: (0, 42), 41: (0, 13), 42: (0, 15), 43: (0, 0), 45: (0, 82), 44: (0, 37), 46: (0, 134), 68: (0, 110), 5: (0, 9), 6: (0, 109), 47: (0, 135), 48: (0, 136), 49: (0, 18), 50: (0, 55), 51: (0, 7), 52: (0, 87), 23: (0, 141), 53: (0, 95), 54: (0, 98), 55: (0, 45), 69: (0, 4), 56: (0, 48), 57: (0, 119), 58: (0, 104), 59: (0, 67), 60: (0, 103), 61: (0, 121), 62: (0, 123), 63: (0, 84), 64: (0, 30), 65: (0, 5), 66: (0, 16), 67: (0, 50)}, 55: {71: (0, 69)}, 56: {4: (1, {'@': 127}), 5: (1, {'@': 127}), 6: (1, {'@': 127}), 7: (1, {'@': 127}), 8: (1, {'@': 127}), 10: (1, {'@': 127}), 11: (1, {'@': 127}), 12: (1, {'@': 127}), 15: (1, {'@': 127}), 20: (1, {'@': 127}), 22: (1, {'@': 127}), 23: (1, {'@': 127}), 25: (1, {'@': 127}), 1: (1, {'@': 127}), 2: (1, {'@': 127}), 3: (1, {'@': 127}), 9: (1, {'@': 127}), 13: (1, {'@': 127}), 14: (1, {'@': 127}), 16: (1, {'@': 127}), 17: (1, {'@': 127}), 18: (1, {'@': 127}), 19: (1, {'@': 127}), 21: (1, {'@': 127}), 24: (1, {'@': 127})}, 57: {2: (1, {'@': 125}), 3: (1, {'@': 125}), 5: (1, {'@': 125}), 6: (1, {'@': 125}), 8: (1, {'@': 125}), 10: (1, {'@': 125}), 11: (1, {'@': 125}), 17: (1, {'@': 125}), 16: (1, {'@': 125}), 12: (1, {'@': 125}), 18: (1, {'@': 125}), 15: (1, {'@': 125}), 19: (1, {'@': 125}), 20: (1, {'@': 125}), 21: (1, {'@': 125}), 23: (1, {'@': 125}), 24: (1, {'@': 125}), 25: (1, {'@': 125}), 1: (1, {'@': 125}), 4: (1, {'@': 125}), 7: (1, {'@': 125}), 9: (1, {'@': 125}), 13: (1, {'@': 125}), 14: (1, {'@': 125}), 22: (1, {'@': 125})}, 58: {5: (0, 63), 23: (0, 23), 15: (1, {'@': 70}), 2: (1, {'@': 70}), 3: (1, {'@': 70}), 12: (1, {'@': 70}), 19: (1, {'@': 70}), 20: (1, {'@': 70}), 6: (1, {'@': 70}), 8: (1, {'@': 70}), 10: (1, {'@': 70}), 24: (1, {'@': 70}), 17: (1, {'@': 70}), 18: (1, {'@': 70}), 1: (1, {'@': 70}), 9: (1, {'@': 70}), 4: (1, {'@': 70}), 7: (1, {'@': 70}), 13: (1, {'@': 70}), 14: (1, {'@': 70}), 22: (1, {'@': 70})}, 59: {28: (0, 77), 5: (0, 9), 47: (0, 135), 29: (0, 73), 31: (0, 51), 49: (0, 18), 50: (0, 55), 51: (0, 7), 52: (0, 87), 44: (0, 37), 34: (0, 2), 27: (0, 62), 23: (0, 141), 53: (0, 95), 55: (0, 45), 54: (0, 98), 36: (0, 106), 56: (0, 48), 57: (0, 119), 58: (0, 104), 59: (0, 67), 60: (0, 103), 61: (0, 121), 62: (0, 123), 38: (0, 108), 63: (0, 84), 39: (0, 89), 16: (0, 75), 40: (0, 42), 64: (0, 30), 42: (0, 15), 43: (0, 0), 65: (0, 64), 66: (0, 16), 46: (0, 134), 67: (0, 50)}, 60: {2: (1, {'@': 124}), 3: (1, {'@': 124}), 5: (1, {'@': 124}), 6: (1, {'@': 124}), 8: (1, {'@': 124}), 10: (1, {'@': 124}), 11: (1, {'@': 124}), 17: (1, {'@': 124}), 16: (1, {'@': 124}), 12: (1, {'@': 124}), 18: (1, {'@': 124}), 15: (1, {'@': 124}), 19: (1, {'@': 124}), 20: (1, {'@': 124}), 21: (1, {'@': 124}), 23: (1, {'@': 124}), 24: (1, {'@': 124}), 25: (1, {'@': 124}), 1: (1, {'@': 124}), 4: (1, {'@': 124}), 7: (1, {'@': 124}), 9: (1, {'@': 124}), 13: (1, {'@': 124}), 14: (1, {'@': 124}), 22: (1, {'@': 124})}, 61: {28: (0, 77), 5: (0, 9), 47: (0, 135), 29: (0, 73), 31: (0, 51), 49: (0, 18), 50: (0, 55), 32: (0, 137), 51: (0, 7), 52: (0, 87), 44: (0, 37), 34: (0, 2), 27: (0, 62), 23: (0, 141), 53: (0, 95), 41: (0, 13), 54: (0, 98), 55: (0, 45), 35: (0, 58), 36: (0, 106), 37: (0, 107), 56: (0, 48), 57: (0, 119), 58: (0, 104), 59: (0, 67), 60: (0, 103), 61: (0, 121), 62: (0, 123), 38: (0, 108), 63: (0, 84), 39: (0, 89), 16: (0, 75), 40: (0, 42), 64: (0, 30), 42: (0, 15), 43: (0, 0), 65: (0, 5), 66: (0, 16), 46: (0, 134), 67: (0, 50)}, 62: {2: (1, {'@': 117}), 3: (1, {'@': 117}), 5: (1, {'@': 117}), 6: (1, {'@': 117}), 8: (1, {'@': 117}), 10: (1, {'@': 117}), 11: (1, {'@': 117}), 17: (1, {'@': 117}), 16: (1, {'@': 117}), 12: (1, {'@': 117}), 18: (1, {'@': 117}), 15: (1, {'@': 117}), 19: (1, {'@': 117}), 20: (1, {'@': 117}), 21: (1, {'@': 117}), 23: (1, {'@': 117}), 24: (1, {'@': 117}), 25: (1, {'@': 117}), 1: (1, {'@': 117}), 4: (1, {'@': 117}), 7: (1, {'@': 117}), 9: (1, {'@': 117}), 13: (1, {'@': 117}), 14: (1, {'@': 117}), 22: (1, {'@': 117})}, 63: {37: (0, 131), 28: (0, 77), 5: (0, 9), 47: (0, 135), 29: (0, 73), 31: (0, 51), 49: (0, 18), 50: (0, 55), 51: (0, 7), 52: (0, 87), 44: (0, 37), 34: (0, 2), 27: (0, 62), 23: (0, 141), 53: (0, 95), 55: (0, 45), 54: (0, 98), 36: (0, 106), 56: (0, 48), 57: (0, 119), 58: (0, 104), 59: (0, 67), 60: (0, 103), 61: (0, 121), 62: (0, 123), 38: (0, 108), 63: (0, 84), 39: (0, 89), 16: (0, 75), 40: (0, 42), 64: (0, 30), 42: (0, 15), 43: (0, 0), 65: (0, 5), 66: (0, 16), 46: (0, 134), 67: (0, 50)}, 64: {2: (1, {'@': 78}), 3: (1, {'@': 78}), 5: (1, {'@': 78}), 6: (1, {'@': 78}), 8: (1, {'@': 78}), 10: (1, {'@': 78}), 11: (1, {'@': 78}), 17: (1, {'@': 78}), 12: (1, {'@': 78}), 18: (1, {'@': 78}), 15: (1, {'@': 78}), 19: (1, {'@': 78}), 20: (1, {'@': 78}), 21: (1, {'@': 78}), 23: (1, {'@': 78}), 24: (1, {'@': 78}), 25: (1, {'@': 78}), 1: (1, {'@': 78}), 9: (1, {'@': 78}), 4: (1, {'@': 78}), 7: (1, {'@': 78}), 13: (1, {'@': 78}), 14: (1, {'@': 78}), 22: (1, {'@': 78})}, 65: {1: (1, {'@': 130}), 14: (1, {'@': 130}), 22: (1, {'@': 130})}, 66: {12: (0, 111)}, 67: {2: (1, {'@': 100}), 3: (1, {'@': 100}), 5: (1, {'@': 100}), 6: (1, {'@': 100}), 8: (1, {'@': 100}), 10: (1, {'@': 100}), 11: (1, {'@': 100}), 17: (1, {'@': 100}), 16: (1, {'@': 100}), 12: (1, {'@': 100}), 18: (1, {'@': 100}), 15: (1, {'@': 100}), 19: (1, {'@': 100}), 20: (1, {'@': 100}), 21: (1, {'@': 100}), 23: (1, {'@': 100}), 24: (1, {'@': 100}), 25: (1, {'@': 100}), 1: (1, {'@': 100}), 4: (1, {'@': 100}), 7: (1, {'@': 100}), 9: (1, {'@': 100}), 13: (1, {'@': 100}), 14: (1, {'@': 100}), 22: (1, {'@': 100})}, 68: {2: (1, {'@': 86}), 3: (1, {'@': 86}), 5: (1, {'@': 86}), 6: (1, {'@': 86}), 8: (1, {'@': 86}), 10: (1, {'@': 86}), 11: (1, {'@': 86}), 17: (1, {'@': 86}), 16: (1, {'@': 86}), 12: (1, {'@': 86}), 18: (1, {'@': 86}), 15: (1, {'@': 86}), 19: (1, {'@': 86}), 20: (1, {'@': 86}), 21: (1, {'@': 86}), 23: (1, {'@': 86}), 24: (1, {'@': 86}), 25: (1, {'@': 86}), 1: (1, {'@': 86}), 4: (1, {'@': 86}), 7: (1, {'@': 86}), 9: (1, {'@': 86}), 13: (1, {'@': 86}), 14: (1, {'@': 86}), 22: (1, {'@': 86})}, 69: {2: (1, {'@': 107}), 3: (1, {'@': 107}), 5: (1, {'@': 107}), 6: (1, {'@': 107}), 8: (1, {'@': 107}), 10: (1, {'@': 107}), 11: (1, {'@': 107}), 17: (1, {'@': 107}), 16: (1, {'@': 107}), 12: (1, {'@': 107}), 18: (1, {'@': 107}), 15: (1, {'@': 107}), 19: (1, {'@': 107}), 20: (1, {'@': 107}), 21: (1, {'@': 107}), 23: (1, {'@': 107}), 24: (1, {'@': 107}), 25: (1, {'@': 107}), 1: (1, {'@': 107}), 4: (1, {'@': 107}), 7: (1, {'@': 107}), 9: (1, {'@': 107}), 13: (1, {'@': 107}), 14: (1, {'@': 107}), 22: (1, {'@': 107})}, 70: {10: (1, {'@': 57}), 17: (1, {'@': 57}), 20: (1, {'@': 57}), 1: (1, {'@': 57}), 9: (1, {'@': 57}), 14: (1, {'@': 57}), 22: (1, {'@': 57}), 7: (1, {'@': 57}), 4: (1, {'@': 57}), 13: (1, {'@': 57})}, 71: {1: (1, {'@': 53}), 14: (1, {'@': 53}), 22: (1, {'@': 53}), 7: (1, {'@': 53}), 4: (1, {'@': 53}), 13: (1, {'@': 53})}, 72: {7: (1, {'@': 48})}, 73: {2: (1, {'@': 101}), 3: (1, {'@': 101}), 5: (1, {'@': 101}), 6: (1, {'@': 101}), 8: (1, {'@': 101}), 10: (1, {'@': 101}), 11: (1, {'@': 101}), 17: (1, {'@': 101}), 16: (1, {'@': 101}), 12: (1, {'@': 101}), 18: (1, {'@': 101}), 15: (1, {'@': 101}), 19: (1, {'@': 101}), 20: (1, {'@': 101}), 21: (1, {'@': 101}), 23: (1, {'@': 101}), 24: (1, {'@': 101}), 25: (1, {'@': 101}), 1: (1, {'@': 101}), 4: (1, {'@': 101}), 7: (1, {'@': 101}), 9: (1, {'@': 101}), 13: (1, {'@': 101}), 14: (1, {'@': 101}), 22: (1, {'@': 101})}, 74: {8: (0, 116), 15: (1, {'@': 68}), 2: (1, {'@': 68}), 3: (1, {'@': 68}), 19: (1, {'@': 68}), 17: (1, {'@': 68}), 20: (1, {'@': 68}), 6: (1, {'@': 68}), 10: (1, {'@': 68}), 24: (1, {'@': 68}), 12: (1, {'@': 68}), 18: (1, {'@': 68}), 1: (1, {'@': 68}), 9: (1, {'@': 68}), 4: (1, {'@': 68}), 7: (1, {'@': 68}), 13: (1, {'@': 68}), 14: (1, {'@': 68}), 22: (1, {'@': 68})}, 75: {28: (0, 77), 29: (0, 73), 30: (0, 132), 31: (0, 51), 32: (0, 145), 33: (0, 122), 34: (0, 2), 27: (0, 62), 69: (0, 21), 35: (0, 58), 36: (0, 106), 37: (0, 107), 38: (0, 108), 39: (0, 89), 16: (0, 75), 40: (0, 42), 41: (0, 13), 42: (0, 15), 43: (0, 0), 45: (0, 82), 44: (0, 37), 46: (0, 134), 68: (0, 110), 5: (0, 9), 6: (0, 109), 47: (0, 135), 48: (0, 136), 49: (0, 18), 50: (0, 55), 51: (0, 7), 14: (0, 32), 52: (0, 87), 23: (0, 141), 53: (0, 95), 54: (0, 98), 55: (0, 45), 56: (0, 48), 57: (0, 119), 63: (0, 84), 58: (0, 104), 59: (0, 67), 61: (0, 121), 62: (0, 123), 60: (0, 103), 77: (0, 28), 64: (0, 30), 65: (0, 5), 66: (0, 16), 67: (0, 50)}, 76: {2: (1, {'@': 115}), 3: (1, {'@': 115}), 5: (1, {'@': 115}), 6: (1, {'@': 115}), 8: (1, {'@': 115}), 10: (1, {'@': 115}), 11: (1, {'@': 115}), 17: (1, {'@': 115}), 16: (1, {'@': 115}), 12: (1, {'@': 115}), 18: (1, {'@': 115}), 15: (1, {'@': 115}), 19: (1, {'@': 115}), 20: (1, {'@': 115}), 21: (1, {'@': 115}), 23: (1, {'@': 115}), 24: (1, {'@': 115}), 25: (1, {'@': 115}), 1: (1, {'@': 115}), 4: (1, {'@': 115}), 7: (1, {'@': 115}), 9: (1, {'@': 115}), 13: (1, {'@': 115}), 14: (1, {'@': 115}), 22: (1, {'@': 115})}, 77: {2: (1, {'@': 89}), 3: (1, {'@': 89}), 5: (1, {'@': 89}), 6: (1, {'@': 89}), 8: (1, {'@': 89}), 10: (1, {'@': 89}), 11: (1, {'@': 89}), 17: (1, {'@': 89}), 16: (1, {'@': 89}), 12: (1, {'@': 89}), 18: (1, {'@': 89}), 15: (1, {'@': 89}), 19: (1, {'@': 89}), 20: (1, {'@': 89}), 21: (1, {'@': 89}), 23: (1, {'@': 89}), 24: (1, {'@': 89}), 25: (1, {'@': 89}), 1: (1, {'@': 89}), 4: (1, {'@': 89}), 7: (1, {'@': 89}), 9: (1, {'@': 89}), 13: (1, {'@': 89}), 14: (1, {'@': 89}), 22: (1, {'@': 89})}, 78: {28: (0, 77), 5: (0, 9), 47: (0, 135), 29: (0, 73), 31: (0, 51), 49: (0, 18), 50: (0, 55), 51: (0, 7), 52: (0, 87), 44: (0, 37), 34: (0, 2), 27: (0, 62), 23: (0, 141), 53: (0, 95), 55: (0, 45), 54: (0, 98), 36: (0, 106), 56: (0, 48), 57: (0, 119), 58: (0, 104), 59: (0, 67), 60: (0, 103), 61: (0, 121), 62: (0, 123), 38: (0, 108), 63: (0, 84), 39: (0, 89), 16: (0, 75), 40: (0, 42), 64: (0, 30), 42: (0, 15), 43: (0, 0), 65: (0, 127), 66: (0, 16), 46: (0, 134), 67: (0, 50)}, 79: {28: (0, 77), 29: (0, 73), 30: (0, 132), 31: (0, 51), 32: (0, 145), 33: (0, 122), 34: (0, 2), 27: (0, 62), 35: (0, 58), 36: (0, 106), 37: (0, 107), 69: (0, 117), 38: (0, 108), 39: (0, 89), 16: (0, 75), 40: (0, 42), 41: (0, 13), 42: (0, 15), 43: (0, 0), 45: (0, 82), 44: (0, 37), 46: (0, 134), 68: (0, 110), 5: (0, 9), 6: (0, 109), 47: (0, 135), 48: (0, 136), 49: (0, 18), 50: (0, 55), 51: (0, 7), 52: (0, 87), 23: (0, 141), 53: (0, 95), 54: (0, 98), 55: (0, 45), 56: (0, 48), 57: (0, 119), 58: (0, 104), 59: (0, 67), 60: (0, 103), 61: (0, 121), 62: (0, 123), 63: (0, 84), 64: (0, 30), 65: (0, 5), 66: (0, 16), 67: (0, 50)}, 80: {2: (1, {'@': 87}), 3: (1, {'@': 87}), 5: (1, {'@': 87}), 6: (1, {'@': 87}), 8: (1, {'@': 87}), 10: (1, {'@': 87}), 11: (1, {'@': 87}), 17: (1, {'@': 87}), 16: (1, {'@': 87}), 12: (1, {'@': 87}), 18: (1, {'@': 87}), 15: (1, {'@': 87}), 19: (1, {'@': 87}), 20: (1, {'@': 87}), 21: (1, {'@': 87}), 23: (1, {'@': 87}), 24: (1, {'@': 87}), 25: (1, {'@': 87}), 1: (1, {'@': 87}), 4: (1, {'@': 87}), 7: (1, {'@': 87}), 9: (1, {'@': 87}), 13: (1, {'@': 87}), 14: (1, {'@': 87}), 22: (1, {'@': 87})}, 81: {65: (0, 36), 28: (0, 77), 5: (0, 9), 47: (0, 135), 29: (0, 73), 31: (0, 51), 49: (0, 18), 50: (0, 55), 51: (0, 7), 52: (0, 87), 44: (0, 37), 34: (0, 2), 27: (0, 62), 23: (0, 141), 53: (0, 95), 55: (0, 45), 54: (0, 98), 36: (0, 106), 56: (0, 48), 57: (0, 119), 58: (0, 104), 59: (0, 67), 60: (0, 103), 61: (0, 121), 62: (0, 123), 38: (0, 108), 63: (0, 84), 39: (0, 89), 16: (0, 75), 40: (0, 42), 64: (0, 30), 42: (0, 15), 43: (0, 0), 66: (0, 16), 46: (0, 134), 67: (0, 50)}, 82: {20: (0, 118), 9: (0, 8), 1: (1, {'@': 52}), 14: (1, {'@': 52}), 22: (1, {'@': 52}), 7: (1, {'@': 52}), 4: (1, {'@': 52}), 13: (1, {'@': 52})}, 83: {5: (0, 63), 23: (0, 23), 15: (1, {'@': 71}), 2: (1, {'@': 71}), 3: (1, {'@': 71}), 12: (1, {'@': 71}), 19: (1, {'@': 71}), 20: (1, {'@': 71}), 6: (1, {'@': 71}), 8: (1, {'@': 71}), 10: (1, {'@': 71}), 24: (1, {'@': 71}), 17: (1, {'@': 71}), 18: (1, {'@': 71}), 1: (1, {'@': 71}), 9: (1, {'@': 71}), 4: (1, {'@': 71}), 7: (1, {'@': 71}), 13: (1, {'@': 71}), 14: (1, {'@': 71}), 22: (1, {'@': 71})}, 84: {0: (0, 101)}, 85: {2: (1, {'@': 108}), 3: (1, {'@': 108}), 5: (1, {'@': 108}), 6: (1, {'@': 108}), 8: (1, {'@': 108}), 10: (1, {'@': 108}), 11: (1, {'@': 108}), 17: (1, {'@': 108}), 16: (1, {'@': 108}), 12: (1, {'@': 108}), 18: (1, {'@': 108}), 15: (1, {'@': 108}), 19: (1, {'@': 108}), 20: (1, {'@': 108}), 21: (1, {'@': 108}), 23: (1, {'@': 108}), 24: (1, {'@': 108}), 25: (1, {'@': 108}), 1: (1, {'@': 108}), 4: (1, {'@': 108}), 7: (1, {'@': 108}), 9: (1, {'@': 108}), 13: (1, {'@': 108}), 14: (1, {'@': 108}), 22: (1, {'@': 108})}, 86: {2: (1, {'@': 123}), 3: (1, {'@': 123}), 5: (1, {'@': 123}), 6: (1, {'@': 123}), 8: (1, {'@': 123}), 10: (1, {'@': 123}), 11: (1, {'@': 123}), 17: (1, {'@': 123}), 16: (1, {'@': 123}), 12: (1, {'@': 123}), 18: (1, {'@': 123}), 15: (1, {'@': 123}), 19: (1, {'@': 123}), 20: (1, {'@': 123}), 21: (1, {'@': 123}), 23: (1, {'@': 123}), 24: (1, {'@': 123}), 25: (1, {'@': 123}), 1: (1, {'@': 123}), 4: (1, {'@': 123}), 7: (1, {'@': 123}), 9: (1, {'@': 123}), 13: (1, {'@': 123}), 14: (1, {'@': 123}), 22: (1, {'@': 123})}, 87: {71: (0, 113)}, 88: {1: (0, 68)}, 89: {0: (0, 40), 2: (1, {'@': 111}), 3: (1, {'@': 111}), 5: (1, {'@': 111}), 6: (1, {'@': 111}), 8: (1, {'@': 111}), 10: (1, {'@': 111}), 11: (1, {'@': 111}), 17: (1, {'@': 111}), 16: (1, {'@': 111}), 12: (1, {'@': 111}), 18: (1, {'@': 111}), 15: (1, {'@': 111}), 19: (1, {'@': 111}), 20: (1, {'@': 111}), 21: (1, {'@': 111}), 23: (1, {'@': 111}), 24: (1, {'@': 111}), 25: (1, {'@': 111}), 1: (1, {'@': 111}), 4: (1, {'@': 111}), 7: (1, {'@': 111}), 9: (1, {'@': 111}), 13: (1, {'@': 111}), 14: (1, {'@': 111}), 22: (1, {'@': 111})}, 90: {62: (0, 140)}, 91: {28: (0, 77), 5: (0, 9), 47: (0, 135), 29: (0, 73), 31: (0, 51), 49: (0, 18), 50: (0, 55), 51: (0, 7), 52: (0, 87), 44: (0, 37), 34: (0, 2), 27: (0, 62), 23: (0, 141), 53: (0, 95), 55: (0, 45), 54: (0, 98), 35: (0, 144), 36: (0, 106), 37: (0, 107), 56: (0, 48), 57: (0, 119), 58: (0, 104), 59: (0, 67), 60: (0, 103), 61: (0, 121), 62: (0, 123), 38: (0, 108), 63: (0, 84), 39: (0, 89), 16: (0, 75), 40: (0, 42), 64: (0, 30), 42: (0, 15), 43: (0, 0), 65: (0, 5), 66: (0, 16), 46: (0, 134), 67: (0, 50)}, 92: {13: (0, 90), 7: (1, {'@': 46})}, 93: {28: (0, 77), 29: (0, 73), 30: (0, 132), 31: (0, 51), 32: (0, 145), 33: (0, 122), 34: (0, 2), 27: (0, 62), 35: (0, 58), 36: (0, 106), 37: (0, 107), 38: (0, 108), 39: (0, 89), 16: (0, 75), 40: (0, 42), 41: (0, 13), 42: (0, 15), 43: (0, 0), 45: (0, 82), 44: (0, 37), 46: (0, 134), 69: (0, 65), 68: (0, 110), 5: (0, 9), 6: (0, 109), 47: (0, 135), 48: (0, 136), 49: (0, 18), 50: (0, 55), 51: (0, 7), 52: (0, 87), 23: (0, 141), 53: (0, 95), 54: (0, 98), 55: (0, 45), 56: (0, 48), 57: (0, 119), 58: (0, 104), 59: (0, 67), 60: (0, 103), 61: (0, 121), 62: (0, 123), 63: (0, 84), 64: (0, 30), 65: (0, 5), 66: (0, 16), 67: (0, 50)}, 94: {26: (0, 130), 27: (0, 35)}, 95: {2: (1, {'@': 80}), 3: (1, {'@': 80}), 5: (1, {'@': 80}), 6: (1, {'@': 80}), 8: (1, {'@': 80}), 10: (1, {'@': 80}), 11: (1, {'@': 80}), 17: (1, {'@': 80}), 12: (1, {'@': 80}), 18: (1, {'@': 80}), 15: (1, {'@': 80}), 19: (1, {'@': 80}), 20: (1, {'@': 80}), 21: (1, {'@': 80}), 23: (1, {'@': 80}), 24: (1, {'@': 80}), 25: (1, {'@': 80}), 4: (1, {'@': 80}), 7: (1, {'@': 80}), 22: (1, {'@': 80}), 1: (1, {'@': 80}), 9: (1, {'@': 80}), 13: (1, {'@': 80}), 14: (1, {'@': 80})}, 96: {28: (0, 77), 5: (0, 9), 47: (0, 135), 29: (0, 73), 31: (0, 51), 49: (0, 18), 50: (0, 55), 32: (0, 139), 51: (0, 7), 52: (0, 87), 44: (0, 37), 34: (0, 2), 27: (0, 62), 23: (0, 141), 53: (0, 95), 41: (0, 13), 54: (0, 98), 55: (0, 45), 35: (0, 58), 36: (0, 106), 37: (0, 107), 56: (0, 48), 57: (0, 119), 58: (0, 104), 59: (0, 67), 60: (0, 103), 61: (0, 121), 62: (0, 123), 38: (0, 108), 63: (0, 84), 39: (0, 89), 16: (0, 75), 40: (0, 42), 64: (0, 30), 42: (0, 15), 43: (0, 0), 65: (0, 5), 66: (0, 16), 46: (0, 134), 67: (0, 50)}, 97: {17: (0, 105), 20: (0, 118)}, 98: {2: (1, {'@': 96}), 3: (1, {'@': 96}), 5: (1, {'@': 96}), 6: (1, {'@': 96}), 8: (1, {'@': 96}), 10: (1, {'@': 96}), 11: (1, {'@': 96}), 17: (1, {'@': 96}), 16: (1, {'@': 96}), 12: (1, {'@': 96}), 18: (1, {'@': 96}), 15: (1, {'@': 96}), 19: (1, {'@': 96}), 20: (1, {'@': 96}), 21: (1, {'@': 96}), 23: (1, {'@': 96}), 24: (1, {'@': 96}), 25: (1, {'@': 96}), 1: (1, {'@': 96}), 4: (1, {'@': 96}), 7: (1, {'@': 96}), 9: (1, {'@': 96}), 13: (1, {'@': 96}), 14: (1, {'@': 96}), 22: (1, {'@': 96})}, 99: {28: (0, 77), 29: (0, 73), 30: (0, 132), 31: (0, 51), 32: (0, 145), 33: (0, 122), 34: (0, 2), 77: (0, 20), 27: (0, 62), 69: (0, 21), 35: (0, 58), 36: (0, 106), 37: (0, 107), 38: (0, 108), 39: (0, 89), 16: (0, 75), 40: (0, 42), 41: (0, 13), 42: (0, 15), 43: (0, 0), 45: (0, 82), 44: (0, 37), 46: (0, 134), 68: (0, 110), 5: (0, 9), 6: (0, 109), 47: (0, 135), 48: (0, 136), 49: (0, 18), 50: (0, 55), 51: (0, 7), 52: (0, 87), 23: (0, 141), 53: (0, 95), 54: (0, 98), 55: (0, 45), 56: (0, 48), 57: (0, 119), 63: (0, 84), 58: (0, 104), 59: (0, 67), 61: (0, 121), 62: (0, 123), 60: (0, 103), 64: (0, 30), 1: (0, 22), 65: (0, 5), 66: (0, 16), 67: (0, 50)}, 100: {63: (0, 24), 78: (0, 6)}, 101: {2: (1, {'@': 109}), 3: (1, {'@': 109}), 5: (1, {'@': 109}), 6: (1, {'@': 109}), 8: (1, {'@': 109}), 10: (1, {'@': 109}), 11: (1, {'@': 109}), 17: (1, {'@': 109}), 16: (1, {'@': 109}), 12: (1, {'@': 109}), 18: (1, {'@': 109}), 15: (1, {'@': 109}), 19: (1, {'@': 109}), 20: (1, {'@': 109}), 21: (1, {'@': 109}), 23: (1, {'@': 109}), 24: (1, {'@': 109}), 25: (1, {'@': 109}), 1: (1, {'@': 109}), 4: (1, {'@': 109}), 7: (1, {'@': 109}), 9: (1, {'@': 109}), 13: (1, {'@': 109}), 14: (1, {'@': 109}), 22: (1, {'@': 109})}, 102: {69: (0, 143), 28: (0, 77), 29: (0, 73), 30: (0, 132), 31: (0, 51), 32: (0, 145), 33: (0, 122), 34: (0, 2), 27: (0, 62), 35: (0, 58), 36: (0, 106), 37: (0, 107), 38: (0, 108), 39: (0, 89), 16: (0, 75), 40: (0, 42), 41: (0, 13), 42: (0, 15), 43: (0, 0), 45: (0, 82), 44: (0, 37), 46: (0, 134), 68: (0, 110), 5: (0, 9), 6: (0, 109), 47: (0, 135), 48: (0, 136), 49: (0, 18), 50: (0, 55), 51: (0, 7), 52: (0, 87), 23: (0, 141), 53: (0, 95), 54: (0, 98), 55: (0, 45), 56: (0, 48), 57: (0, 119), 58: (0, 104), 59: (0, 67), 60: (0, 103), 61: (0, 121), 62: (0, 123), 63: (0, 84), 64: (0, 30), 65: (0, 5), 66: (0, 16), 67: (0, 50)}, 103: {0: (0, 85)}, 104: {2: (1, {'@': 94}), 3: (1, {'@': 94}), 5: (1, {'@': 94}), 6: (1, {'@': 94}), 8: (1, {'@': 94}), 10: (1, {'@': 94}), 11: (1, {'@': 94}), 17: (1, {'@': 94}), 16: (1, {'@': 94}), 12: (1, {'@': 94}), 18: (1, {'@': 94}), 15: (1, {'@': 94}), 19: (1, {'@': 94}), 20: (1, {'@': 94}), 21: (1, {'@': 94}), 23: (1, {'@': 94}), 24: (1, {'@': 94}), 25: (1, {'@': 94}), 1: (1, {'@': 94}), 4: (1, {'@': 94}), 7: (1, {'@': 94}), 9: (1, {'@': 94}), 13: (1, {'@': 94}), 14: (1, {'@': 94}), 22: (1, {'@': 94})}, 105: {28: (0, 77), 29: (0, 73), 30: (0, 132), 31: (0, 51), 32: (0, 145), 33: (0, 122), 34: (0, 2), 27: (0, 62), 35: (0, 58), 36: (0, 106), 37: (0, 107), 38: (0, 108), 39: (0, 89), 16: (0, 75), 40: (0, 42), 41: (0, 13), 42: (0, 15), 43: (0, 0), 45: (0, 82), 44: (0, 37), 46: (0, 134), 5: (0, 9), 6: (0, 109), 47: (0, 135), 48: (0, 136), 49: (0, 18), 50: (0, 55), 51: (0, 7), 52: (0, 87), 23: (0, 141), 53: (0, 95), 54: (0, 98), 55: (0, 45), 56: (0, 48), 57: (0, 119), 58: (0, 104), 59: (0, 67), 60: (0, 103), 61: (0, 121), 62: (0, 123), 63: (0, 84), 68: (0, 71), 64: (0, 30), 65: (0, 5), 66: (0, 16), 67: (0, 50)}, 106: {2: (1, {'@': 97}), 3: (1, {'@': 97}), 5: (1, {'@': 97}), 6: (1, {'@': 97}), 8: (1, {'@': 97}), 10: (1, {'@': 97}), 11: (1, {'@': 97}), 17: (1, {'@': 97}), 16: (1, {'@': 97}), 12: (1, {'@': 97}), 18: (1, {'@': 97}), 15: (1, {'@': 97}), 19: (1, {'@': 97}), 20: (1, {'@': 97}), 21: (1, {'@': 97}), 23: (1, {'@': 97}), 24: (1, {'@': 97}), 25: (1, {'@': 97}), 1: (1, {'@': 97}), 4: (1, {'@': 97}), 7: (1, {'@': 97}), 9: (1, {'@': 97}), 13: (1, {'@': 97}), 14: (1, {'@': 97}), 22: (1, {'@': 97})}, 107: {21: (0, 78), 25: (0, 59), 11: (0, 81), 15: (1, {'@': 73}), 2: (1, {'@': 73}), 3: (1, {'@': 73}), 19: (1, {'@': 73}), 17: (1, {'@': 73}), 5: (1, {'@': 73}), 20: (1, {'@': 73}), 6: (1, {'@': 73}), 8: (1, {'@': 73}), 23: (1, {'@': 73}), 10: (1, {'@': 73}), 24: (1, {'@': 73}), 12: (1, {'@': 73}), 18: (1, {'@': 73}), 1: (1, {'@': 73}), 9: (1, {'@': 73}), 4: (1, {'@': 73}), 7: (1, {'@': 73}), 13: (1, {'@': 73}), 14: (1, {'@': 73}), 22: (1, {'@': 73})}, 108: {28: (0, 77), 29: (0, 73), 30: (0, 132), 31: (0, 51), 32: (0, 145), 69: (0, 14), 33: (0, 122), 34: (0, 2), 27: (0, 62), 35: (0, 58), 36: (0, 106), 37: (0, 107), 38: (0, 108), 39: (0, 89), 16: (0, 75), 40: (0, 42), 41: (0, 13), 42: (0, 15), 43: (0, 0), 45: (0, 82), 44: (0, 37), 46: (0, 134), 68: (0, 110), 5: (0, 9), 6: (0, 109), 47: (0, 135), 48: (0, 136), 49: (0, 18), 50: (0, 55), 51: (0, 7), 52: (0, 87), 23: (0, 141), 53: (0, 95), 54: (0, 98), 55: (0, 45), 56: (0, 48), 57: (0, 119), 58: (0, 104), 59: (0, 67), 60: (0, 103), 61: (0, 121), 62: (0, 123), 63: (0, 84), 64: (0, 30), 65: (0, 5), 66: (0, 16), 67: (0, 50)}, 109: {30: (0, 41), 28: (0, 77), 5: (0, 9), 47: (0, 135), 29: (0, 73), 31: (0, 51), 32: (0, 145), 49: (0, 18), 50: (0, 55), 51: (0, 7), 52: (0, 87), 44: (0, 37), 34: (0, 2), 27: (0, 62), 23: (0, 141), 53: (0, 95), 41: (0, 13), 54: (0, 98), 55: (0, 45), 35: (0, 58), 36: (0, 106), 37: (0, 107), 56: (0, 48), 57: (0, 119), 58: (0, 104), 59: (0, 67), 60: (0, 103), 61: (0, 121), 62: (0, 123), 38: (0, 108), 63: (0, 84), 39: (0, 89), 16: (0, 75), 40: (0, 42), 64: (0, 30), 42: (0, 15), 43: (0, 0), 65: (0, 5), 66: (0, 16), 46: (0, 134), 67: (0, 50)}, 110: {1: (1, {'@': 51}), 14: (1, {'@': 51}), 22: (1, {'@': 51}), 7: (1, {'@': 51}), 4: (1, {'@': 51}), 13: (1, {'@': 51})}, 111: {28: (0, 77), 5: (0, 9), 47: (0, 135), 29: (0, 73), 31: (0, 51), 49: (0, 18), 41: (0, 120), 50: (0, 55), 51: (0, 7), 52: (0, 87), 44: (0, 37), 34: (0, 2), 27: (0, 62), 23: (0, 141), 53: (0, 95), 54: (0, 98), 55: (0, 45), 35: (0, 58), 36: (0, 106), 37: (0, 107), 56: (0, 48), 57: (0, 119), 58: (0, 104), 59: (0, 67), 60: (0, 103), 61: (0, 121), 62: (0, 123), 38: (0, 108), 63: (0, 84), 39: (0, 89), 16: (0, 75), 40: (0, 42), 64: (0, 30), 42: (0, 15), 43: (0, 0), 65: (0, 5), 66: (0, 16), 46: (0, 134), 67: (0, 50)}, 112: {4: (1, {'@': 131}), 22: (1, {'@': 131})}, 113: {2: (1, {'@': 106}), 3: (1, {'@': 106}), 5: (1, {'@': 106}), 6: (1, {'@': 106}), 8: (1, {'@': 106}), 10: (1, {'@': 106}), 11: (1, {'@': 106}), 17: (1, {'@': 106}), 16: (1, {'@': 106}), 12: (1, {'@': 106}), 18: (1, {'@': 106}), 15: (1, {'@': 106}), 19: (1, {'@': 106}), 20: (1, {'@': 106}), 21: (1, {'@': 106}), 23: (1, {'@': 106}), 24: (1, {'@': 106}), 25: (1, {'@': 106}), 1: (1, {'@': 106}), 4: (1, {'@': 106}), 7: (1, {'@': 106}), 9: (1, {'@': 106}), 13: (1, {'@': 106}), 14: (1, {'@': 106}), 22: (1, {'@': 106})}, 114: {2: (1, {'@': 81}), 3: (1, {'@': 81}), 5: (1, {'@': 81}), 6: (1, {'@': 81}), 8: (1, {'@': 81}), 10: (1, {'@': 81}), 11: (1, {'@': 81}), 17: (1, {'@': 81}), 12: (1, {'@': 81}), 18: (1, {'@': 81}), 15: (1, {'@': 81}), 19: (1, {'@': 81}), 20: (1, {'@': 81}), 21: (1, {'@': 81}), 23: (1, {'@': 81}), 24: (1, {'@': 81}), 25: (1, {'@': 81}), 4: (1, {'@': 81}), 7: (1, {'@': 81}), 22: (1, {'@': 81}), 1: (1, {'@': 81}), 9: (1, {'@': 81}), 13: (1, {'@': 81}), 14: (1, {'@': 81})}, 115: {10: (0, 52), 20: (1, {'@': 55}), 17: (1, {'@': 55}), 1: (1, {'@': 55}), 9: (1, {'@': 55}), 14: (1, {'@': 55}), 22: (1, {'@': 55}), 7: (1, {'@': 55}), 4: (1, {'@': 55}), 13: (1, {'@': 55})}, 116: {28: (0, 77), 5: (0, 9), 47: (0, 135), 29: (0, 73), 31: (0, 51), 49: (0, 18), 50: (0, 55), 51: (0, 7), 52: (0, 87), 44: (0, 37), 34: (0, 2), 27: (0, 62), 23: (0, 141), 53: (0, 95), 55: (0, 45), 54: (0, 98), 35: (0, 83), 36: (0, 106), 37: (0, 107), 56: (0, 48), 57: (0, 119), 58: (0, 104), 59: (0, 67), 60: (0, 103), 61: (0, 121), 62: (0, 123), 38: (0, 108), 63: (0, 84), 39: (0, 89), 16: (0, 75), 40: (0, 42), 64: (0, 30), 42: (0, 15), 43: (0, 0), 6: (0, 91), 65: (0, 5), 66: (0, 16), 46: (0, 134), 67: (0, 50)}, 117: {7: (1, {'@': 50})}, 118: {28: (0, 77), 29: (0, 73), 30: (0, 132), 31: (0, 51), 32: (0, 145), 33: (0, 115), 34: (0, 2), 27: (0, 62), 35: (0, 58), 36: (0, 106), 37: (0, 107), 38: (0, 108), 39: (0, 89), 16: (0, 75), 40: (0, 42), 41: (0, 13), 42: (0, 15), 43: (0, 0), 44: (0, 37), 46: (0, 134), 5: (0, 9), 6: (0, 109), 47: (0, 135), 48: (0, 136), 49: (0, 18), 50: (0, 55), 51: (0, 7), 52: (0, 87), 23: (0, 141), 53: (0, 95), 54: (0, 98), 55: (0, 45), 56: (0, 48), 57: (0, 119), 58: (0, 104), 59: (0, 67), 60: (0, 103), 61: (0, 121), 62: (0, 123), 63: (0, 84), 64: (0, 30), 65: (0, 5), 66: (0, 16), 67: (0, 50)}, 119: {2: (1, {'@': 95}), 3: (1, {'@': 95}), 5: (1, {'@': 95}), 6: (1, {'@': 95}), 8: (1, {'@': 95}), 10: (1, {'@': 95}), 11: (1, {'@': 95}), 17: (1, {'@': 95}), 16: (1, {'@': 95}), 12: (1, {'@': 95}), 18: (1, {'@': 95}), 15: (1, {'@': 95}), 19: (1, {'@': 95}), 20: (1, {'@': 95}), 21: (1, {'@': 95}), 23: (1, {'@': 95}), 24: (1, {'@': 95}), 25: (1, {'@': 95}), 1: (1, {'@': 95}), 4: (1, {'@': 95}), 7: (1, {'@': 95}), 9: (1, {'@': 95}), 13: (1, {'@': 95}), 14: (1, {'@': 95}), 22: (1, {'@': 95})}, 120: {8: (0, 116), 15: (1, {'@': 69}), 2: (1, {'@': 69}), 3: (1, {'@': 69}), 19: (1, {'@': 69}), 17: (1, {'@': 69}), 20: (1, {'@': 69}), 6: (1, {'@': 69}), 10: (1, {'@': 69}), 24: (1, {'@': 69}), 12: (1, {'@': 69}), 18: (1, {'@': 69}), 1: (1, {'@': 69}), 9: (1, {'@': 69}), 4: (1, {'@': 69}), 7: (1, {'@': 69}), 13: (1, {'@': 69}), 14: (1, {'@': 69}), 22: (1, {'@': 69})}, 121: {2: (1, {'@': 99}), 3: (1, {'@': 99}), 5: (1, {'@': 99}), 6: (1, {'@': 99}), 8: (1, {'@': 99}), 10: (1, {'@': 99}), 11: (1, {'@': 99}), 17: (1, {'@': 99}), 16: (1, {'@': 99}), 12: (1, {'@': 99}), 18: (1, {'@': 99}), 15: (1, {'@': 99}), 19: (1, {'@': 99}), 20: (1, {'@': 99}), 21: (1, {'@': 99}), 23: (1, {'@': 99}), 24: (1, {'@': 99}), 25: (1, {'@': 99}), 1: (1, {'@': 99}), 4: (1, {'@': 99}), 7: (1, {'@': 99}), 9: (1, {'@': 99}), 13: (1, {'@': 99}), 14: (1, {'@': 99}), 22: (1, {'@': 99})}, 122: {10: (0, 52), 20: (1, {'@': 54}), 17: (1, {'@': 54}), 1: (1, {'@': 54}), 9: (1, {'@': 54}), 14: (1, {'@': 54}), 22: (1, {'@': 54}), 7: (1, {'@': 54}), 4: (1, {'@': 54}), 13: (1, {'@': 54})}, 123: {38: (0, 10)}, 124: {12: (0, 129), 6: (0, 66), 15: (1, {'@': 62}), 2: (1, {'@': 62}), 3: (1, {'@': 62}), 19: (1, {'@': 62}), 20: (1, {'@': 62}), 10: (1, {'@': 62}), 24: (1, {'@': 62}), 17: (1, {'@': 62}), 18: (1, {'@': 62}), 1: (1, {'@': 62}), 9: (1, {'@': 62}), 14: (1, {'@': 62}), 13: (1, {'@': 62}), 4: (1, {'@': 62}), 7: (1, {'@': 62}), 22: (1, {'@': 62})}, 125: {14: (0, 1)}, 126: {12: (0, 129), 6: (0, 66), 15: (1, {'@': 63}), 2: (1, {'@': 63}), 3: (1, {'@': 63}), 19: (1, {'@': 63}), 20: (1, {'@': 63}), 10: (1, {'@': 63}), 24: (1, {'@': 63}), 17: (1, {'@': 63}), 18: (1, {'@': 63}), 1: (1, {'@': 63}), 9: (1, {'@': 63}), 14: (1, {'@': 63}), 13: (1, {'@': 63}), 4: (1, {'@': 63}), 7: (1, {'@': 63}), 22: (1, {'@': 63})}, 127: {2: (1, {'@': 79}), 3: (1, {'@': 79}), 5: (1, {'@': 79}), 6: (1, {'@': 79}), 8: (1, {'@': 79}), 10: (1, {'@': 79}), 11: (1, {'@': 79}), 17: (1, {'@': 79}), 12: (1, {'@': 79}), 18: (1, {'@': 79}), 15: (1, {'@': 79}), 19: (1, {'@': 79}), 20: (1, {'@': 79}), 21: (1, {'@': 79}), 23: (1, {'@': 79}), 24: (1, {'@': 79}), 25: (1, {'@': 79}), 1: (1, {'@': 79}), 9: (1, {'@': 79}), 4: (1, {'@': 79}), 7: (1, {'@': 79}), 13: (1, {'@': 79}), 14: (1, {'@': 79}), 22: (1, {'@': 79})}, 128: {22: (0, 94), 4: (0, 86)}, 129: {28: (0, 77), 5: (0, 9), 47: (0, 135), 29: (0, 73), 31: (0, 51), 49: (0, 18), 50: (0, 55), 51: (0, 7), 52: (0, 87), 44: (0, 37), 34: (0, 2), 27: (0, 62), 23: (0, 141), 67: (0, 50), 53: (0, 95), 41: (0, 74), 54: (0, 98), 55: (0, 45), 35: (0, 58), 36: (0, 106), 37: (0, 107), 56: (0, 48), 57: (0, 119), 58: (0, 104), 59: (0, 67), 60: (0, 103), 61: (0, 121), 62: (0, 123), 38: (0, 108), 63: (0, 84), 39: (0, 89), 16: (0, 75), 40: (0, 42), 64: (0, 30), 42: (0, 15), 43: (0, 0), 65: (0, 5), 66: (0, 16), 46: (0, 134)}, 130: {4: (1, {'@': 132}), 22: (1, {'@': 132})}, 131: {21: (0, 78), 25: (0, 59), 11: (0, 81), 15: (1, {'@': 75}), 2: (1, {'@': 75}), 3: (1, {'@': 75}), 19: (1, {'@': 75}), 17: (1, {'@': 75}), 5: (1, {'@': 75}), 20: (1, {'@': 75}), 6: (1, {'@': 75}), 8: (1, {'@': 75}), 23: (1, {'@': 75}), 10: (1, {'@': 75}), 24: (1, {'@': 75}), 12: (1, {'@': 75}), 18: (1, {'@': 75}), 1: (1, {'@': 75}), 9: (1, {'@': 75}), 4: (1, {'@': 75}), 7: (1, {'@': 75}), 13: (1, {'@': 75}), 14: (1, {'@': 75}), 22: (1, {'@': 75})}, 132: {24: (0, 96), 3: (0, 26), 15: (0, 19), 2: (0, 33), 19: (0, 27), 18: (0, 61), 10: (1, {'@': 58}), 17: (1, {'@': 58}), 20: (1, {'@': 58}), 1: (1, {'@': 58}), 9: (1, {'@': 58}), 14: (1, {'@': 58}), 4: (1, {'@': 58}), 7: (1, {'@': 58}), 13: (1, {'@': 58}), 22: (1, {'@': 58})}, 133: {12: (0, 129), 6: (0, 66), 15: (1, {'@': 61}), 2: (1, {'@': 61}), 3: (1, {'@': 61}), 19: (1, {'@': 61}), 20: (1, {'@': 61}), 10: (1, {'@': 61}), 24: (1, {'@': 61}), 17: (1, {'@': 61}), 18: (1, {'@': 61}), 1: (1, {'@': 61}), 9: (1, {'@': 61}), 14: (1, {'@': 61}), 13: (1, {'@': 61}), 4: (1, {'@': 61}), 7: (1, {'@': 61}), 22: (1, {'@': 61})}, 134: {2: (1, {'@': 119}), 3: (1, {'@': 119}), 5: (1, {'@': 119}), 6: (1, {'@': 119}), 8: (1, {'@': 119}), 10: (1, {'@': 119}), 11: (1, {'@': 119}), 17: (1, {'@': 119}), 16: (1, {'@': 119}), 12: (1, {'@': 119}), 18: (1, {'@': 119}), 15: (1, {'@': 119}), 19: (1, {'@': 119}), 20: (1, {'@': 119}), 21: (1, {'@': 119}), 23: (1, {'@': 119}), 24: (1, {'@': 119}), 25: (1, {'@': 119}), 1: (1, {'@': 119}), 4: (1, {'@': 119}), 7: (1, {'@': 119}), 9: (1, {'@': 119}), 13: (1, {'@': 119}), 14: (1, {'@': 119}), 22: (1, {'@': 119})}, 135: {2: (1, {'@': 85}), 3: (1, {'@': 85}), 5: (1, {'@': 85}), 6: (1, {'@': 85}), 8: (1, {'@': 85}), 10: (1, {'@': 85}), 11: (1, {'@': 85}), 17: (1, {'@': 85}), 16: (1, {'@': 85}), 12: (1, {'@': 85}), 18: (1, {'@': 85}), 15: (1, {'@': 85}), 19: (1, {'@': 85}), 20: (1, {'@': 85}), 21: (1, {'@': 85}), 23: (1, {'@': 85}), 24: (1, {'@': 85}), 25: (1, {'@': 85}), 1: (1, {'@': 85}), 4: (1, {'@': 85}), 7: (1, {'@': 85}), 9: (1, {'@': 85}), 13: (1, {'@': 85}), 14: (1, {'@': 85}), 22: (1, {'@': 85})}, 136: {10: (1, {'@': 56}), 17: (1, {'@': 56}), 20: (1, {'@': 56}), 1: (1, {'@': 56}), 9: (1, {'@': 56}), 14: (1, {'@': 56}), 22: (1, {'@': 56}), 7: (1, {'@': 56}), 4: (1, {'@': 56}), 13: (1, {'@': 56})}, 137: {12: (0, 129), 6: (0, 66), 15: (1, {'@': 64}), 2: (1, {'@': 64}), 3: (1, {'@': 64}), 19: (1, {'@': 64}), 20: (1, {'@': 64}), 10: (1, {'@': 64}), 24: (1, {'@': 64}), 17: (1, {'@': 64}), 18: (1, {'@': 64}), 1: (1, {'@': 64}), 9: (1, {'@': 64}), 14: (1, {'@': 64}), 13: (1, {'@': 64}), 4: (1, {'@': 64}), 7: (1, {'@': 64}), 22: (1, {'@': 64})}, 138: {12: (0, 129), 6: (0, 66), 15: (1, {'@': 65}), 2: (1, {'@': 65}), 3: (1, {'@': 65}), 19: (1, {'@': 65}), 20: (1, {'@': 65}), 10: (1, {'@': 65}), 24: (1, {'@': 65}), 17: (1, {'@': 65}), 18: (1, {'@': 65}), 1: (1, {'@': 65}), 9: (1, {'@': 65}), 14: (1, {'@': 65}), 13: (1, {'@': 65}), 4: (1, {'@': 65}), 7: (1, {'@': 65}), 22: (1, {'@': 65})}, 139: {12: (0, 129), 6: (0, 66), 15: (1, {'@': 66}), 2: (1, {'@': 66}), 3: (1, {'@': 66}), 19: (1, {'@': 66}), 20: (1, {'@': 66}), 10: (1, {'@': 66}), 24: (1, {'@': 66}), 17: (1, {'@': 66}), 18: (1, {'@': 66}), 1: (1, {'@': 66}), 9: (1, {'@': 66}), 14: (1, {'@': 66}), 13: (1, {'@': 66}), 4: (1, {'@': 66}), 7: (1, {'@': 66}), 22: (1, {'@': 66})}, 140: {7: (1, {'@': 49})}, 141: {28: (0, 77), 65: (0, 25), 5: (0, 9), 47: (0, 135), 29: (0, 73), 31: (0, 51), 49: (0, 18), 50: (0, 55), 51: (0, 7), 52: (0, 87), 44: (0, 37), 34: (0, 2), 27: (0, 62), 23: (0, 141), 53: (0, 95), 55: (0, 45), 54: (0, 98), 36: (0, 106), 56: (0, 48), 57: (0, 119), 58: (0, 104), 59: (0, 67), 60: (0, 103), 61: (0, 121), 62: (0, 123), 38: (0, 108), 63: (0, 84), 39: (0, 89), 16: (0, 75), 40: (0, 42), 64: (0, 30), 42: (0, 15), 43: (0, 0), 66: (0, 16), 46: (0, 134), 67: (0, 50)}, 142: {28: (0, 77), 79: (0, 72), 80: (0, 34), 29: (0, 73), 30: (0, 132), 31: (0, 51), 32: (0, 145), 33: (0, 122), 34: (0, 2), 27: (0, 62), 35: (0, 58), 36: (0, 106), 37: (0, 107), 38: (0, 108), 39: (0, 89), 16: (0, 75), 40: (0, 42), 41: (0, 13), 42: (0, 15), 43: (0, 0), 81: (0, 47), 45: (0, 82), 44: (0, 37), 46: (0, 134), 68: (0, 110), 5: (0, 9), 6: (0, 109), 47: (0, 135), 48: (0, 136), 49: (0, 18), 50: (0, 55), 51: (0, 7), 52: (0, 87), 69: (0, 92), 23: (0, 141), 53: (0, 95), 54: (0, 98), 55: (0, 45), 82: (0, 100), 56: (0, 48), 57: (0, 119), 58: (0, 104), 59: (0, 67), 60: (0, 103), 61: (0, 121), 62: (0, 123), 63: (0, 84), 64: (0, 30), 65: (0, 5), 66: (0, 16), 67: (0, 50)}, 143: {4: (1, {'@': 126}), 22: (1, {'@': 126})}, 144: {5: (0, 63), 23: (0, 23), 15: (1, {'@': 72}), 2: (1, {'@': 72}), 3: (1, {'@': 72}), 12: (1, {'@': 72}), 19: (1, {'@': 72}), 20: (1, {'@': 72}), 6: (1, {'@': 72}), 8: (1, {'@': 72}), 10: (1, {'@': 72}), 24: (1, {'@': 72}), 17: (1, {'@': 72}), 18: (1, {'@': 72}), 1: (1, {'@': 72}), 9: (1, {'@': 72}), 4: (1, {'@': 72}), 7: (1, {'@': 72}), 13: (1, {'@': 72}), 14: (1, {'@': 72}), 22: (1, {'@': 72})}, 145: {6: (0, 66), 12: (0, 129), 15: (1, {'@': 60}), 2: (1, {'@': 60}), 3: (1, {'@': 60}), 19: (1, {'@': 60}), 20: (1, {'@': 60}), 10: (1, {'@': 60}), 24: (1, {'@': 60}), 17: (1, {'@': 60}), 18: (1, {'@': 60}), 1: (1, {'@': 60}), 9: (1, {'@': 60}), 14: (1, {'@': 60}), 13: (1, {'@': 60}), 4: (1, {'@': 60}), 7: (1, {'@': 60}), 22: (1, {'@': 60})}}, 'start_states': {'root': 142}, 'end_states': {'root': 47}}, '__type__': 'ParsingFrontend'}, 'rules': [{'@': 46}, {'@': 47}, {'@': 48}, {'@': 49}, {'@': 50}, {'@': 51}, {'@': 52}, {'@': 53}, {'@': 54}, {'@': 55}, {'@': 56}, {'@': 57}, {'@': 58}, {'@': 59}, {'@': 60}, {'@': 61}, {'@': 62}, {'@': 63}, {'@': 64}, {'@': 65}, {'@': 66}, {'@': 67}, {'@': 68}, {'@': 69}, {'@': 70}, {'@': 71}, {'@': 72}, {'@': 73}, {'@': 74}, {'@': 75}, {'@': 76}, {'@': 77}, {'@': 78}, {'@': 79}, {'@': 80}, {'@': 81}, {'@': 82}, {'@': 83}, {'@': 84}, {'@': 85}, {'@': 86}, {'@': 87}, {'@': 88}, {'@': 89}, {'@': 90}, {'@': 91}, {'@': 92}, {'@': 93}, {'@': 94}, {'@': 95}, {'@': 96}, {'@': 97}, {'@': 98}, {'@': 99}, {'@': 100}, {'@': 101}, {'@': 102}, {'@': 103}, {'@': 104}, {'@': 105}, {'@': 106}, {'@': 107}, {'@': 108}, {'@': 109}, {'@': 110}, {'@': 111}, {'@': 112}, {'@': 113}, {'@': 114}, {'@': 115}, {'@': 116}, {'@': 117}, {'@': 118}, {'@': 119}, {'@': 120}, {'@': 121}, {'@': 122}, {'@': 123}, {'@': 124}, {'@': 125}, {'@': 126}, {'@': 127}, {'@': 128}, {'@': 129}, {'@': 130}, {'@': 131}, {'@': 132}], 'options': {'debug': False, 'strict': False, 'keep_all_tokens': False, 'tree_class': None, 'cache': False, 'postlex': None, 'parser': 'lalr', 'lexer': 'contextual', 'transformer': None, 'start': ['root'], 'priority': 'normal', 'ambiguity': 'auto', 'regex': False, 'propagate_positions': False, 'lexer_callbacks': {}, 'maybe_placeholders': True, 'edit_terminals': None, 'g_regex_flags': 0, 'use_bytes': False, 'ordered_sets': True, 'import_paths': [], 'source_path': None, '_plugins': {}}, '__type__': 'Lark'}
+MEMO = {0: {'name': 'WS', 'pattern': {'value': '(?:[ \t\x0c\r\n])+', 'flags': [], 'raw': None, '_width': [1, 18446744073709551616], '__type__': 'PatternRE'}, 'priority': 0, '__type__': 'TerminalDef'}, 1: {'name': 'ATTRIBUTE_PATH', 'pattern': {'value': '(?:\\.(?:(?:[A-Z]|[a-z])|_)(?:(?:(?:[A-Z]|[a-z])|[0-9]|_))*)+', 'flags': [], 'raw': None, '_width': [2, 18446744073709551616], '__type__': 'PatternRE'}, 'priority': 0, '__type__': 'TerminalDef'}, 2: {'name': 'FN_NAME_WITH_TRANSFORM', 'pattern': {'value': '(?:(?:[A-Z]|[a-z])|_)(?:(?:(?:[A-Z]|[a-z])|[0-9]|_))*(?:\\.(?:(?:[A-Z]|[a-z])|_)(?:(?:(?:[A-Z]|[a-z])|[0-9]|_))*)?', 'flags': [], 'raw': None, '_width': [1, 18446744073709551616], '__type__': 'PatternRE'}, 'priority': 0, '__type__': 'TerminalDef'}, 3: {'name': 'PARTIAL_JSONPATH_EXPR', 'pattern': {'value': '(?:\\.(\\.)?(?:[a-zA-Z_][a-zA-Z0-9_]*|\\*|\'[^\']*\'|"[^"]*"|\\[[^\\]]+\\]|\\`[^\\`]*\\`)|\\.\\.|\\[[^\\]]+\\])+', 'flags': [], 'raw': '/(?:\\.(\\.)?(?:[a-zA-Z_][a-zA-Z0-9_]*|\\*|\'[^\']*\'|"[^"]*"|\\[[^\\]]+\\]|\\`[^\\`]*\\`)|\\.\\.|\\[[^\\]]+\\])+/', '_width': [2, 18446744073709551616], '__type__': 'PatternRE'}, 'priority': 0, '__type__': 'TerminalDef'}, 4: {'name': 'TYPE_SPECIFIER', 'pattern': {'value': '(?:float|bool|int|str)', 'flags': [], 'raw': None, '_width': [3, 5], '__type__': 'PatternRE'}, 'priority': 0, '__type__': 'TerminalDef'}, 5: {'name': 'STRING_LITERAL', 'pattern': {'value': '(?:\'(?:[^\'\\\\]|\\\\.)*\'|"(?:[^"\\\\]|\\\\.)*")', 'flags': [], 'raw': None, '_width': [2, 18446744073709551616], '__type__': 'PatternRE'}, 'priority': 0, '__type__': 'TerminalDef'}, 6: {'name': 'BOOL_LITERAL', 'pattern': {'value': '(?:False|True)', 'flags': [], 'raw': None, '_width': [4, 5], '__type__': 'PatternRE'}, 'priority': 0, '__type__': 'TerminalDef'}, 7: {'name': 'NUMERIC_LITERAL', 'pattern': {'value': '\\d+(\\.\\d+)?', 'flags': [], 'raw': '/\\d+(\\.\\d+)?/', '_width': [1, 18446744073709551616], '__type__': 'PatternRE'}, 'priority': 0, '__type__': 'TerminalDef'}, 8: {'name': 'NONE_LITERAL', 'pattern': {'value': 'None', 'flags': [], 'raw': '"None"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 9: {'name': '__ANON_0', 'pattern': {'value': '->', 'flags': [], 'raw': '"->"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 10: {'name': 'FOR', 'pattern': {'value': 'for', 'flags': [], 'raw': '"for"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 11: {'name': 'IN', 'pattern': {'value': 'in', 'flags': [], 'raw': '"in"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 12: {'name': 'IF', 'pattern': {'value': 'if', 'flags': [], 'raw': '"if"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 13: {'name': 'ELSE', 'pattern': {'value': 'else', 'flags': [], 'raw': '"else"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 14: {'name': '__ANON_1', 'pattern': {'value': '||', 'flags': [], 'raw': '"||"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 15: {'name': '__ANON_2', 'pattern': {'value': '&&', 'flags': [], 'raw': '"&&"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 16: {'name': 'NOT', 'pattern': {'value': 'not', 'flags': [], 'raw': '"not"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 17: {'name': '__ANON_3', 'pattern': {'value': '==', 'flags': [], 'raw': '"=="', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 18: {'name': '__ANON_4', 'pattern': {'value': '!=', 'flags': [], 'raw': '"!="', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 19: {'name': 'MORETHAN', 'pattern': {'value': '>', 'flags': [], 'raw': '">"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 20: {'name': '__ANON_5', 'pattern': {'value': '>=', 'flags': [], 'raw': '">="', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 21: {'name': 'LESSTHAN', 'pattern': {'value': '<', 'flags': [], 'raw': '"<"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 22: {'name': '__ANON_6', 'pattern': {'value': '<=', 'flags': [], 'raw': '"<="', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 23: {'name': 'IS', 'pattern': {'value': 'is', 'flags': [], 'raw': '"is"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 24: {'name': 'PLUS', 'pattern': {'value': '+', 'flags': [], 'raw': '"+"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 25: {'name': 'MINUS', 'pattern': {'value': '-', 'flags': [], 'raw': '"-"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 26: {'name': 'STAR', 'pattern': {'value': '*', 'flags': [], 'raw': '"*"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 27: {'name': 'SLASH', 'pattern': {'value': '/', 'flags': [], 'raw': '"/"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 28: {'name': 'PERCENT', 'pattern': {'value': '%', 'flags': [], 'raw': '"%"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 29: {'name': 'LPAR', 'pattern': {'value': '(', 'flags': [], 'raw': '"("', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 30: {'name': 'RPAR', 'pattern': {'value': ')', 'flags': [], 'raw': '")"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 31: {'name': 'LSQB', 'pattern': {'value': '[', 'flags': [], 'raw': '"["', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 32: {'name': 'RSQB', 'pattern': {'value': ']', 'flags': [], 'raw': '"]"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 33: {'name': 'COMMA', 'pattern': {'value': ',', 'flags': [], 'raw': '","', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 34: {'name': 'ACTIONS', 'pattern': {'value': 'ACTIONS', 'flags': [], 'raw': '"ACTIONS"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 35: {'name': 'SECRETS', 'pattern': {'value': 'SECRETS', 'flags': [], 'raw': '"SECRETS"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 36: {'name': 'VARS', 'pattern': {'value': 'VARS', 'flags': [], 'raw': '"VARS"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 37: {'name': 'ENV', 'pattern': {'value': 'ENV', 'flags': [], 'raw': '"ENV"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 38: {'name': 'VAR', 'pattern': {'value': 'var', 'flags': [], 'raw': '"var"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 39: {'name': 'TRIGGER', 'pattern': {'value': 'TRIGGER', 'flags': [], 'raw': '"TRIGGER"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 40: {'name': '__ANON_7', 'pattern': {'value': 'FN.', 'flags': [], 'raw': '"FN."', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 41: {'name': 'INPUTS', 'pattern': {'value': 'inputs', 'flags': [], 'raw': '"inputs"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 42: {'name': 'STEPS', 'pattern': {'value': 'steps', 'flags': [], 'raw': '"steps"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 43: {'name': 'LBRACE', 'pattern': {'value': '{', 'flags': [], 'raw': '"{"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 44: {'name': 'RBRACE', 'pattern': {'value': '}', 'flags': [], 'raw': '"}"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 45: {'name': 'COLON', 'pattern': {'value': ':', 'flags': [], 'raw': '":"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 46: {'origin': {'name': Token('RULE', 'root'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'expression', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 47: {'origin': {'name': Token('RULE', 'root'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'trailing_typecast_expression', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 48: {'origin': {'name': Token('RULE', 'root'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'iterator', '__type__': 'NonTerminal'}], 'order': 2, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 49: {'origin': {'name': Token('RULE', 'trailing_typecast_expression'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'expression', '__type__': 'NonTerminal'}, {'name': '__ANON_0', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'TYPE_SPECIFIER', 'filter_out': False, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 50: {'origin': {'name': Token('RULE', 'iterator'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'FOR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'local_vars_assignment', '__type__': 'NonTerminal'}, {'name': 'IN', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'expression', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 51: {'origin': {'name': Token('RULE', 'expression'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'ternary_expr', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 52: {'origin': {'name': Token('RULE', 'ternary_expr'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'or_expr', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 53: {'origin': {'name': Token('RULE', 'ternary_expr'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'or_expr', '__type__': 'NonTerminal'}, {'name': 'IF', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'or_expr', '__type__': 'NonTerminal'}, {'name': 'ELSE', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'ternary_expr', '__type__': 'NonTerminal'}], 'order': 1, 'alias': 'ternary', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 54: {'origin': {'name': Token('RULE', 'or_expr'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'and_expr', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 55: {'origin': {'name': Token('RULE', 'or_expr'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'or_expr', '__type__': 'NonTerminal'}, {'name': '__ANON_1', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'and_expr', '__type__': 'NonTerminal'}], 'order': 1, 'alias': 'or_op', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 56: {'origin': {'name': Token('RULE', 'and_expr'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'not_expr', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 57: {'origin': {'name': Token('RULE', 'and_expr'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'and_expr', '__type__': 'NonTerminal'}, {'name': '__ANON_2', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'not_expr', '__type__': 'NonTerminal'}], 'order': 1, 'alias': 'and_op', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 58: {'origin': {'name': Token('RULE', 'not_expr'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'comparison_expr', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 59: {'origin': {'name': Token('RULE', 'not_expr'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'NOT', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'comparison_expr', '__type__': 'NonTerminal'}], 'order': 1, 'alias': 'not_op', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 60: {'origin': {'name': Token('RULE', 'comparison_expr'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'inclusion_expr', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 61: {'origin': {'name': Token('RULE', 'comparison_expr'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'comparison_expr', '__type__': 'NonTerminal'}, {'name': '__ANON_3', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'inclusion_expr', '__type__': 'NonTerminal'}], 'order': 1, 'alias': 'eq_op', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 62: {'origin': {'name': Token('RULE', 'comparison_expr'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'comparison_expr', '__type__': 'NonTerminal'}, {'name': '__ANON_4', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'inclusion_expr', '__type__': 'NonTerminal'}], 'order': 2, 'alias': 'ne_op', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 63: {'origin': {'name': Token('RULE', 'comparison_expr'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'comparison_expr', '__type__': 'NonTerminal'}, {'name': 'MORETHAN', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'inclusion_expr', '__type__': 'NonTerminal'}], 'order': 3, 'alias': 'gt_op', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 64: {'origin': {'name': Token('RULE', 'comparison_expr'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'comparison_expr', '__type__': 'NonTerminal'}, {'name': '__ANON_5', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'inclusion_expr', '__type__': 'NonTerminal'}], 'order': 4, 'alias': 'ge_op', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 65: {'origin': {'name': Token('RULE', 'comparison_expr'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'comparison_expr', '__type__': 'NonTerminal'}, {'name': 'LESSTHAN', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'inclusion_expr', '__type__': 'NonTerminal'}], 'order': 5, 'alias': 'lt_op', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 66: {'origin': {'name': Token('RULE', 'comparison_expr'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'comparison_expr', '__type__': 'NonTerminal'}, {'name': '__ANON_6', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'inclusion_expr', '__type__': 'NonTerminal'}], 'order': 6, 'alias': 'le_op', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 67: {'origin': {'name': Token('RULE', 'inclusion_expr'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'identity_expr', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 68: {'origin': {'name': Token('RULE', 'inclusion_expr'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'inclusion_expr', '__type__': 'NonTerminal'}, {'name': 'IN', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'identity_expr', '__type__': 'NonTerminal'}], 'order': 1, 'alias': 'in_op', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 69: {'origin': {'name': Token('RULE', 'inclusion_expr'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'inclusion_expr', '__type__': 'NonTerminal'}, {'name': 'NOT', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'IN', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'identity_expr', '__type__': 'NonTerminal'}], 'order': 2, 'alias': 'not_in_op', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 70: {'origin': {'name': Token('RULE', 'identity_expr'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'addition_expr', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 71: {'origin': {'name': Token('RULE', 'identity_expr'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'identity_expr', '__type__': 'NonTerminal'}, {'name': 'IS', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'addition_expr', '__type__': 'NonTerminal'}], 'order': 1, 'alias': 'is_op', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 72: {'origin': {'name': Token('RULE', 'identity_expr'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'identity_expr', '__type__': 'NonTerminal'}, {'name': 'IS', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'NOT', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'addition_expr', '__type__': 'NonTerminal'}], 'order': 2, 'alias': 'is_not_op', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 73: {'origin': {'name': Token('RULE', 'addition_expr'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'multiplication_expr', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 74: {'origin': {'name': Token('RULE', 'addition_expr'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'addition_expr', '__type__': 'NonTerminal'}, {'name': 'PLUS', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'multiplication_expr', '__type__': 'NonTerminal'}], 'order': 1, 'alias': 'add_op', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 75: {'origin': {'name': Token('RULE', 'addition_expr'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'addition_expr', '__type__': 'NonTerminal'}, {'name': 'MINUS', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'multiplication_expr', '__type__': 'NonTerminal'}], 'order': 2, 'alias': 'sub_op', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 76: {'origin': {'name': Token('RULE', 'multiplication_expr'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'unary_expr', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 77: {'origin': {'name': Token('RULE', 'multiplication_expr'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'multiplication_expr', '__type__': 'NonTerminal'}, {'name': 'STAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'unary_expr', '__type__': 'NonTerminal'}], 'order': 1, 'alias': 'mul_op', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 78: {'origin': {'name': Token('RULE', 'multiplication_expr'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'multiplication_expr', '__type__': 'NonTerminal'}, {'name': 'SLASH', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'unary_expr', '__type__': 'NonTerminal'}], 'order': 2, 'alias': 'div_op', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 79: {'origin': {'name': Token('RULE', 'multiplication_expr'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'multiplication_expr', '__type__': 'NonTerminal'}, {'name': 'PERCENT', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'unary_expr', '__type__': 'NonTerminal'}], 'order': 3, 'alias': 'mod_op', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 80: {'origin': {'name': Token('RULE', 'unary_expr'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'primary_expr', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 81: {'origin': {'name': Token('RULE', 'unary_expr'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'MINUS', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'unary_expr', '__type__': 'NonTerminal'}], 'order': 1, 'alias': 'neg_op', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 82: {'origin': {'name': Token('RULE', 'unary_expr'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'PLUS', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'unary_expr', '__type__': 'NonTerminal'}], 'order': 2, 'alias': 'pos_op', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 83: {'origin': {'name': Token('RULE', 'primary_expr'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'base_expr', '__type__': 'NonTerminal'}, {'name': '__primary_expr_star_0', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 84: {'origin': {'name': Token('RULE', 'primary_expr'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'base_expr', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 85: {'origin': {'name': Token('RULE', 'base_expr'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'atom', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 86: {'origin': {'name': Token('RULE', 'base_expr'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'TYPE_SPECIFIER', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'LPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'expression', '__type__': 'NonTerminal'}, {'name': 'RPAR', 'filter_out': True, '__type__': 'Terminal'}], 'order': 1, 'alias': 'typecast', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 87: {'origin': {'name': Token('RULE', 'base_expr'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'LPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'expression', '__type__': 'NonTerminal'}, {'name': 'RPAR', 'filter_out': True, '__type__': 'Terminal'}], 'order': 2, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 88: {'origin': {'name': Token('RULE', 'indexer'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'LSQB', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'expression', '__type__': 'NonTerminal'}, {'name': 'RSQB', 'filter_out': True, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 89: {'origin': {'name': Token('RULE', 'atom'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'context', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 90: {'origin': {'name': Token('RULE', 'atom'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'literal', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 91: {'origin': {'name': Token('RULE', 'atom'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'list', '__type__': 'NonTerminal'}], 'order': 2, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 92: {'origin': {'name': Token('RULE', 'atom'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'dict', '__type__': 'NonTerminal'}], 'order': 3, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 93: {'origin': {'name': Token('RULE', 'context'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'actions', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 94: {'origin': {'name': Token('RULE', 'context'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'secrets', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 95: {'origin': {'name': Token('RULE', 'context'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'vars', '__type__': 'NonTerminal'}], 'order': 2, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 96: {'origin': {'name': Token('RULE', 'context'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'env', '__type__': 'NonTerminal'}], 'order': 3, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 97: {'origin': {'name': Token('RULE', 'context'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'local_vars', '__type__': 'NonTerminal'}], 'order': 4, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 98: {'origin': {'name': Token('RULE', 'context'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'trigger', '__type__': 'NonTerminal'}], 'order': 5, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 99: {'origin': {'name': Token('RULE', 'context'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'function', '__type__': 'NonTerminal'}], 'order': 6, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 100: {'origin': {'name': Token('RULE', 'context'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'template_action_inputs', '__type__': 'NonTerminal'}], 'order': 7, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 101: {'origin': {'name': Token('RULE', 'context'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'template_action_steps', '__type__': 'NonTerminal'}], 'order': 8, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 102: {'origin': {'name': Token('RULE', 'arg_list'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'expression', '__type__': 'NonTerminal'}, {'name': '__arg_list_star_1', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 103: {'origin': {'name': Token('RULE', 'arg_list'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'expression', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 104: {'origin': {'name': Token('RULE', 'arg_list'), '__type__': 'NonTerminal'}, 'expansion': [], 'order': 2, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 105: {'origin': {'name': Token('RULE', 'actions'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'ACTIONS', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'PARTIAL_JSONPATH_EXPR', 'filter_out': False, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 106: {'origin': {'name': Token('RULE', 'secrets'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'SECRETS', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'ATTRIBUTE_PATH', 'filter_out': False, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 107: {'origin': {'name': Token('RULE', 'vars'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'VARS', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'ATTRIBUTE_PATH', 'filter_out': False, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 108: {'origin': {'name': Token('RULE', 'env'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'ENV', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'PARTIAL_JSONPATH_EXPR', 'filter_out': False, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 109: {'origin': {'name': Token('RULE', 'local_vars'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'VAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'PARTIAL_JSONPATH_EXPR', 'filter_out': False, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 110: {'origin': {'name': Token('RULE', 'trigger'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'TRIGGER', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'PARTIAL_JSONPATH_EXPR', 'filter_out': False, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 111: {'origin': {'name': Token('RULE', 'trigger'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'TRIGGER', 'filter_out': True, '__type__': 'Terminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (False, True), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 112: {'origin': {'name': Token('RULE', 'function'), '__type__': 'NonTerminal'}, 'expansion': [{'name': '__ANON_7', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'FN_NAME_WITH_TRANSFORM', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'LPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'arg_list', '__type__': 'NonTerminal'}, {'name': 'RPAR', 'filter_out': True, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 113: {'origin': {'name': Token('RULE', 'function'), '__type__': 'NonTerminal'}, 'expansion': [{'name': '__ANON_7', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'FN_NAME_WITH_TRANSFORM', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'LPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'RPAR', 'filter_out': True, '__type__': 'Terminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (False, False, False, True, False), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 114: {'origin': {'name': Token('RULE', 'local_vars_assignment'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'VAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'ATTRIBUTE_PATH', 'filter_out': False, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 115: {'origin': {'name': Token('RULE', 'template_action_inputs'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'INPUTS', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'PARTIAL_JSONPATH_EXPR', 'filter_out': False, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 116: {'origin': {'name': Token('RULE', 'template_action_steps'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'STEPS', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'PARTIAL_JSONPATH_EXPR', 'filter_out': False, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 117: {'origin': {'name': Token('RULE', 'literal'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'STRING_LITERAL', 'filter_out': False, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 118: {'origin': {'name': Token('RULE', 'literal'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'BOOL_LITERAL', 'filter_out': False, '__type__': 'Terminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 119: {'origin': {'name': Token('RULE', 'literal'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'NUMERIC_LITERAL', 'filter_out': False, '__type__': 'Terminal'}], 'order': 2, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 120: {'origin': {'name': Token('RULE', 'literal'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'NONE_LITERAL', 'filter_out': False, '__type__': 'Terminal'}], 'order': 3, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 121: {'origin': {'name': Token('RULE', 'list'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'LSQB', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'arg_list', '__type__': 'NonTerminal'}, {'name': 'RSQB', 'filter_out': True, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 122: {'origin': {'name': Token('RULE', 'list'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'LSQB', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'RSQB', 'filter_out': True, '__type__': 'Terminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (False, True, False), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 123: {'origin': {'name': Token('RULE', 'dict'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'LBRACE', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'kvpair', '__type__': 'NonTerminal'}, {'name': '__dict_star_2', '__type__': 'NonTerminal'}, {'name': 'RBRACE', 'filter_out': True, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 124: {'origin': {'name': Token('RULE', 'dict'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'LBRACE', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'kvpair', '__type__': 'NonTerminal'}, {'name': 'RBRACE', 'filter_out': True, '__type__': 'Terminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 125: {'origin': {'name': Token('RULE', 'dict'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'LBRACE', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'RBRACE', 'filter_out': True, '__type__': 'Terminal'}], 'order': 2, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (False, True, False), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 126: {'origin': {'name': Token('RULE', 'kvpair'), '__type__': 'NonTerminal'}, 'expansion': [{'name': 'STRING_LITERAL', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'COLON', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'expression', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 127: {'origin': {'name': '__primary_expr_star_0', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'indexer', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 128: {'origin': {'name': '__primary_expr_star_0', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__primary_expr_star_0', '__type__': 'NonTerminal'}, {'name': 'indexer', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 129: {'origin': {'name': '__arg_list_star_1', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'COMMA', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'expression', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 130: {'origin': {'name': '__arg_list_star_1', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__arg_list_star_1', '__type__': 'NonTerminal'}, {'name': 'COMMA', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'expression', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 131: {'origin': {'name': '__dict_star_2', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'COMMA', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'kvpair', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 132: {'origin': {'name': '__dict_star_2', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__dict_star_2', '__type__': 'NonTerminal'}, {'name': 'COMMA', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'kvpair', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}}
@@ -0,0 +1,368 @@
+"""Compile parsed expressions into Python closures.
+
+`ExprEvaluator` walks the Lark tree on every evaluation, dispatching one
+callback per node. The compiler walks the tree once and produces a nested
+closure that takes an `ExprOperand` and returns the value, so repeated
+evaluations of the same expression (loops, scatters, run_if conditions) only
+pay for the work that actually depends on the operand.
+
+`ExprEvaluator` remains the reference implementation: the compiled closure must
+return the same values and raise the same errors for every tree.
+"""
+
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Sequence
+from typing import Any
+
+from lark import Token, Tree
+from lark.exceptions import VisitError
+
+from tracecat.exceptions import TracecatExpressionError
+from tracecat.expressions import functions
+from tracecat.expressions.common import (
+    MAX_VARS_PATH_DEPTH,
+    ExprContext,
+    ExprOperand,
+    IterableExpr,
+    eval_jsonpath,
+)
+from tracecat.expressions.parser.evaluator import ExprEvaluator, apply_index
+from tracecat.logger import logger
+
+type CompiledExpr = Callable[[ExprOperand[str] | None], Any]
+type _Node = Callable[[ExprOperand[str]], Any]
+
+_COMPILE_CACHE_MAXSIZE = 2048
+
+_CONTEXT_RULES: dict[str, ExprContext] = {
+    "actions": ExprContext.ACTIONS,
+    "secrets": ExprContext.SECRETS,
+    "vars": ExprContext.VARS,
+    "env": ExprContext.ENV,
+    "local_vars": ExprContext.LOCAL_VARS,
+    "trigger": ExprContext.TRIGGER,
+    "template_action_inputs": ExprContext.TEMPLATE_ACTION_INPUTS,
+    "template_action_steps": ExprContext.TEMPLATE_ACTION_STEPS,
+}
+
+_BINARY_OPERATORS: dict[str, str] = {
+    "or_op": "||",
+    "and_op": "&&",
+    "eq_op": "==",
+    "ne_op": "!=",
+    "gt_op": ">",
+    "ge_op": ">=",
+    "lt_op": "<",
+    "le_op": "<=",
+    "in_op": "in",
+    "not_in_op": "not in",
+    "is_op": "is",
+    "is_not_op": "is not",
+    "add_op": "+",
+    "sub_op": "-",
+    "mul_op": "*",
+    "div_op": "/",
+    "mod_op": "%",
+}
+
+
+def _typecast(typename: str, value: Any) -> Any:
+    return functions.cast(value, typename)
+
+
+def _function(fn_name: str, fn_args: Sequence[Any] | None) -> Any:
+    is_mapped = fn_name.endswith(".map")
+    fn_name = fn_name.rsplit(".", 1)[0] if is_mapped else fn_name
+    if fn_args is None:
+        fn_args = ()
+    fn = functions.FUNCTION_MAPPING.get(fn_name)
+    if fn is None:
+        raise TracecatExpressionError(f"Unknown function {fn_name!r}")
+    final_fn = fn.map if is_mapped else fn  # pyright: ignore[reportFunctionMemberAccess] # type: ignore[possibly-missing-attribute]
+    return final_fn(*fn_args)
+
+
+def _iterator(iter_var_expr: str, collection: Any) -> IterableExpr[Any]:
+    if not hasattr(collection, "__iter__"):
+        raise ValueError(
+            f"Invalid iterator collection: {collection!r}. Must be an iterable."
+        )
+    return IterableExpr(iter_var_expr, collection)
+
+
+_RULE_HANDLERS: dict[str, Callable[..., Any]] = {
+    "trailing_typecast_expression": lambda value, typename: functions.cast(
+        value, typename
+    ),
+    "typecast": _typecast,
+    "iterator": _iterator,
+    "local_vars_assignment": lambda jsonpath: jsonpath,
+    "indexer": lambda index: index,
+    "list": lambda *args: list(*args),
+    "dict": lambda *args: dict(args),
+    "kvpair": lambda *args: args,
+    "arg_list": lambda *args: args,
+    "function": _function,
+    "not_op": lambda value: not value,
+    "neg_op": lambda value: -value,
+    "pos_op": lambda value: +value,
+}
+
+_TOKEN_HANDLERS: dict[str, Callable[[Token], Any]] = {
+    "PARTIAL_JSONPATH_EXPR": lambda token: token.value,
+    "JSONPATH_INDEX": lambda token: token.value,
+    "CNAME": lambda token: token.value,
+    "OPERATOR": lambda token: token.value,
+    "STRING_LITERAL": lambda token: token.value[1:-1],
+    "NUMERIC_LITERAL": lambda token: (
+        int(token.value) if token.value.isdigit() else float(token.value)
+    ),
+    "TYPE_SPECIFIER": lambda token: token.value,
+    "BOOL_LITERAL": lambda token: functions.cast(token.value, "bool"),
+    "NONE_LITERAL": lambda token: None,
+    "FN_NAME_WITH_TRANSFORM": lambda token: token.value,
+    "ATTRIBUTE_PATH": lambda token: token.value,
+    "ATTRIBUTE_ACCESS": lambda token: token.value,
+    "BRACKET_ACCESS": lambda token: token.value,
+}
+
+
+class _Constant:
+    """Marker wrapper for compile-time constant nodes."""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: Any) -> None:
+        self.value = value
+
+    def __call__(self, operand: ExprOperand[str]) -> Any:
+        return self.value
+
+
+def _raise_visit_error(rule: str, obj: Any, exc: Exception) -> _Node:
+    def node(operand: ExprOperand[str]) -> Any:
+        raise VisitError(rule, obj, exc) from exc
+
+    return node
+
+
+class ExprCompiler:
+    """Compile expression parse trees into reusable closures.
+
+    Compiled closures are cached per expression source so that a template
+    evaluated once per loop iteration or scatter item is only compiled once per
+    process.
+    """
+
+    def __init__(self, *, cache_maxsize: int = _COMPILE_CACHE_MAXSIZE) -> None:
+        self._cache: OrderedDict[tuple[str, bool], CompiledExpr] = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._cache_maxsize = cache_maxsize
+
+    def get_or_compile(
+        self, expression: str, tree: Tree[Token], *, strict: bool = False
+    ) -> CompiledExpr:
+        """Return the compiled closure for ``expression``, compiling on a miss.
+
+        ``tree`` must be the parse tree of ``expression``.
+        """
+        key = (expression, strict)
+        with self._cache_lock:
+            if (compiled := self._cache.get(key)) is not None:
+                self._cache.move_to_end(key)
+                return compiled
+
+        compiled = self.compile(tree, strict=strict)
+        if self._cache_maxsize > 0:
+            with self._cache_lock:
+                self._cache[key] = compiled
+                if len(self._cache) > self._cache_maxsize:
+                    self._cache.popitem(last=False)
+        return compiled
+
+    def cache_clear(self) -> None:
+        with self._cache_lock:
+            self._cache.clear()
+
+    def compile(self, tree: Tree[Token], *, strict: bool = False) -> CompiledExpr:
+        """Compile a parse tree into a closure over an `ExprOperand`."""
+        body = self._compile_node(tree, strict)
+
+        def evaluate(operand: ExprOperand[str] | None = None) -> Any:
+            try:
+                return body(operand or {})
+            except VisitError as e:
+                logger.error(
+                    "Evaluation failed at node",
+                    node=e.obj,
+                    reason=e.orig_exc,
+                )
+                raise TracecatExpressionError(
+                    f"[evaluator] Evaluation failed at node:\n```\n{tree.pretty()}\n```\nReason: {e}",
+                    detail=str(e),
+                ) from e
+
+        return evaluate
+
+    def _compile_node(self, node: Tree[Token] | Token | None, strict: bool) -> _Node:
+        if node is None:
+            return _Constant(None)
+        if isinstance(node, Token):
+            return self._compile_token(node)
+
+        rule = str(node.data)
+        if rule == "literal":
+            return self._compile_node(node.children[0], strict)
+        if rule == "ternary":
+            return self._compile_ternary(node, strict)
+        if rule == "primary_expr":
+            return self._compile_primary_expr(node, strict)
+        if rule in _CONTEXT_RULES:
+            return self._compile_context(node, strict)
+        if (op := _BINARY_OPERATORS.get(rule)) is not None:
+            return self._compile_binary_op(node, functions.OPERATORS[op], strict)
+        if (handler := _RULE_HANDLERS.get(rule)) is not None:
+            return self._compile_rule(node, handler, strict)
+        return self._compile_fallback(node, strict)
+
+    def _compile_token(self, token: Token) -> _Node:
+        handler = _TOKEN_HANDLERS.get(token.type)
+        if handler is None:
+            return _Constant(token)
+        try:
+            return _Constant(handler(token))
+        except Exception as e:
+            return _raise_visit_error(token.type, token, e)
+
+    def _compile_rule(
+        self, node: Tree[Token], handler: Callable[..., Any], strict: bool
+    ) -> _Node:
+        rule = str(node.data)
+        children = tuple(self._compile_node(child, strict) for child in node.children)
+
+        if len(children) == 1:
+            (child,) = children
+
+            def unary(operand: ExprOperand[str]) -> Any:
+                value = child(operand)
+                try:
+                    return handler(value)
+                except Exception as e:
+                    raise VisitError(rule, node, e) from e
+
+            return unary
+
+        if len(children) == 2:
+            first, second = children
+
+            def binary(operand: ExprOperand[str]) -> Any:
+                lhs = first(operand)
+                rhs = second(operand)
+                try:
+                    return handler(lhs, rhs)
+                except Exception as e:
+                    raise VisitError(rule, node, e) from e
+
+            return binary
+
+        def variadic(operand: ExprOperand[str]) -> Any:
+            args = [child(operand) for child in children]
+            try:
+                return handler(*args)
+            except Exception as e:
+                raise VisitError(rule, node, e) from e
+
+        return variadic
+
+    def _compile_binary_op(
+        self, node: Tree[Token], op: Callable[[Any, Any], Any], strict: bool
+    ) -> _Node:
+        rule = str(node.data)
+        lhs_node, rhs_node = (
+            self._compile_node(child, strict) for child in node.children
+        )
+
+        def binary_op(operand: ExprOperand[str]) -> Any:
+            lhs = lhs_node(operand)
+            rhs = rhs_node(operand)
+            try:
+                return op(lhs, rhs)
+            except Exception as e:
+                raise VisitError(rule, node, e) from e
+
+        return binary_op
+
+    def _compile_ternary(self, node: Tree[Token], strict: bool) -> _Node:
+        true_node, condition_node, false_node = (
+            self._compile_node(child, strict) for child in node.children
+        )
+
+        def ternary(operand: ExprOperand[str]) -> Any:
+            if condition_node(operand):
+                return true_node(operand)
+            return false_node(operand)
+
+        return ternary
+
+    def _compile_primary_expr(self, node: Tree[Token], strict: bool) -> _Node:
+        base_node, *indexer_nodes = (
+            self._compile_node(child, strict) for child in node.children
+        )
+
+        def primary_expr(operand: ExprOperand[str]) -> Any:
+            result = base_node(operand)
+            indexes = [indexer(operand) for indexer in indexer_nodes]
+            try:
+                for index in indexes:
+                    result = apply_index(result, index)
+            except Exception as e:
+                raise VisitError("primary_expr", node, e) from e
+            return result
+
+        return primary_expr
+
+    def _compile_context(self, node: Tree[Token], strict: bool) -> _Node:
+        rule = str(node.data)
+        path_node = self._compile_node(node.children[0], strict)
+        if not isinstance(path_node, _Constant):
+            # The path token itself failed to convert; surface that error.
+            return path_node
+        path = path_node.value
+        if rule == "vars" and (error := _vars_depth_error(path)) is not None:
+            return _raise_visit_error(rule, node, error)
+
+        expr = _CONTEXT_RULES[rule] + (path or "")
+
+        def context(operand: ExprOperand[str]) -> Any:
+            try:
+                return eval_jsonpath(expr, operand, strict=strict)
+            except Exception as e:
+                raise VisitError(rule, node, e) from e
+
+        return context
+
+    def _compile_fallback(self, node: Tree[Token], strict: bool) -> _Node:
+        """Delegate rules the compiler does not specialise to the evaluator."""
+
+        def fallback(operand: ExprOperand[str]) -> Any:
+            return ExprEvaluator(operand=operand, strict=strict)._transform_tree(node)
+
+        return fallback
+
+
+def _vars_depth_error(path: str) -> TracecatExpressionError | None:
+    trimmed = path.lstrip(".")
+    parts = trimmed.split(".") if trimmed else []
+    key_segments = parts[1:] if len(parts) > 1 else []
+    if len(key_segments) > MAX_VARS_PATH_DEPTH:
+        formatted = ".".join(parts)
+        return TracecatExpressionError(
+            "VARS expressions currently support at most one key segment "
+            "(`VARS.<name>.<key>`). "
+            f"Got VARS.{formatted!s} with {len(key_segments)} key segments after the variable name."
+        )
+    return None
+
+
+compiler = ExprCompiler()
@@ -1,16 +1,121 @@
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+
+import lark
 from lark import Lark, Token, Tree
 from lark.exceptions import UnexpectedCharacters, UnexpectedEOF, UnexpectedInput
 
 from tracecat.exceptions import TracecatExpressionError
-from tracecat.expressions.parser.grammar import grammar
+from tracecat.expressions.parser import _generated
+from tracecat.expressions.parser.grammar import grammar, grammar_sha256
 from tracecat.logger import logger
 
+# The same template expression is parsed for every loop iteration, scatter item
+# and action dispatch. Parse trees are treated as read-only by the evaluator,
+# validators and extractors, so one tree per expression source can be shared
+# across threads. These limits affect retention only; longer expressions remain
+# valid and parse without caching.
+_PARSE_CACHE_MAXSIZE = 2048
+_PARSE_CACHE_MAX_EXPR_LENGTH = 4096
+
+
+def build_lark(start_rule: str = "root") -> Lark:
+    """Build the LALR parser for the expression grammar.
+
+    Loads the tables serialized by `scripts/generate_expression_parser.py` when
+    they were generated from the current grammar with the installed lark
+    version, which avoids LALR table construction on every process start.
+    Otherwise the grammar is compiled from source.
+    """
+    if start_rule == _generated.START:
+        if (
+            _generated.GRAMMAR_SHA256 == grammar_sha256()
+            and _generated.LARK_VERSION == lark.__version__
+        ):
+            return Lark._load_from_dict(_generated.DATA, _generated.MEMO)
+        logger.warning(
+            "Generated expression parser is out of date, compiling grammar. "
+            "Run `just gen-expression-parser` to regenerate it.",
+            generated_lark_version=_generated.LARK_VERSION,
+            lark_version=lark.__version__,
+        )
+    return Lark(grammar, start=start_rule, parser="lalr")
+
+
+@dataclass(frozen=True, slots=True)
+class ParseCacheInfo:
+    """Snapshot of the parse tree cache statistics."""
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
 
 class ExprParser:
-    def __init__(self, start_rule: str = "root") -> None:
-        self.parser = Lark(grammar, start=start_rule, parser="lalr")
+    def __init__(
+        self,
+        start_rule: str = "root",
+        *,
+        cache_maxsize: int = _PARSE_CACHE_MAXSIZE,
+    ) -> None:
+        self.parser = build_lark(start_rule)
+        self._cache: OrderedDict[str, Tree[Token]] = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._cache_maxsize = cache_maxsize
+        self._hits = 0
+        self._misses = 0
 
     def parse(self, expression: str) -> Tree[Token] | None:
+        cacheable = (
+            self._cache_maxsize > 0 and len(expression) <= _PARSE_CACHE_MAX_EXPR_LENGTH
+        )
+        if cacheable and (tree := self._get_cached(expression)) is not None:
+            return tree
+
+        tree = self._parse(expression)
+        if cacheable:
+            self._put_cached(expression, tree)
+        return tree
+
+    def cache_info(self) -> ParseCacheInfo:
+        """Return hit/miss counters and the current size of the parse cache."""
+        with self._cache_lock:
+            return ParseCacheInfo(
+                hits=self._hits,
+                misses=self._misses,
+                maxsize=self._cache_maxsize,
+                currsize=len(self._cache),
+            )
+
+    def cache_clear(self) -> None:
+        """Drop all cached parse trees and reset the counters."""
+        with self._cache_lock:
+            self._cache.clear()
+            self._hits = 0
+            self._misses = 0
+
+    def _get_cached(self, expression: str) -> Tree[Token] | None:
+        """Return a cached parse tree and update its LRU position."""
+        with self._cache_lock:
+            tree = self._cache.get(expression)
+            if tree is None:
+                self._misses += 1
+                return None
+            self._cache.move_to_end(expression)
+            self._hits += 1
+            return tree
+
+    def _put_cached(self, expression: str, tree: Tree[Token]) -> None:
+        """Cache a parse tree, evicting the least recently used entry if full."""
+        with self._cache_lock:
+            self._cache[expression] = tree
+            self._cache.move_to_end(expression)
+            if len(self._cache) > self._cache_maxsize:
+                self._cache.popitem(last=False)
+
+    def _parse(self, expression: str) -> Tree[Token]:
         try:
             return self.parser.parse(expression)
         except (UnexpectedCharacters, UnexpectedEOF, UnexpectedInput) as e:
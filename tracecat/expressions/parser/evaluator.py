@@ -415,30 +415,35 @@ class ExprEvaluator(Transformer[Token, Any]):
 
     def _apply_index(self, value: Any, index: Any) -> Any:
         self.logger.trace("Applying index", value=value, index=index)
-        if isinstance(value, Mapping):
-            try:
-                return value[index]
-            except KeyError as exc:
-                raise TracecatExpressionError(
-                    f"Key {index!r} not found for mapping access"
-                ) from exc
-            except TypeError as exc:
-                raise TracecatExpressionError(
-                    f"Invalid key type {type(index).__name__!r} for mapping access"
-                ) from exc
-
-        if isinstance(value, Sequence):
-            if not isinstance(index, int):
-                raise TracecatExpressionError(
-                    f"Sequence indices must be integers, got {type(index).__name__!r}"
-                )
-            try:
-                return value[index]
-            except IndexError as exc:
-                raise TracecatExpressionError(
-                    f"Sequence index {index} out of range"
-                ) from exc
-
-        raise TracecatExpressionError(
-            f"Object of type {type(value).__name__!r} is not indexable"
-        )
+        return apply_index(value, index)
+
+
+def apply_index(value: Any, index: Any) -> Any:
+    """Apply one bracket index to a mapping or sequence value."""
+    if isinstance(value, Mapping):
+        try:
+            return value[index]
+        except KeyError as exc:
+            raise TracecatExpressionError(
+                f"Key {index!r} not found for mapping access"
+            ) from exc
+        except TypeError as exc:
+            raise TracecatExpressionError(
+                f"Invalid key type {type(index).__name__!r} for mapping access"
+            ) from exc
+
+    if isinstance(value, Sequence):
+        if not isinstance(index, int):
+            raise TracecatExpressionError(
+                f"Sequence indices must be integers, got {type(index).__name__!r}"
+            )
+        try:
+            return value[index]
+        except IndexError as exc:
+            raise TracecatExpressionError(
+                f"Sequence index {index} out of range"
+            ) from exc
+
+    raise TracecatExpressionError(
+        f"Object of type {type(value).__name__!r} is not indexable"
+    )
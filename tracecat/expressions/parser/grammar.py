@@ -1,3 +1,5 @@
+import hashlib
+
 grammar = r"""
 ?root: expression
         | trailing_typecast_expression
@@ -118,3 +120,8 @@ NONE_LITERAL: "None"
 %import common.WS
 %ignore WS
 """
+
+
+def grammar_sha256() -> str:
+    """Digest of the grammar source, used to detect stale generated parsers."""
+    return hashlib.sha256(grammar.encode("utf-8")).hexdigest()
@@ -7,3 +7,6 @@ TEMPLATE_STRING = re.compile(
 
 STANDALONE_TEMPLATE = re.compile(r"^\${{\s*(?:(?!\${{).)*?\s*}}$")
 """Pattern that matches a standalone template expression."""
+
+JSONPATH_TOP_LEVEL_KEY = re.compile(r"^\.([A-Za-z_][A-Za-z0-9_]*)(?=$|[.\[])")
+"""Pattern that matches the leading `.key` of a partial jsonpath expression."""
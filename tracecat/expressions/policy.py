@@ -21,8 +21,8 @@ from lark import Token, Tree
 
 from tracecat.exceptions import TracecatExpressionError
 from tracecat.expressions import patterns
-from tracecat.expressions.common import eval_jsonpath
-from tracecat.expressions.eval import eval_templated_object
+from tracecat.expressions.common import eval_jsonpath, prefetched_jsonpaths
+from tracecat.expressions.eval import collect_expressions, eval_templated_object
 from tracecat.expressions.parser.core import parser
 from tracecat.secrets.constants import MASK_VALUE
 
@@ -451,14 +451,31 @@ class ActionArgumentPlan:
                         evaluable[parameter] = value
         return cls(action=action, original=arguments, evaluable=evaluable)
 
-    def evaluate(self, context: Mapping[str, Any]) -> dict[str, Any]:
-        """Evaluate the planned subset and restore preserved parameters."""
-        return resolve_action_args(
-            self.action,
-            self.original,
-            context,
-            {},
-        )
+    def evaluate(
+        self,
+        context: Mapping[str, Any],
+        *,
+        paths: Iterable[str] | None = None,
+    ) -> dict[str, Any]:
+        """Evaluate the planned subset and restore preserved parameters.
+
+        ``paths`` are the context paths referenced by the evaluable arguments,
+        as collected by `collect_expressions`. They are resolved against
+        ``context`` in one shared walk before the arguments are evaluated.
+        """
+        if paths is None:
+            try:
+                paths = collect_expressions(self.evaluable).paths
+            except TracecatExpressionError:
+                # Invalid expressions surface from evaluation below.
+                paths = ()
+        with prefetched_jsonpaths(paths, context):
+            return resolve_action_args(
+                self.action,
+                self.original,
+                context,
+                {},
+            )
 
 
 def resolve_action_args(
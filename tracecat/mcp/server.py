@@ -220,7 +220,6 @@ from tracecat.registry.constants import (
     DEFAULT_LOCAL_REGISTRY_ORIGIN,
     DEFAULT_REGISTRY_ORIGIN,
 )
-from tracecat.registry.lock.types import RegistryLock
 from tracecat.registry.repositories.schemas import RegistryRepositorySync
 from tracecat.registry.repositories.service import RegistryReposService
 from tracecat.registry.repository import Repository
@@ -262,7 +261,10 @@ from tracecat.workflow.executions.shaping import (
     build_execution_events,
     build_execution_summary,
 )
-from tracecat.workflow.management.definitions import WorkflowDefinitionsService
+from tracecat.workflow.management.definitions import (
+    WorkflowDefinitionsService,
+    load_definition,
+)
 from tracecat.workflow.management.draft import (
     WorkflowEditError,
     apply_layout_to_workflow,
@@ -5975,12 +5977,9 @@ async def run_case_task(
                     "Publish the workflow first using publish_workflow."
                 )
 
-            dsl_input = DSLInput(**defn.content)
-            registry_lock = (
-                RegistryLock.model_validate(defn.registry_lock)
-                if defn.registry_lock
-                else None
-            )
+            definition = load_definition(defn)
+            dsl_input = definition.dsl
+            registry_lock = definition.registry_lock
 
         # Validate inputs against the workflow's expects schema
         payload = _validate_trigger_inputs_payload(
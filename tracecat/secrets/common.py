@@ -1,47 +1,129 @@
+import functools
 import re
 from collections.abc import Iterable, Mapping, Sequence
 
 from tracecat.secrets.constants import MASK_VALUE
 
+# Upper bound on cached trie patterns, one per distinct set of secrets that
+# co-occur in a masked string.
+_MASK_PATTERN_CACHE_MAXSIZE = 256
 
-def _compile_mask_pattern(masks: Iterable[str]) -> re.Pattern[str] | None:
-    """Compile a reusable pattern for the provided secret values."""
+
+def _trie_regex(masks: Iterable[str]) -> str:
+    """Build a regex that walks a prefix trie of ``masks``.
+
+    Unlike a flat alternation, which retries every secret at each position, the
+    regex engine follows a single trie branch per character. Optional subtrees
+    are greedy, so the longest secret matching at a position wins, which is the
+    same result as a longest-first alternation.
+    """
+    trie: dict[str, dict] = {}
+    for mask in masks:
+        node = trie
+        for char in mask:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def build(node: dict[str, dict]) -> str:
+        parts: list[str] = []
+        # Collapse single-child chains iteratively so long secrets (e.g. PEM
+        # keys) do not recurse once per character.
+        while len(node) == 1 and "" not in node:
+            ((char, node),) = node.items()
+            parts.append(re.escape(char))
+        children = sorted(char for char in node if char)
+        if children:
+            if all(node[char].keys() == {""} for char in children):
+                branch = (
+                    re.escape(children[0])
+                    if len(children) == 1
+                    else f"[{''.join(map(re.escape, children))}]"
+                )
+            else:
+                branch = (
+                    "(?:"
+                    + "|".join(re.escape(char) + build(node[char]) for char in children)
+                    + ")"
+                )
+            parts.append(f"(?:{branch})?" if "" in node else branch)
+        return "".join(parts)
+
+    return build(trie)
+
+
+@functools.lru_cache(maxsize=_MASK_PATTERN_CACHE_MAXSIZE)
+def _compile_trie_pattern(masks: tuple[str, ...]) -> re.Pattern[str]:
+    return re.compile(_trie_regex(masks))
+
+
+class _SecretMasker:
+    """Secret values prepared for repeated masking."""
+
+    __slots__ = ("masks",)
+
+    def __init__(self, masks: tuple[str, ...]) -> None:
+        self.masks = masks
+
+    def mask(self, value: str) -> str:
+        # Substring checks run at C speed and usually rule out every secret,
+        # in which case the original string is returned untouched. Otherwise
+        # only the secrets actually present are compiled into the pattern.
+        present = tuple(mask for mask in self.masks if mask in value)
+        if not present:
+            return value
+        return _compile_trie_pattern(present).sub(MASK_VALUE, value)
+
+
+def _compile_mask_pattern(masks: Iterable[str]) -> _SecretMasker | None:
+    """Compile a reusable masker for the provided secret values."""
     # Filter out single-character masks to prevent over-aggressive masking.
-    filtered_masks = [mask for mask in masks if len(mask) > 1]
+    # Sort for a stable order so equal secret subsets share a cached pattern.
+    filtered_masks = sorted({mask for mask in masks if len(mask) > 1})
     if not filtered_masks:
         return None
-
-    # Sort longest-first so a longer secret is not partially matched by a
-    # shorter substring that happens to appear earlier in the alternation.
-    filtered_masks.sort(key=len, reverse=True)
-    return re.compile("|".join(map(re.escape, filtered_masks)))
+    return _SecretMasker(tuple(filtered_masks))
 
 
-def _apply_mask_pattern(value: str, pattern: re.Pattern[str] | None) -> str:
+def _apply_mask_pattern(value: str, pattern: _SecretMasker | None) -> str:
     if pattern is None:
         return value
-    return pattern.sub(MASK_VALUE, value)
+    return pattern.mask(value)
 
 
 def apply_masks(value: str, masks: Iterable[str]) -> str:
     return _apply_mask_pattern(value, _compile_mask_pattern(masks))
 
 
-def _apply_masks_object[T](obj: T, pattern: re.Pattern[str] | None) -> T:
+def _apply_masks_object[T](obj: T, pattern: _SecretMasker) -> T:
+    # Containers are only rebuilt when something inside them was masked, so
+    # unaffected subtrees (usually the whole result) are returned as-is.
     match obj:
         case str():
-            return _apply_mask_pattern(obj, pattern)
+            return pattern.mask(obj)  # pyright: ignore[reportReturnType]
         case Sequence():
-            return type(obj)(_apply_masks_object(item, pattern) for item in obj)  # pyright: ignore[reportCallIssue]
-        case Mapping():
-            masked_items = (
-                (k, _apply_masks_object(v, pattern)) for k, v in obj.items()
-            )
+            masked_items = [_apply_masks_object(item, pattern) for item in obj]
+            if all(
+                masked is item for masked, item in zip(masked_items, obj, strict=True)
+            ):
+                return obj
             return type(obj)(masked_items)  # pyright: ignore[reportCallIssue]
+        case Mapping():
+            masked_pairs = [
+                (k, v, _apply_masks_object(v, pattern)) for k, v in obj.items()
+            ]
+            if all(masked is v for _, v, masked in masked_pairs):
+                return obj
+            return type(obj)((k, masked) for k, _, masked in masked_pairs)  # pyright: ignore[reportCallIssue]
         case _:
             return obj
 
 
 def apply_masks_object[T](obj: T, masks: Iterable[str]) -> T:
-    """Mask secret values in strings, sequences, and mappings."""
-    return _apply_masks_object(obj, _compile_mask_pattern(masks))
+    """Mask secret values in strings, sequences, and mappings.
+
+    Objects that contain no secret are returned unchanged rather than copied.
+    """
+    pattern = _compile_mask_pattern(masks)
+    if pattern is None:
+        return obj
+    return _apply_masks_object(obj, pattern)
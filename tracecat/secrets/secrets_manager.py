@@ -22,6 +22,8 @@ if TYPE_CHECKING:
     from tracecat_registry import RegistrySecretType
     from tracecat_registry._internal.models import RegistryOAuthSecret
 
+    from tracecat.executor.prefetch import RunPrefetchCache
+
 
 @overload
 def get(name: str, /) -> str | None: ...
@@ -133,6 +135,8 @@ def _inject_runtime_aws_external_id(secrets: dict[str, Any]) -> None:
 async def get_action_secrets(
     secret_exprs: builtins.set[str],
     action_secrets: builtins.set[RegistrySecretType],
+    *,
+    cache: RunPrefetchCache | None = None,
 ) -> dict[str, Any]:
     # Handle secrets from the task args
     args_secrets = secret_exprs
@@ -200,6 +204,7 @@ async def get_action_secrets(
         secrets=all_basic_secrets,
         environment=get_runtime_env(),
         optional_secrets=optional_basic_secrets,
+        cache=cache,
     ) as sandbox:
         secrets |= sandbox.secrets.copy()
     _inject_runtime_aws_external_id(secrets)
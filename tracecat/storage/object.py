@@ -396,6 +396,16 @@ def return_key(workspace_id: str, wf_exec_id: str) -> str:
     return f"{workspace_id}/{wf_exec_id}/return.json"
 
 
+def checkpoint_key(
+    workspace_id: str, wf_exec_id: str, wf_run_id: str, part: int
+) -> str:
+    """Generate S3 key for one part of a checkpoint taken before continue-as-new.
+
+    Format: {workspace_id}/{wf_exec_id}/checkpoints/{wf_run_id}/{part}.json
+    """
+    return f"{workspace_id}/{wf_exec_id}/checkpoints/{wf_run_id}/{part}.json"
+
+
 def action_key(workspace_id: str, wf_exec_id: str, stream_id: str, ref: str) -> str:
     """Generate S3 key for action result.
 
@@ -422,6 +432,14 @@ def collection_item_key(prefix: str, index: int) -> str:
     return f"{prefix}/items/{index}.json"
 
 
+def gather_chunk_prefix(prefix: str, index: int) -> str:
+    """Generate S3 key prefix for the i-th chunk collection of a streamed gather.
+
+    Format: {prefix}/gather/{index}
+    """
+    return f"{prefix}/gather/{index}"
+
+
 __all__ = [
     # Types
     "CollectionObject",
@@ -441,6 +459,7 @@ __all__ = [
     "action_collection_prefix",
     "action_key",
     "collection_item_key",
+    "gather_chunk_prefix",
     "return_key",
     "trigger_key",
 ]
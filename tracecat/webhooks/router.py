@@ -20,7 +20,6 @@ from tracecat import config
 from tracecat.concurrency import cooperative
 from tracecat.contexts import ctx_role
 from tracecat.dsl.client import get_temporal_client
-from tracecat.dsl.common import DSLInput
 from tracecat.dsl.schemas import TriggerInputs
 from tracecat.dsl.workflow import DSLWorkflow
 from tracecat.ee.interactions.enums import InteractionCategory
@@ -58,6 +57,7 @@ from tracecat.workflow.executions.schemas import (
     WorkflowExecutionCreateResponse,
 )
 from tracecat.workflow.executions.service import WorkflowExecutionsService
+from tracecat.workflow.management.definitions import load_definition
 
 router = APIRouter(
     prefix="/webhooks/{workflow_id}/{secret}",
@@ -391,7 +391,8 @@ async def _incoming_webhook(
     logger.info("Webhook hit", path=workflow_id, role=ctx_role.get())
     logger.trace("Webhook payload", payload=payload)
 
-    dsl_input = DSLInput(**defn.content)
+    definition = load_definition(defn)
+    dsl_input = definition.dsl
     include_raw_body = _include_raw_body(dsl_input.entrypoint.expects)
 
     service = await WorkflowExecutionsService.connect()
@@ -412,9 +413,7 @@ async def _incoming_webhook(
                 if include_headers
                 else p,
                 trigger_type=TriggerType.WEBHOOK,
-                registry_lock=RegistryLock.model_validate(defn.registry_lock)
-                if defn.registry_lock
-                else None,
+                registry_lock=definition.registry_lock,
             )
         # Currently just return the last response's wf_exec_id
         response = WorkflowExecutionCreateResponse(
@@ -435,9 +434,7 @@ async def _incoming_webhook(
             if include_headers
             else payload,
             trigger_type=TriggerType.WEBHOOK,
-            registry_lock=RegistryLock.model_validate(defn.registry_lock)
-            if defn.registry_lock
-            else None,
+            registry_lock=definition.registry_lock,
         )
 
     # Response handling
@@ -507,7 +504,8 @@ async def incoming_webhook_wait(
     # (include_headers), which can contain auth/signature values.
     logger.trace("Webhook payload received")
 
-    dsl_input = DSLInput(**defn.content)
+    definition = load_definition(defn)
+    dsl_input = definition.dsl
     payload = await _wrapped_payload(
         request=request,
         payload=payload,
@@ -520,9 +518,7 @@ async def incoming_webhook_wait(
         wf_id=workflow_id,
         payload=payload,
         trigger_type=TriggerType.WEBHOOK,
-        registry_lock=RegistryLock.model_validate(defn.registry_lock)
-        if defn.registry_lock
-        else None,
+        registry_lock=definition.registry_lock,
     )
 
     result = response["result"]
@@ -32,7 +32,6 @@ from tracecat.auth.credentials import compute_attributed_user_scopes
 from tracecat.auth.dependencies import ExecutorWorkspaceRole
 from tracecat.authz.controls import require_scope
 from tracecat.db.dependencies import AsyncDBSession
-from tracecat.dsl.common import DSLInput
 from tracecat.exceptions import (
     BuiltinRegistryHasNoSelectionError,
     TracecatNotFoundError,
@@ -53,7 +52,6 @@ from tracecat.mcp.schemas import (
     WorkflowEditResponse,
 )
 from tracecat.pagination import CursorPaginatedResponse, CursorPaginationParams
-from tracecat.registry.lock.types import RegistryLock
 from tracecat.webhooks import service as webhook_service
 from tracecat.webhooks.schemas import WebhookRead, WebhookUpdate
 from tracecat.workflow.case_triggers.schemas import (
@@ -73,7 +71,10 @@ from tracecat.workflow.executions.shaping import (
     extract_execution_types,
     format_temporal_status,
 )
-from tracecat.workflow.management.definitions import WorkflowDefinitionsService
+from tracecat.workflow.management.definitions import (
+    WorkflowDefinitionsService,
+    load_definition,
+)
 from tracecat.workflow.management.draft import (
     WorkflowEditError,
     build_workflow_edit_document,
@@ -862,7 +863,7 @@ async def execute_workflow(
 
     # Build DSL from definition content
     try:
-        dsl = DSLInput(**defn.content)
+        definition = load_definition(defn)
     except Exception as e:
         logger.error("Failed to build DSL from definition", error=str(e))
         raise HTTPException(
@@ -876,18 +877,14 @@ async def execute_workflow(
     try:
         exec_service = await WorkflowExecutionsService.connect(role=role)
         # Pass registry_lock from the definition, same as regular execution
-        registry_lock = (
-            RegistryLock.model_validate(defn.registry_lock)
-            if defn.registry_lock
-            else None
-        )
+        registry_lock = definition.registry_lock
         # Build memo for correlation (visible in Temporal UI)
         memo: dict[str, Any] | None = None
         if params.parent_workflow_execution_id:
             memo = {"parent_workflow_execution_id": params.parent_workflow_execution_id}
 
         response = exec_service.create_workflow_execution_nowait(
-            dsl=dsl,
+            dsl=definition.dsl,
             wf_id=wf_id,
             payload=params.trigger_inputs,
             trigger_type=TriggerType.MANUAL,
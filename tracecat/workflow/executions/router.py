@@ -21,7 +21,6 @@ from tracecat.authz.controls import require_scope
 from tracecat.db.dependencies import AsyncDBSession
 from tracecat.db.models import Workflow
 from tracecat.dsl.common import (
-    DSLInput,
     get_execution_type_from_search_attr,
     get_trigger_type_from_search_attr,
 )
@@ -40,7 +39,6 @@ from tracecat.identifiers.workflow import (
 )
 from tracecat.logger import logger
 from tracecat.pagination import CursorPaginatedResponse, CursorPaginationParams
-from tracecat.registry.lock.types import RegistryLock
 from tracecat.settings.service import get_setting
 from tracecat.storage import blob
 from tracecat.storage.object import (
@@ -91,7 +89,10 @@ from tracecat.workflow.executions.service import (
     WorkflowExecutionResultNotFoundError,
     WorkflowExecutionsService,
 )
-from tracecat.workflow.management.definitions import WorkflowDefinitionsService
+from tracecat.workflow.management.definitions import (
+    WorkflowDefinitionsService,
+    load_definition,
+)
 from tracecat.workflow.management.management import WorkflowsManagementService
 
 router = APIRouter(prefix="/workflow-executions", tags=["workflow-executions"])
@@ -1013,20 +1014,16 @@ async def create_workflow_execution(
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Invalid workflow ID"
         )
-    dsl_input = DSLInput(**defn.content)
+    definition = load_definition(defn)
     try:
         service = await WorkflowExecutionsService.connect(role=role)
         response = service.create_workflow_execution_nowait(
-            dsl=dsl_input,
+            dsl=definition.dsl,
             wf_id=wf_id,
             payload=params.inputs,
             time_anchor=params.time_anchor,
             # For regular workflow executions, use the registry lock from the workflow definition
-            registry_lock=(
-                RegistryLock.model_validate(defn.registry_lock)
-                if defn.registry_lock
-                else None
-            ),
+            registry_lock=definition.registry_lock,
         )
         return response
     except TracecatValidationError as e:
@@ -1,10 +1,16 @@
 from __future__ import annotations
 
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+
 from sqlalchemy import case, select
 from sqlalchemy.orm import selectinload
 from temporalio import activity
 from temporalio.exceptions import ApplicationError
 
+from tracecat import config
 from tracecat.authz.controls import require_scope
 from tracecat.db.models import Workflow, WorkflowDefinition
 from tracecat.dsl.common import DSLInput
@@ -24,6 +30,110 @@ from tracecat.workflow.management.schemas import (
     WorkflowDefinitionActivityResult,
 )
 
+DefinitionCacheKey = tuple[uuid.UUID, int]
+"""Definition row ID and version"""
+
+
+@dataclass(slots=True)
+class DefinitionCacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class WorkflowDefinitionCache:
+    """Bounded LRU cache of validated workflow definitions for this process.
+
+    A definition row never changes once it is created, so entries keyed by its
+    ID and version don't need invalidation. Triggers and child workflow
+    launches of the same workflow then validate its DSL once per process. On
+    workers, lookups run in activities, whose results are recorded in workflow
+    history, so caching doesn't affect replay.
+
+    Cached results are shared between callers and must not be mutated.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self.stats = DefinitionCacheStats()
+        self._entries: OrderedDict[
+            DefinitionCacheKey, WorkflowDefinitionActivityResult
+        ] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: DefinitionCacheKey) -> WorkflowDefinitionActivityResult | None:
+        result = self._entries.get(key)
+        if result is None:
+            self.stats.misses += 1
+        else:
+            self.stats.hits += 1
+            self._entries.move_to_end(key)
+        _record_cache_lookup(hit=result is not None)
+        return result
+
+    def put(
+        self, key: DefinitionCacheKey, result: WorkflowDefinitionActivityResult
+    ) -> None:
+        if self.maxsize <= 0:
+            return
+        self._entries[key] = result
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.stats.evictions += 1
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.stats = DefinitionCacheStats()
+
+
+def _record_cache_lookup(*, hit: bool) -> None:
+    """Count a lookup in the worker's Temporal metrics, tagged hit or miss."""
+    if not activity.in_activity():
+        return
+    activity.metric_meter().create_counter(
+        "tracecat_workflow_definition_cache_lookups",
+        "Workflow definition cache lookups in activities",
+    ).add(1, {"result": "hit" if hit else "miss"})
+
+
+definition_cache = WorkflowDefinitionCache(
+    maxsize=config.TRACECAT__WORKFLOW_DEFINITION_CACHE_SIZE
+)
+"""Process-wide cache shared by triggers and definition activities"""
+
+
+def _parse_definition(defn: WorkflowDefinition) -> WorkflowDefinitionActivityResult:
+    result = WorkflowDefinitionActivityResult(
+        dsl=DSLInput(**defn.content),
+        # Convert from DB dict type to RegistryLock (JSONB deserializes to dict)
+        registry_lock=(
+            RegistryLock.model_validate(defn.registry_lock)
+            if defn.registry_lock
+            else None
+        ),
+    )
+    definition_cache.put((defn.id, defn.version), result)
+    return result
+
+
+def load_definition(defn: WorkflowDefinition) -> WorkflowDefinitionActivityResult:
+    """Get the validated DSL and registry lock of a definition.
+
+    Validating a large DSL dominates trigger latency, so each definition is
+    validated once per process and shared by every trigger that loads it.
+    """
+    if (cached := definition_cache.get((defn.id, defn.version))) is not None:
+        return cached
+    return _parse_definition(defn)
+
 
 class WorkflowDefinitionsService(BaseWorkspaceService):
     service_name = "workflow_definitions"
@@ -49,22 +159,72 @@ class WorkflowDefinitionsService(BaseWorkspaceService):
         if version is not None:
             statement = statement.where(WorkflowDefinition.version == version)
         else:
-            current_version_sq = (
-                select(Workflow.version)
-                .where(
-                    Workflow.workspace_id == self.workspace_id,
-                    Workflow.id == workflow_id,
-                )
-                .scalar_subquery()
-            )
             statement = statement.order_by(
-                case((WorkflowDefinition.version == current_version_sq, 0), else_=1),
-                WorkflowDefinition.version.desc(),
+                *self._current_version_order(workflow_id)
             ).limit(1)
 
         result = await self.session.execute(statement)
         return result.scalars().first()
 
+    def _current_version_order(self, workflow_id: WorkflowID) -> tuple[Any, ...]:
+        """Order definitions so the workflow's current version comes first.
+
+        Falls back to the latest version if the current one has no definition.
+        """
+        current_version_sq = (
+            select(Workflow.version)
+            .where(
+                Workflow.workspace_id == self.workspace_id,
+                Workflow.id == workflow_id,
+            )
+            .scalar_subquery()
+        )
+        return (
+            case((WorkflowDefinition.version == current_version_sq, 0), else_=1),
+            WorkflowDefinition.version.desc(),
+        )
+
+    async def resolve_definition_key(
+        self, workflow_id: WorkflowID, *, version: int | None = None
+    ) -> DefinitionCacheKey | None:
+        """Get the ID and version of the definition `get_definition_by_workflow_id`
+        returns, without loading its content."""
+        statement = select(WorkflowDefinition.id, WorkflowDefinition.version).where(
+            WorkflowDefinition.workspace_id == self.workspace_id,
+            WorkflowDefinition.workflow_id == workflow_id,
+        )
+        if version is not None:
+            statement = statement.where(WorkflowDefinition.version == version)
+        else:
+            statement = statement.order_by(
+                *self._current_version_order(workflow_id)
+            ).limit(1)
+        result = await self.session.execute(statement)
+        row = result.first()
+        return (row.id, row.version) if row else None
+
+    async def get_definition_result(
+        self, workflow_id: WorkflowID, *, version: int | None = None
+    ) -> WorkflowDefinitionActivityResult | None:
+        """Get the DSL and registry lock of a definition version.
+
+        Goes through the process-wide definition cache. The definition is
+        resolved first with a query that skips its content, so newly published
+        versions are picked up immediately.
+        """
+        key = await self.resolve_definition_key(workflow_id, version=version)
+        if key is None:
+            return None
+        if (cached := definition_cache.get(key)) is not None:
+            return cached
+        _, resolved_version = key
+        defn = await self.get_definition_by_workflow_id(
+            workflow_id, version=resolved_version, load_relationships=False
+        )
+        if defn is None:
+            return None
+        return _parse_definition(defn)
+
     async def list_workflow_defitinions(
         self, workflow_id: WorkflowID | None = None
     ) -> list[WorkflowDefinition]:
@@ -172,19 +332,14 @@ async def get_workflow_definition_activity(
     input: GetWorkflowDefinitionActivityInputs,
 ) -> WorkflowDefinitionActivityResult:
     async with WorkflowDefinitionsService.with_session(role=input.role) as service:
-        defn = await service.get_definition_by_workflow_id(
+        result = await service.get_definition_result(
             input.workflow_id, version=input.version
         )
-        if not defn:
-            msg = f"Workflow definition not found for {input.workflow_id.short()}, version={input.version}"
-            logger.error(msg)
-            raise ApplicationError(msg, non_retryable=True)
-        dsl = DSLInput(**defn.content)
-    # Convert from DB dict type to RegistryLock (JSONB deserializes to dict)
-    registry_lock = (
-        RegistryLock.model_validate(defn.registry_lock) if defn.registry_lock else None
-    )
-    return WorkflowDefinitionActivityResult(dsl=dsl, registry_lock=registry_lock)
+    if not result:
+        msg = f"Workflow definition not found for {input.workflow_id.short()}, version={input.version}"
+        logger.error(msg)
+        raise ApplicationError(msg, non_retryable=True)
+    return result
 
 
 @activity.defn
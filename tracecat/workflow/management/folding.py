@@ -0,0 +1,230 @@
+"""Constant folding for workflow definitions at commit time.
+
+Template expressions that only combine literals and pure ``FN`` functions
+evaluate to the same value on every run. Folding them into literals when a
+workflow is committed means the stored definition no longer carries them, so
+executors never parse or evaluate them again.
+
+Folding is conservative. An expression is left untouched if it references any
+runtime context (``ACTIONS``, ``TRIGGER``, ``SECRETS``, ``VARS``, ``ENV``,
+``var``, template ``inputs`` or ``steps``), calls a function listed in
+`NON_FOLDABLE_FUNCTIONS`, fails to evaluate, or produces a value that would not
+round-trip through the stored JSON definition unchanged.
+"""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from typing import Any
+
+import orjson
+from lark import Token, Tree
+
+from tracecat.dsl.common import DSLInput
+from tracecat.dsl.schemas import ActionStatement
+from tracecat.exceptions import TracecatExpressionError
+from tracecat.expressions import patterns
+from tracecat.expressions.core import Expression
+from tracecat.expressions.eval import is_template_only
+from tracecat.expressions.functions import NON_FOLDABLE_FUNCTIONS
+from tracecat.expressions.parser.core import parser
+from tracecat.expressions.policy import ExpressionPolicy, expression_policy
+
+MAX_FOLDED_VALUE_BYTES = 16 * 1024
+"""Largest serialized value an expression may fold into."""
+
+_CONTEXT_RULES = frozenset(
+    {
+        "actions",
+        "secrets",
+        "vars",
+        "env",
+        "local_vars",
+        "trigger",
+        "template_action_inputs",
+        "template_action_steps",
+        "iterator",
+    }
+)
+
+
+@dataclass(slots=True)
+class ConstantFoldReport:
+    """Expressions folded into literals for one workflow definition."""
+
+    paths: list[str] = field(default_factory=list)
+    """Locations of the folded values, e.g. ``actions.fetch.args.url``."""
+
+    @property
+    def folded(self) -> int:
+        return len(self.paths)
+
+
+class _NotFoldable(Exception):
+    pass
+
+
+def _is_numeric_literal(node: Tree[Token] | Token) -> bool:
+    return (
+        isinstance(node, Tree)
+        and node.data == "literal"
+        and isinstance(token := node.children[0], Token)
+        and token.type == "NUMERIC_LITERAL"
+    )
+
+
+def _is_constant(tree: Tree[Token]) -> bool:
+    for node in tree.iter_subtrees():
+        if node.data in _CONTEXT_RULES:
+            return False
+        if node.data == "function":
+            fn_name = str(node.children[0]).removesuffix(".map")
+            if fn_name in NON_FOLDABLE_FUNCTIONS:
+                return False
+        # `*` repeats strings and lists; only fold plain numeric products.
+        if node.data == "mul_op" and not all(
+            _is_numeric_literal(child) for child in node.children
+        ):
+            return False
+    return True
+
+
+def _is_json_literal(value: Any) -> bool:
+    match value:
+        case None | bool() | int():
+            return True
+        case float():
+            return math.isfinite(value)
+        case str():
+            # A folded string must not introduce a new template.
+            return patterns.TEMPLATE_STRING.search(value) is None
+        case list():
+            return all(_is_json_literal(item) for item in value)
+        case dict():
+            return all(
+                isinstance(k, str) and _is_json_literal(k) and _is_json_literal(v)
+                for k, v in value.items()
+            )
+        case _:
+            return False
+
+
+def _fold_expression(expr: str) -> Any:
+    """Evaluate a constant expression, or raise `_NotFoldable`."""
+    try:
+        tree = parser.parse(expr)
+    except TracecatExpressionError as e:
+        raise _NotFoldable from e
+    if tree is None or not _is_constant(tree):
+        raise _NotFoldable
+    try:
+        value = Expression(expr, operand={}).result()
+    except Exception as e:
+        raise _NotFoldable from e
+    if not _is_json_literal(value):
+        raise _NotFoldable
+    try:
+        if len(orjson.dumps(value)) > MAX_FOLDED_VALUE_BYTES:
+            raise _NotFoldable
+    except orjson.JSONEncodeError as e:
+        raise _NotFoldable from e
+    return value
+
+
+def _fold_str(value: str) -> tuple[Any, bool]:
+    matches = list(patterns.TEMPLATE_STRING.finditer(value))
+    if not matches:
+        return value, False
+
+    if is_template_only(value) and len(matches) == 1:
+        try:
+            return _fold_expression(matches[0].group("expr")), True
+        except _NotFoldable:
+            return value, False
+
+    parts: list[str] = []
+    remaining: list[str] = []
+    position = 0
+    folded = False
+    for match in matches:
+        parts.append(value[position : match.start()])
+        template = match.group("template")
+        try:
+            parts.append(str(_fold_expression(match.group("expr"))))
+            folded = True
+        except _NotFoldable:
+            parts.append(template)
+            remaining.append(template)
+        position = match.end()
+    if not folded:
+        return value, False
+    parts.append(value[position:])
+    result = "".join(parts)
+
+    # Folding must leave exactly the unfolded templates behind, and must not
+    # turn an inline string into a standalone template, which would change
+    # its result type.
+    result_templates = [
+        match.group("template") for match in patterns.TEMPLATE_STRING.finditer(result)
+    ]
+    if result_templates != remaining or (
+        is_template_only(result) and len(remaining) == 1
+    ):
+        return value, False
+    return result, True
+
+
+def _fold_object(obj: Any, path: str, report: ConstantFoldReport) -> Any:
+    match obj:
+        case str():
+            folded, changed = _fold_str(obj)
+            if changed:
+                report.paths.append(path)
+            return folded
+        case list():
+            return [
+                _fold_object(item, f"{path}[{i}]", report) for i, item in enumerate(obj)
+            ]
+        case Mapping():
+            return {
+                key: _fold_object(value, f"{path}.{key}", report)
+                for key, value in obj.items()
+            }
+        case _:
+            return obj
+
+
+def _fold_action(stmt: ActionStatement, report: ConstantFoldReport) -> ActionStatement:
+    n_folded = report.folded
+    args: dict[str, Any] = {}
+    for name, value in stmt.args.items():
+        # Parameters with a non-default expression policy interpret the
+        # authored source, so leave them exactly as written.
+        if expression_policy(stmt.action, name) != ExpressionPolicy.RESOLVE:
+            args[name] = value
+        else:
+            args[name] = _fold_object(value, f"actions.{stmt.ref}.args.{name}", report)
+    if report.folded == n_folded:
+        return stmt
+    return stmt.model_copy(update={"args": args})
+
+
+def fold_constants(dsl: DSLInput) -> tuple[DSLInput, ConstantFoldReport]:
+    """Fold constant template expressions in action args and workflow returns.
+
+    Returns the folded definition (``dsl`` itself if nothing was folded) and a
+    report of the folded locations.
+    """
+    report = ConstantFoldReport()
+    actions = [_fold_action(stmt, report) for stmt in dsl.actions]
+    n_action_folds = report.folded
+    returns = _fold_object(dsl.returns, "returns", report)
+    if not report.folded:
+        return dsl, report
+
+    update: dict[str, Any] = {"actions": actions}
+    if report.folded > n_action_folds:
+        update["returns"] = returns
+    return dsl.model_copy(update=update), report
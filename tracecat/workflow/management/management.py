@@ -15,6 +15,7 @@ from sqlalchemy.orm import selectinload
 from temporalio import activity
 from temporalio.exceptions import ApplicationError
 
+from tracecat import config
 from tracecat.agent.catalog.service import AgentCatalogService
 from tracecat.audit.logger import AuditEventDetails, audit_log
 from tracecat.authz.controls import require_scope
@@ -72,7 +73,11 @@ from tracecat.workflow.case_triggers.service import CaseTriggersService
 from tracecat.workflow.executions.enums import ExecutionType, TriggerType
 from tracecat.workflow.executions.schemas import WorkflowExecutionCreateResponse
 from tracecat.workflow.graph.service import WorkflowGraphService
-from tracecat.workflow.management.definitions import WorkflowDefinitionsService
+from tracecat.workflow.management.definitions import (
+    WorkflowDefinitionsService,
+    load_definition,
+)
+from tracecat.workflow.management.folding import fold_constants
 from tracecat.workflow.management.layout import (
     WorkflowActionLayoutInput,
     auto_generate_layout,
@@ -115,10 +120,13 @@ class WorkflowPublishResult:
     ``version`` is the newly committed definition version on success, or ``None``
     when ``errors`` is non-empty. Callers render ``errors`` (correctable
     validation problems) rather than treating publish failure as an exception.
+    ``folded_expressions`` counts the constant expressions that were folded into
+    literals in the committed definition.
     """
 
     version: int | None
     errors: list[ValidationResult]
+    folded_expressions: int = 0
 
     @property
     def ok(self) -> bool:
@@ -1021,6 +1029,20 @@ class WorkflowsManagementService(BaseWorkspaceService):
             )
         workflow.registry_lock = registry_lock.model_dump()
 
+        # Fold constant expressions so executors never re-evaluate them. This
+        # runs after validation so errors still point at the authored source.
+        folded_expressions = 0
+        if config.TRACECAT__WORKFLOW_CONSTANT_FOLDING_ENABLED:
+            dsl, fold_report = fold_constants(dsl)
+            folded_expressions = fold_report.folded
+            if folded_expressions:
+                self.logger.info(
+                    "Folded constant expressions",
+                    workflow_id=workflow_id,
+                    folded=folded_expressions,
+                    paths=fold_report.paths,
+                )
+
         # Phase 2/3: create the definition and bump the workflow version.
         defn_service = WorkflowDefinitionsService(self.session, self.role)
         defn = await defn_service.create_workflow_definition(
@@ -1036,7 +1058,11 @@ class WorkflowsManagementService(BaseWorkspaceService):
         await self.session.commit()
         await self.session.refresh(workflow)
         await self.session.refresh(defn)
-        return WorkflowPublishResult(version=defn.version, errors=[])
+        return WorkflowPublishResult(
+            version=defn.version,
+            errors=[],
+            folded_expressions=folded_expressions,
+        )
 
     async def build_dsl_from_workflow(self, workflow: Workflow) -> DSLInput:
         """Build a DSLInput from a Workflow."""
@@ -1128,12 +1154,9 @@ class WorkflowsManagementService(BaseWorkspaceService):
                     f"Workflow {wf_id.short()} has no published definition. "
                     "Publish the workflow before running a published version."
                 )
-            dsl = DSLInput(**defn.content)
-            registry_lock = (
-                RegistryLock.model_validate(defn.registry_lock)
-                if defn.registry_lock
-                else None
-            )
+            definition = load_definition(defn)
+            dsl = definition.dsl
+            registry_lock = definition.registry_lock
 
         # Validate trigger inputs against the entrypoint schema up front so a
         # bad payload returns a fixable error here instead of failing inside the
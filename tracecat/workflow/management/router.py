@@ -484,7 +484,10 @@ async def commit_workflow(
         workflow_id=workflow_id.short(),
         status="success",
         message="Workflow committed successfully.",
-        metadata={"version": result.version},
+        metadata={
+            "version": result.version,
+            "folded_expressions": result.folded_expressions,
+        },
     )
 
 